@@ -0,0 +1,78 @@
+# coding: utf-8
+
+"""
+Compares the date parsing of `signer_client.deserializer` with dateutil.
+
+    python benchmarks/bench_datetime.py [--documents 200] [--repeat 20]
+
+Reports the time per timestamp of dateutil, of the ISO 8601 fast path and
+of a cache hit, then the time to deserialize a page of full
+`DocumentsDocumentModel` (7 datetimes each with their flow actions), with
+eager and lazy dates, and how long reading one date of every document takes
+afterwards.
+"""
+
+from __future__ import absolute_import
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from dateutil.parser import parse  # noqa: E402
+
+from signer_client import deserializer  # noqa: E402
+
+from payloads import documents  # noqa: E402
+
+
+def _best(function, repeat, number=1):
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--documents', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    page = documents(args.documents)
+    strings = [page[0]['creationDate'],
+               '2024-03-01T10:20:30.1234567-03:00',
+               '2024-03-01T13:20:30Z']
+    uncached = deserializer.parse_datetime.__wrapped__
+    print('%-36s %10s %10s %10s' % ('timestamp', 'dateutil', 'fast path',
+                                      'cached'))
+    for string in strings:
+        deserializer.parse_datetime(string)
+        timings = (
+            _best(lambda: parse(string), args.repeat, 1000),
+            _best(lambda: uncached(string), args.repeat, 1000),
+            _best(lambda: deserializer.parse_datetime(string), args.repeat,
+                  1000),
+        )
+        print('%-36s %8.2fus %8.2fus %8.2fus' % (
+            (string,) + tuple(t * 1e6 for t in timings)))
+
+    def decode(lazy):
+        deserializer.parse_datetime.cache_clear()
+        return deserializer.deserialize(page, 'list[DocumentsDocumentModel]',
+                                        trusted=True, lazy_datetimes=lazy)
+
+    def decode_and_read(lazy):
+        for document in decode(lazy):
+            document.update_date
+
+    print('\n%d documents' % args.documents)
+    print('%-10s %12s %16s' % ('dates', 'deserialize', '+ update_date'))
+    for lazy in (False, True):
+        print('%-10s %10.2fms %14.2fms' % (
+            'lazy' if lazy else 'eager',
+            _best(lambda: decode(lazy), args.repeat) * 1000,
+            _best(lambda: decode_and_read(lazy), args.repeat) * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+# coding: utf-8
+
+"""
+Compares the deserialization of a document listing by the compiled decoders
+of `signer_client.deserializer`, trusted or not, with the former recursive
+deserializer kept below for reference.
+
+    python benchmarks/bench_deserialize.py [--documents 1000] [--repeat 20]
+
+The JSON is decoded once beforehand: only the conversion into
+`PaginatedSearchResponseDocumentsDocumentListModel` is timed, with and
+without the dates of the documents (see also `bench_datetime.py`).
+"""
+
+from __future__ import absolute_import
+
+import argparse
+import datetime
+import os
+import re
+import sys
+import timeit
+
+import six
+from dateutil.parser import parse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import signer_client.models  # noqa: E402
+from signer_client import deserializer  # noqa: E402
+
+from payloads import document_listing  # noqa: E402
+
+RESPONSE_TYPE = 'PaginatedSearchResponseDocumentsDocumentListModel'
+
+
+def _recursive(data, klass):
+    """The deserializer of `ApiClient` before the decoders were compiled."""
+    if data is None:
+        return None
+    if type(klass) == str:
+        if klass.startswith('list['):
+            sub_kls = re.match(r'list\[(.*)\]', klass).group(1)
+            return [_recursive(sub_data, sub_kls) for sub_data in data]
+        if klass.startswith('dict('):
+            sub_kls = re.match(r'dict\(([^,]*), (.*)\)', klass).group(2)
+            return {k: _recursive(v, sub_kls) for k, v in six.iteritems(data)}
+        if klass in deserializer._NATIVE_TYPES:
+            klass = deserializer._NATIVE_TYPES[klass]
+        else:
+            klass = getattr(signer_client.models, klass)
+    if klass in deserializer._PRIMITIVE_TYPES:
+        try:
+            return klass(data)
+        except TypeError:
+            return data
+    elif klass == object:
+        return data
+    elif klass == datetime.date:
+        return parse(data).date()
+    elif klass == datetime.datetime:
+        return parse(data)
+    if not klass.swagger_types:
+        return data
+    kwargs = {}
+    for attr, attr_type in six.iteritems(klass.swagger_types):
+        if klass.attribute_map[attr] in data and isinstance(data, dict):
+            kwargs[attr] = _recursive(data[klass.attribute_map[attr]],
+                                      attr_type)
+    return klass(**kwargs)
+
+
+def _cold(payload, trusted):
+    # without the timestamps parsed by the previous runs
+    deserializer.parse_datetime.cache_clear()
+    return deserializer.deserialize(payload, RESPONSE_TYPE, trusted=trusted)
+
+
+def _best(function, repeat):
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--documents', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    listing = document_listing(args.documents)
+    undated = document_listing(args.documents)
+    for item in undated['items']:
+        item['creationDate'] = item['updateDate'] = None
+
+    print('%d documents' % args.documents)
+    for title, payload in (('full listing', listing),
+                           ('without dates (model building only)', undated)):
+        candidates = [
+            ('recursive', lambda: _recursive(payload, RESPONSE_TYPE)),
+            ('compiled', lambda: _cold(payload, trusted=False)),
+            ('trusted', lambda: _cold(payload, trusted=True)),
+        ]
+        # the results must not differ
+        results = [function().to_dict() for _, function in candidates]
+        assert all(result == results[0] for result in results)
+
+        print('\n%s' % title)
+        baseline = None
+        for name, function in candidates:
+            timing = _best(function, args.repeat)
+            baseline = baseline or timing
+            print('  %-10s %10.2fms %8.1fx' % (name, timing * 1000,
+                                               baseline / timing))
+
+if __name__ == '__main__':
+    main()
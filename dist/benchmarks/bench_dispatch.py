@@ -0,0 +1,90 @@
+# coding: utf-8
+
+"""
+Measures the per-call overhead of the client, with the network stubbed out.
+
+    python benchmarks/bench_dispatch.py [--calls 20000] [--repeat 5]
+
+Calls generated API methods on an `ApiClient` whose `request` returns a
+canned response, and asks for the raw body so that no JSON is decoded:
+what is left is the work of the client itself (argument checks, url,
+headers and query building, authentication, serialization of the body,
+dispatch). Reports the best of `--repeat` runs in microseconds per call.
+"""
+
+from __future__ import absolute_import
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from signer_client.api.documents_api import DocumentsApi  # noqa: E402
+from signer_client.api_client import ApiClient  # noqa: E402
+from signer_client.configuration import Configuration  # noqa: E402
+from signer_client.models import (  # noqa: E402
+    DocumentsDocumentNotifiedEmailsEditRequest,
+)
+
+
+class _Response(object):
+    status = 200
+    reason = 'OK'
+    data = b'{"id": "a5e3c1f0-0000-0000-0000-000000000001"}'
+
+    def getheaders(self):
+        return {'Content-Type': 'application/json'}
+
+    def getheader(self, name, default=None):
+        return self.getheaders().get(name, default)
+
+
+class _StubApiClient(ApiClient):
+    """Answers every request without sending it."""
+
+    response = _Response()
+
+    def request(self, method, url, query_params=None, headers=None,
+                post_params=None, body=None, _preload_content=True,
+                _request_timeout=None, _retry_policy=None, _throttle=None):
+        return self.response
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--calls', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    configuration = Configuration()
+    configuration.host = 'https://signer.example.com'
+    configuration.api_key = {'X-Api-Key': 'app|0123456789abcdef'}
+    documents_api = DocumentsApi(_StubApiClient(configuration))
+    body = DocumentsDocumentNotifiedEmailsEditRequest(
+        emails=['juridico@example.com.br', 'financeiro@example.com.br'])
+
+    cases = [
+        ('GET /api/documents/{id}',
+         lambda: documents_api.api_documents_id_get(
+             'a5e3c1f0-0000-0000-0000-000000000001',
+             _response_format='raw')),
+        ('GET /api/documents (5 query parameters)',
+         lambda: documents_api.api_documents_get(
+             status='Pending', q='contrato', limit=20, offset=40,
+             order='Desc', _response_format='raw')),
+        ('PUT /api/documents/{id}/notified-emails',
+         lambda: documents_api.api_documents_id_notified_emails_put(
+             'a5e3c1f0-0000-0000-0000-000000000001', body=body,
+             _response_format='raw')),
+    ]
+    print('%d calls, best of %d' % (args.calls, args.repeat))
+    for name, call in cases:
+        call()
+        best = min(timeit.repeat(call, number=args.calls, repeat=args.repeat))
+        print('  %-44s %6.2f us/call' % (name, best / args.calls * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+# coding: utf-8
+
+"""
+Measures the import time of signer_client in fresh interpreters.
+
+    python benchmarks/bench_import.py [--repeat 15] [--max-ms 50]
+
+Each statement is timed in its own interpreter, `--repeat` times, and the
+median is reported with the number of modules it loaded. `import
+signer_client` loads no API or model module; `from signer_client import *`
+loads all of them, as the package used to on import. With `--max-ms` the
+script exits with status 1 when the median of `import signer_client`
+exceeds it, to catch regressions in CI.
+
+Run it twice when the bytecode of the package is not cached yet
+(`__pycache__`), or the first run also measures the compilation.
+"""
+
+from __future__ import absolute_import
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+STATEMENTS = [
+    'import signer_client',
+    'from signer_client import ApiClient, Configuration, DocumentsApi',
+    'from signer_client import SignerClient',
+    'from signer_client import *',
+]
+
+_SCRIPT = '''
+import sys, time
+before = len(sys.modules)
+start = time.perf_counter()
+%s
+elapsed = time.perf_counter() - start
+print('{"seconds": %%r, "modules": %%d}' %% (elapsed, len(sys.modules) - before))
+'''
+
+
+def _run(statement):
+    output = subprocess.check_output(
+        [sys.executable, '-c', _SCRIPT % statement], cwd=ROOT)
+    return json.loads(output.decode('utf-8').splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--repeat', type=int, default=15)
+    parser.add_argument('--max-ms', type=float, default=None,
+                        help='fail when `import signer_client` takes longer')
+    args = parser.parse_args()
+
+    medians = {}
+    for statement in STATEMENTS:
+        runs = [_run(statement) for _ in range(args.repeat)]
+        median = statistics.median(run['seconds'] for run in runs) * 1000
+        medians[statement] = median
+        print('  %-66s %8.1f ms %5d modules' % (
+            statement, median, runs[-1]['modules']))
+
+    if args.max_ms is not None and medians[STATEMENTS[0]] > args.max_ms:
+        print('`import signer_client` took %.1f ms, more than %.1f ms'
+              % (medians[STATEMENTS[0]], args.max_ms))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
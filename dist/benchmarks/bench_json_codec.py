@@ -0,0 +1,78 @@
+# coding: utf-8
+
+"""
+Compares the JSON codecs of `signer_client.codec` on document listings and
+base64 uploads.
+
+    python benchmarks/bench_json_codec.py [--documents 500] [--repeat 20]
+
+For each codec, reports the best time to encode a request body (as the REST
+layer does, from `sanitize_for_serialization` output), to decode a response
+and to decode and deserialize it into `DocumentsDocumentModel` objects.
+"""
+
+from __future__ import absolute_import
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from signer_client.api_client import ApiClient  # noqa: E402
+from signer_client.codec import CODECS, StdlibCodec, get_codec  # noqa: E402,E501
+from signer_client.configuration import Configuration  # noqa: E402
+
+from payloads import documents, upload_bytes  # noqa: E402
+
+
+class _Response(object):
+
+    def __init__(self, data):
+        self.data = data
+
+
+def _best(function, repeat):
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--documents', type=int, default=500)
+    parser.add_argument('--upload-size', type=int, default=8 * 1024 * 1024)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    listing = documents(args.documents)
+    upload = upload_bytes(args.upload_size)
+    listing_bytes = StdlibCodec().dumps(listing)
+    print('%d documents (%d KiB), upload of %d KiB\n' % (
+        args.documents, len(listing_bytes) // 1024,
+        args.upload_size // 1024))
+    print('%-8s %12s %12s %14s %12s' % (
+        'codec', 'dumps list', 'loads list', 'deserialize', 'dumps upload'))
+
+    for name in sorted(CODECS):
+        configuration = Configuration()
+        configuration.json_codec = name
+        try:
+            codec = get_codec(configuration)
+        except ImportError as e:
+            print('%-8s %s' % (name, e))
+            continue
+        api_client = ApiClient(configuration)
+        response = _Response(listing_bytes)
+        timings = (
+            _best(lambda: codec.dumps(listing), args.repeat),
+            _best(lambda: codec.loads(listing_bytes), args.repeat),
+            _best(lambda: api_client.deserialize(
+                response, 'list[DocumentsDocumentModel]'), args.repeat),
+            _best(lambda: codec.dumps(upload), args.repeat),
+        )
+        print('%-8s %10.2fms %10.2fms %12.2fms %10.2fms' % (
+            (name,) + tuple(t * 1000 for t in timings)))
+
+
+if __name__ == '__main__':
+    main()
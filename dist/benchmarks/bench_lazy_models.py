@@ -0,0 +1,84 @@
+# coding: utf-8
+
+"""
+Compares eager and lazy (view) models when only a few attributes are read.
+
+    python benchmarks/bench_lazy_models.py [--documents 2000] [--repeat 5]
+
+Deserializes full `DocumentsDocumentModel` objects and reads their `id`,
+`status` and `update_date`, as code polling the state of documents does.
+Reports the time of the best run and the memory the models hold after the
+reads with `tracemalloc`, the parsed JSON they are built from excluded.
+"""
+
+from __future__ import absolute_import
+
+import argparse
+import gc
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from signer_client import deserializer  # noqa: E402
+
+from payloads import documents  # noqa: E402
+
+
+def _shallow(models):
+    for model in models:
+        (model.id, model.status, model.update_date)
+    return models
+
+
+def _allocated(function):
+    """Returns the result of `function` and the bytes it still holds."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = function()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--documents', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    data = documents(args.documents)
+    variants = [
+        ('eager', {}),
+        ('eager, trusted', {'trusted': True}),
+        ('eager, lazy dates', {'trusted': True, 'lazy_datetimes': True}),
+        ('lazy models', {'lazy_models': True}),
+    ]
+    print('%d x DocumentsDocumentModel, reading id, status, update_date'
+          % len(data))
+    baseline = None
+    for name, options in variants:
+        decode = deserializer.get_decoder('list[DocumentsDocumentModel]',
+                                          **options)
+        decode(data[:1])
+
+        def run():
+            # without the timestamps cached by the previous runs
+            deserializer.parse_datetime.cache_clear()
+            _shallow(decode(data))
+
+        best = min(timeit.repeat(run, number=1, repeat=args.repeat))
+        deserializer.parse_datetime.cache_clear()
+        models, size = _allocated(lambda: _shallow(decode(data)))
+        baseline = baseline or best
+        print('  %-18s %8.1f ms %6.1fx %8.1f MiB' % (
+            name, best * 1000, baseline / best, size / 1048576.0))
+        del models
+
+
+if __name__ == '__main__':
+    main()
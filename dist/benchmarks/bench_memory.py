@@ -0,0 +1,77 @@
+# coding: utf-8
+
+"""
+Compares the memory held by regular and compact (slotted) response models.
+
+    python benchmarks/bench_memory.py [--documents 20000]
+
+Deserializes a listing of `DocumentsDocumentListModel` and the
+`FlowActionsFlowActionModel` of full documents, and reports the memory
+allocated for the models with `tracemalloc`, the parsed JSON they are built
+from excluded.
+"""
+
+from __future__ import absolute_import
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from signer_client import deserializer  # noqa: E402
+
+from payloads import document, document_listing  # noqa: E402
+
+
+def _allocated(function):
+    """Returns the result of `function` and the bytes it still holds."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = function()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--documents', type=int, default=20000)
+    args = parser.parse_args()
+
+    listing = document_listing(args.documents)['items']
+    flow_actions = document(flow_actions=args.documents)['flowActions']
+    cases = [
+        ('DocumentsDocumentListModel', listing),
+        ('FlowActionsFlowActionModel', flow_actions),
+    ]
+    variants = [
+        ('regular', {}),
+        ('compact', {'compact': True}),
+        ('compact, lazy dates', {'compact': True, 'lazy_datetimes': True}),
+    ]
+    for model, data in cases:
+        print('%d x %s' % (len(data), model))
+        baseline = None
+        for name, options in variants:
+            decode = deserializer.get_decoder('list[%s]' % model,
+                                              trusted=True, **options)
+            # compiled beforehand, and without the timestamps cached by the
+            # previous variants
+            decode(data[:1])
+            deserializer.parse_datetime.cache_clear()
+            models, size = _allocated(lambda: decode(data))
+            baseline = baseline or size
+            print('  %-22s %8.1f MiB %7d B/model %6.1fx' % (
+                name, size / 1048576.0, size // len(models),
+                float(baseline) / size))
+            del models
+        print('')
+
+
+if __name__ == '__main__':
+    main()
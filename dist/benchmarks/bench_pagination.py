@@ -0,0 +1,109 @@
+# coding: utf-8
+
+"""
+Measures a full scan of a listing with and without prefetching.
+
+    python benchmarks/bench_pagination.py [--items 2000] [--page-size 100]
+                                          [--latency-ms 50]
+
+Serves a listing from a local server that answers each page after
+`--latency-ms`, standing in for the round trip to the API, and times
+`SignerClient.iter_organization_users` with 0, 1, 2 and 4 pages prefetched,
+then `SignerClient.scan_documents` with 1 to 16 requests at a time. Without
+prefetching the scan waits for every page in turn; with it the next pages
+are already in flight while one is read.
+"""
+
+from __future__ import absolute_import
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from signer_client.client import SignerClient  # noqa: E402
+from signer_client.configuration import Configuration  # noqa: E402
+
+
+def _handler(users, latency):
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        # headers and body are written separately
+        disable_nagle_algorithm = True
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            query = parse_qs(urlparse(self.path).query)
+            offset = int(query['Offset'][0])
+            limit = int(query['Limit'][0])
+            time.sleep(latency)
+            body = json.dumps({'items': users[offset:offset + limit],
+                               'totalCount': len(users)}).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--items', type=int, default=2000)
+    parser.add_argument('--page-size', type=int, default=100)
+    parser.add_argument('--latency-ms', type=float, default=50)
+    args = parser.parse_args()
+
+    users = [{'id': 'u%06d' % i, 'name': 'Item %d' % i,
+              'email': 'item%d@example.com' % i} for i in range(args.items)]
+    server = ThreadingHTTPServer(
+        ('127.0.0.1', 0), _handler(users, args.latency_ms / 1000.0))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host = 'http://127.0.0.1:%d' % server.server_address[1]
+
+    pages = -(-args.items // args.page_size)
+    print('%d items, %d pages, %.0f ms per page'
+          % (args.items, pages, args.latency_ms))
+    try:
+        # as many threads and connections as requests at a time; the
+        # defaults are 5 per CPU
+        configuration = Configuration()
+        configuration.executor = ThreadPoolExecutor(16)
+        configuration.connection_pool_maxsize = 16
+        Configuration.set_default(configuration)
+        with SignerClient('app|key', host) as client:
+            for prefetch in (0, 1, 2, 4):
+                start = time.perf_counter()
+                count = sum(1 for _ in client.iter_organization_users(
+                    page_size=args.page_size, prefetch=prefetch))
+                elapsed = time.perf_counter() - start
+                assert count == args.items
+                print('  iter_organization_users prefetch=%-2d   %8.3f s'
+                      % (prefetch, elapsed))
+            for parallelism in (1, 4, 8, 16):
+                start = time.perf_counter()
+                count = sum(1 for _ in client.scan_documents(
+                    page_size=args.page_size, parallelism=parallelism))
+                elapsed = time.perf_counter() - start
+                assert count == args.items
+                print('  scan_documents parallelism=%-2d     %8.3f s'
+                      % (parallelism, elapsed))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
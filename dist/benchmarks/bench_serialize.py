@@ -0,0 +1,126 @@
+# coding: utf-8
+
+"""
+Compares the compiled encoders of `signer_client.serializer` with the former
+`sanitize_for_serialization`, kept below for reference.
+
+    python benchmarks/bench_serialize.py [--requests 100] [--repeat 20]
+
+Encodes a batch of `DocumentsCreateDocumentRequest` with several files,
+flow actions and observers each, as in a bulk document creation, and
+reports the requests encoded per second, to the wire dict and to JSON
+bytes with the default codec.
+"""
+
+from __future__ import absolute_import
+
+import argparse
+import datetime
+import os
+import sys
+import timeit
+
+import six
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from signer_client import serializer  # noqa: E402
+from signer_client.codec import get_codec  # noqa: E402
+from signer_client.configuration import Configuration  # noqa: E402
+from signer_client.models import (  # noqa: E402
+    DocumentsCreateDocumentRequest,
+    DocumentsDocumentTagData,
+    FileUploadModel,
+    FlowActionsFlowActionCreateModel,
+    ObserversObserverCreateModel,
+    UsersParticipantUserModel,
+)
+from signer_client.multipart import FilePart  # noqa: E402
+from signer_client.streaming import StreamingBody  # noqa: E402
+
+_PRIMITIVE_TYPES = (float, bool, bytes, six.text_type) + six.integer_types
+
+
+def _reference(obj):
+    """`sanitize_for_serialization` before its encoders were compiled."""
+    if obj is None:
+        return None
+    elif isinstance(obj, _PRIMITIVE_TYPES + (FilePart, StreamingBody)):
+        return obj
+    elif isinstance(obj, list):
+        return [_reference(sub_obj) for sub_obj in obj]
+    elif isinstance(obj, tuple):
+        return tuple(_reference(sub_obj) for sub_obj in obj)
+    elif isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+    if isinstance(obj, dict):
+        obj_dict = obj
+    else:
+        obj_dict = {obj.attribute_map[attr]: getattr(obj, attr)
+                    for attr, _ in six.iteritems(obj.swagger_types)
+                    if getattr(obj, attr) is not None}
+    return {key: _reference(val) for key, val in six.iteritems(obj_dict)}
+
+
+def _user(i):
+    return UsersParticipantUserModel(
+        name='Participante Número %d' % i, identifier='%011d' % i,
+        email='participante%d@example.com.br' % i,
+        phone='+55 11 9%08d' % i)
+
+
+def create_request(i, files=3, signers=8, observers=3):
+    """Returns a `DocumentsCreateDocumentRequest` as built by a bulk
+    creation job."""
+    return DocumentsCreateDocumentRequest(
+        files=[FileUploadModel(display_name='Contrato %d-%d' % (i, n),
+                               id='upload-%d-%d' % (i, n),
+                               name='contrato-%d.pdf' % n,
+                               content_type='application/pdf')
+               for n in range(files)],
+        flow_actions=[FlowActionsFlowActionCreateModel(
+            type='Signer', step=n + 1, user=_user(n),
+            allow_electronic_signature=bool(n % 2),
+            require_sms_authentication_to_sign_electronically=False,
+            title='Assinatura %d' % n)
+            for n in range(signers)],
+        observers=[ObserversObserverCreateModel(user=_user(100 + n))
+                   for n in range(observers)],
+        folder_id='0b5d6e48-7c0f-4d4e-9f0a-5b3e6f1c2d3a',
+        description='Lote de contratos %d' % i,
+        notified_emails=['juridico@example.com.br'],
+        tags=[DocumentsDocumentTagData(label='lote', value=str(i))],
+        expiration_date=datetime.datetime(2030, 1, 1, 12, 0),
+    )
+
+
+def _best(function, repeat):
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--requests', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    batch = [create_request(i) for i in range(args.requests)]
+    assert serializer.sanitize(batch) == _reference(batch)
+    codec = get_codec(Configuration())
+
+    candidates = [
+        ('reference', _reference),
+        ('compiled', serializer.sanitize),
+    ]
+    print('%d requests, %s codec\n' % (args.requests, codec.name))
+    print('%-10s %14s %14s' % ('encoder', 'dict req/s', 'bytes req/s'))
+    for name, encode in candidates:
+        to_dict = _best(lambda: [encode(r) for r in batch], args.repeat)
+        to_bytes = _best(lambda: [codec.dumps(encode(r)) for r in batch],
+                         args.repeat)
+        print('%-10s %14.0f %14.0f' % (name, args.requests / to_dict,
+                                        args.requests / to_bytes))
+
+
+if __name__ == '__main__':
+    main()
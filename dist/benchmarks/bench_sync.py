@@ -0,0 +1,145 @@
+# coding: utf-8
+
+"""
+Measures runs of `DocumentSync` against the number of changed documents.
+
+    python benchmarks/bench_sync.py [--documents 5000] [--changes 10]
+                                    [--latency-ms 20]
+
+Serves documents from a local server that answers each request after
+`--latency-ms`, standing in for the round trip to the API, and times the
+first run, which lists everything and fetches every document's details, then
+incremental runs after `--changes` documents and 10 times as many were
+updated. An incremental run lists the newest pages only and fetches the
+details of the changed documents, so its cost follows the number of changes
+and not the number of documents.
+"""
+
+from __future__ import absolute_import
+
+import argparse
+import datetime
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from signer_client.client import SignerClient  # noqa: E402
+from signer_client.configuration import Configuration  # noqa: E402
+from signer_client.sync import DocumentSync  # noqa: E402
+
+START = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+LISTING = ('id', 'name', 'creationDate', 'updateDate', 'folder', 'type',
+           'tags')
+
+
+def _date(seconds):
+    return (START + datetime.timedelta(seconds=seconds)).isoformat()
+
+
+def _handler(documents, latency, counts):
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        # headers and body are written separately
+        disable_nagle_algorithm = True
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            time.sleep(latency)
+            if url.path == '/api/documents':
+                counts['pages'] += 1
+                query = parse_qs(url.query)
+                offset = int(query['Offset'][0])
+                limit = int(query['Limit'][0])
+                items = sorted(documents.values(),
+                               key=lambda d: d['updateDate'], reverse=True)
+                body = {'items': [dict((k, d[k]) for k in LISTING)
+                                  for d in items[offset:offset + limit]],
+                        'totalCount': len(items)}
+            else:
+                counts['details'] += 1
+                body = documents[url.path.rsplit('/', 1)[1]]
+            data = json.dumps(body).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--documents', type=int, default=5000)
+    parser.add_argument('--changes', type=int, default=10)
+    parser.add_argument('--latency-ms', type=float, default=20)
+    args = parser.parse_args()
+
+    documents = dict(
+        ('d%06d' % i, {'id': 'd%06d' % i, 'name': 'Document %d' % i,
+                       'creationDate': _date(i), 'updateDate': _date(i),
+                       'folder': None, 'type': None, 'tags': [],
+                       'status': 'Pending', 'isConcluded': False,
+                       'isDeleted': False, 'hasSignature': False,
+                       'description': None})
+        for i in range(args.documents))
+    counts = {'pages': 0, 'details': 0}
+    server = ThreadingHTTPServer(
+        ('127.0.0.1', 0),
+        _handler(documents, args.latency_ms / 1000.0, counts))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host = 'http://127.0.0.1:%d' % server.server_address[1]
+    directory = tempfile.mkdtemp()
+
+    print('%d documents, %.0f ms per request'
+          % (args.documents, args.latency_ms))
+    try:
+        # as many threads and connections as requests at a time; the
+        # defaults are 5 per CPU
+        configuration = Configuration()
+        configuration.executor = ThreadPoolExecutor(16)
+        configuration.connection_pool_maxsize = 16
+        Configuration.set_default(configuration)
+        with SignerClient('app|key', host) as client, DocumentSync(
+                client.documents_api, os.path.join(directory, 'sync.db'),
+                parallelism=16) as sync:
+            clock = args.documents
+            for label, changes in (('first run', None),
+                                   ('no changes', 0),
+                                   ('%d changes' % args.changes,
+                                    args.changes),
+                                   ('%d changes' % (10 * args.changes),
+                                    10 * args.changes)):
+                for i in range(changes or 0):
+                    clock += 1
+                    document = documents['d%06d' % (i * 7 % args.documents)]
+                    document['updateDate'] = _date(clock)
+                counts['pages'] = counts['details'] = 0
+                start = time.perf_counter()
+                result = sync.run()
+                elapsed = time.perf_counter() - start
+                print('  %-14s %8.3f s  %5d pages  %5d details  %r'
+                      % (label, elapsed, counts['pages'], counts['details'],
+                         result))
+    finally:
+        server.shutdown()
+        server.server_close()
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
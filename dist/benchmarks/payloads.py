@@ -0,0 +1,120 @@
+# coding: utf-8
+
+"""
+Payloads shaped like the responses of the Signer API, for the benchmarks.
+"""
+
+from __future__ import absolute_import
+
+import base64
+import os
+import random
+import uuid
+
+
+def _guid(rng):
+    return str(uuid.UUID(int=rng.getrandbits(128)))
+
+
+def _date(rng):
+    return '2024-%02d-%02dT%02d:%02d:%02d.%03d-03:00' % (
+        rng.randint(1, 12), rng.randint(1, 28), rng.randint(0, 23),
+        rng.randint(0, 59), rng.randint(0, 59), rng.randint(0, 999))
+
+
+def _user(rng, i):
+    return {
+        'id': _guid(rng),
+        'name': 'Participante Número %d' % i,
+        'identifier': '%011d' % rng.getrandbits(32),
+        'email': 'participante%d@example.com.br' % i,
+        'phone': '+55 11 9%04d-%04d' % (rng.randint(0, 9999),
+                                        rng.randint(0, 9999)),
+    }
+
+
+def _flow_action(rng, i):
+    return {
+        'id': _guid(rng),
+        'creationDate': _date(rng),
+        'pendingDate': _date(rng),
+        'updateDate': _date(rng),
+        'user': _user(rng, i),
+        'numberRequiredSignatures': 1,
+        'allowElectronicSignature': bool(i % 2),
+        'requireEmailAuthenticationToSignElectronically': True,
+        'requireSmsAuthenticationToSignElectronically': False,
+        'requireCompanyCertificate': False,
+        'isElectronic': bool(i % 2),
+        'allowRuleFlowToContinueIfRefused': False,
+        'type': 'Signer',
+        'status': 'Pending',
+        'step': i + 1,
+    }
+
+
+def document(rng=None, flow_actions=3):
+    """Returns a `DocumentsDocumentModel` as sent by the API."""
+    rng = rng or random.Random(0)
+    return {
+        'id': _guid(rng),
+        'checksumMd5': '%032x' % rng.getrandbits(128),
+        'isDeleted': False,
+        'flowActions': [_flow_action(rng, i) for i in range(flow_actions)],
+        'observers': [],
+        'attachments': [],
+        'permissions': {'move': True, 'editFlow': True},
+        'notifiedEmails': ['juridico@example.com.br'],
+        'key': '%016x' % rng.getrandbits(64),
+        'hideDownloadOptionForPendingDocuments': False,
+        'name': 'Contrato de prestação de serviços %d' % rng.randint(0, 9999),
+        'filename': 'contrato.pdf',
+        'fileSize': rng.randint(10 ** 4, 10 ** 7),
+        'mimeType': 'application/pdf',
+        'hasSignature': True,
+        'status': 'Pending',
+        'isConcluded': False,
+        'folder': {'id': _guid(rng), 'name': 'Contratos', 'parentId': None},
+        'organization': {'id': _guid(rng), 'name': 'Lacuna Software',
+                         'identifier': '12345678000199'},
+        'creationDate': _date(rng),
+        'updateDate': _date(rng),
+        'expirationDate': None,
+        'createdBy': {'id': _guid(rng), 'name': 'Administrador'},
+        'description': 'Documento gerado para testes de desempenho. ' * 4,
+        'forceCadesSignature': False,
+        'isScanned': False,
+        'isEnvelope': False,
+        'tags': [{'id': _guid(rng), 'label': 'área', 'value': 'vendas'}],
+        'signatureType': 'Qualified',
+    }
+
+
+def documents(count, seed=0):
+    """Returns `count` documents, as in a listing."""
+    rng = random.Random(seed)
+    return [document(rng) for _ in range(count)]
+
+
+def document_listing(count, seed=0):
+    """Returns a `PaginatedSearchResponseDocumentsDocumentListModel` with
+    `count` items, as returned by ``GET /api/documents``."""
+    rng = random.Random(seed)
+    items = []
+    for _ in range(count):
+        full = document(rng, flow_actions=0)
+        items.append({
+            'id': full['id'],
+            'name': full['name'],
+            'creationDate': full['creationDate'],
+            'updateDate': full['updateDate'],
+            'folder': full['folder'],
+            'type': 'Deed',
+            'tags': full['tags'],
+        })
+    return {'items': items, 'totalCount': count * 3, 'nextCursor': _guid(rng)}
+
+
+def upload_bytes(size):
+    """Returns an `UploadsUploadBytesRequest` body with `size` bytes."""
+    return {'bytes': base64.b64encode(os.urandom(size)).decode('ascii')}
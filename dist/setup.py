@@ -21,7 +21,13 @@ VERSION = "0.9.0"
 # prerequisite: setuptools
 # http://pypi.python.org/pypi/setuptools
 
-REQUIRES = ["urllib3 >= 1.15", "six >= 1.10", "certifi", "python-dateutil"]
+REQUIRES = ["urllib3 >= 2", "six >= 1.10", "certifi", "python-dateutil"]
+EXTRAS = {
+    "asyncio": ["aiohttp >= 3.0"],
+    "http2": ["httpx[http2] >= 0.26"],
+    "brotli": ["brotli"],
+    "orjson": ["orjson >= 3"],
+}
 
 setup(
     name=NAME,
@@ -31,6 +37,7 @@ setup(
     url="https://github.com/lacunasoftware/signer-python-client",
     keywords=["Swagger", "Dropsigner (HML)"],
     install_requires=REQUIRES,
+    extras_require=EXTRAS,
     packages=find_packages(),
     include_package_data=True,
     long_description="""\
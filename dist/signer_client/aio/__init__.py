@@ -0,0 +1,20 @@
+# coding: utf-8
+
+# flake8: noqa
+
+"""
+asyncio support for the Signer client.
+
+Requires the optional `aiohttp` dependency
+(`pip install signer-python-client[asyncio]`).
+"""
+
+from __future__ import absolute_import
+
+from signer_client.aio.rest import AsyncRESTClientObject
+from signer_client.aio.api_client import AsyncApiClient
+from signer_client.aio.api import (
+    AsyncDocumentsApi, AsyncFlowsApi, AsyncFoldersApi, AsyncMarksSessionsApi,
+    AsyncNotificationsApi, AsyncOrganizationsApi, AsyncUploadApi
+)
+from signer_client.aio.client import AsyncSignerClient
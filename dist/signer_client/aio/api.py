@@ -0,0 +1,63 @@
+# coding: utf-8
+
+"""
+Awaitable variants of the generated API classes.
+
+Each class is the generated API class bound to an `AsyncApiClient`: every
+operation keeps its name, parameters and return type, but returns an
+awaitable.
+
+>>> documents_api = AsyncDocumentsApi(AsyncApiClient(configuration))
+>>> document = await documents_api.api_documents_id_get(document_id)
+"""
+
+from __future__ import absolute_import
+
+from signer_client.api.documents_api import DocumentsApi
+from signer_client.api.flows_api import FlowsApi
+from signer_client.api.folders_api import FoldersApi
+from signer_client.api.marks_sessions_api import MarksSessionsApi
+from signer_client.api.notifications_api import NotificationsApi
+from signer_client.api.organizations_api import OrganizationsApi
+from signer_client.api.upload_api import UploadApi
+from signer_client.aio.api_client import AsyncApiClient
+
+
+class _AsyncApiMixin(object):
+
+    def __init__(self, api_client=None):
+        if api_client is None:
+            api_client = AsyncApiClient()
+        if not isinstance(api_client, AsyncApiClient):
+            raise TypeError(
+                "%s requires an AsyncApiClient, got %s"
+                % (type(self).__name__, type(api_client).__name__))
+        self.api_client = api_client
+
+
+class AsyncDocumentsApi(_AsyncApiMixin, DocumentsApi):
+    """Awaitable variant of :class:`DocumentsApi`."""
+
+
+class AsyncFlowsApi(_AsyncApiMixin, FlowsApi):
+    """Awaitable variant of :class:`FlowsApi`."""
+
+
+class AsyncFoldersApi(_AsyncApiMixin, FoldersApi):
+    """Awaitable variant of :class:`FoldersApi`."""
+
+
+class AsyncMarksSessionsApi(_AsyncApiMixin, MarksSessionsApi):
+    """Awaitable variant of :class:`MarksSessionsApi`."""
+
+
+class AsyncNotificationsApi(_AsyncApiMixin, NotificationsApi):
+    """Awaitable variant of :class:`NotificationsApi`."""
+
+
+class AsyncOrganizationsApi(_AsyncApiMixin, OrganizationsApi):
+    """Awaitable variant of :class:`OrganizationsApi`."""
+
+
+class AsyncUploadApi(_AsyncApiMixin, UploadApi):
+    """Awaitable variant of :class:`UploadApi`."""
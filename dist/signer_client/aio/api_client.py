@@ -0,0 +1,210 @@
+# coding: utf-8
+
+"""
+asyncio variant of `signer_client.ApiClient`.
+"""
+
+from __future__ import absolute_import
+
+import asyncio
+
+from signer_client.api_client import ApiClient
+from signer_client.coalesce import SingleFlight
+from signer_client.configuration import Configuration
+from signer_client.aio.rest import AsyncRESTClientObject
+from signer_client.rest import ApiException
+
+
+class AsyncApiClient(ApiClient):
+    """API client whose calls are coroutines.
+
+    Requests are built and responses deserialized exactly like in
+    `ApiClient` (same models, same sanitization), only the network I/O goes
+    through `AsyncRESTClientObject`. Any generated API class works on top of
+    it: its methods then return awaitables instead of results.
+
+    Use it as an async context manager, or call `close()`, to release the
+    underlying connections:
+
+    >>> async with AsyncApiClient(configuration) as api_client:
+    ...     document = await DocumentsApi(api_client).api_documents_id_get(id)
+
+    :param configuration: .Configuration object for this client
+    :param header_name: a header to pass when making calls to the API.
+    :param header_value: a header value to pass when making calls to
+        the API.
+    :param cookie: a cookie to include in the header when making calls
+        to the API
+    """
+
+    def __init__(self, configuration=None, header_name=None, header_value=None,
+                 cookie=None):
+        if configuration is None:
+            configuration = Configuration()
+        self.configuration = configuration
+
+        self.rest_client = AsyncRESTClientObject(configuration)
+        # identical GETs in flight, see `signer_client.coalesce`
+        self.singleflight = SingleFlight()
+        self.default_headers = {}
+        if header_name is not None:
+            self.default_headers[header_name] = header_value
+        self.cookie = cookie
+        # Set default User-Agent.
+        self.user_agent = 'Swagger-Codegen/1.0.0/python'
+
+    def __del__(self):
+        # There is no thread pool to tear down, connections are released by
+        # `close()`.
+        pass
+
+    async def close(self):
+        """Closes the underlying HTTP session."""
+        await self.rest_client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def __call_api(
+            self, resource_path, method, path_params=None,
+            query_params=None, header_params=None, body=None, post_params=None,
+            files=None, response_type=None, auth_settings=None,
+            _return_http_data_only=None, collection_formats=None,
+            _preload_content=True, _request_timeout=None,
+            _response_format=None, _fields=None, _operation=None):
+
+        response_options = self._response_options(_response_format, _fields)
+        if _operation is None:
+            operation = '%s %s' % (method, resource_path)
+            url, query_params, header_params, post_params, body = \
+                self._prepare_request(resource_path, path_params,
+                                      query_params, header_params, body,
+                                      post_params, files, auth_settings,
+                                      collection_formats)
+        else:
+            operation = _operation.key
+            url, query_params, header_params, post_params, body = \
+                self._prepare_operation(_operation, path_params,
+                                        query_params, header_params, body,
+                                        post_params, files)
+
+        async def fetch(headers):
+            # perform request and return response
+            def send():
+                return self.request(
+                    method, url, query_params=query_params,
+                    headers=headers, post_params=post_params,
+                    body=body, _preload_content=_preload_content,
+                    _request_timeout=_request_timeout,
+                    _retry_policy=self._retry_policy(method, resource_path),
+                    _throttle=self._throttle(method, resource_path))
+
+            hedging = self._hedging_policy(method, resource_path, body,
+                                           post_params, _preload_content)
+            if hedging is None:
+                return await send()
+            return await hedging.call_async(operation, send, send)
+
+        key = self._request_key(method, url, query_params, header_params,
+                                response_type, _return_http_data_only,
+                                _preload_content, response_options)
+        cache = self._response_cache(operation, key)
+        entry = None
+        if cache is not None:
+            entry = cache.get(key)
+            if entry is not None and entry.fresh:
+                return entry.value
+
+        async def call():
+            headers = header_params
+            if entry is not None:
+                headers = dict(header_params, **entry.conditional_headers())
+            try:
+                response_data = await fetch(headers)
+            except ApiException as e:
+                if entry is None or e.status != 304:
+                    raise
+                return cache.refresh(key, operation, entry, e.headers)
+            return_data = self._process_response(response_data, response_type,
+                                                 _return_http_data_only,
+                                                 _preload_content,
+                                                 response_options)
+            if cache is not None:
+                cache.store(key, operation, url, return_data, response_data)
+            return return_data
+
+        if key is None or not getattr(self.configuration,
+                                      'coalesce_requests', False):
+            return_data = await call()
+        else:
+            return_data = await self.singleflight.call_async(key, call)
+        self._invalidate_cache(method, url)
+        return return_data
+
+    def _throttle(self, method, resource_path):
+        """Returns a coroutine function waiting until the rate limiter lets
+        an attempt of the operation through, None without rate limiter."""
+        limiter = getattr(self.configuration, 'rate_limiter', None)
+        if limiter is None:
+            return None
+
+        async def throttle():
+            wait = limiter.reserve(method, resource_path)
+            if wait > 0:
+                await asyncio.sleep(wait)
+        return throttle
+
+    def call_api(self, resource_path, method,
+                 path_params=None, query_params=None, header_params=None,
+                 body=None, post_params=None, files=None,
+                 response_type=None, auth_settings=None, async_req=None,
+                 _return_http_data_only=None, collection_formats=None,
+                 _preload_content=True, _request_timeout=None,
+                 _response_format=None, _fields=None, _operation=None):
+        """Makes the HTTP request and returns an awaitable for the result.
+
+        Takes the same parameters as `ApiClient.call_api`.
+
+        :return:
+            If async_req parameter is True, an `asyncio.Task` already
+            scheduled on the running loop.
+            Otherwise a coroutine that must be awaited.
+        """
+        coro = self.__call_api(resource_path, method,
+                               path_params, query_params, header_params,
+                               body, post_params, files,
+                               response_type, auth_settings,
+                               _return_http_data_only, collection_formats,
+                               _preload_content, _request_timeout,
+                               _response_format, _fields, _operation)
+        if async_req:
+            return asyncio.ensure_future(coro)
+        return coro
+
+    async def request(self, method, url, query_params=None, headers=None,
+                      post_params=None, body=None, _preload_content=True,
+                      _request_timeout=None, _retry_policy=None,
+                      _throttle=None):
+        """Makes the HTTP request using AsyncRESTClientObject."""
+        if method not in ('GET', 'HEAD', 'OPTIONS', 'POST', 'PUT', 'PATCH',
+                          'DELETE'):
+            raise ValueError(
+                "http method must be `GET`, `HEAD`, `OPTIONS`,"
+                " `POST`, `PATCH`, `PUT` or `DELETE`."
+            )
+        if method in ('GET', 'HEAD'):
+            post_params = None
+            body = None
+        return await self.rest_client.request(
+            method, url,
+            query_params=query_params,
+            headers=headers,
+            post_params=post_params,
+            body=body,
+            _preload_content=_preload_content,
+            _request_timeout=_request_timeout,
+            _retry_policy=_retry_policy,
+            _throttle=_throttle)
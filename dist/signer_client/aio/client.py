@@ -0,0 +1,666 @@
+"""
+Lacuna Signer asyncio client
+
+Awaitable counterpart of `signer_client.client.SignerClient`. Every method
+has the same name, arguments and return value as in the blocking client, but
+must be awaited; all of them share one `AsyncApiClient` connection pool.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, AsyncIterator, List, Dict, Any, Optional, Union, BinaryIO, Callable
+
+from signer_client.aio.api_client import AsyncApiClient
+from signer_client.aio.api import (
+    AsyncDocumentsApi, AsyncFlowsApi, AsyncFoldersApi, AsyncMarksSessionsApi,
+    AsyncNotificationsApi, AsyncOrganizationsApi, AsyncUploadApi
+)
+from signer_client.configuration import Configuration
+from signer_client.download import (
+    DEFAULT_CHUNK_SIZE, DownloadResult, async_download_response
+)
+from signer_client.pagination import aiter_items, ascan_items, item_fields
+from signer_client.projection import MODEL, RAW, response_options
+from signer_client.streaming import Base64JsonBody
+# used at run time; the other models only appear in annotations, which are
+# not evaluated, so that importing the client does not load all the models
+from signer_client.models import (
+    AuthenticationTypes, DocumentFlowsDocumentFlowCreateRequest,
+    DocumentsActionUrlRequest, DocumentsCreateDocumentRequest,
+    DocumentsDocumentNotifiedEmailsEditRequest,
+    DocumentsMoveDocumentBatchRequest, DocumentsMoveDocumentRequest,
+    FlowActionType, FlowActionsFlowActionCreateModel,
+    UsersParticipantUserModel
+)
+
+if TYPE_CHECKING:
+    from signer_client.models import (
+        DocumentsCreateDocumentRequest, DocumentsDocumentModel,
+        DocumentsDocumentSignaturesInfoModel, DocumentsActionUrlRequest,
+        DocumentsActionUrlResponse, DocumentsCancelDocumentRequest,
+        DocumentsDocumentAddVersionRequest, DocumentsDocumentFlowEditRequest,
+        DocumentsDocumentNotifiedEmailsEditRequest,
+        DocumentsEnvelopeAddVersionRequest, DocumentsMoveDocumentRequest,
+        DocumentsMoveDocumentBatchRequest,
+        DocumentFlowsDocumentFlowCreateRequest, DocumentFlowsDocumentFlowModel,
+        FoldersFolderCreateRequest, FoldersFolderInfoModel,
+        FoldersFolderDeleteRequest,
+        UploadsUploadBytesRequest, FileModel, UploadModel, FileUploadModel,
+        FlowActionsFlowActionCreateModel, UsersParticipantUserModel,
+        DocumentStatus, DocumentTypes, FlowActionType, AuthenticationTypes,
+        PaginationOrders, DocumentDownloadTypes,
+        PaginatedSearchResponseDocumentsDocumentListModel,
+        PaginatedSearchResponseFoldersFolderInfoModel,
+        PaginatedSearchResponseOrganizationsOrganizationUserModel,
+        OrganizationsOrganizationUserPostRequest,
+        OrganizationsOrganizationUserModel,
+        DocumentMarkMarksSessionCreateRequest,
+        DocumentMarkMarksSessionCreateResponse, DocumentMarkMarksSessionModel,
+        BatchItemResultModel, TicketModel, SignatureSignaturesInfoRequest,
+        RefusalRefusalRequest, SignerModel
+    )
+
+
+class AsyncSignerClient:
+    """
+    asyncio client for the Lacuna Signer API.
+
+    Usage:
+        async with AsyncSignerClient(api_key, base_url) as client:
+            documents = await asyncio.gather(
+                *(client.get_document(i) for i in document_ids))
+    """
+
+    def __init__(self, api_key: str, base_url: str = "https://signer-demo.lacunasoftware.com",
+                 response_format: str = MODEL):
+        """
+        Initialize the asyncio Signer client.
+
+        Args:
+            api_key: Your API key in the format 'your-app|xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx'
+            base_url: The base URL for the Signer API (defaults to demo environment)
+            response_format: What the listing and detail methods (get_*,
+                list_*, iter_* and scan_*) return by default: 'model',
+                'dict' or 'raw'; the other methods return models
+        """
+        response_options(response_format)
+        self.configuration = Configuration()
+        self.configuration.host = base_url
+        self.configuration.api_key = {'X-Api-Key': api_key}
+        # only for the listing and detail methods, unlike
+        # configuration.response_format which applies to every call
+        self.response_format = response_format
+        self.api_client = AsyncApiClient(configuration=self.configuration)
+
+        # Initialize all API clients
+        self.documents_api = AsyncDocumentsApi(self.api_client)
+        self.flows_api = AsyncFlowsApi(self.api_client)
+        self.folders_api = AsyncFoldersApi(self.api_client)
+        self.marks_sessions_api = AsyncMarksSessionsApi(self.api_client)
+        self.notifications_api = AsyncNotificationsApi(self.api_client)
+        self.organizations_api = AsyncOrganizationsApi(self.api_client)
+        self.upload_api = AsyncUploadApi(self.api_client)
+
+    # ============================================================================
+    # DOCUMENT MANAGEMENT
+    # ============================================================================
+
+    async def create_document(self, document_request: DocumentsCreateDocumentRequest) -> DocumentsDocumentModel:
+        """Create a new document with signature flow."""
+        return await self.documents_api.api_documents_post(body=document_request)
+
+    async def get_document(self, document_id: str,
+                           response_format: Optional[str] = None,
+                           fields: Optional[List[str]] = None) -> DocumentsDocumentModel:
+        """Get document details by ID."""
+        return await self.documents_api.api_documents_id_get(
+            document_id, _response_format=response_format or self.response_format, _fields=fields)
+
+    async def list_documents(self,
+                             status: Optional[DocumentStatus] = None,
+                             folder_id: Optional[str] = None,
+                             document_type: Optional[DocumentTypes] = None,
+                             query: Optional[str] = None,
+                             limit: int = 20,
+                             offset: int = 0,
+                             order: Optional[PaginationOrders] = None,
+                             response_format: Optional[str] = None,
+                             fields: Optional[List[str]] = None) -> PaginatedSearchResponseDocumentsDocumentListModel:
+        """List documents with optional filtering."""
+        return await self.documents_api.api_documents_get(
+            status=status,
+            folder_id=folder_id,
+            document_type=document_type,
+            q=query,
+            limit=limit,
+            offset=offset,
+            order=order,
+            _response_format=response_format or self.response_format,
+            _fields=fields
+        )
+
+    def iter_documents(self,
+                       status: Optional[DocumentStatus] = None,
+                       folder_id: Optional[str] = None,
+                       document_type: Optional[DocumentTypes] = None,
+                       query: Optional[str] = None,
+                       order: Optional[PaginationOrders] = None,
+                       page_size: Optional[int] = None,
+                       prefetch: Optional[int] = None,
+                       response_format: Optional[str] = None,
+                       fields: Optional[List[str]] = None) -> AsyncIterator[DocumentsDocumentListModel]:
+        """Iterate (`async for`) over all the documents matching the filters,
+        see `SignerClient.iter_documents`."""
+        fields = item_fields(fields)
+        return self._iter_items(
+            lambda offset, limit: self.documents_api.api_documents_get(
+                status=status,
+                folder_id=folder_id,
+                document_type=document_type,
+                q=query,
+                limit=limit,
+                offset=offset,
+                order=order,
+                _response_format=response_format or self.response_format,
+                _fields=fields
+            ),
+            page_size, prefetch, response_format)
+
+    def scan_documents(self,
+                       status: Optional[DocumentStatus] = None,
+                       folder_id: Optional[str] = None,
+                       document_type: Optional[DocumentTypes] = None,
+                       tags: Optional[str] = None,
+                       query: Optional[str] = None,
+                       order: Optional[PaginationOrders] = None,
+                       partitions: Optional[List[Dict[str, Any]]] = None,
+                       page_size: Optional[int] = None,
+                       parallelism: Optional[int] = None,
+                       overlap: int = 0,
+                       response_format: Optional[str] = None,
+                       fields: Optional[List[str]] = None) -> AsyncIterator[DocumentsDocumentListModel]:
+        """Export (`async for`) all the documents matching the filters,
+        fetching many pages at a time, see `SignerClient.scan_documents`."""
+        self._check_pageable(response_format)
+        fields = item_fields(fields, 'id')
+        fetches = [
+            functools.partial(self._fetch_documents,
+                              dict(filters, q=query, order=order),
+                              response_format, fields)
+            for filters in self._document_partitions(
+                dict(status=status, folder_id=folder_id,
+                     document_type=document_type, tags=tags), partitions)
+        ]
+        return ascan_items(
+            fetches,
+            self.configuration.page_size if page_size is None else page_size,
+            parallelism=(self.configuration.scan_parallelism
+                         if parallelism is None else parallelism),
+            overlap=overlap)
+
+    async def get_document_content(self, document_id: str,
+                                   download_type: Optional[DocumentDownloadTypes] = None) -> bytes:
+        """Get document content as bytes."""
+        response = await self._open_document_content(document_id, download_type)
+        try:
+            return await response.read()
+        finally:
+            response.release()
+
+    async def download_document(self, document_id: str,
+                                destination: Union[str, os.PathLike, BinaryIO],
+                                download_type: Optional[DocumentDownloadTypes] = None,
+                                chunk_size: int = DEFAULT_CHUNK_SIZE,
+                                progress: Optional[Callable[[int, Optional[int]], None]] = None,
+                                expected_digest: Optional[str] = None,
+                                algorithm: str = 'sha256') -> DownloadResult:
+        """Stream document content to a file or a writable object."""
+        response = await self._open_document_content(document_id, download_type)
+        return await async_download_response(
+            response, destination, chunk_size=chunk_size, progress=progress,
+            algorithm=algorithm, expected_digest=expected_digest)
+
+    async def _open_document_content(self, document_id: str,
+                                     download_type: Optional[DocumentDownloadTypes] = None):
+        """Request document content without reading the response body."""
+        kwargs = {'_preload_content': False}
+        if download_type is not None:
+            kwargs['type'] = download_type
+        return await self.documents_api.api_documents_id_content_get(document_id, **kwargs)
+
+    async def get_document_content_b64(self, document_id: str) -> str:
+        """Get document content as base64 string."""
+        return await self.documents_api.api_documents_id_content_b64_get(document_id)
+
+    async def get_document_signatures_details(self, document_id: str,
+                                              response_format: Optional[str] = None,
+                                              fields: Optional[List[str]] = None) -> DocumentsDocumentSignaturesInfoModel:
+        """Get detailed signature information for a document."""
+        return await self.documents_api.api_documents_id_signatures_details_get(
+            document_id, _response_format=response_format or self.response_format, _fields=fields)
+
+    async def get_document_ticket(self, document_id: str) -> TicketModel:
+        """Get document ticket for signing."""
+        return await self.documents_api.api_documents_id_ticket_get(document_id)
+
+    async def delete_document(self, document_id: str) -> None:
+        """Delete a document."""
+        await self.documents_api.api_documents_id_delete(document_id)
+
+    async def move_document_to_folder(self, document_id: str, folder_id: str) -> None:
+        """Move a document to a specific folder."""
+        request = DocumentsMoveDocumentRequest(folder_id=folder_id)
+        await self.documents_api.api_documents_id_folder_post(document_id, body=request)
+
+    async def move_documents_batch_to_folder(self, document_ids: List[str], folder_id: str) -> List[BatchItemResultModel]:
+        """Move multiple documents to a folder in batch."""
+        request = DocumentsMoveDocumentBatchRequest(
+            documents=document_ids,
+            folder_id=folder_id
+        )
+        return await self.documents_api.api_documents_batch_folder_post(body=request)
+
+    async def update_document_notified_emails(self, document_id: str, emails: List[str]) -> None:
+        """Update the emails that will be notified when document is concluded."""
+        request = DocumentsDocumentNotifiedEmailsEditRequest(emails=emails)
+        await self.documents_api.api_documents_id_notified_emails_put(document_id, body=request)
+
+    async def create_document_version(self, document_id: str, version_request: DocumentsDocumentAddVersionRequest) -> DocumentsDocumentModel:
+        """Create a new version of a document."""
+        return await self.documents_api.api_documents_id_versions_post(document_id, body=version_request)
+
+    async def create_document_envelope_version(self, document_id: str, envelope_request: DocumentsEnvelopeAddVersionRequest) -> DocumentsDocumentModel:
+        """Create a new envelope version of a document."""
+        return await self.documents_api.api_documents_id_envelope_versions_post(document_id, body=envelope_request)
+
+    async def get_signatures_by_key(self, key: str) -> DocumentsDocumentSignaturesInfoModel:
+        """Get signatures by document key."""
+        return await self.documents_api.api_documents_keys_key_signatures_get(key)
+
+    async def validate_signatures(self, validation_request: SignatureSignaturesInfoRequest) -> List[SignerModel]:
+        """Validate document signatures."""
+        return await self.documents_api.api_documents_validate_signatures_post(body=validation_request)
+
+    async def create_action_url(self, document_id: str, action_request: DocumentsActionUrlRequest) -> DocumentsActionUrlResponse:
+        """Create an action URL for document signing."""
+        return await self.documents_api.api_documents_id_action_url_post(document_id, body=action_request)
+
+    async def cancel_document(self, document_id: str, cancellation_request: DocumentsCancelDocumentRequest) -> None:
+        """Cancel a document."""
+        await self.documents_api.api_documents_id_cancellation_post(document_id, body=cancellation_request)
+
+    async def refuse_document(self, document_id: str, refusal_request: RefusalRefusalRequest) -> None:
+        """Refuse a document."""
+        await self.documents_api.api_documents_id_refusal_post(document_id, body=refusal_request)
+
+    async def create_document_flow(self, document_id: str, flow_request: DocumentsDocumentFlowEditRequest) -> DocumentsDocumentModel:
+        """Create a signature flow for a document."""
+        return await self.documents_api.api_documents_id_flow_post(document_id, body=flow_request)
+
+    # ============================================================================
+    # FOLDER MANAGEMENT
+    # ============================================================================
+
+    async def create_folder(self, folder_request: FoldersFolderCreateRequest) -> FoldersFolderInfoModel:
+        """Create a new folder."""
+        return await self.folders_api.api_folders_post(body=folder_request)
+
+    async def get_folder(self, folder_id: str) -> FoldersFolderInfoModel:
+        """Get folder details by ID."""
+        return await self.folders_api.api_folders_id_get(folder_id)
+
+    async def list_folders(self,
+                           query: Optional[str] = None,
+                           limit: int = 20,
+                           offset: int = 0,
+                           order: Optional[PaginationOrders] = None,
+                           parent_id: Optional[str] = None,
+                           response_format: Optional[str] = None,
+                           fields: Optional[List[str]] = None) -> PaginatedSearchResponseFoldersFolderInfoModel:
+        """List folders with optional filtering."""
+        return await self.folders_api.api_folders_get(
+            q=query,
+            limit=limit,
+            offset=offset,
+            order=order,
+            filter_by_parent=parent_id is not None,
+            parent_id=parent_id,
+            _response_format=response_format or self.response_format,
+            _fields=fields
+        )
+
+    def iter_folders(self,
+                     query: Optional[str] = None,
+                     order: Optional[PaginationOrders] = None,
+                     parent_id: Optional[str] = None,
+                     page_size: Optional[int] = None,
+                     prefetch: Optional[int] = None,
+                     response_format: Optional[str] = None,
+                     fields: Optional[List[str]] = None) -> AsyncIterator[FoldersFolderInfoModel]:
+        """Iterate (`async for`) over all the folders matching the filters."""
+        fields = item_fields(fields)
+        return self._iter_items(
+            lambda offset, limit: self.folders_api.api_folders_get(
+                q=query,
+                limit=limit,
+                offset=offset,
+                order=order,
+                filter_by_parent=parent_id is not None,
+                parent_id=parent_id,
+                _response_format=response_format or self.response_format,
+                _fields=fields
+            ),
+            page_size, prefetch, response_format)
+
+    async def delete_folder(self, folder_id: str, delete_request: FoldersFolderDeleteRequest) -> None:
+        """Delete a folder."""
+        await self.folders_api.api_folders_id_delete_post(folder_id, body=delete_request)
+
+    # ============================================================================
+    # SIGNATURE FLOW MANAGEMENT
+    # ============================================================================
+
+    async def create_signature_flow(self,
+                                    document_id: str,
+                                    signers: List[Dict],
+                                    title: Optional[str] = None,
+                                    description: Optional[str] = None,
+                                    expires_at: Optional[str] = None) -> DocumentFlowsDocumentFlowModel:
+        """Create a signature flow, see `SignerClient.create_signature_flow`."""
+        flow_actions = []
+        for i, signer in enumerate(signers):
+            action = FlowActionsFlowActionCreateModel(
+                type=FlowActionType.SIGNER,
+                step=i + 1,
+                user=UsersParticipantUserModel(
+                    name=signer['name'],
+                    email=signer['email'],
+                    identifier=signer.get('identifier')
+                ),
+
+                authentication_type=signer.get('authentication_type', AuthenticationTypes.EMAIL)
+            )
+            flow_actions.append(action)
+
+        flow_request = DocumentFlowsDocumentFlowCreateRequest(
+            title=title,
+            description=description,
+            expires_at=expires_at,
+            flow_actions=flow_actions
+        )
+
+        return await self.flows_api.api_document_flows_post(body=flow_request)
+
+    async def get_signature_flow(self, flow_id: str) -> DocumentFlowsDocumentFlowModel:
+        """Get signature flow details."""
+        return await self.flows_api.api_document_flows_id_get(flow_id)
+
+    async def list_signature_flows(self, limit: int = 20, offset: int = 0,
+                                   response_format: Optional[str] = None,
+                                   fields: Optional[List[str]] = None) -> List[DocumentFlowsDocumentFlowModel]:
+        """List signature flows."""
+        if fields is not None:
+            fields = ['items.' + field for field in
+                      ([fields] if isinstance(fields, str) else fields)]
+        response = await self.flows_api.api_document_flows_get(
+            limit=limit, offset=offset,
+            _response_format=response_format or self.response_format, _fields=fields)
+        if isinstance(response, dict):
+            return response.get('items')
+        return response.items if hasattr(response, 'items') else response
+
+    def iter_signature_flows(self,
+                             page_size: Optional[int] = None,
+                             prefetch: Optional[int] = None,
+                             response_format: Optional[str] = None,
+                             fields: Optional[List[str]] = None) -> AsyncIterator[DocumentFlowsDocumentFlowModel]:
+        """Iterate (`async for`) over all the signature flows."""
+        fields = item_fields(fields)
+        return self._iter_items(
+            lambda offset, limit: self.flows_api.api_document_flows_get(
+                limit=limit, offset=offset,
+                _response_format=response_format or self.response_format, _fields=fields),
+            page_size, prefetch, response_format)
+
+    async def cancel_signature_flow(self, flow_id: str, reason: Optional[str] = None) -> None:
+        """Cancel a signature flow."""
+        await self.flows_api.api_document_flows_id_delete(flow_id)
+
+    async def update_signature_flow(self, flow_id: str, flow_request: DocumentFlowsDocumentFlowCreateRequest) -> DocumentFlowsDocumentFlowModel:
+        """Update a signature flow."""
+        return await self.flows_api.api_document_flows_id_put(flow_id, body=flow_request)
+
+    async def delete_signature_flow(self, flow_id: str) -> None:
+        """Delete a signature flow."""
+        return await self.flows_api.api_document_flows_id_delete(flow_id)
+
+    # ============================================================================
+    # FILE UPLOAD
+    # ============================================================================
+
+    async def upload_file(self, file_path: Union[str, os.PathLike, BinaryIO]) -> FileModel:
+        """Upload a file using multipart/form-data, streamed from disk."""
+        if isinstance(file_path, str):
+            file_path = Path(file_path)
+        return await self.upload_api.api_uploads_post(file=file_path)
+
+    async def upload_file_bytes(self, file_bytes: Union[bytes, memoryview, str, os.PathLike, BinaryIO]) -> UploadModel:
+        """Upload file bytes (or a path or stream), base64-encoded while sent."""
+        return await self.upload_api.api_uploads_bytes_post(body=Base64JsonBody(file_bytes))
+
+    # ============================================================================
+    # NOTIFICATIONS
+    # ============================================================================
+
+    async def send_reminder(self, flow_action_id: str, message: Optional[str] = None) -> None:
+        """Send a reminder to a signer."""
+        request = {
+            'flow_action_id': flow_action_id
+        }
+        if message:
+            request['message'] = message
+
+        await self.notifications_api.api_notifications_flow_action_reminder_post(body=request)
+
+    async def notify_pending_users(self, email_list: List[str]) -> None:
+        """Send notifications to users with pending actions."""
+        request = {
+            'email_list': email_list
+        }
+
+        await self.notifications_api.api_users_notify_pending_post(body=request)
+
+    # ============================================================================
+    # ORGANIZATION MANAGEMENT
+    # ============================================================================
+
+    async def get_organization_info(self):
+        """Get current organization information."""
+        return await self.organizations_api.api_organizations_get()
+
+    async def list_organization_users(self,
+                                      query: Optional[str] = None,
+                                      limit: int = 20,
+                                      offset: int = 0,
+                                      order: Optional[PaginationOrders] = None,
+                                      response_format: Optional[str] = None,
+                                      fields: Optional[List[str]] = None) -> PaginatedSearchResponseOrganizationsOrganizationUserModel:
+        """List organization users."""
+        return await self.organizations_api.api_organizations_users_get(
+            q=query,
+            limit=limit,
+            offset=offset,
+            order=order,
+            _response_format=response_format or self.response_format,
+            _fields=fields
+        )
+
+    def iter_organization_users(self,
+                                query: Optional[str] = None,
+                                order: Optional[PaginationOrders] = None,
+                                page_size: Optional[int] = None,
+                                prefetch: Optional[int] = None,
+                                response_format: Optional[str] = None,
+                                fields: Optional[List[str]] = None) -> AsyncIterator[OrganizationsOrganizationUserModel]:
+        """Iterate (`async for`) over all the users of the organization."""
+        fields = item_fields(fields)
+        return self._iter_items(
+            lambda offset, limit: self.organizations_api.api_organizations_users_get(
+                q=query,
+                limit=limit,
+                offset=offset,
+                order=order,
+                _response_format=response_format or self.response_format,
+                _fields=fields
+            ),
+            page_size, prefetch, response_format)
+
+    async def add_organization_user(self, user_request: OrganizationsOrganizationUserPostRequest) -> OrganizationsOrganizationUserModel:
+        """Add a user to the organization."""
+        return await self.organizations_api.api_organizations_users_post(body=user_request)
+
+    async def remove_organization_user(self, user_id: str) -> None:
+        """Remove a user from the organization."""
+        await self.organizations_api.api_organizations_users_user_id_delete(user_id)
+
+    # ============================================================================
+    # MARKS SESSIONS
+    # ============================================================================
+
+    async def create_marks_session(self, session_request: DocumentMarkMarksSessionCreateRequest) -> DocumentMarkMarksSessionCreateResponse:
+        """Create a mark positioning session."""
+        return await self.marks_sessions_api.api_marks_sessions_post(body=session_request)
+
+    async def create_marks_session_from_document(self, document_request: DocumentsCreateDocumentRequest) -> DocumentMarkMarksSessionCreateResponse:
+        """Create a mark positioning session from a document request."""
+        return await self.marks_sessions_api.api_marks_sessions_documents_post(body=document_request)
+
+    async def get_marks_session(self, session_id: str) -> DocumentMarkMarksSessionModel:
+        """Get marks session details."""
+        return await self.marks_sessions_api.api_marks_sessions_id_get(session_id)
+
+    # ============================================================================
+    # HIGH-LEVEL OPERATIONS
+    # ============================================================================
+
+    async def sign_document_simple(self, request: DocumentsCreateDocumentRequest) -> DocumentsDocumentModel:
+        """Create a document and signature flow in one operation."""
+        return await self.documents_api.api_documents_post(body=request)
+
+    async def create_document_with_signer(self,
+                                          file_upload: FileUploadModel,
+                                          title: str,
+                                          signer: UsersParticipantUserModel,
+                                          flow_action: FlowActionsFlowActionCreateModel,
+                                          folder_id: Optional[str] = None) -> DocumentsDocumentModel:
+        """Create a document with a signature flow using model objects."""
+        document_request = DocumentsCreateDocumentRequest(
+            files=[file_upload],
+            flow_actions=[flow_action],
+            folder_id=folder_id
+        )
+
+        return await self.documents_api.api_documents_post(body=document_request)
+
+    async def get_document_status(self, document_id: str) -> str:
+        """Get the current status of a document."""
+        document = await self.get_document(document_id, response_format=MODEL)
+        return document.status if document.status else "Unknown"
+
+    async def get_signing_url(self, document_id: str, signer_email: str) -> str:
+        """Get the signing URL for a specific signer."""
+        action_request = DocumentsActionUrlRequest(
+            email_address=signer_email
+        )
+        action_url = await self.documents_api.api_documents_id_action_url_post(
+            document_id, body=action_request, _response_format=MODEL)
+        return action_url.url
+
+    async def download_signed_document(self, document_id: str, output_path: str,
+                                       **kwargs) -> DownloadResult:
+        """Download a signed document to a local file."""
+        return await self.download_document(document_id, output_path, **kwargs)
+
+    async def get_document_summary(self, document_id: str) -> Dict[str, Any]:
+        """
+        Get a summary of document information.
+
+        The document and its signatures are fetched concurrently.
+        """
+        document, signatures = await asyncio.gather(
+            self.get_document(document_id, response_format=MODEL),
+            self.get_document_signatures_details(document_id,
+                                                 response_format=MODEL))
+
+        return {
+            'id': document.id,
+            'title': document.title,
+            'status': document.status.value if document.status else None,
+            'created_at': document.created_at,
+            'updated_at': document.updated_at,
+            'signature_count': len(signatures.signatures) if signatures.signatures else 0,
+            'is_concluded': document.is_concluded,
+            'folder_id': document.folder_id
+        }
+
+    # ============================================================================
+    # UTILITY METHODS
+    # ============================================================================
+
+    def _check_pageable(self, response_format: Optional[str]) -> None:
+        """Reject the raw format, whose pages cannot be read."""
+        if (response_format or self.response_format) == RAW:
+            raise ValueError("Raw responses cannot be paginated, use the "
+                             "'model' or 'dict' response format")
+
+    @staticmethod
+    def _document_partitions(filters: Dict[str, Any],
+                             partitions: Optional[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Filters of each partition of scan_documents."""
+        if partitions is None:
+            return [filters]
+        result = []
+        for partition in partitions:
+            unknown = set(partition) - set(filters)
+            if unknown:
+                raise ValueError("Documents cannot be partitioned by %s, only "
+                                 "by %s" % (', '.join(sorted(unknown)),
+                                            ', '.join(filters)))
+            result.append(dict(filters, **partition))
+        return result
+
+    async def _fetch_documents(self, filters: Dict[str, Any],
+                               response_format: Optional[str], fields: Optional[tuple],
+                               offset: int, limit: int) -> PaginatedSearchResponseDocumentsDocumentListModel:
+        """Fetch a page of documents for scan_documents, sending only the
+        filters that are set."""
+        filters = {name: value for name, value in filters.items()
+                   if value is not None}
+        return await self.documents_api.api_documents_get(
+            limit=limit, offset=offset, _response_format=response_format or self.response_format,
+            _fields=fields, **filters)
+
+    def _iter_items(self, fetch: Callable, page_size: Optional[int],
+                    prefetch: Optional[int],
+                    response_format: Optional[str]) -> AsyncIterator[Any]:
+        """Iterate over the items of a listing, see signer_client.pagination."""
+        self._check_pageable(response_format)
+        return aiter_items(
+            fetch,
+            self.configuration.page_size if page_size is None else page_size,
+            prefetch=(self.configuration.prefetch_pages if prefetch is None
+                      else prefetch))
+
+    async def close(self):
+        """Close the API client and release its connections."""
+        await self.api_client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
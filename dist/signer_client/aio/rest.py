@@ -0,0 +1,338 @@
+# coding: utf-8
+
+"""
+asyncio REST layer for the Signer client, built on aiohttp.
+
+Mirrors `signer_client.rest.RESTClientObject`, but every request is a
+coroutine and all connections are multiplexed by a single
+`aiohttp.ClientSession`, so one event loop can keep many requests in flight
+without a thread per request.
+"""
+
+from __future__ import absolute_import
+
+import asyncio
+import io
+import logging
+import re
+import ssl
+
+import certifi
+from six.moves.urllib.parse import urlencode
+
+try:
+    import aiohttp
+except ImportError:
+    raise ImportError(
+        'The asyncio Signer client requires aiohttp '
+        '(pip install signer-python-client[asyncio]).')
+
+from signer_client.codec import get_codec
+from signer_client.deadline import (
+    DeadlineExceeded, cap_timeout, time_left, within_deadline
+)
+from signer_client.compression import (
+    TransferStats, accept_encoding, compress_request
+)
+from signer_client.rest import ApiException
+from signer_client.streaming import StreamingBody
+
+
+logger = logging.getLogger(__name__)
+
+
+class RESTResponse(io.IOBase):
+
+    def __init__(self, resp, data):
+        self.aiohttp_response = resp
+        self.status = resp.status
+        self.reason = resp.reason
+        self.data = data
+
+    def getheaders(self):
+        """Returns a dictionary of the response headers."""
+        return self.aiohttp_response.headers
+
+    def getheader(self, name, default=None):
+        """Returns a given response header."""
+        return self.aiohttp_response.headers.get(name, default)
+
+
+class AsyncRESTClientObject(object):
+
+    def __init__(self, configuration, pools_size=4, maxsize=None):
+        # maxsize is the number of requests to host that are allowed in
+        # parallel, `pools_size` is kept for signature compatibility with
+        # the blocking client: aiohttp keeps a single pool per session.
+        if maxsize is None:
+            if configuration.connection_pool_maxsize is not None:
+                maxsize = configuration.connection_pool_maxsize
+            else:
+                maxsize = 4
+        self.configuration = configuration
+        self.maxsize = maxsize
+        self.proxy = configuration.proxy
+
+        if configuration.verify_ssl:
+            # ca_certs
+            if configuration.ssl_ca_cert:
+                ca_certs = configuration.ssl_ca_cert
+            else:
+                # if not set certificate file, use Mozilla's root certificates.
+                ca_certs = certifi.where()
+            self.ssl_context = ssl.create_default_context(cafile=ca_certs)
+            if configuration.assert_hostname is False:
+                self.ssl_context.check_hostname = False
+        else:
+            self.ssl_context = ssl.create_default_context()
+            self.ssl_context.check_hostname = False
+            self.ssl_context.verify_mode = ssl.CERT_NONE
+        if configuration.cert_file:
+            self.ssl_context.load_cert_chain(
+                configuration.cert_file, keyfile=configuration.key_file)
+
+        self._session = None
+        # bytes sent and received, compressed and decoded
+        self.transfer_stats = TransferStats()
+
+    @property
+    def session(self):
+        """The aiohttp session, created on first use.
+
+        aiohttp sessions must be created with a running event loop, so it
+        cannot be built in the constructor.
+        """
+        if self._session is None or self._session.closed:
+            keepalive = {}
+            idle_timeout = getattr(self.configuration,
+                                   'connection_idle_timeout', None)
+            if idle_timeout is not None:
+                keepalive['keepalive_timeout'] = idle_timeout
+            connector = aiohttp.TCPConnector(limit=self.maxsize,
+                                             ssl=self.ssl_context,
+                                             **keepalive)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self):
+        """Closes the session and all its pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def request(self, method, url, query_params=None, headers=None,
+                      body=None, post_params=None, _preload_content=True,
+                      _request_timeout=None, _retry_policy=None,
+                      _throttle=None):
+        """Perform requests.
+
+        :param method: http request method
+        :param url: http request url
+        :param query_params: query parameters in the url
+        :param headers: http request headers
+        :param body: request json body, for `application/json`
+        :param post_params: request post parameters,
+                            `application/x-www-form-urlencoded`
+                            and `multipart/form-data`
+        :param _preload_content: if False, the aiohttp.ClientResponse object
+                                 will be returned without reading the
+                                 response body. Default is True.
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :param _retry_policy: `signer_client.retry.RetryPolicy` for this
+                              request, defaults to `configuration.retries`.
+        :param _throttle: coroutine function waiting for the rate limiter,
+                          awaited before every attempt, retries included.
+        """
+        method = method.upper()
+        assert method in ['GET', 'HEAD', 'DELETE', 'POST', 'PUT',
+                          'PATCH', 'OPTIONS']
+
+        if post_params and body:
+            raise ValueError(
+                "body parameter cannot be used with post_params parameter."
+            )
+
+        post_params = post_params or {}
+        headers = headers or {}
+
+        timeout = None
+        if _request_timeout:
+            if isinstance(_request_timeout, (int, float)):
+                timeout = _request_timeout
+            elif (isinstance(_request_timeout, tuple) and
+                  len(_request_timeout) == 2):
+                timeout = _request_timeout
+
+        if 'Content-Type' not in headers:
+            headers['Content-Type'] = 'application/json'
+        if 'Accept-Encoding' not in headers:
+            # aiohttp decodes the responses
+            headers['Accept-Encoding'] = accept_encoding(self.configuration)
+
+        args = {
+            'proxy': self.proxy,
+            'headers': headers,
+        }
+        if query_params:
+            url += '?' + urlencode(query_params)
+        form_params = None
+
+        # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
+        if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
+            if isinstance(body, StreamingBody):
+                # encoded while sending, see `signer_client.streaming`
+                headers['Content-Type'] = body.content_type
+                if body.length is not None:
+                    headers['Content-Length'] = str(body.length)
+                args['data'] = body
+            elif re.search('json', headers['Content-Type'], re.IGNORECASE):
+                request_body = b'{}'
+                if body is not None:
+                    request_body = get_codec(self.configuration).dumps(body)
+                args['data'] = request_body
+            elif headers['Content-Type'] in ('application/x-www-form-urlencoded',  # noqa: E501
+                                             'multipart/form-data'):
+                # aiohttp generates the Content-Type (and the multipart
+                # boundary) from the form data itself.
+                del headers['Content-Type']
+                form_params = post_params
+            # Pass a `string` parameter directly in the body to support
+            # other content types than Json when `body` argument is
+            # provided in serialized form
+            elif isinstance(body, str):
+                args['data'] = body
+            else:
+                # Cannot generate the request from given parameters
+                msg = """Cannot prepare a request message for provided
+                         arguments. Please check that your arguments match
+                         declared content type."""
+                raise ApiException(status=0, reason=msg)
+
+        if args.get('data') is not None and 'Content-Encoding' not in headers:
+            args['data'], encoding = compress_request(
+                args['data'], headers['Content-Type'],
+                getattr(self.configuration, 'request_compression', None),
+                getattr(self.configuration, 'request_compression_min_size', 0),
+                self.transfer_stats)
+            if encoding:
+                headers['Content-Encoding'] = encoding
+                headers.pop('Content-Length', None)
+
+        if _retry_policy is None:
+            _retry_policy = getattr(self.configuration, 'retries', None)
+        r = await self._send(_retry_policy, method, url, form_params, args,
+                             timeout, _throttle)
+
+        if _preload_content or not 200 <= r.status <= 299:
+            data = await r.read()
+            self._record_response(r, data)
+            r = RESTResponse(r, data)
+
+            # log response body
+            logger.debug("response body: %s", r.data)
+
+        if not 200 <= r.status <= 299:
+            raise ApiException(http_resp=r)
+
+        return r
+
+    def _record_response(self, response, data):
+        """Counts the size of a read response, on the wire and decoded.
+
+        aiohttp does not expose the raw byte count, the `Content-Length` is
+        used when the server sent one.
+        """
+        on_wire = response.content_length
+        if on_wire is None:
+            on_wire = len(data)
+        self.transfer_stats.record_response(
+            on_wire, len(data), response.headers.get('Content-Encoding'))
+
+    async def _send(self, policy, method, url, form_params, args,
+                    timeout=None, throttle=None):
+        """Sends a request, retrying per `policy`.
+
+        `form_params` are converted to a new `aiohttp.FormData` for every
+        attempt, as aiohttp refuses to send the same one twice. Each attempt
+        awaits `throttle`, if any, so that retries count against the rate
+        limit too, and gets `timeout` capped to the time left before the
+        deadline of the operation, see `signer_client.deadline`.
+        """
+        attempt = 0
+        while True:
+            if throttle is not None:
+                await throttle()
+            if form_params is not None:
+                args['data'] = self._form_data(form_params)
+            args.pop('timeout', None)
+            if timeout is not None or time_left() is not None:
+                args['timeout'] = _client_timeout(cap_timeout(timeout))
+            if policy is not None:
+                policy.stats.record_attempt()
+            try:
+                r = await self.session.request(method, url, **args)
+            except aiohttp.ClientSSLError as e:
+                msg = "{0}\n{1}".format(type(e).__name__, str(e))
+                raise ApiException(status=0, reason=msg)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                left = time_left()
+                if left is not None and left <= 0:
+                    raise DeadlineExceeded('Deadline exceeded: %r' % e)
+                delay = None
+                if policy is not None and policy.should_retry(method, attempt):
+                    delay = within_deadline(policy.sleep_time(attempt))
+                if delay is None:
+                    if policy is not None:
+                        policy.stats.record_outcome(attempt > 0, False)
+                    raise
+                cause = type(e).__name__
+            else:
+                if (policy is None or 200 <= r.status <= 299 or
+                        not policy.should_retry(method, attempt, r.status)):
+                    break
+                cause = r.status
+                delay = within_deadline(
+                    policy.sleep_time(attempt, r.status, r.headers))
+                if delay is None:
+                    break
+                r.release()
+
+            policy.stats.record_retry(cause, delay)
+            logger.info("retrying %s %s in %.2fs after %s (retry %d of %d)",
+                        method, url, delay, cause, attempt + 1, policy.total)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        if policy is not None:
+            policy.stats.record_outcome(attempt > 0, 200 <= r.status <= 299)
+        return r
+
+    @staticmethod
+    def _form_data(post_params):
+        """Converts `ApiClient.prepare_post_parameters` output to FormData."""
+        if isinstance(post_params, dict):
+            post_params = post_params.items()
+        data = aiohttp.FormData()
+        for k, v in post_params:
+            if isinstance(v, tuple):
+                filename, filedata, mimetype = v
+                if isinstance(filedata, str):
+                    # a path: aiohttp streams the file and closes it
+                    filedata = open(filedata, 'rb')
+                data.add_field(k, filedata, filename=filename,
+                               content_type=mimetype)
+            else:
+                data.add_field(k, str(v))
+        return data
+
+
+def _client_timeout(timeout):
+    """Converts a number (total) or a (connection, read) tuple to an
+    `aiohttp.ClientTimeout`."""
+    if isinstance(timeout, tuple):
+        return aiohttp.ClientTimeout(sock_connect=timeout[0],
+                                     sock_read=timeout[1])
+    return aiohttp.ClientTimeout(total=timeout)
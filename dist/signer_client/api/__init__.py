@@ -2,11 +2,45 @@ from __future__ import absolute_import
 
 # flake8: noqa
 
-# import apis into api package
-from signer_client.api.documents_api import DocumentsApi
-from signer_client.api.flows_api import FlowsApi
-from signer_client.api.folders_api import FoldersApi
-from signer_client.api.marks_sessions_api import MarksSessionsApi
-from signer_client.api.notifications_api import NotificationsApi
-from signer_client.api.organizations_api import OrganizationsApi
-from signer_client.api.upload_api import UploadApi
+import importlib
+
+# APIs are imported on first access (PEP 562), see `signer_client`. The
+# imports below are only seen by type checkers.
+TYPE_CHECKING = False  # as typing.TYPE_CHECKING, without importing typing
+if TYPE_CHECKING:
+    # import apis into api package
+    from signer_client.api.documents_api import DocumentsApi
+    from signer_client.api.flows_api import FlowsApi
+    from signer_client.api.folders_api import FoldersApi
+    from signer_client.api.marks_sessions_api import MarksSessionsApi
+    from signer_client.api.notifications_api import NotificationsApi
+    from signer_client.api.organizations_api import OrganizationsApi
+    from signer_client.api.upload_api import UploadApi
+
+# API class name -> module
+_MODULES = {
+    'DocumentsApi': 'documents_api',
+    'FlowsApi': 'flows_api',
+    'FoldersApi': 'folders_api',
+    'MarksSessionsApi': 'marks_sessions_api',
+    'NotificationsApi': 'notifications_api',
+    'OrganizationsApi': 'organizations_api',
+    'UploadApi': 'upload_api',
+}
+
+__all__ = sorted(_MODULES)
+
+
+def __getattr__(name):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(
+            "module '%s' has no attribute '%s'" % (__name__, name))
+    value = getattr(importlib.import_module('%s.%s' % (__name__, module)),
+                    name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODULES))
@@ -14,10 +14,514 @@ from __future__ import absolute_import
 
 import re  # noqa: F401
 
-# python 2 and python 3 compatibility library
-import six
-
 from signer_client.api_client import ApiClient
+from signer_client.operations import Operation
+
+# operation name -> descriptor, see `signer_client.operations`
+OPERATIONS = {operation.name: operation for operation in [
+    Operation(
+        'api_documents_batch_folder_post', 'POST', '/api/documents/batch/folder',
+        params=[
+            'body',
+        ],
+        body_param='body',
+        accept=[
+            'text/plain',
+            'application/json',
+            'text/json',
+        ],
+        content_types=[
+            'application/json-patch+json',
+            'application/json',
+            'text/json',
+            'application/*+json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        response_type='list[BatchItemResultModel]',
+        collection_formats={
+        }),
+    Operation(
+        'api_documents_get', 'GET', '/api/documents',
+        params=[
+            'is_concluded',
+            'status',
+            'folder_id',
+            'folder_type',
+            'document_type',
+            'filter_by_document_type',
+            'filter_by_pending_signature',
+            'query_type',
+            'participant_q',
+            'participant_query_type',
+            'tags',
+            'is_deleted',
+            'q',
+            'limit',
+            'offset',
+            'order',
+        ],
+        query_params=[
+            ('IsConcluded', 'is_concluded'),
+            ('Status', 'status'),
+            ('FolderId', 'folder_id'),
+            ('FolderType', 'folder_type'),
+            ('DocumentType', 'document_type'),
+            ('FilterByDocumentType', 'filter_by_document_type'),
+            ('FilterByPendingSignature', 'filter_by_pending_signature'),
+            ('QueryType', 'query_type'),
+            ('ParticipantQ', 'participant_q'),
+            ('ParticipantQueryType', 'participant_query_type'),
+            ('Tags', 'tags'),
+            ('IsDeleted', 'is_deleted'),
+            ('Q', 'q'),
+            ('Limit', 'limit'),
+            ('Offset', 'offset'),
+            ('Order', 'order'),
+        ],
+        accept=[
+            'text/plain',
+            'application/json',
+            'text/json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        response_type='PaginatedSearchResponseDocumentsDocumentListModel',
+        collection_formats={
+        }),
+    Operation(
+        'api_documents_id_action_url_post', 'POST', '/api/documents/{id}/action-url',
+        params=[
+            'id',
+            'body',
+        ],
+        positional=[
+            'id',
+        ],
+        path_params=[
+            ('id', 'id'),
+        ],
+        body_param='body',
+        accept=[
+            'text/plain',
+            'application/json',
+            'text/json',
+        ],
+        content_types=[
+            'application/json-patch+json',
+            'application/json',
+            'text/json',
+            'application/*+json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        response_type='DocumentsActionUrlResponse',
+        collection_formats={
+        }),
+    Operation(
+        'api_documents_id_cancellation_post', 'POST', '/api/documents/{id}/cancellation',
+        params=[
+            'id',
+            'body',
+        ],
+        positional=[
+            'id',
+        ],
+        path_params=[
+            ('id', 'id'),
+        ],
+        body_param='body',
+        accept=[
+            'application/json',
+        ],
+        content_types=[
+            'application/json-patch+json',
+            'application/json',
+            'text/json',
+            'application/*+json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        collection_formats={
+        }),
+    Operation(
+        'api_documents_id_content_b64_get', 'GET', '/api/documents/{id}/content-b64',
+        params=[
+            'id',
+            'type',
+        ],
+        positional=[
+            'id',
+        ],
+        path_params=[
+            ('id', 'id'),
+        ],
+        query_params=[
+            ('type', 'type'),
+        ],
+        accept=[
+            'text/plain',
+            'application/json',
+            'text/json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        response_type='DocumentsDocumentContentModel',
+        collection_formats={
+        }),
+    Operation(
+        'api_documents_id_content_get', 'GET', '/api/documents/{id}/content',
+        params=[
+            'id',
+            'type',
+        ],
+        positional=[
+            'id',
+        ],
+        path_params=[
+            ('id', 'id'),
+        ],
+        query_params=[
+            ('type', 'type'),
+        ],
+        accept=[
+            'application/json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        collection_formats={
+        }),
+    Operation(
+        'api_documents_id_delete', 'DELETE', '/api/documents/{id}',
+        params=[
+            'id',
+        ],
+        positional=[
+            'id',
+        ],
+        path_params=[
+            ('id', 'id'),
+        ],
+        accept=[
+            'application/json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        collection_formats={
+        }),
+    Operation(
+        'api_documents_id_envelope_versions_post', 'POST', '/api/documents/{id}/envelope/versions',
+        params=[
+            'id',
+            'body',
+        ],
+        positional=[
+            'id',
+        ],
+        path_params=[
+            ('id', 'id'),
+        ],
+        body_param='body',
+        accept=[
+            'application/json',
+        ],
+        content_types=[
+            'application/json-patch+json',
+            'application/json',
+            'text/json',
+            'application/*+json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        collection_formats={
+        }),
+    Operation(
+        'api_documents_id_flow_post', 'POST', '/api/documents/{id}/flow',
+        params=[
+            'id',
+            'body',
+        ],
+        positional=[
+            'id',
+        ],
+        path_params=[
+            ('id', 'id'),
+        ],
+        body_param='body',
+        accept=[
+            'text/plain',
+            'application/json',
+            'text/json',
+        ],
+        content_types=[
+            'application/json-patch+json',
+            'application/json',
+            'text/json',
+            'application/*+json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        response_type='FlowActionsDocumentFlowEditResponse',
+        collection_formats={
+        }),
+    Operation(
+        'api_documents_id_folder_post', 'POST', '/api/documents/{id}/folder',
+        params=[
+            'id',
+            'body',
+        ],
+        positional=[
+            'id',
+        ],
+        path_params=[
+            ('id', 'id'),
+        ],
+        body_param='body',
+        accept=[
+            'application/json',
+        ],
+        content_types=[
+            'application/json-patch+json',
+            'application/json',
+            'text/json',
+            'application/*+json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        collection_formats={
+        }),
+    Operation(
+        'api_documents_id_get', 'GET', '/api/documents/{id}',
+        params=[
+            'id',
+        ],
+        positional=[
+            'id',
+        ],
+        path_params=[
+            ('id', 'id'),
+        ],
+        accept=[
+            'text/plain',
+            'application/json',
+            'text/json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        response_type='DocumentsDocumentModel',
+        collection_formats={
+        }),
+    Operation(
+        'api_documents_id_notified_emails_put', 'PUT', '/api/documents/{id}/notified-emails',
+        params=[
+            'id',
+            'body',
+        ],
+        positional=[
+            'id',
+        ],
+        path_params=[
+            ('id', 'id'),
+        ],
+        body_param='body',
+        accept=[
+            'application/json',
+        ],
+        content_types=[
+            'application/json-patch+json',
+            'application/json',
+            'text/json',
+            'application/*+json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        collection_formats={
+        }),
+    Operation(
+        'api_documents_id_refusal_post', 'POST', '/api/documents/{id}/refusal',
+        params=[
+            'id',
+            'body',
+        ],
+        positional=[
+            'id',
+        ],
+        path_params=[
+            ('id', 'id'),
+        ],
+        body_param='body',
+        accept=[
+            'application/json',
+        ],
+        content_types=[
+            'application/json-patch+json',
+            'application/json',
+            'text/json',
+            'application/*+json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        collection_formats={
+        }),
+    Operation(
+        'api_documents_id_signatures_details_get', 'GET', '/api/documents/{id}/signatures-details',
+        params=[
+            'id',
+        ],
+        positional=[
+            'id',
+        ],
+        path_params=[
+            ('id', 'id'),
+        ],
+        accept=[
+            'text/plain',
+            'application/json',
+            'text/json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        response_type='DocumentsDocumentSignaturesInfoModel',
+        collection_formats={
+        }),
+    Operation(
+        'api_documents_id_ticket_get', 'GET', '/api/documents/{id}/ticket',
+        params=[
+            'id',
+            'type',
+            'preview',
+        ],
+        positional=[
+            'id',
+        ],
+        path_params=[
+            ('id', 'id'),
+        ],
+        query_params=[
+            ('type', 'type'),
+            ('preview', 'preview'),
+        ],
+        accept=[
+            'text/plain',
+            'application/json',
+            'text/json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        response_type='TicketModel',
+        collection_formats={
+        }),
+    Operation(
+        'api_documents_id_versions_post', 'POST', '/api/documents/{id}/versions',
+        params=[
+            'id',
+            'body',
+        ],
+        positional=[
+            'id',
+        ],
+        path_params=[
+            ('id', 'id'),
+        ],
+        body_param='body',
+        accept=[
+            'application/json',
+        ],
+        content_types=[
+            'application/json-patch+json',
+            'application/json',
+            'text/json',
+            'application/*+json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        collection_formats={
+        }),
+    Operation(
+        'api_documents_keys_key_signatures_get', 'GET', '/api/documents/keys/{key}/signatures',
+        params=[
+            'key',
+        ],
+        positional=[
+            'key',
+        ],
+        path_params=[
+            ('key', 'key'),
+        ],
+        accept=[
+            'text/plain',
+            'application/json',
+            'text/json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        response_type='DocumentsDocumentSignaturesInfoModel',
+        collection_formats={
+        }),
+    Operation(
+        'api_documents_post', 'POST', '/api/documents',
+        params=[
+            'body',
+        ],
+        body_param='body',
+        accept=[
+            'text/plain',
+            'application/json',
+            'text/json',
+        ],
+        content_types=[
+            'application/json-patch+json',
+            'application/json',
+            'text/json',
+            'application/*+json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        response_type='list[DocumentsCreateDocumentResult]',
+        collection_formats={
+        }),
+    Operation(
+        'api_documents_validate_signatures_post', 'POST', '/api/documents/validate-signatures',
+        params=[
+            'body',
+        ],
+        body_param='body',
+        accept=[
+            'text/plain',
+            'application/json',
+            'text/json',
+        ],
+        content_types=[
+            'application/json-patch+json',
+            'application/json',
+            'text/json',
+            'application/*+json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        response_type='list[SignerModel]',
+        collection_formats={
+        }),
+]}
 
 
 class DocumentsApi(object):
@@ -38,7 +542,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_batch_folder_post(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param DocumentsMoveDocumentBatchRequest body:
@@ -59,7 +563,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_batch_folder_post_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param DocumentsMoveDocumentBatchRequest body:
@@ -67,63 +571,8 @@ class DocumentsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_documents_batch_folder_post" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain', 'application/json', 'text/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json-patch+json', 'application/json', 'text/json', 'application/*+json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/documents/batch/folder', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='list[BatchItemResultModel]',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_documents_batch_folder_post'], (), kwargs)
 
     def api_documents_get(self, **kwargs):  # noqa: E501
         """Retrieves the documents of the organization paginating the response.  # noqa: E501
@@ -132,7 +581,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_get(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param bool is_concluded: (DEPRECATED) Please use \"Status\" parameter instead. Set to true to list concluded documents, false to list pending documents.
@@ -169,7 +618,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_get_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param bool is_concluded: (DEPRECATED) Please use \"Status\" parameter instead. Set to true to list concluded documents, false to list pending documents.
@@ -192,89 +641,8 @@ class DocumentsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['is_concluded', 'status', 'folder_id', 'folder_type', 'document_type', 'filter_by_document_type', 'filter_by_pending_signature', 'query_type', 'participant_q', 'participant_query_type', 'tags', 'is_deleted', 'q', 'limit', 'offset', 'order']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_documents_get" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'is_concluded' in params:
-            query_params.append(('IsConcluded', params['is_concluded']))  # noqa: E501
-        if 'status' in params:
-            query_params.append(('Status', params['status']))  # noqa: E501
-        if 'folder_id' in params:
-            query_params.append(('FolderId', params['folder_id']))  # noqa: E501
-        if 'folder_type' in params:
-            query_params.append(('FolderType', params['folder_type']))  # noqa: E501
-        if 'document_type' in params:
-            query_params.append(('DocumentType', params['document_type']))  # noqa: E501
-        if 'filter_by_document_type' in params:
-            query_params.append(('FilterByDocumentType', params['filter_by_document_type']))  # noqa: E501
-        if 'filter_by_pending_signature' in params:
-            query_params.append(('FilterByPendingSignature', params['filter_by_pending_signature']))  # noqa: E501
-        if 'query_type' in params:
-            query_params.append(('QueryType', params['query_type']))  # noqa: E501
-        if 'participant_q' in params:
-            query_params.append(('ParticipantQ', params['participant_q']))  # noqa: E501
-        if 'participant_query_type' in params:
-            query_params.append(('ParticipantQueryType', params['participant_query_type']))  # noqa: E501
-        if 'tags' in params:
-            query_params.append(('Tags', params['tags']))  # noqa: E501
-        if 'is_deleted' in params:
-            query_params.append(('IsDeleted', params['is_deleted']))  # noqa: E501
-        if 'q' in params:
-            query_params.append(('Q', params['q']))  # noqa: E501
-        if 'limit' in params:
-            query_params.append(('Limit', params['limit']))  # noqa: E501
-        if 'offset' in params:
-            query_params.append(('Offset', params['offset']))  # noqa: E501
-        if 'order' in params:
-            query_params.append(('Order', params['order']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain', 'application/json', 'text/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/documents', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='PaginatedSearchResponseDocumentsDocumentListModel',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_documents_get'], (), kwargs)
 
     def api_documents_id_action_url_post(self, id, **kwargs):  # noqa: E501
         """Retrieves an URL to redirect the user to the first pending action of the document.  # noqa: E501
@@ -283,7 +651,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_id_action_url_post(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: Document Id (required)
@@ -306,7 +674,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_id_action_url_post_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: Document Id (required)
@@ -315,69 +683,8 @@ class DocumentsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['id', 'body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_documents_id_action_url_post" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'id' is set
-        if ('id' not in params or
-                params['id'] is None):
-            raise ValueError("Missing the required parameter `id` when calling `api_documents_id_action_url_post`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'id' in params:
-            path_params['id'] = params['id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain', 'application/json', 'text/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json-patch+json', 'application/json', 'text/json', 'application/*+json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/documents/{id}/action-url', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='DocumentsActionUrlResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_documents_id_action_url_post'], (id,), kwargs)
 
     def api_documents_id_cancellation_post(self, id, **kwargs):  # noqa: E501
         """Cancels the document by providing a reason for the cancellation.  # noqa: E501
@@ -386,7 +693,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_id_cancellation_post(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: (required)
@@ -409,7 +716,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_id_cancellation_post_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: (required)
@@ -418,69 +725,8 @@ class DocumentsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['id', 'body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_documents_id_cancellation_post" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'id' is set
-        if ('id' not in params or
-                params['id'] is None):
-            raise ValueError("Missing the required parameter `id` when calling `api_documents_id_cancellation_post`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'id' in params:
-            path_params['id'] = params['id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json-patch+json', 'application/json', 'text/json', 'application/*+json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/documents/{id}/cancellation', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_documents_id_cancellation_post'], (id,), kwargs)
 
     def api_documents_id_content_b64_get(self, id, **kwargs):  # noqa: E501
         """Downloads a specific version type of the document encoding the bytes in Base 64 format.  # noqa: E501
@@ -488,7 +734,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_id_content_b64_get(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: Document id (required)
@@ -510,7 +756,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_id_content_b64_get_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: Document id (required)
@@ -519,65 +765,8 @@ class DocumentsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['id', 'type']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_documents_id_content_b64_get" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'id' is set
-        if ('id' not in params or
-                params['id'] is None):
-            raise ValueError("Missing the required parameter `id` when calling `api_documents_id_content_b64_get`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'id' in params:
-            path_params['id'] = params['id']  # noqa: E501
-
-        query_params = []
-        if 'type' in params:
-            query_params.append(('type', params['type']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain', 'application/json', 'text/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/documents/{id}/content-b64', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='DocumentsDocumentContentModel',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_documents_id_content_b64_get'], (id,), kwargs)
 
     def api_documents_id_content_get(self, id, **kwargs):  # noqa: E501
         """Downloads a specific version type of the document.  # noqa: E501
@@ -585,7 +774,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_id_content_get(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: Document id (required)
@@ -607,7 +796,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_id_content_get_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: Document id (required)
@@ -616,65 +805,8 @@ class DocumentsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['id', 'type']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_documents_id_content_get" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'id' is set
-        if ('id' not in params or
-                params['id'] is None):
-            raise ValueError("Missing the required parameter `id` when calling `api_documents_id_content_get`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'id' in params:
-            path_params['id'] = params['id']  # noqa: E501
-
-        query_params = []
-        if 'type' in params:
-            query_params.append(('type', params['type']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/documents/{id}/content', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_documents_id_content_get'], (id,), kwargs)
 
     def api_documents_id_delete(self, id, **kwargs):  # noqa: E501
         """Deletes a specific document using it's id.  # noqa: E501
@@ -682,7 +814,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_id_delete(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: Document id (required)
@@ -703,7 +835,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_id_delete_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: Document id (required)
@@ -711,63 +843,8 @@ class DocumentsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_documents_id_delete" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'id' is set
-        if ('id' not in params or
-                params['id'] is None):
-            raise ValueError("Missing the required parameter `id` when calling `api_documents_id_delete`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'id' in params:
-            path_params['id'] = params['id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/documents/{id}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_documents_id_delete'], (id,), kwargs)
 
     def api_documents_id_envelope_versions_post(self, id, **kwargs):  # noqa: E501
         """Adds a new version for an envelope.  # noqa: E501
@@ -776,7 +853,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_id_envelope_versions_post(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: (required)
@@ -799,7 +876,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_id_envelope_versions_post_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: (required)
@@ -808,69 +885,8 @@ class DocumentsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['id', 'body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_documents_id_envelope_versions_post" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'id' is set
-        if ('id' not in params or
-                params['id'] is None):
-            raise ValueError("Missing the required parameter `id` when calling `api_documents_id_envelope_versions_post`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'id' in params:
-            path_params['id'] = params['id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json-patch+json', 'application/json', 'text/json', 'application/*+json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/documents/{id}/envelope/versions', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_documents_id_envelope_versions_post'], (id,), kwargs)
 
     def api_documents_id_flow_post(self, id, **kwargs):  # noqa: E501
         """Updates the document's flow.  # noqa: E501
@@ -878,7 +894,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_id_flow_post(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: Id of the document (required)
@@ -900,7 +916,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_id_flow_post_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: Id of the document (required)
@@ -909,69 +925,8 @@ class DocumentsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['id', 'body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_documents_id_flow_post" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'id' is set
-        if ('id' not in params or
-                params['id'] is None):
-            raise ValueError("Missing the required parameter `id` when calling `api_documents_id_flow_post`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'id' in params:
-            path_params['id'] = params['id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain', 'application/json', 'text/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json-patch+json', 'application/json', 'text/json', 'application/*+json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/documents/{id}/flow', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='FlowActionsDocumentFlowEditResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_documents_id_flow_post'], (id,), kwargs)
 
     def api_documents_id_folder_post(self, id, **kwargs):  # noqa: E501
         """Moves a document to a folder.  # noqa: E501
@@ -979,7 +934,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_id_folder_post(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: (required)
@@ -1001,7 +956,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_id_folder_post_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: (required)
@@ -1010,69 +965,8 @@ class DocumentsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['id', 'body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_documents_id_folder_post" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'id' is set
-        if ('id' not in params or
-                params['id'] is None):
-            raise ValueError("Missing the required parameter `id` when calling `api_documents_id_folder_post`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'id' in params:
-            path_params['id'] = params['id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json-patch+json', 'application/json', 'text/json', 'application/*+json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/documents/{id}/folder', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_documents_id_folder_post'], (id,), kwargs)
 
     def api_documents_id_get(self, id, **kwargs):  # noqa: E501
         """Retrieves the document's details.  # noqa: E501
@@ -1080,7 +974,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_id_get(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: Document id (required)
@@ -1101,7 +995,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_id_get_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: Document id (required)
@@ -1109,63 +1003,8 @@ class DocumentsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_documents_id_get" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'id' is set
-        if ('id' not in params or
-                params['id'] is None):
-            raise ValueError("Missing the required parameter `id` when calling `api_documents_id_get`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'id' in params:
-            path_params['id'] = params['id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain', 'application/json', 'text/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/documents/{id}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='DocumentsDocumentModel',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_documents_id_get'], (id,), kwargs)
 
     def api_documents_id_notified_emails_put(self, id, **kwargs):  # noqa: E501
         """Updates the document's notified emails  # noqa: E501
@@ -1174,7 +1013,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_id_notified_emails_put(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: Id of the document (required)
@@ -1197,7 +1036,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_id_notified_emails_put_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: Id of the document (required)
@@ -1206,69 +1045,8 @@ class DocumentsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['id', 'body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_documents_id_notified_emails_put" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'id' is set
-        if ('id' not in params or
-                params['id'] is None):
-            raise ValueError("Missing the required parameter `id` when calling `api_documents_id_notified_emails_put`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'id' in params:
-            path_params['id'] = params['id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json-patch+json', 'application/json', 'text/json', 'application/*+json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/documents/{id}/notified-emails', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_documents_id_notified_emails_put'], (id,), kwargs)
 
     def api_documents_id_refusal_post(self, id, **kwargs):  # noqa: E501
         """Refuses a document by providing a reason for the refusal.  # noqa: E501
@@ -1277,7 +1055,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_id_refusal_post(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: (required)
@@ -1300,7 +1078,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_id_refusal_post_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: (required)
@@ -1309,69 +1087,8 @@ class DocumentsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['id', 'body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_documents_id_refusal_post" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'id' is set
-        if ('id' not in params or
-                params['id'] is None):
-            raise ValueError("Missing the required parameter `id` when calling `api_documents_id_refusal_post`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'id' in params:
-            path_params['id'] = params['id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json-patch+json', 'application/json', 'text/json', 'application/*+json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/documents/{id}/refusal', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_documents_id_refusal_post'], (id,), kwargs)
 
     def api_documents_id_signatures_details_get(self, id, **kwargs):  # noqa: E501
         """Retrieves the details of the document's signatures.  # noqa: E501
@@ -1380,7 +1097,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_id_signatures_details_get(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: The Id of the document (required)
@@ -1402,7 +1119,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_id_signatures_details_get_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: The Id of the document (required)
@@ -1410,63 +1127,8 @@ class DocumentsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_documents_id_signatures_details_get" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'id' is set
-        if ('id' not in params or
-                params['id'] is None):
-            raise ValueError("Missing the required parameter `id` when calling `api_documents_id_signatures_details_get`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'id' in params:
-            path_params['id'] = params['id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain', 'application/json', 'text/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/documents/{id}/signatures-details', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='DocumentsDocumentSignaturesInfoModel',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_documents_id_signatures_details_get'], (id,), kwargs)
 
     def api_documents_id_ticket_get(self, id, **kwargs):  # noqa: E501
         """Generates a URL (ticket) to download a specific version type of the document.  # noqa: E501
@@ -1475,7 +1137,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_id_ticket_get(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: Document id (required)
@@ -1499,7 +1161,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_id_ticket_get_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: Document id (required)
@@ -1509,67 +1171,8 @@ class DocumentsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['id', 'type', 'preview']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_documents_id_ticket_get" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'id' is set
-        if ('id' not in params or
-                params['id'] is None):
-            raise ValueError("Missing the required parameter `id` when calling `api_documents_id_ticket_get`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'id' in params:
-            path_params['id'] = params['id']  # noqa: E501
-
-        query_params = []
-        if 'type' in params:
-            query_params.append(('type', params['type']))  # noqa: E501
-        if 'preview' in params:
-            query_params.append(('preview', params['preview']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain', 'application/json', 'text/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/documents/{id}/ticket', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='TicketModel',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_documents_id_ticket_get'], (id,), kwargs)
 
     def api_documents_id_versions_post(self, id, **kwargs):  # noqa: E501
         """Adds a new version for the document.  # noqa: E501
@@ -1578,7 +1181,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_id_versions_post(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: (required)
@@ -1601,7 +1204,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_id_versions_post_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: (required)
@@ -1610,69 +1213,8 @@ class DocumentsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['id', 'body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_documents_id_versions_post" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'id' is set
-        if ('id' not in params or
-                params['id'] is None):
-            raise ValueError("Missing the required parameter `id` when calling `api_documents_id_versions_post`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'id' in params:
-            path_params['id'] = params['id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json-patch+json', 'application/json', 'text/json', 'application/*+json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/documents/{id}/versions', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_documents_id_versions_post'], (id,), kwargs)
 
     def api_documents_keys_key_signatures_get(self, key, **kwargs):  # noqa: E501
         """Validates each signature in a document using the verification code  # noqa: E501
@@ -1680,7 +1222,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_keys_key_signatures_get(key, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str key: The verification code presented in the document (required)
@@ -1701,7 +1243,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_keys_key_signatures_get_with_http_info(key, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str key: The verification code presented in the document (required)
@@ -1709,63 +1251,8 @@ class DocumentsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['key']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_documents_keys_key_signatures_get" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'key' is set
-        if ('key' not in params or
-                params['key'] is None):
-            raise ValueError("Missing the required parameter `key` when calling `api_documents_keys_key_signatures_get`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'key' in params:
-            path_params['key'] = params['key']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain', 'application/json', 'text/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/documents/keys/{key}/signatures', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='DocumentsDocumentSignaturesInfoModel',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_documents_keys_key_signatures_get'], (key,), kwargs)
 
     def api_documents_post(self, **kwargs):  # noqa: E501
         """Creates one or multiple documents.  # noqa: E501
@@ -1774,7 +1261,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_post(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param DocumentsCreateDocumentRequest body:
@@ -1796,7 +1283,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_post_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param DocumentsCreateDocumentRequest body:
@@ -1804,63 +1291,8 @@ class DocumentsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_documents_post" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain', 'application/json', 'text/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json-patch+json', 'application/json', 'text/json', 'application/*+json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/documents', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='list[DocumentsCreateDocumentResult]',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_documents_post'], (), kwargs)
 
     def api_documents_validate_signatures_post(self, **kwargs):  # noqa: E501
         """Validates each signature in the uploaded document  # noqa: E501
@@ -1869,7 +1301,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_validate_signatures_post(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param SignatureSignaturesInfoRequest body:
@@ -1891,7 +1323,7 @@ class DocumentsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_documents_validate_signatures_post_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param SignatureSignaturesInfoRequest body:
@@ -1899,60 +1331,5 @@ class DocumentsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_documents_validate_signatures_post" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain', 'application/json', 'text/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json-patch+json', 'application/json', 'text/json', 'application/*+json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/documents/validate-signatures', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='list[SignerModel]',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_documents_validate_signatures_post'], (), kwargs)
@@ -14,10 +14,128 @@ from __future__ import absolute_import
 
 import re  # noqa: F401
 
-# python 2 and python 3 compatibility library
-import six
-
 from signer_client.api_client import ApiClient
+from signer_client.operations import Operation
+
+# operation name -> descriptor, see `signer_client.operations`
+OPERATIONS = {operation.name: operation for operation in [
+    Operation(
+        'api_document_flows_get', 'GET', '/api/document-flows',
+        params=[
+            'q',
+            'limit',
+            'offset',
+            'order',
+        ],
+        query_params=[
+            ('Q', 'q'),
+            ('Limit', 'limit'),
+            ('Offset', 'offset'),
+            ('Order', 'order'),
+        ],
+        accept=[
+            'text/plain',
+            'application/json',
+            'text/json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        response_type='PaginatedSearchResponseDocumentFlowsDocumentFlowModel',
+        collection_formats={
+        }),
+    Operation(
+        'api_document_flows_id_delete', 'DELETE', '/api/document-flows/{id}',
+        params=[
+            'id',
+        ],
+        positional=[
+            'id',
+        ],
+        path_params=[
+            ('id', 'id'),
+        ],
+        accept=[
+            'application/json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        collection_formats={
+        }),
+    Operation(
+        'api_document_flows_id_get', 'GET', '/api/document-flows/{id}',
+        params=[
+            'id',
+        ],
+        positional=[
+            'id',
+        ],
+        path_params=[
+            ('id', 'id'),
+        ],
+        accept=[
+            'text/plain',
+            'application/json',
+            'text/json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        response_type='DocumentFlowsDocumentFlowDetailsModel',
+        collection_formats={
+        }),
+    Operation(
+        'api_document_flows_id_put', 'PUT', '/api/document-flows/{id}',
+        params=[
+            'id',
+            'body',
+        ],
+        positional=[
+            'id',
+        ],
+        path_params=[
+            ('id', 'id'),
+        ],
+        body_param='body',
+        accept=[
+            'application/json',
+        ],
+        content_types=[
+            'application/json-patch+json',
+            'application/json',
+            'text/json',
+            'application/*+json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        collection_formats={
+        }),
+    Operation(
+        'api_document_flows_post', 'POST', '/api/document-flows',
+        params=[
+            'body',
+        ],
+        body_param='body',
+        accept=[
+            'text/plain',
+            'application/json',
+            'text/json',
+        ],
+        content_types=[
+            'application/json-patch+json',
+            'application/json',
+            'text/json',
+            'application/*+json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        response_type='DocumentFlowsDocumentFlowModel',
+        collection_formats={
+        }),
+]}
 
 
 class FlowsApi(object):
@@ -38,7 +156,7 @@ class FlowsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_document_flows_get(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str q: Query to filter items.
@@ -62,7 +180,7 @@ class FlowsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_document_flows_get_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str q: Query to filter items.
@@ -73,65 +191,8 @@ class FlowsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['q', 'limit', 'offset', 'order']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_document_flows_get" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'q' in params:
-            query_params.append(('Q', params['q']))  # noqa: E501
-        if 'limit' in params:
-            query_params.append(('Limit', params['limit']))  # noqa: E501
-        if 'offset' in params:
-            query_params.append(('Offset', params['offset']))  # noqa: E501
-        if 'order' in params:
-            query_params.append(('Order', params['order']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain', 'application/json', 'text/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/document-flows', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='PaginatedSearchResponseDocumentFlowsDocumentFlowModel',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_document_flows_get'], (), kwargs)
 
     def api_document_flows_id_delete(self, id, **kwargs):  # noqa: E501
         """Deletes a flow.  # noqa: E501
@@ -139,7 +200,7 @@ class FlowsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_document_flows_id_delete(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: (required)
@@ -160,7 +221,7 @@ class FlowsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_document_flows_id_delete_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: (required)
@@ -168,63 +229,8 @@ class FlowsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_document_flows_id_delete" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'id' is set
-        if ('id' not in params or
-                params['id'] is None):
-            raise ValueError("Missing the required parameter `id` when calling `api_document_flows_id_delete`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'id' in params:
-            path_params['id'] = params['id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/document-flows/{id}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_document_flows_id_delete'], (id,), kwargs)
 
     def api_document_flows_id_get(self, id, **kwargs):  # noqa: E501
         """Retrieves flow details  # noqa: E501
@@ -232,7 +238,7 @@ class FlowsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_document_flows_id_get(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: (required)
@@ -253,7 +259,7 @@ class FlowsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_document_flows_id_get_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: (required)
@@ -261,63 +267,8 @@ class FlowsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_document_flows_id_get" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'id' is set
-        if ('id' not in params or
-                params['id'] is None):
-            raise ValueError("Missing the required parameter `id` when calling `api_document_flows_id_get`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'id' in params:
-            path_params['id'] = params['id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain', 'application/json', 'text/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/document-flows/{id}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='DocumentFlowsDocumentFlowDetailsModel',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_document_flows_id_get'], (id,), kwargs)
 
     def api_document_flows_id_put(self, id, **kwargs):  # noqa: E501
         """Updates a flow.  # noqa: E501
@@ -325,7 +276,7 @@ class FlowsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_document_flows_id_put(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: (required)
@@ -347,7 +298,7 @@ class FlowsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_document_flows_id_put_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: (required)
@@ -356,69 +307,8 @@ class FlowsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['id', 'body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_document_flows_id_put" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'id' is set
-        if ('id' not in params or
-                params['id'] is None):
-            raise ValueError("Missing the required parameter `id` when calling `api_document_flows_id_put`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'id' in params:
-            path_params['id'] = params['id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json-patch+json', 'application/json', 'text/json', 'application/*+json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/document-flows/{id}', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_document_flows_id_put'], (id,), kwargs)
 
     def api_document_flows_post(self, **kwargs):  # noqa: E501
         """Creates a flow that can be used to create documents  # noqa: E501
@@ -426,7 +316,7 @@ class FlowsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_document_flows_post(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param DocumentFlowsDocumentFlowCreateRequest body:
@@ -447,7 +337,7 @@ class FlowsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_document_flows_post_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param DocumentFlowsDocumentFlowCreateRequest body:
@@ -455,60 +345,5 @@ class FlowsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_document_flows_post" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain', 'application/json', 'text/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json-patch+json', 'application/json', 'text/json', 'application/*+json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/document-flows', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='DocumentFlowsDocumentFlowModel',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_document_flows_post'], (), kwargs)
@@ -14,10 +14,113 @@ from __future__ import absolute_import
 
 import re  # noqa: F401
 
-# python 2 and python 3 compatibility library
-import six
-
 from signer_client.api_client import ApiClient
+from signer_client.operations import Operation
+
+# operation name -> descriptor, see `signer_client.operations`
+OPERATIONS = {operation.name: operation for operation in [
+    Operation(
+        'api_folders_get', 'GET', '/api/folders',
+        params=[
+            'q',
+            'limit',
+            'offset',
+            'order',
+            'filter_by_parent',
+            'parent_id',
+        ],
+        query_params=[
+            ('Q', 'q'),
+            ('Limit', 'limit'),
+            ('Offset', 'offset'),
+            ('Order', 'order'),
+            ('filterByParent', 'filter_by_parent'),
+            ('parentId', 'parent_id'),
+        ],
+        accept=[
+            'text/plain',
+            'application/json',
+            'text/json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        response_type='PaginatedSearchResponseFoldersFolderInfoModel',
+        collection_formats={
+        }),
+    Operation(
+        'api_folders_id_delete_post', 'POST', '/api/folders/{id}/delete',
+        params=[
+            'id',
+            'body',
+        ],
+        positional=[
+            'id',
+        ],
+        path_params=[
+            ('id', 'id'),
+        ],
+        body_param='body',
+        accept=[
+            'application/json',
+        ],
+        content_types=[
+            'application/json-patch+json',
+            'application/json',
+            'text/json',
+            'application/*+json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        collection_formats={
+        }),
+    Operation(
+        'api_folders_id_get', 'GET', '/api/folders/{id}',
+        params=[
+            'id',
+        ],
+        positional=[
+            'id',
+        ],
+        path_params=[
+            ('id', 'id'),
+        ],
+        accept=[
+            'text/plain',
+            'application/json',
+            'text/json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        response_type='FoldersFolderOrganizationModel',
+        collection_formats={
+        }),
+    Operation(
+        'api_folders_post', 'POST', '/api/folders',
+        params=[
+            'body',
+        ],
+        body_param='body',
+        accept=[
+            'text/plain',
+            'application/json',
+            'text/json',
+        ],
+        content_types=[
+            'application/json-patch+json',
+            'application/json',
+            'text/json',
+            'application/*+json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        response_type='FoldersFolderInfoModel',
+        collection_formats={
+        }),
+]}
 
 
 class FoldersApi(object):
@@ -39,7 +142,7 @@ class FoldersApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_folders_get(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str q: Query to filter items.
@@ -66,7 +169,7 @@ class FoldersApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_folders_get_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str q: Query to filter items.
@@ -79,69 +182,8 @@ class FoldersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['q', 'limit', 'offset', 'order', 'filter_by_parent', 'parent_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_folders_get" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'q' in params:
-            query_params.append(('Q', params['q']))  # noqa: E501
-        if 'limit' in params:
-            query_params.append(('Limit', params['limit']))  # noqa: E501
-        if 'offset' in params:
-            query_params.append(('Offset', params['offset']))  # noqa: E501
-        if 'order' in params:
-            query_params.append(('Order', params['order']))  # noqa: E501
-        if 'filter_by_parent' in params:
-            query_params.append(('filterByParent', params['filter_by_parent']))  # noqa: E501
-        if 'parent_id' in params:
-            query_params.append(('parentId', params['parent_id']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain', 'application/json', 'text/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/folders', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='PaginatedSearchResponseFoldersFolderInfoModel',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_folders_get'], (), kwargs)
 
     def api_folders_id_delete_post(self, id, **kwargs):  # noqa: E501
         """Deletes a folder.  # noqa: E501
@@ -149,7 +191,7 @@ class FoldersApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_folders_id_delete_post(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: Id of the folder to be deleted (required)
@@ -171,7 +213,7 @@ class FoldersApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_folders_id_delete_post_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: Id of the folder to be deleted (required)
@@ -180,69 +222,8 @@ class FoldersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['id', 'body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_folders_id_delete_post" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'id' is set
-        if ('id' not in params or
-                params['id'] is None):
-            raise ValueError("Missing the required parameter `id` when calling `api_folders_id_delete_post`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'id' in params:
-            path_params['id'] = params['id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json-patch+json', 'application/json', 'text/json', 'application/*+json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/folders/{id}/delete', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_folders_id_delete_post'], (id,), kwargs)
 
     def api_folders_id_get(self, id, **kwargs):  # noqa: E501
         """Retrieves the folder's info.  # noqa: E501
@@ -250,7 +231,7 @@ class FoldersApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_folders_id_get(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: Folder id (required)
@@ -271,7 +252,7 @@ class FoldersApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_folders_id_get_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: Folder id (required)
@@ -279,63 +260,8 @@ class FoldersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_folders_id_get" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'id' is set
-        if ('id' not in params or
-                params['id'] is None):
-            raise ValueError("Missing the required parameter `id` when calling `api_folders_id_get`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'id' in params:
-            path_params['id'] = params['id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain', 'application/json', 'text/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/folders/{id}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='FoldersFolderOrganizationModel',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_folders_id_get'], (id,), kwargs)
 
     def api_folders_post(self, **kwargs):  # noqa: E501
         """Creates a folder.  # noqa: E501
@@ -343,7 +269,7 @@ class FoldersApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_folders_post(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param FoldersFolderCreateRequest body:
@@ -364,7 +290,7 @@ class FoldersApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_folders_post_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param FoldersFolderCreateRequest body:
@@ -372,60 +298,5 @@ class FoldersApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_folders_post" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain', 'application/json', 'text/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json-patch+json', 'application/json', 'text/json', 'application/*+json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/folders', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='FoldersFolderInfoModel',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_folders_post'], (), kwargs)
@@ -14,10 +14,80 @@ from __future__ import absolute_import
 
 import re  # noqa: F401
 
-# python 2 and python 3 compatibility library
-import six
-
 from signer_client.api_client import ApiClient
+from signer_client.operations import Operation
+
+# operation name -> descriptor, see `signer_client.operations`
+OPERATIONS = {operation.name: operation for operation in [
+    Operation(
+        'api_marks_sessions_documents_post', 'POST', '/api/marks-sessions/documents',
+        params=[
+            'body',
+        ],
+        body_param='body',
+        accept=[
+            'text/plain',
+            'application/json',
+            'text/json',
+        ],
+        content_types=[
+            'application/json-patch+json',
+            'application/json',
+            'text/json',
+            'application/*+json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        response_type='DocumentMarkMarksSessionCreateResponse',
+        collection_formats={
+        }),
+    Operation(
+        'api_marks_sessions_id_get', 'GET', '/api/marks-sessions/{id}',
+        params=[
+            'id',
+        ],
+        positional=[
+            'id',
+        ],
+        path_params=[
+            ('id', 'id'),
+        ],
+        accept=[
+            'text/plain',
+            'application/json',
+            'text/json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        response_type='DocumentMarkMarksSessionModel',
+        collection_formats={
+        }),
+    Operation(
+        'api_marks_sessions_post', 'POST', '/api/marks-sessions',
+        params=[
+            'body',
+        ],
+        body_param='body',
+        accept=[
+            'text/plain',
+            'application/json',
+            'text/json',
+        ],
+        content_types=[
+            'application/json-patch+json',
+            'application/json',
+            'text/json',
+            'application/*+json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        response_type='DocumentMarkMarksSessionCreateResponse',
+        collection_formats={
+        }),
+]}
 
 
 class MarksSessionsApi(object):
@@ -39,7 +109,7 @@ class MarksSessionsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_marks_sessions_documents_post(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param DocumentsCreateDocumentRequest body:
@@ -61,7 +131,7 @@ class MarksSessionsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_marks_sessions_documents_post_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param DocumentsCreateDocumentRequest body:
@@ -69,63 +139,8 @@ class MarksSessionsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_marks_sessions_documents_post" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain', 'application/json', 'text/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json-patch+json', 'application/json', 'text/json', 'application/*+json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/marks-sessions/documents', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='DocumentMarkMarksSessionCreateResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_marks_sessions_documents_post'], (), kwargs)
 
     def api_marks_sessions_id_get(self, id, **kwargs):  # noqa: E501
         """Retrieves session information.  # noqa: E501
@@ -133,7 +148,7 @@ class MarksSessionsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_marks_sessions_id_get(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: The session ID obtained when the session was created (required)
@@ -154,7 +169,7 @@ class MarksSessionsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_marks_sessions_id_get_with_http_info(id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str id: The session ID obtained when the session was created (required)
@@ -162,63 +177,8 @@ class MarksSessionsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_marks_sessions_id_get" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'id' is set
-        if ('id' not in params or
-                params['id'] is None):
-            raise ValueError("Missing the required parameter `id` when calling `api_marks_sessions_id_get`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'id' in params:
-            path_params['id'] = params['id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain', 'application/json', 'text/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/marks-sessions/{id}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='DocumentMarkMarksSessionModel',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_marks_sessions_id_get'], (id,), kwargs)
 
     def api_marks_sessions_post(self, **kwargs):  # noqa: E501
         """Creates a mark positioning session by requiring only the necessary data.  # noqa: E501
@@ -227,7 +187,7 @@ class MarksSessionsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_marks_sessions_post(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param DocumentMarkMarksSessionCreateRequest body:
@@ -249,7 +209,7 @@ class MarksSessionsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_marks_sessions_post_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param DocumentMarkMarksSessionCreateRequest body:
@@ -257,60 +217,5 @@ class MarksSessionsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_marks_sessions_post" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain', 'application/json', 'text/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json-patch+json', 'application/json', 'text/json', 'application/*+json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/marks-sessions', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='DocumentMarkMarksSessionCreateResponse',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_marks_sessions_post'], (), kwargs)
@@ -14,10 +14,52 @@ from __future__ import absolute_import
 
 import re  # noqa: F401
 
-# python 2 and python 3 compatibility library
-import six
-
 from signer_client.api_client import ApiClient
+from signer_client.operations import Operation
+
+# operation name -> descriptor, see `signer_client.operations`
+OPERATIONS = {operation.name: operation for operation in [
+    Operation(
+        'api_notifications_flow_action_reminder_post', 'POST', '/api/notifications/flow-action-reminder',
+        params=[
+            'body',
+        ],
+        body_param='body',
+        accept=[
+            'application/json',
+        ],
+        content_types=[
+            'application/json-patch+json',
+            'application/json',
+            'text/json',
+            'application/*+json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        collection_formats={
+        }),
+    Operation(
+        'api_users_notify_pending_post', 'POST', '/api/users/notify-pending',
+        params=[
+            'body',
+        ],
+        body_param='body',
+        accept=[
+            'application/json',
+        ],
+        content_types=[
+            'application/json-patch+json',
+            'application/json',
+            'text/json',
+            'application/*+json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        collection_formats={
+        }),
+]}
 
 
 class NotificationsApi(object):
@@ -38,7 +80,7 @@ class NotificationsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_notifications_flow_action_reminder_post(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param NotificationsCreateFlowActionReminderRequest body:
@@ -59,7 +101,7 @@ class NotificationsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_notifications_flow_action_reminder_post_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param NotificationsCreateFlowActionReminderRequest body:
@@ -67,63 +109,8 @@ class NotificationsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_notifications_flow_action_reminder_post" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json-patch+json', 'application/json', 'text/json', 'application/*+json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/notifications/flow-action-reminder', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_notifications_flow_action_reminder_post'], (), kwargs)
 
     def api_users_notify_pending_post(self, **kwargs):  # noqa: E501
         """Sends a reminder email to the e-mails provided on request. Should be used after creating a batch of documents.  # noqa: E501
@@ -131,7 +118,7 @@ class NotificationsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_users_notify_pending_post(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param NotificationsEmailListNotificationRequest body:
@@ -152,7 +139,7 @@ class NotificationsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_users_notify_pending_post_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param NotificationsEmailListNotificationRequest body:
@@ -160,60 +147,5 @@ class NotificationsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_users_notify_pending_post" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json-patch+json', 'application/json', 'text/json', 'application/*+json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/users/notify-pending', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_users_notify_pending_post'], (), kwargs)
@@ -14,10 +14,79 @@ from __future__ import absolute_import
 
 import re  # noqa: F401
 
-# python 2 and python 3 compatibility library
-import six
-
 from signer_client.api_client import ApiClient
+from signer_client.operations import Operation
+
+# operation name -> descriptor, see `signer_client.operations`
+OPERATIONS = {operation.name: operation for operation in [
+    Operation(
+        'api_organizations_users_get', 'GET', '/api/organizations/users',
+        params=[
+            'q',
+            'limit',
+            'offset',
+            'order',
+        ],
+        query_params=[
+            ('Q', 'q'),
+            ('Limit', 'limit'),
+            ('Offset', 'offset'),
+            ('Order', 'order'),
+        ],
+        accept=[
+            'text/plain',
+            'application/json',
+            'text/json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        response_type='PaginatedSearchResponseOrganizationsOrganizationUserModel',
+        collection_formats={
+        }),
+    Operation(
+        'api_organizations_users_post', 'POST', '/api/organizations/users',
+        params=[
+            'body',
+        ],
+        body_param='body',
+        accept=[
+            'text/plain',
+            'application/json',
+            'text/json',
+        ],
+        content_types=[
+            'application/json-patch+json',
+            'application/json',
+            'text/json',
+            'application/*+json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        response_type='OrganizationsOrganizationUserModel',
+        collection_formats={
+        }),
+    Operation(
+        'api_organizations_users_user_id_delete', 'DELETE', '/api/organizations/users/{userId}',
+        params=[
+            'user_id',
+        ],
+        positional=[
+            'user_id',
+        ],
+        path_params=[
+            ('userId', 'user_id'),
+        ],
+        accept=[
+            'application/json',
+        ],
+        auth_settings=[
+            'ApiKey',
+        ],
+        collection_formats={
+        }),
+]}
 
 
 class OrganizationsApi(object):
@@ -38,7 +107,7 @@ class OrganizationsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_organizations_users_get(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str q: Query to filter items.
@@ -62,7 +131,7 @@ class OrganizationsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_organizations_users_get_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str q: Query to filter items.
@@ -73,65 +142,8 @@ class OrganizationsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['q', 'limit', 'offset', 'order']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_organizations_users_get" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'q' in params:
-            query_params.append(('Q', params['q']))  # noqa: E501
-        if 'limit' in params:
-            query_params.append(('Limit', params['limit']))  # noqa: E501
-        if 'offset' in params:
-            query_params.append(('Offset', params['offset']))  # noqa: E501
-        if 'order' in params:
-            query_params.append(('Order', params['order']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain', 'application/json', 'text/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/organizations/users', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='PaginatedSearchResponseOrganizationsOrganizationUserModel',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_organizations_users_get'], (), kwargs)
 
     def api_organizations_users_post(self, **kwargs):  # noqa: E501
         """Adds a user to the organization  # noqa: E501
@@ -139,7 +151,7 @@ class OrganizationsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_organizations_users_post(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param OrganizationsOrganizationUserPostRequest body:
@@ -160,7 +172,7 @@ class OrganizationsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_organizations_users_post_with_http_info(async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param OrganizationsOrganizationUserPostRequest body:
@@ -168,63 +180,8 @@ class OrganizationsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_organizations_users_post" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain', 'application/json', 'text/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json-patch+json', 'application/json', 'text/json', 'application/*+json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/organizations/users', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='OrganizationsOrganizationUserModel',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_organizations_users_post'], (), kwargs)
 
     def api_organizations_users_user_id_delete(self, user_id, **kwargs):  # noqa: E501
         """Deletes a user from organization  # noqa: E501
@@ -232,7 +189,7 @@ class OrganizationsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_organizations_users_user_id_delete(user_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str user_id: (required)
@@ -253,7 +210,7 @@ class OrganizationsApi(object):
         This method makes a synchronous HTTP request by default. To make an
         asynchronous HTTP request, please pass async_req=True
         >>> thread = api.api_organizations_users_user_id_delete_with_http_info(user_id, async_req=True)
-        >>> result = thread.get()
+        >>> result = thread.result()
 
         :param async_req bool
         :param str user_id: (required)
@@ -261,60 +218,5 @@ class OrganizationsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['user_id']  # noqa: E501
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in six.iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method api_organizations_users_user_id_delete" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'user_id' is set
-        if ('user_id' not in params or
-                params['user_id'] is None):
-            raise ValueError("Missing the required parameter `user_id` when calling `api_organizations_users_user_id_delete`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'user_id' in params:
-            path_params['userId'] = params['user_id']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['ApiKey']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/api/organizations/users/{userId}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=params.get('async_req'),
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            OPERATIONS['api_organizations_users_user_id_delete'], (user_id,), kwargs)
@@ -11,9 +11,7 @@
 from __future__ import absolute_import
 
 import datetime
-import json
-import mimetypes
-from multiprocessing.pool import ThreadPool
+import functools
 import os
 import re
 import tempfile
@@ -22,9 +20,14 @@ import tempfile
 import six
 from six.moves.urllib.parse import quote
 
+from signer_client.codec import get_codec
+from signer_client.coalesce import SingleFlight
 from signer_client.configuration import Configuration
-import signer_client.models
-from signer_client import rest
+from signer_client.executor import submit
+from signer_client.multipart import FilePart
+from signer_client.streaming import StreamingBody
+from signer_client import (deserializer, operations, projection, rest,
+                           serializer)
 
 
 class ApiClient(object):
@@ -65,8 +68,9 @@ class ApiClient(object):
             configuration = Configuration()
         self.configuration = configuration
 
-        self.pool = ThreadPool()
         self.rest_client = rest.RESTClientObject(configuration)
+        # identical GETs in flight, see `signer_client.coalesce`
+        self.singleflight = SingleFlight()
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -74,9 +78,9 @@ class ApiClient(object):
         # Set default User-Agent.
         self.user_agent = 'Swagger-Codegen/1.0.0/python'
 
-    def __del__(self):
-        self.pool.close()
-        self.pool.join()
+    def close(self):
+        """Releases the pooled connections of the HTTP transport."""
+        self.rest_client.close()
 
     @property
     def user_agent(self):
@@ -95,8 +99,159 @@ class ApiClient(object):
             query_params=None, header_params=None, body=None, post_params=None,
             files=None, response_type=None, auth_settings=None,
             _return_http_data_only=None, collection_formats=None,
-            _preload_content=True, _request_timeout=None):
+            _preload_content=True, _request_timeout=None,
+            _response_format=None, _fields=None, _operation=None):
+
+        response_options = self._response_options(_response_format, _fields)
+        if _operation is None:
+            operation = '%s %s' % (method, resource_path)
+            url, query_params, header_params, post_params, body = \
+                self._prepare_request(resource_path, path_params,
+                                      query_params, header_params, body,
+                                      post_params, files, auth_settings,
+                                      collection_formats)
+        else:
+            operation = _operation.key
+            url, query_params, header_params, post_params, body = \
+                self._prepare_operation(_operation, path_params,
+                                        query_params, header_params, body,
+                                        post_params, files)
+
+        def fetch(headers):
+            # perform request and return response, every attempt (retries
+            # and hedged backups) waiting for the rate limiter
+            def send():
+                return self.request(
+                    method, url, query_params=query_params,
+                    headers=headers, post_params=post_params,
+                    body=body, _preload_content=_preload_content,
+                    _request_timeout=_request_timeout,
+                    _retry_policy=self._retry_policy(method, resource_path),
+                    _throttle=self._throttle(method, resource_path))
+
+            hedging = self._hedging_policy(method, resource_path, body,
+                                           post_params, _preload_content)
+            if hedging is None:
+                return send()
+            return hedging.call(operation, send, send)
+
+        key = self._request_key(method, url, query_params, header_params,
+                                response_type, _return_http_data_only,
+                                _preload_content, response_options)
+        cache = self._response_cache(operation, key)
+        entry = None
+        if cache is not None:
+            entry = cache.get(key)
+            if entry is not None and entry.fresh:
+                return entry.value
+
+        def call():
+            headers = header_params
+            if entry is not None:
+                headers = dict(header_params, **entry.conditional_headers())
+            try:
+                response_data = fetch(headers)
+            except rest.ApiException as e:
+                if entry is None or e.status != 304:
+                    raise
+                return cache.refresh(key, operation, entry, e.headers)
+            return_data = self._process_response(response_data, response_type,
+                                                 _return_http_data_only,
+                                                 _preload_content,
+                                                 response_options)
+            if cache is not None:
+                cache.store(key, operation, url, return_data, response_data)
+            return return_data
+
+        if key is None or not getattr(self.configuration,
+                                      'coalesce_requests', False):
+            return_data = call()
+        else:
+            return_data = self.singleflight.call(key, call)
+        self._invalidate_cache(method, url)
+        return return_data
+
+    def _throttle(self, method, resource_path):
+        """Returns a callable waiting until the rate limiter lets an
+        attempt of the operation through, None without rate limiter."""
+        limiter = getattr(self.configuration, 'rate_limiter', None)
+        if limiter is None:
+            return None
+        return functools.partial(limiter.acquire, method, resource_path)
+
+    def _retry_policy(self, method, resource_path):
+        """Returns the retry policy of an operation, None if disabled."""
+        retries = getattr(self.configuration, 'retries', None)
+        if retries is None:
+            return None
+        return retries.for_operation(method, resource_path)
+
+    def _request_key(self, method, url, query_params, header_params,
+                     response_type, return_http_data_only, preload_content,
+                     response_options=None):
+        """Returns the key identifying identical GET requests, None for
+        requests that must neither be coalesced nor cached (see
+        `signer_client.coalesce` and `signer_client.cache`)."""
+        if method != 'GET' or not preload_content:
+            return None
+        key = (url, tuple(query_params or ()),
+               tuple(sorted((header_params or {}).items())),
+               response_type, return_http_data_only, response_options)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
 
+    def _response_options(self, response_format, fields):
+        """Returns the (format, fields) of a response, the format defaulting
+        to `configuration.response_format` (see `signer_client.projection`).
+
+        :raise ValueError: invalid format or fields.
+        """
+        if response_format is None:
+            response_format = getattr(self.configuration, 'response_format',
+                                      None) or projection.MODEL
+        return projection.response_options(response_format, fields)
+
+    def _response_cache(self, operation, key):
+        """Returns the response cache of a request, None if its result must
+        not be cached."""
+        cache = getattr(self.configuration, 'response_cache', None)
+        if key is None or cache is None or not cache.enabled_for(operation):
+            return None
+        return cache
+
+    def _invalidate_cache(self, method, url):
+        """Drops the cached results a successful request may have
+        changed."""
+        cache = getattr(self.configuration, 'response_cache', None)
+        if cache is not None and method not in ('GET', 'HEAD', 'OPTIONS'):
+            cache.invalidate(url)
+
+    def _hedging_policy(self, method, resource_path, body, post_params,
+                        preload_content):
+        """Returns the hedging policy of a request, None if it must not be
+        hedged: hedging is disabled or not enabled for the operation, the
+        response is streamed or the body cannot be sent twice."""
+        hedging = getattr(self.configuration, 'hedging', None)
+        if (hedging is None or not preload_content or post_params or
+                isinstance(body, StreamingBody)):
+            return None
+        return hedging.for_operation(method, resource_path)
+
+    def _prepare_request(self, resource_path, path_params=None,
+                         query_params=None, header_params=None, body=None,
+                         post_params=None, files=None, auth_settings=None,
+                         collection_formats=None):
+        """Builds the url, parameters and body of a request.
+
+        Shared by the blocking and the asyncio clients so both send exactly
+        the same request for the same operation.
+
+        :return: tuple of (url, query_params, header_params, post_params,
+                 body), ready to be handed to `request`.
+        """
         config = self.configuration
 
         # header parameters
@@ -144,20 +299,80 @@ class ApiClient(object):
         # request url
         url = self.configuration.host + resource_path
 
-        # perform request and return response
-        response_data = self.request(
-            method, url, query_params=query_params, headers=header_params,
-            post_params=post_params, body=body,
-            _preload_content=_preload_content,
-            _request_timeout=_request_timeout)
+        return url, query_params, header_params, post_params, body
+
+    def _prepare_operation(self, operation, path_params, query_params,
+                           header_params, body, post_params, files):
+        """Builds the request of an operation from its descriptor, as
+        `_prepare_request` does from the parameters of `call_api`: the url
+        comes from the precompiled path template, the `Accept` and
+        `Content-Type` headers from the descriptor, and values of plain
+        types are not serialized.
 
+        :param operation: `signer_client.operations.Operation`.
+        :return: tuple of (url, query_params, header_params, post_params,
+                 body), ready to be handed to `request`.
+        """
+        if operation.collection_formats:
+            header_params.update(operation.headers)
+            return self._prepare_request(
+                operation.path, path_params, query_params, header_params,
+                body, post_params, files, operation.auth_settings,
+                operation.collection_formats)
+        config = self.configuration
+
+        # header parameters
+        header_params.update(operation.headers)
+        header_params.update(self.default_headers)
+        if self.cookie:
+            header_params['Cookie'] = self.cookie
+        for value in six.itervalues(header_params):
+            if not isinstance(value, str):
+                header_params = dict(self.parameters_to_tuples(
+                    self.sanitize_for_serialization(header_params), None))
+                break
+
+        # path and query parameters
+        url = config.host + operation.url_path(
+            path_params, config.safe_chars_for_path_param)
+        query_params = [(name, operations.plain(value))
+                        for name, value in query_params]
+
+        # post parameters
+        if post_params or files:
+            post_params = self.prepare_post_parameters(post_params, files)
+            post_params = self.sanitize_for_serialization(post_params)
+            post_params = self.parameters_to_tuples(post_params, None)
+
+        # auth setting
+        self.update_params_for_auth(header_params, query_params,
+                                    operation.auth_settings)
+
+        # body
+        if body:
+            body = self.sanitize_for_serialization(body)
+
+        return url, query_params, header_params, post_params, body
+
+    def _process_response(self, response_data, response_type,
+                          _return_http_data_only, _preload_content,
+                          response_options=None):
+        """Deserializes a response as returned by `__call_api`.
+
+        :param response_data: RESTResponse, or the raw response when
+            `_preload_content` is False.
+        :param response_options: (format, fields) as returned by
+            `_response_options`, None for models.
+        :return: the deserialized data, optionally with status and headers.
+        """
         self.last_response = response_data
 
         return_data = response_data
         if _preload_content:
             # deserialize response data
             if response_type:
-                return_data = self.deserialize(response_data, response_type)
+                return_data = self.deserialize(response_data, response_type,
+                                               *(response_options or ()))
             else:
                 return_data = None
 
@@ -178,46 +393,29 @@ class ApiClient(object):
         If obj is dict, return the dict.
         If obj is swagger model, return the properties dict.
 
+        Encoders are compiled once per type, see `signer_client.serializer`.
+
         :param obj: The data to serialize.
         :return: The serialized form of data.
         """
-        if obj is None:
-            return None
-        elif isinstance(obj, self.PRIMITIVE_TYPES):
-            return obj
-        elif isinstance(obj, list):
-            return [self.sanitize_for_serialization(sub_obj)
-                    for sub_obj in obj]
-        elif isinstance(obj, tuple):
-            return tuple(self.sanitize_for_serialization(sub_obj)
-                         for sub_obj in obj)
-        elif isinstance(obj, (datetime.datetime, datetime.date)):
-            return obj.isoformat()
-
-        if isinstance(obj, dict):
-            obj_dict = obj
-        else:
-            # Convert model obj to dict except
-            # attributes `swagger_types`, `attribute_map`
-            # and attributes which value is not None.
-            # Convert attribute name to json key in
-            # model definition for request.
-            obj_dict = {obj.attribute_map[attr]: getattr(obj, attr)
-                        for attr, _ in six.iteritems(obj.swagger_types)
-                        if getattr(obj, attr) is not None}
-
-        return {key: self.sanitize_for_serialization(val)
-                for key, val in six.iteritems(obj_dict)}
-
-    def deserialize(self, response, response_type):
+        return serializer.sanitize(obj)
+
+    def deserialize(self, response, response_type, response_format=None,
+                    fields=None):
         """Deserializes response into an object.
 
         :param response: RESTResponse object to be deserialized.
         :param response_type: class literal for
             deserialized object, or string of class name.
+        :param response_format: 'model' (default), 'dict' for the decoded
+            JSON or 'raw' for the body bytes, see `signer_client.projection`.
+        :param fields: tuple of the JSON paths to keep, None for all.
 
         :return: deserialized object.
         """
+        if response_format == projection.RAW:
+            return response.data
+
         # handle file downloading
         # save response body into a tmp file and return the instance
         if response_type == "file":
@@ -225,57 +423,31 @@ class ApiClient(object):
 
         # fetch data from response object
         try:
-            data = json.loads(response.data)
+            data = get_codec(self.configuration).loads(response.data)
         except ValueError:
             data = response.data
+            if isinstance(data, bytes):
+                # e.g. a plain text response
+                data = data.decode('utf-8', 'replace')
 
-        return self.__deserialize(data, response_type)
-
-    def __deserialize(self, data, klass):
-        """Deserializes dict, list, str into an object.
-
-        :param data: dict, list or str.
-        :param klass: class literal, or string of class name.
-
-        :return: object.
-        """
-        if data is None:
-            return None
-
-        if type(klass) == str:
-            if klass.startswith('list['):
-                sub_kls = re.match(r'list\[(.*)\]', klass).group(1)
-                return [self.__deserialize(sub_data, sub_kls)
-                        for sub_data in data]
-
-            if klass.startswith('dict('):
-                sub_kls = re.match(r'dict\(([^,]*), (.*)\)', klass).group(2)
-                return {k: self.__deserialize(v, sub_kls)
-                        for k, v in six.iteritems(data)}
-
-            # convert str to class
-            if klass in self.NATIVE_TYPES_MAPPING:
-                klass = self.NATIVE_TYPES_MAPPING[klass]
-            else:
-                klass = getattr(signer_client.models, klass)
-
-        if klass in self.PRIMITIVE_TYPES:
-            return self.__deserialize_primitive(data, klass)
-        elif klass == object:
-            return self.__deserialize_object(data)
-        elif klass == datetime.date:
-            return self.__deserialize_date(data)
-        elif klass == datetime.datetime:
-            return self.__deserialize_datatime(data)
-        else:
-            return self.__deserialize_model(data, klass)
+        if fields is not None:
+            data = projection.project(data, fields)
+        if response_format == projection.DICT:
+            return data
+        return deserializer.deserialize(
+            data, response_type,
+            getattr(self.configuration, 'trusted_deserialization', False),
+            getattr(self.configuration, 'lazy_datetimes', False),
+            getattr(self.configuration, 'compact_models', False),
+            getattr(self.configuration, 'lazy_models', False))
 
     def call_api(self, resource_path, method,
                  path_params=None, query_params=None, header_params=None,
                  body=None, post_params=None, files=None,
                  response_type=None, auth_settings=None, async_req=None,
                  _return_http_data_only=None, collection_formats=None,
-                 _preload_content=True, _request_timeout=None):
+                 _preload_content=True, _request_timeout=None,
+                 _response_format=None, _fields=None, _operation=None):
         """Makes the HTTP request (synchronous) and returns deserialized data.
 
         To make an async request, set the async_req parameter.
@@ -293,7 +465,9 @@ class ApiClient(object):
         :param response: Response data type.
         :param files dict: key -> filename, value -> filepath,
             for `multipart/form-data`.
-        :param async_req bool: execute request asynchronously
+        :param async_req bool: execute request asynchronously, on
+            `configuration.executor` or the shared pool of
+            `signer_client.executor`
         :param _return_http_data_only: response data without head status code
                                        and headers
         :param collection_formats: dict of collection formats for path, query,
@@ -305,10 +479,17 @@ class ApiClient(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _response_format: 'model', 'dict' (decoded JSON) or 'raw'
+                                 (body bytes); defaults to
+                                 `configuration.response_format`.
+        :param _fields: JSON paths of the response to keep, e.g.
+                        ``['items.id', 'totalCount']``; None keeps all.
+        :param _operation: `signer_client.operations.Operation` describing
+                           the call, set by `call_operation`.
         :return:
             If async_req parameter is True,
             the request will be called asynchronously.
-            The method will return the request thread.
+            The method will return a `signer_client.executor.ApiFuture`.
             If parameter async_req is False or missing,
             then the method will return the response directly.
         """
@@ -318,33 +499,94 @@ class ApiClient(object):
                                    body, post_params, files,
                                    response_type, auth_settings,
                                    _return_http_data_only, collection_formats,
-                                   _preload_content, _request_timeout)
+                                   _preload_content, _request_timeout,
+                                   _response_format, _fields, _operation)
         else:
-            thread = self.pool.apply_async(self.__call_api, (resource_path,
-                                           method, path_params, query_params,
-                                           header_params, body,
-                                           post_params, files,
-                                           response_type, auth_settings,
-                                           _return_http_data_only,
-                                           collection_formats,
-                                           _preload_content, _request_timeout))
-        return thread
+            return submit(getattr(self.configuration, 'executor', None),
+                          self.__call_api, resource_path,
+                          method, path_params, query_params,
+                          header_params, body,
+                          post_params, files,
+                          response_type, auth_settings,
+                          _return_http_data_only,
+                          collection_formats,
+                          _preload_content, _request_timeout,
+                          _response_format, _fields, _operation)
+
+    def call_operation(self, operation, args, kwargs):
+        """Calls an API operation with the arguments of its generated
+        method.
+
+        :param operation: `signer_client.operations.Operation` of the
+            method.
+        :param args: values of its positional parameters.
+        :param kwargs: its keyword arguments, parameters and options
+            (`async_req`, `_preload_content`...) alike.
+        :return: as `call_api`.
+        :raise TypeError: unexpected keyword argument.
+        :raise ValueError: missing required parameter.
+        """
+        params = operation.bind(args, kwargs)
+        path_params = {}
+        query_params = []
+        header_params = {}
+        form_params = []
+        files = {}
+        # most operations only have parameters of one or two kinds
+        if operation.path_params:
+            path_params = {name: params[param]
+                           for name, param in operation.path_params
+                           if param in params}
+        if operation.query_params:
+            query_params = [(name, params[param])
+                            for name, param in operation.query_params
+                            if param in params]
+        if operation.header_params:
+            header_params = {name: params[param]
+                             for name, param in operation.header_params
+                             if param in params}
+        if operation.form_params:
+            form_params = [(name, params[param])
+                           for name, param in operation.form_params
+                           if param in params]
+        if operation.file_params:
+            files = {name: params[param]
+                     for name, param in operation.file_params
+                     if param in params}
+        return self.call_api(
+            operation.path, operation.method, path_params, query_params,
+            header_params, body=params.get(operation.body_param),
+            post_params=form_params, files=files,
+            response_type=operation.response_type,
+            auth_settings=operation.auth_settings,
+            async_req=params.get('async_req'),
+            _return_http_data_only=params.get('_return_http_data_only'),
+            _preload_content=params.get('_preload_content', True),
+            _request_timeout=params.get('_request_timeout'),
+            _response_format=params.get('_response_format'),
+            _fields=params.get('_fields'),
+            collection_formats=operation.collection_formats,
+            _operation=operation)
 
     def request(self, method, url, query_params=None, headers=None,
                 post_params=None, body=None, _preload_content=True,
-                _request_timeout=None):
+                _request_timeout=None, _retry_policy=None, _throttle=None):
         """Makes the HTTP request using RESTClient."""
         if method == "GET":
             return self.rest_client.GET(url,
                                         query_params=query_params,
                                         _preload_content=_preload_content,
                                         _request_timeout=_request_timeout,
+                                        _retry_policy=_retry_policy,
+                                        _throttle=_throttle,
                                         headers=headers)
         elif method == "HEAD":
             return self.rest_client.HEAD(url,
                                          query_params=query_params,
                                          _preload_content=_preload_content,
                                          _request_timeout=_request_timeout,
+                                         _retry_policy=_retry_policy,
+                                         _throttle=_throttle,
                                          headers=headers)
         elif method == "OPTIONS":
             return self.rest_client.OPTIONS(url,
@@ -353,6 +595,8 @@ class ApiClient(object):
                                             post_params=post_params,
                                             _preload_content=_preload_content,
                                             _request_timeout=_request_timeout,
+                                            _retry_policy=_retry_policy,
+                                            _throttle=_throttle,
                                             body=body)
         elif method == "POST":
             return self.rest_client.POST(url,
@@ -361,6 +605,8 @@ class ApiClient(object):
                                          post_params=post_params,
                                          _preload_content=_preload_content,
                                          _request_timeout=_request_timeout,
+                                         _retry_policy=_retry_policy,
+                                         _throttle=_throttle,
                                          body=body)
         elif method == "PUT":
             return self.rest_client.PUT(url,
@@ -369,6 +615,8 @@ class ApiClient(object):
                                         post_params=post_params,
                                         _preload_content=_preload_content,
                                         _request_timeout=_request_timeout,
+                                        _retry_policy=_retry_policy,
+                                        _throttle=_throttle,
                                         body=body)
         elif method == "PATCH":
             return self.rest_client.PATCH(url,
@@ -377,6 +625,8 @@ class ApiClient(object):
                                           post_params=post_params,
                                           _preload_content=_preload_content,
                                           _request_timeout=_request_timeout,
+                                          _retry_policy=_retry_policy,
+                                          _throttle=_throttle,
                                           body=body)
         elif method == "DELETE":
             return self.rest_client.DELETE(url,
@@ -384,6 +634,8 @@ class ApiClient(object):
                                            headers=headers,
                                            _preload_content=_preload_content,
                                            _request_timeout=_request_timeout,
+                                           _retry_policy=_retry_policy,
+                                           _throttle=_throttle,
                                            body=body)
         else:
             raise ValueError(
@@ -424,6 +676,10 @@ class ApiClient(object):
     def prepare_post_parameters(self, post_params=None, files=None):
         """Builds form parameters.
 
+        Files are not read here: they become `FilePart` tuples that the REST
+        layer streams from disk while sending the request. Form parameters
+        holding a file object or a path-like object are files as well.
+
         :param post_params: Normal form parameters.
         :param files: File parameters.
         :return: Form parameters with files.
@@ -431,7 +687,9 @@ class ApiClient(object):
         params = []
 
         if post_params:
-            params = post_params
+            for k, v in (six.iteritems(post_params)
+                         if isinstance(post_params, dict) else post_params):
+                params.append((k, FilePart.from_value(v) or v))
 
         if files:
             for k, v in six.iteritems(files):
@@ -439,13 +697,8 @@ class ApiClient(object):
                     continue
                 file_names = v if type(v) is list else [v]
                 for n in file_names:
-                    with open(n, 'rb') as f:
-                        filename = os.path.basename(f.name)
-                        filedata = f.read()
-                        mimetype = (mimetypes.guess_type(filename)[0] or
-                                    'application/octet-stream')
-                        params.append(
-                            tuple([k, tuple([filename, filedata, mimetype])]))
+                    params.append(
+                        (k, FilePart(os.path.basename(n), n)))
 
         return params
 
@@ -532,101 +785,3 @@ class ApiClient(object):
                 else:
                     f.write(response_data)
         return path
-
-    def __deserialize_primitive(self, data, klass):
-        """Deserializes string to primitive type.
-
-        :param data: str.
-        :param klass: class literal.
-
-        :return: int, long, float, str, bool.
-        """
-        try:
-            return klass(data)
-        except UnicodeEncodeError:
-            return six.text_type(data)
-        except TypeError:
-            return data
-
-    def __deserialize_object(self, value):
-        """Return a original value.
-
-        :return: object.
-        """
-        return value
-
-    def __deserialize_date(self, string):
-        """Deserializes string to date.
-
-        :param string: str.
-        :return: date.
-        """
-        try:
-            from dateutil.parser import parse
-            return parse(string).date()
-        except ImportError:
-            return string
-        except ValueError:
-            raise rest.ApiException(
-                status=0,
-                reason="Failed to parse `{0}` as date object".format(string)
-            )
-
-    def __deserialize_datatime(self, string):
-        """Deserializes string to datetime.
-
-        The string should be in iso8601 datetime format.
-
-        :param string: str.
-        :return: datetime.
-        """
-        try:
-            from dateutil.parser import parse
-            return parse(string)
-        except ImportError:
-            return string
-        except ValueError:
-            raise rest.ApiException(
-                status=0,
-                reason=(
-                    "Failed to parse `{0}` as datetime object"
-                    .format(string)
-                )
-            )
-
-    def __hasattr(self, object, name):
-            return name in object.__class__.__dict__
-
-    def __deserialize_model(self, data, klass):
-        """Deserializes list or dict to model.
-
-        :param data: dict, list.
-        :param klass: class literal.
-        :return: model object.
-        """
-
-        if not klass.swagger_types and not self.__hasattr(klass, 'get_real_child_model'):
-            return data
-
-        kwargs = {}
-        if klass.swagger_types is not None:
-            for attr, attr_type in six.iteritems(klass.swagger_types):
-                if (data is not None and
-                        klass.attribute_map[attr] in data and
-                        isinstance(data, (list, dict))):
-                    value = data[klass.attribute_map[attr]]
-                    kwargs[attr] = self.__deserialize(value, attr_type)
-
-        instance = klass(**kwargs)
-
-        if (isinstance(instance, dict) and
-                klass.swagger_types is not None and
-                isinstance(data, dict)):
-            for key, value in data.items():
-                if key not in klass.swagger_types:
-                    instance[key] = value
-        if self.__hasattr(instance, 'get_real_child_model'):
-            klass_name = instance.get_real_child_model(data)
-            if klass_name:
-                instance = self.__deserialize(data, klass_name)
-        return instance
@@ -0,0 +1,264 @@
+# coding: utf-8
+
+"""
+HTTP cache of GET responses, keeping the deserialized results.
+
+Enabled by setting `Configuration.response_cache` to a `ResponseCache`.
+A GET whose result is cached and fresh is answered locally, without a
+request nor deserialization. Once stale, the result is revalidated with
+``If-None-Match`` / ``If-Modified-Since``: a ``304 Not Modified`` answer
+refreshes it and returns it again, so unchanged resources cost a round
+trip with an empty body and no parsing.
+
+Freshness comes from the TTL configured for the operation if any (e.g.
+``{'GET /api/organizations': 300}``), else from ``Cache-Control: max-age``
+(minus ``Age``), else from `default_ttl`. Responses with
+``Cache-Control: no-store`` are not kept, ``no-cache`` ones are always
+revalidated. Successful POST, PUT, PATCH and DELETE requests invalidate the
+cached results of their url and of its parent paths, e.g. a PUT on
+``/api/documents/{id}/folder`` invalidates ``/api/documents/{id}``.
+
+Cached results are shared by the callers, so they must be treated as
+read-only.
+"""
+
+from __future__ import absolute_import
+
+import collections
+import threading
+import time
+
+from six.moves.urllib.parse import urlsplit
+
+
+class CacheStats(object):
+    """Thread-safe counters of a `ResponseCache`."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Sets all counters back to zero."""
+        with self._lock:
+            #: requests answered from the cache without a round trip
+            self.hits = 0
+            #: requests with nothing cached
+            self.misses = 0
+            #: conditional requests sent for stale results
+            self.revalidations = 0
+            #: revalidations answered with 304 Not Modified
+            self.not_modified = 0
+            #: results evicted to stay within the size limits
+            self.evictions = 0
+            #: results dropped by unsafe requests
+            self.invalidations = 0
+
+    def record(self, **counts):
+        with self._lock:
+            for name, count in counts.items():
+                setattr(self, name, getattr(self, name) + count)
+
+    def as_dict(self):
+        """Returns a snapshot of the counters and the hit ratio, counting
+        304 answers as hits."""
+        with self._lock:
+            stats = {
+                'hits': self.hits,
+                'misses': self.misses,
+                'revalidations': self.revalidations,
+                'not_modified': self.not_modified,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+            }
+        lookups = stats['hits'] + stats['misses'] + stats['revalidations']
+        stats['hit_ratio'] = (
+            float(stats['hits'] + stats['not_modified']) / lookups
+            if lookups else None)
+        return stats
+
+    def __repr__(self):
+        return 'CacheStats(%r)' % self.as_dict()
+
+
+class CacheEntry(object):
+    """A cached result with its validators."""
+
+    __slots__ = ('path', 'value', 'etag', 'last_modified', 'expires_at',
+                 'size')
+
+    def __init__(self, path, value, etag, last_modified, expires_at, size):
+        self.path = path
+        self.value = value
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at
+        self.size = size
+
+    @property
+    def fresh(self):
+        return time.monotonic() < self.expires_at
+
+    def conditional_headers(self):
+        """Returns the headers revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+def parse_cache_control(value):
+    """Parses a `Cache-Control` header into a dict of lower-case
+    directives, mapped to their value or True."""
+    directives = {}
+    for part in (value or '').split(','):
+        name, _, argument = part.strip().partition('=')
+        if name:
+            directives[name.lower()] = argument.strip('"') or True
+    return directives
+
+
+class ResponseCache(object):
+    """Size-bounded LRU cache of deserialized GET results.
+
+    :param max_entries: maximum number of results kept.
+    :param max_bytes: maximum total size of the response bodies the kept
+        results were parsed from, None for no limit.
+    :param default_ttl: seconds a result stays fresh when neither the
+        operation nor the response sets it. With 0 (default), results are
+        revalidated on every use and only kept when the response has an
+        `ETag` or `Last-Modified`.
+    :param ttls: dict of freshness lifetimes by operation, in seconds,
+        taking precedence over the response headers, e.g.
+        ``{'GET /api/documents/{id}': 30, 'GET /api/organizations': 300}``.
+        A TTL of None disables caching for the operation.
+    """
+
+    def __init__(self, max_entries=1024, max_bytes=None, default_ttl=0,
+                 ttls=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        self._bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def enabled_for(self, operation):
+        """Tells whether the results of an operation (``'GET /path'``) may
+        be cached."""
+        return self.ttls.get(operation, 0) is not None
+
+    def get(self, key):
+        """Returns the entry of `key`, or None, and counts the lookup."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is None:
+            self.stats.record(misses=1)
+        elif entry.fresh:
+            self.stats.record(hits=1)
+        else:
+            self.stats.record(revalidations=1)
+        return entry
+
+    def _ttl(self, operation, headers):
+        ttl = self.ttls.get(operation)
+        if ttl is not None:
+            return ttl
+        directives = parse_cache_control(headers.get('Cache-Control'))
+        if 'no-cache' in directives:
+            return 0
+        max_age = directives.get('max-age')
+        if max_age not in (None, True):
+            try:
+                return max(0, int(max_age) - int(headers.get('Age') or 0))
+            except ValueError:
+                pass
+        return self.default_ttl
+
+    def store(self, key, operation, url, value, response):
+        """Keeps the result of a 200 response if it is cacheable.
+
+        :param key: key of the request.
+        :param operation: method and path template of the request.
+        :param url: url of the request, for invalidations.
+        :param value: the deserialized result.
+        :param response: the `RESTResponse` it was parsed from.
+        """
+        headers = response.getheaders() or {}
+        if (response.status != 200 or
+                'no-store' in parse_cache_control(
+                    headers.get('Cache-Control'))):
+            return
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        ttl = self._ttl(operation, headers)
+        if ttl <= 0 and not etag and not last_modified:
+            return
+        entry = CacheEntry(_path(url), value, etag, last_modified,
+                           time.monotonic() + ttl, len(response.data or b''))
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.size
+            self._entries[key] = entry
+            self._bytes += entry.size
+            evicted = 0
+            while self._entries and (
+                    len(self._entries) > self.max_entries or
+                    (self.max_bytes is not None and
+                     self._bytes > self.max_bytes)):
+                _, oldest = self._entries.popitem(last=False)
+                self._bytes -= oldest.size
+                evicted += 1
+        if evicted:
+            self.stats.record(evictions=evicted)
+
+    def refresh(self, key, operation, entry, headers):
+        """Marks `entry` fresh again after a 304 answer and returns its
+        result."""
+        headers = headers or {}
+        entry.expires_at = time.monotonic() + self._ttl(operation, headers)
+        entry.etag = headers.get('ETag') or entry.etag
+        entry.last_modified = (headers.get('Last-Modified') or
+                               entry.last_modified)
+        self.stats.record(not_modified=1)
+        return entry.value
+
+    def invalidate(self, url):
+        """Drops the results of `url` and of its parent paths, whatever
+        their query string."""
+        path = _path(url)
+        prefixes = set()
+        while path:
+            prefixes.add(path)
+            path = path.rsplit('/', 1)[0]
+        with self._lock:
+            stale = [key for key, entry in self._entries.items()
+                     if entry.path in prefixes]
+            for key in stale:
+                self._bytes -= self._entries.pop(key).size
+        if stale:
+            self.stats.record(invalidations=len(stale))
+
+    def clear(self):
+        """Drops all the results."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __repr__(self):
+        return 'ResponseCache(entries=%d, max_entries=%r)' % (
+            len(self._entries), self.max_entries)
+
+
+def _path(url):
+    return urlsplit(url).path.rstrip('/')
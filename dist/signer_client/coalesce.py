@@ -0,0 +1,124 @@
+# coding: utf-8
+
+"""
+Coalescing of identical concurrent GET requests ("single flight").
+
+When `Configuration.coalesce_requests` is enabled, a GET sent while an
+identical one (same url and query, headers and response type) is still in
+flight is not sent again: the caller waits for the first request and gets
+the same deserialized result, or the same exception. Bursts of calls for
+the same document then cost a single round trip.
+
+Callers sharing a request share the result object too, so models returned
+by coalesced calls must be treated as read-only.
+"""
+
+from __future__ import absolute_import
+
+import threading
+from concurrent.futures import Future, TimeoutError
+
+from signer_client.deadline import DeadlineExceeded, time_left
+
+
+class CoalescingStats(object):
+    """Thread-safe counters of a `SingleFlight`."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Sets all counters back to zero."""
+        with self._lock:
+            #: requests sent
+            self.requests = 0
+            #: calls served by a request already in flight
+            self.coalesced = 0
+
+    def record(self, requests=0, coalesced=0):
+        with self._lock:
+            self.requests += requests
+            self.coalesced += coalesced
+
+    def as_dict(self):
+        """Returns a snapshot of the counters."""
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'coalesced': self.coalesced,
+            }
+
+    def __repr__(self):
+        return 'CoalescingStats(%r)' % self.as_dict()
+
+
+class SingleFlight(object):
+    """Runs at most one call per key at a time, sharing its outcome with
+    the callers that arrive while it runs."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._tasks = {}
+        self.stats = CoalescingStats()
+
+    def call(self, key, fn):
+        """Returns ``fn()``, or the outcome of the call of `key` in flight.
+
+        Waiting callers give up with `DeadlineExceeded` at the deadline of
+        their operation (see `signer_client.deadline`).
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            self.stats.record(coalesced=1)
+            try:
+                return future.result(time_left())
+            except TimeoutError:
+                raise DeadlineExceeded('Deadline exceeded')
+
+        self.stats.record(requests=1)
+        try:
+            result = fn()
+        except BaseException as e:
+            self._done(key)
+            future.set_exception(e)
+            raise
+        self._done(key)
+        future.set_result(result)
+        return result
+
+    def _done(self, key):
+        with self._lock:
+            del self._calls[key]
+
+    async def call_async(self, key, factory):
+        """Coroutine version of `call`; `factory` returns a coroutine.
+
+        The request runs in a task of its own, so cancelling one of the
+        callers does not cancel it for the others.
+        """
+        # only needed by the asyncio client, not loaded by the blocking one
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        task = self._tasks.get((loop, key))
+        if task is None:
+            self.stats.record(requests=1)
+            task = asyncio.ensure_future(factory())
+            self._tasks[(loop, key)] = task
+            task.add_done_callback(
+                lambda task: self._task_done(loop, key, task))
+        else:
+            self.stats.record(coalesced=1)
+        return await asyncio.shield(task)
+
+    def _task_done(self, loop, key, task):
+        self._tasks.pop((loop, key), None)
+        if not task.cancelled():
+            # retrieved, even if all the callers were cancelled
+            task.exception()
@@ -0,0 +1,232 @@
+# coding: utf-8
+
+"""
+HTTP compression: negotiated response decoding and opt-in compression of
+request bodies.
+
+Responses are requested with `Accept-Encoding` (see
+`Configuration.accept_encoding`) and decoded by the transport, which tells
+the encodings it decodes (`Transport.accept_encoding`). Request
+bodies are compressed when `Configuration.request_compression` names an
+encoding; this requires the server to accept compressed requests, which is
+why it is off by default.
+
+`TransferStats` counts the bytes that went over the wire against the
+decoded sizes, so the gain can be measured.
+"""
+
+from __future__ import absolute_import
+
+import re
+import threading
+import zlib
+
+from urllib3.util.request import ACCEPT_ENCODING
+
+from signer_client.streaming import StreamingBody
+
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+#: encodings urllib3 can decode, e.g. ``'gzip,deflate,br'``
+DEFAULT_ACCEPT_ENCODING = ACCEPT_ENCODING
+
+
+def accept_encoding(configuration, supported=None):
+    """Returns the `Accept-Encoding` header to send per
+    `configuration.accept_encoding`.
+
+    :param supported: `Accept-Encoding` of the encodings the transport
+        decodes, `DEFAULT_ACCEPT_ENCODING` if None.
+    """
+    value = getattr(configuration, 'accept_encoding', True)
+    if value is True:
+        return supported or DEFAULT_ACCEPT_ENCODING
+    if not value:
+        return 'identity'
+    return value
+
+
+def _zlib_compressor(encoding):
+    # wbits: 16 + 15 writes a gzip container, 15 a zlib one (HTTP deflate)
+    wbits = 31 if encoding == 'gzip' else 15
+    return zlib.compressobj(6, zlib.DEFLATED, wbits)
+
+
+def compressor(encoding):
+    """Returns an object with ``compress(data)`` and ``flush()`` methods
+    producing `encoding` ('gzip', 'deflate' or 'br')."""
+    if encoding in ('gzip', 'deflate'):
+        return _zlib_compressor(encoding)
+    if encoding == 'br':
+        if brotli is None:
+            raise ValueError("The 'br' request compression requires brotli "
+                             "(pip install signer-python-client[brotli]).")
+        return _BrotliCompressor()
+    raise ValueError("Unsupported request compression `%s`, expected one of: "
+                     "gzip, deflate, br" % encoding)
+
+
+class _BrotliCompressor(object):
+
+    def __init__(self):
+        self._compressor = brotli.Compressor(quality=5)
+
+    def compress(self, data):
+        return self._compressor.process(bytes(data))
+
+    def flush(self):
+        return self._compressor.finish()
+
+
+def compress(data, encoding):
+    """Compresses a whole body."""
+    c = compressor(encoding)
+    return c.compress(data) + c.flush()
+
+
+def compress_request(body, content_type, encoding, min_size=0, stats=None):
+    """Compresses an encoded request body if it is JSON.
+
+    :param body: bytes, str or `StreamingBody`, as built by the REST layer.
+    :param content_type: the Content-Type the body is sent with.
+    :param encoding: compression to apply, None to send the body as is.
+    :param min_size: bodies smaller than this are not compressed (streaming
+        bodies of unknown size always are).
+    :param stats: optional `TransferStats` to update.
+    :return: the body to send and the `Content-Encoding` to declare, None if
+        the body was not compressed.
+    """
+    if body is None:
+        return None, None
+    if encoding and not re.search('json', content_type or '', re.IGNORECASE):
+        encoding = None
+    if isinstance(body, StreamingBody):
+        length = body.length
+        if encoding and (length is None or length >= min_size):
+            return CompressedBody(body, encoding, stats), encoding
+        if stats is not None and length is not None:
+            stats.record_request(length, length)
+        return body, None
+    data = body.encode('utf-8') if isinstance(body, str) else body
+    if encoding and len(data) >= min_size:
+        compressed = compress(data, encoding)
+        if stats is not None:
+            stats.record_request(len(data), len(compressed))
+        return compressed, encoding
+    if stats is not None:
+        stats.record_request(len(data), len(data))
+    return body, None
+
+
+class CompressedBody(StreamingBody):
+    """Compresses a `StreamingBody` while it is sent.
+
+    The compressed size is not known in advance, so the body is sent with
+    chunked transfer encoding.
+
+    :param body: the `StreamingBody` to compress.
+    :param encoding: 'gzip', 'deflate' or 'br'.
+    :param stats: optional `TransferStats` updated once the body was sent.
+    """
+
+    def __init__(self, body, encoding, stats=None):
+        compressor(encoding)  # fail early on unsupported encodings
+        self.body = body
+        self.encoding = encoding
+        self.stats = stats
+        self.content_type = body.content_type
+
+    def __iter__(self):
+        c = compressor(self.encoding)
+        raw = sent = 0
+        for chunk in self.body:
+            raw += len(chunk)
+            compressed = c.compress(chunk)
+            if compressed:
+                sent += len(compressed)
+                yield compressed
+        compressed = c.flush()
+        sent += len(compressed)
+        yield compressed
+        if self.stats is not None:
+            self.stats.record_request(raw, sent)
+
+
+class TransferStats(object):
+    """Thread-safe counters of bytes sent and received by a REST client.
+
+    Response sizes are only counted for responses read at once (not for
+    `_preload_content=False` streams).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Sets all counters back to zero."""
+        with self._lock:
+            #: request bodies sent
+            self.requests = 0
+            #: request bodies compressed
+            self.requests_compressed = 0
+            #: size of the request bodies before compression
+            self.request_bytes = 0
+            #: size of the request bodies on the wire
+            self.request_bytes_sent = 0
+            #: responses read
+            self.responses = 0
+            #: responses received with a Content-Encoding
+            self.responses_compressed = 0
+            #: size of the response bodies on the wire
+            self.response_bytes_on_wire = 0
+            #: size of the response bodies once decoded
+            self.response_bytes_decoded = 0
+
+    def record_request(self, raw, sent):
+        with self._lock:
+            self.requests += 1
+            self.request_bytes += raw
+            self.request_bytes_sent += sent
+            if sent != raw:
+                self.requests_compressed += 1
+
+    def record_response(self, on_wire, decoded, encoding=None):
+        with self._lock:
+            self.responses += 1
+            self.response_bytes_on_wire += on_wire
+            self.response_bytes_decoded += decoded
+            if encoding and encoding != 'identity':
+                self.responses_compressed += 1
+
+    def as_dict(self):
+        """Returns a snapshot of the counters, with the compression ratios
+        (bytes on the wire / decoded bytes)."""
+        with self._lock:
+            stats = {
+                'requests': self.requests,
+                'requests_compressed': self.requests_compressed,
+                'request_bytes': self.request_bytes,
+                'request_bytes_sent': self.request_bytes_sent,
+                'responses': self.responses,
+                'responses_compressed': self.responses_compressed,
+                'response_bytes_on_wire': self.response_bytes_on_wire,
+                'response_bytes_decoded': self.response_bytes_decoded,
+            }
+        stats['request_ratio'] = (
+            float(stats['request_bytes_sent']) / stats['request_bytes']
+            if stats['request_bytes'] else None)
+        stats['response_ratio'] = (
+            float(stats['response_bytes_on_wire']) /
+            stats['response_bytes_decoded']
+            if stats['response_bytes_decoded'] else None)
+        return stats
+
+    def __repr__(self):
+        return 'TransferStats(%r)' % self.as_dict()
@@ -96,11 +96,125 @@ class Configuration(six.with_metaclass(TypeWithDefault, object)):
         # cpu_count * 5 is used as default value to increase performance.
         self.connection_pool_maxsize = multiprocessing.cpu_count() * 5
 
+        # HTTP backend: 'urllib3' (default), 'http2' (multiplexes concurrent
+        # requests over a few connections, needs httpx[http2]), a name
+        # registered with `signer_client.transport.register_transport` or a
+        # `signer_client.transport.Transport` instance.
+        self.transport = 'urllib3'
+
+        # Pooled connections unused for longer than this many seconds are
+        # closed instead of reused, e.g. to stay below the idle timeout of a
+        # load balancer. None keeps them until the server closes them.
+        self.connection_idle_timeout = None
+        # Connections are replaced once older than this many seconds (None
+        # for no limit), e.g. to follow DNS changes.
+        self.connection_max_lifetime = None
+        # Resume the TLS session of a host on new connections, which saves a
+        # round trip and the key exchange. Counted in
+        # `RESTClientObject.pool_stats`.
+        self.tls_session_reuse = False
+        # Count pool hits and misses (`RESTClientObject.pool_stats`) and
+        # allow `RESTClientObject.warm_up` with the urllib3 transport, see
+        # `signer_client.pool`. Implied by the three settings above.
+        self.connection_pool_tracking = False
+
+        # JSON codec of request and response bodies, see
+        # `signer_client.codec`: 'json' (the standard library), 'orjson',
+        # 'auto' (orjson when installed, else 'json') or a `JsonCodec`
+        # instance.
+        self.json_codec = 'json'
+
+        # Build response models without calling their constructors and
+        # setters, see `signer_client.deserializer`. Faster, but skips the
+        # validations of the setters.
+        self.trusted_deserialization = False
+
+        # Parse the dates of response models when first read rather than
+        # when the response is received, see `signer_client.deserializer`.
+        self.lazy_datetimes = False
+
+        # Build response models as slotted copies of their classes, which
+        # takes less than half the memory of large listings, see
+        # `signer_client.deserializer.compact_class`.
+        self.compact_models = False
+
+        # Return response models as views over the parsed JSON, building
+        # each attribute on first access, see
+        # `signer_client.deserializer.view_class`. Skips setter validations.
+        self.lazy_models = False
+
+        # What the operations return: 'model', 'dict' (the decoded JSON) or
+        # 'raw' (the body bytes). Overridden per call by `_response_format`,
+        # see `signer_client.projection`.
+        self.response_format = 'model'
+
+        # Items per request and pages requested ahead of the one being read
+        # by the iterators over whole listings (`SignerClient.iter_documents`
+        # and the like), see `signer_client.pagination`.
+        self.page_size = 100
+        self.prefetch_pages = 2
+
+        # Requests running at a time in the parallel scans of whole listings
+        # (`SignerClient.scan_documents`), see `signer_client.pagination`.
+        self.scan_parallelism = 8
+
+        # `concurrent.futures.Executor` running the `async_req=True` calls.
+        # None uses the bounded pool shared by all the clients of the
+        # process, see `signer_client.executor`.
+        self.executor = None
+
+        # Retry policy of failed requests, see `signer_client.retry`: a
+        # `RetryPolicy` enables it, None (default) leaves the connection
+        # retries of urllib3. Copies of a configuration get their own copy
+        # of the policy. Counters are available in `retries.stats`.
+        self.retries = None
+
+        # Identical GET requests sent concurrently share one request and
+        # one deserialized result (treat it as read-only), see
+        # `signer_client.coalesce`. Counted in `ApiClient.singleflight.stats`.
+        self.coalesce_requests = False
+
+        # Cache of GET results revalidated with ETag / Last-Modified, see
+        # `signer_client.cache`: a `ResponseCache` enables it, None (default)
+        # disables it. Counters are available in `response_cache.stats`.
+        self.response_cache = None
+
+        # Hedged requests, see `signer_client.hedging`: a `HedgingPolicy`
+        # sends a backup request when a read is slower than usual and uses
+        # the first response. None (default) disables hedging.
+        self.hedging = None
+
+        # Client-side throttling, see `signer_client.ratelimit`. Use
+        # `RateLimiter.shared(directory, rate)` to keep all the worker
+        # processes of a machine under the API key quota. None disables it.
+        self.rate_limiter = None
+
+        # Response compression, see `signer_client.compression`: True sends
+        # the `Accept-Encoding` of the encodings the transport decodes (see
+        # `Transport.accept_encoding`: gzip, deflate, and br when brotli is
+        # installed), a string sends that value, False asks for uncompressed
+        # responses (`identity`).
+        self.accept_encoding = True
+        # Compression of JSON request bodies: None (default, the server must
+        # accept compressed requests), 'gzip', 'deflate' or 'br'. Bodies
+        # smaller than `request_compression_min_size` bytes are sent as is.
+        self.request_compression = None
+        self.request_compression_min_size = 1024
+
         # Proxy URL
         self.proxy = None
         # Safe chars for path_param
         self.safe_chars_for_path_param = ''
 
+    def __copy__(self):
+        # shallow, but the retry policy keeps its settings and counters per
+        # configuration
+        copied = self.__class__.__new__(self.__class__)
+        copied.__dict__.update(self.__dict__)
+        if self.retries is not None:
+            copied.retries = self.retries.copy()
+        return copied
+
     @property
     def logger_file(self):
         """The logger file.
@@ -0,0 +1,105 @@
+# coding: utf-8
+
+"""
+Deadlines shared by all the requests of an operation.
+
+    with deadline(1.5):
+        document = documents_api.api_documents_id_get(document_id)
+        ticket = documents_api.api_documents_id_ticket_get(document_id)
+
+Requests sent within the block, by the same thread or asyncio task or by
+``async_req`` calls submitted from it, have their timeout capped to the
+time left. Retries and hedged requests are not attempted past the deadline,
+and a request that would start after it fails right away with
+`DeadlineExceeded`. A nested deadline never extends the enclosing one.
+"""
+
+from __future__ import absolute_import
+
+import contextlib
+import contextvars
+import time
+
+_current = contextvars.ContextVar('signer_client_deadline', default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """The deadline of the operation passed before it completed."""
+
+
+class Deadline(object):
+    """Point in time (`time.monotonic`) by which an operation must end."""
+
+    def __init__(self, seconds):
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self):
+        """Seconds left, negative once expired."""
+        return self.expires_at - time.monotonic()
+
+    @property
+    def expired(self):
+        return self.remaining() <= 0
+
+    def check(self):
+        """Raises `DeadlineExceeded` if the deadline passed."""
+        if self.expired:
+            raise DeadlineExceeded('Deadline exceeded')
+
+    def __repr__(self):
+        return 'Deadline(remaining=%.3f)' % self.remaining()
+
+
+@contextlib.contextmanager
+def deadline(seconds):
+    """Runs the block with a budget of `seconds` for all its requests.
+    Yields the `Deadline`."""
+    new = Deadline(seconds)
+    outer = _current.get()
+    if outer is not None and outer.expires_at < new.expires_at:
+        new = outer
+    token = _current.set(new)
+    try:
+        yield new
+    finally:
+        _current.reset(token)
+
+
+def current_deadline():
+    """Returns the `Deadline` of the running operation, or None."""
+    return _current.get()
+
+
+def time_left():
+    """Returns the seconds left before the current deadline, None without
+    one."""
+    current = _current.get()
+    return None if current is None else current.remaining()
+
+
+def within_deadline(delay):
+    """Returns a retry `delay`, or None if the deadline would pass before
+    the retry (or `delay` is None)."""
+    left = time_left()
+    if delay is None or (left is not None and delay >= left):
+        return None
+    return delay
+
+
+def cap_timeout(timeout):
+    """Caps a request timeout (None, a number or a (connection, read)
+    tuple) to the time left before the current deadline, if any.
+
+    :raises DeadlineExceeded: if the deadline already passed.
+    """
+    current = _current.get()
+    if current is None:
+        return timeout
+    left = current.remaining()
+    if left <= 0:
+        raise DeadlineExceeded('Deadline exceeded')
+    if timeout is None:
+        return left
+    if isinstance(timeout, tuple):
+        return tuple(left if t is None else min(t, left) for t in timeout)
+    return min(timeout, left)
@@ -0,0 +1,563 @@
+# coding: utf-8
+
+"""
+Compiled deserialization of API responses into models.
+
+`ApiClient.deserialize` used to walk each value with the type string of its
+attribute: parsing ``list[...]`` / ``dict(...)`` with regular expressions,
+resolving model names in `signer_client.models` and iterating over
+`swagger_types` / `attribute_map` again for every object. Here a type
+string or model class is compiled once into a decoder, a plain function
+taking the decoded JSON value, and the decoders are cached for the life of
+the process: decoding a listing of a thousand documents then only costs
+the dict lookups and object creations it needs.
+
+By default models are built by calling their constructor, so the property
+setters validate the values exactly as before. In trusted mode
+(`Configuration.trusted_deserialization`) the validation is skipped and
+attributes are written directly to new instances, without calling their
+constructor nor their setters.
+
+Dates and datetimes are parsed with `datetime.fromisoformat`, dateutil
+only being used for the strings it rejects, and the last few thousand
+distinct timestamps are cached. With `Configuration.lazy_datetimes` they are
+not parsed at all until read: models are then instances of a subclass of
+their class (same name, `isinstance` holds) keeping the raw string of each
+date attribute until its getter is first called.
+
+With `Configuration.compact_models` models are instances of a copy of their
+class storing the attributes in ``__slots__`` instead of a ``__dict__``: a
+listing then takes less than half the memory, about a quarter with lazy
+dates, for jobs holding large numbers of models. They are not instances of
+the generated class (see `compact_class`).
+
+With `Configuration.lazy_models` models are views over the parsed JSON:
+nothing is converted when the response is received, each attribute (nested
+model, list, datetime...) being built the first time it is read and then
+kept. Code reading a few attributes of large documents skips the cost of
+the rest. Views are instances of a subclass of their class too; like in
+trusted mode, the setters do not validate the values.
+"""
+
+from __future__ import absolute_import
+
+import collections
+import datetime
+import functools
+import re
+import threading
+
+import six
+
+import signer_client.models
+from signer_client import rest
+
+_lock = threading.RLock()
+# decoders by (type, options), complete
+_decoders = {}
+# decoders being compiled, possibly waiting for the decoders of their
+# attributes (models may refer to each other)
+_compiling = {}
+# lazy-datetime subclasses by model class
+_lazy_classes = {}
+# slotted subclasses by (model class, lazy datetimes)
+_compact_classes = {}
+# view subclasses by (model class, options)
+_view_classes = {}
+
+#: distinct date strings whose parsed value is cached
+DATETIME_CACHE_SIZE = 4096
+
+_Options = collections.namedtuple('_Options',
+                                  'trusted lazy_datetimes compact lazy_models')
+
+
+def deserialize(data, klass, trusted=False, lazy_datetimes=False,
+                compact=False, lazy_models=False):
+    """Deserializes decoded JSON `data` into `klass`.
+
+    :param data: dict, list, str... as returned by the JSON codec.
+    :param klass: type string (e.g. ``'list[DocumentsDocumentListModel]'``)
+        or class literal.
+    :param trusted: skip the validations of the model setters.
+    :param lazy_datetimes: parse the date attributes of models on first
+        access.
+    :param compact: build slotted models (see `compact_class`).
+    :param lazy_models: build views materializing their attributes on
+        first access (see `view_class`); takes precedence over `compact`.
+    """
+    if data is None:
+        return None
+    return get_decoder(klass, trusted, lazy_datetimes, compact,
+                       lazy_models)(data)
+
+
+def get_decoder(klass, trusted=False, lazy_datetimes=False, compact=False,
+                lazy_models=False):
+    """Returns the decoder of a type string or class, compiling it on first
+    use. Decoders are never given None."""
+    options = _Options(trusted, lazy_datetimes, compact, lazy_models)
+    decoder = _decoders.get((klass, options))
+    if decoder is not None:
+        return decoder
+    with _lock:
+        outermost = not _compiling
+        try:
+            decoder = _compile(klass, options)
+        except Exception:
+            if outermost:
+                _compiling.clear()
+            raise
+        if outermost:
+            _decoders.update(_compiling)
+            _compiling.clear()
+    return decoder
+
+
+def _compile(klass, options):
+    key = (klass, options)
+    decoder = _decoders.get(key) or _compiling.get(key)
+    if decoder is not None:
+        return decoder
+
+    if isinstance(klass, str):
+        if klass.startswith('list['):
+            decoder = _list_decoder(_compile(klass[5:-1], options))
+        elif klass.startswith('dict('):
+            value_type = klass[5:-1].split(', ', 1)[1]
+            decoder = _dict_decoder(_compile(value_type, options))
+        elif klass in _NATIVE_TYPES:
+            decoder = _compile(_NATIVE_TYPES[klass], options)
+        else:
+            decoder = _compile(getattr(signer_client.models, klass), options)
+    elif klass in _PRIMITIVE_TYPES:
+        decoder = _primitive_decoder(klass)
+    elif klass is object:
+        decoder = _identity
+    elif klass is datetime.date:
+        decoder = deserialize_date
+    elif klass is datetime.datetime:
+        decoder = deserialize_datetime
+    else:
+        return _model_decoder(klass, options)
+    _compiling[key] = decoder
+    return decoder
+
+
+def _identity(data):
+    return data
+
+
+def _list_decoder(decode):
+    def decode_list(data):
+        return [None if item is None else decode(item) for item in data]
+    return decode_list
+
+
+def _dict_decoder(decode):
+    def decode_dict(data):
+        return {k: None if v is None else decode(v)
+                for k, v in six.iteritems(data)}
+    return decode_dict
+
+
+def _primitive_decoder(klass):
+    def decode_primitive(data):
+        if type(data) is klass:
+            return data
+        try:
+            return klass(data)
+        except UnicodeEncodeError:
+            return six.text_type(data)
+        except TypeError:
+            return data
+    return decode_primitive
+
+
+_FRACTION = re.compile(r'[.,](\d+)')
+
+
+def _normalize_iso(string):
+    """Rewrites what `fromisoformat` rejects before Python 3.11: a ``Z``
+    suffix and fractions of other than 3 or 6 digits (.NET sends 7)."""
+    if string[-1:] in ('Z', 'z'):
+        string = string[:-1] + '+00:00'
+    return _FRACTION.sub(
+        lambda match: '.' + (match.group(1) + '000000')[:6], string, 1)
+
+
+@functools.lru_cache(maxsize=DATETIME_CACHE_SIZE)
+def parse_datetime(string):
+    """Parses an ISO 8601 datetime, falling back on dateutil for other
+    formats.
+
+    :raises ValueError: if the string is not a datetime.
+    """
+    try:
+        return datetime.datetime.fromisoformat(string)
+    except ValueError:
+        pass
+    try:
+        return datetime.datetime.fromisoformat(_normalize_iso(string))
+    except ValueError:
+        pass
+    try:
+        from dateutil.parser import parse
+    except ImportError:
+        raise ValueError('Unknown datetime format: %r' % string)
+    return parse(string)
+
+
+def deserialize_date(string):
+    """Deserializes string to date."""
+    try:
+        return parse_datetime(string).date()
+    except (ValueError, OverflowError, TypeError):
+        raise rest.ApiException(
+            status=0,
+            reason="Failed to parse `{0}` as date object".format(string)
+        )
+
+
+def deserialize_datetime(string):
+    """Deserializes an iso8601 string to datetime."""
+    try:
+        return parse_datetime(string)
+    except (ValueError, OverflowError, TypeError):
+        raise rest.ApiException(
+            status=0,
+            reason=(
+                "Failed to parse `{0}` as datetime object"
+                .format(string)
+            )
+        )
+
+
+_DATE_PARSERS = {'date': deserialize_date, 'datetime': deserialize_datetime}
+
+
+def _private_name(klass, attr):
+    """Returns the name under which the generated code of `klass` stores
+    `attr` (``self._attr``, mangled when it starts with an underscore)."""
+    name = '_' + attr
+    if name.startswith('__'):
+        name = '_' + klass.__name__.lstrip('_') + name
+    return name
+
+
+def _instance_template(klass):
+    """Returns the `__dict__` of an empty instance of `klass` when its
+    attributes can be written directly, None otherwise."""
+    if issubclass(klass, dict):
+        return None
+    expected = set(_private_name(klass, attr) for attr in klass.swagger_types)
+    try:
+        template = dict(klass().__dict__)
+    except ValueError:
+        # required attributes: the constructor rejects their absence, after
+        # having set every attribute and the discriminator to None
+        template = dict.fromkeys(expected)
+        template['discriminator'] = None
+    except (TypeError, AttributeError):
+        # required arguments, or no __dict__
+        return None
+    if not expected.issubset(template):
+        return None
+    return template
+
+
+def _lazy_property(prop, private, parse):
+    def fget(self):
+        value = prop.fget(self)
+        if isinstance(value, str):
+            value = parse(value)
+            setattr(self, private, value)
+        return value
+    return property(fget, prop.fset, prop.fdel, prop.__doc__)
+
+
+def _restore(klass, state):
+    instance = object.__new__(klass)
+    instance.__dict__.update(state)
+    return instance
+
+
+def lazy_datetime_class(klass):
+    """Returns the subclass of `klass` parsing its date attributes on first
+    access, or `klass` itself if it has none."""
+    lazy_class = _lazy_classes.get(klass)
+    if lazy_class is not None:
+        return lazy_class
+    lazy_attrs = [attr for attr, attr_type in
+                  six.iteritems(klass.swagger_types)
+                  if attr_type in _DATE_PARSERS]
+    if not lazy_attrs:
+        lazy_class = klass
+    else:
+        def materialize(self):
+            for attr in lazy_attrs:
+                getattr(self, attr)
+
+        def __eq__(self, other):
+            materialize(self)
+            if isinstance(other, lazy_class):
+                materialize(other)
+            return klass.__eq__(self, other)
+
+        def __ne__(self, other):
+            return not self == other
+
+        def __reduce__(self):
+            # pickled as the generated class
+            materialize(self)
+            return _restore, (klass, self.__dict__)
+
+        namespace = {
+            '__module__': klass.__module__,
+            '__doc__': klass.__doc__,
+            '__eq__': __eq__,
+            '__ne__': __ne__,
+            '__reduce__': __reduce__,
+        }
+        for attr in lazy_attrs:
+            namespace[attr] = _lazy_property(
+                getattr(klass, attr), _private_name(klass, attr),
+                _DATE_PARSERS[klass.swagger_types[attr]])
+        lazy_class = type(klass.__name__, (klass,), namespace)
+    return _lazy_classes.setdefault(klass, lazy_class)
+
+
+def _restore_compact(klass, lazy_datetimes, values):
+    instance = object.__new__(compact_class(klass, lazy_datetimes))
+    for private, value in zip(instance.__slots__, values):
+        setattr(instance, private, value)
+    return instance
+
+
+def compact_class(klass, lazy_datetimes=False):
+    """Returns a class keeping the attributes of `klass` (with lazy dates
+    as `lazy_datetime_class`) in slots.
+
+    A subclass would inherit the ``__dict__`` of `klass`, so the class has
+    no base but `object` and gets copies of the methods, properties and
+    class attributes of `klass` instead: instances have no ``__dict__`` and
+    are not instances of `klass`. Their attributes, `to_dict` and pickling
+    behave as with `klass`; they compare equal to compact or regular
+    instances of `klass` with the same values, but the generated
+    ``__eq__`` of a regular instance returns False for them.
+    """
+    key = (klass, lazy_datetimes)
+    compact = _compact_classes.get(key)
+    if compact is not None:
+        return compact
+    base = lazy_datetime_class(klass) if lazy_datetimes else klass
+    attrs = list(klass.swagger_types)
+    slots = tuple(_private_name(klass, attr) for attr in attrs) + (
+        'discriminator',)
+
+    def __eq__(self, other):
+        # the generated method compares the __dict__ of the instances
+        if not (isinstance(other, klass) or
+                getattr(type(other), '_compact_model', None) is klass):
+            return False
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in attrs)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __reduce__(self):
+        return _restore_compact, (
+            klass, lazy_datetimes, [getattr(self, slot) for slot in slots])
+
+    namespace = {}
+    for owner in reversed(base.__mro__[:-1]):
+        namespace.update(vars(owner))
+    for name in ('__dict__', '__weakref__') + slots:
+        namespace.pop(name, None)
+    namespace.update({
+        '__slots__': slots,
+        '__module__': klass.__module__,
+        '__doc__': klass.__doc__,
+        '__eq__': __eq__,
+        '__ne__': __ne__,
+        '__reduce__': __reduce__,
+        '_compact_model': klass,
+    })
+    compact = type(klass.__name__, (object,), namespace)
+    return _compact_classes.setdefault(key, compact)
+
+
+def _view_getattr(self, name):
+    # called for the private attributes not read yet
+    field = type(self)._view_fields.get(name)
+    if field is None:
+        if name == 'discriminator':
+            return None
+        raise AttributeError("'%s' object has no attribute '%s'" % (
+            type(self).__name__, name))
+    json_key, decode = field
+    value = self._json.get(json_key)
+    if value is not None:
+        value = decode(value)
+    setattr(self, name, value)
+    return value
+
+
+def view_class(klass, options):
+    """Returns the subclass of `klass` whose instances are views over a
+    parsed JSON object, converting the value of each attribute on first
+    access with the decoders compiled for `options`."""
+    key = (klass, options)
+    view = _view_classes.get(key)
+    if view is not None:
+        return view
+    attrs = list(klass.swagger_types)
+    privates = [_private_name(klass, attr) for attr in attrs]
+
+    def __eq__(self, other):
+        # the generated method compares the __dict__ of the instances
+        if not isinstance(other, klass):
+            return False
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in attrs)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __reduce__(self):
+        # pickled as the generated class, fully materialized
+        state = {private: getattr(self, private) for private in privates}
+        state['discriminator'] = None
+        return _restore, (klass, state)
+
+    view = type(klass.__name__, (klass,), {
+        '__slots__': ('_json',),
+        '__module__': klass.__module__,
+        '__doc__': klass.__doc__,
+        '__getattr__': _view_getattr,
+        '__eq__': __eq__,
+        '__ne__': __ne__,
+        '__reduce__': __reduce__,
+        # private name -> (json key, decoder), filled by `_model_decoder`
+        '_view_fields': {},
+    })
+    return _view_classes.setdefault(key, view)
+
+
+def _view_decoder(klass, options, has_child_model):
+    view = view_class(klass, options)
+    new = object.__new__
+
+    def decode_view(data):
+        instance = new(view)
+        instance._json = data if isinstance(data, dict) else {}
+        if has_child_model:
+            return _child_model(instance, data, options)
+        return instance
+
+    _compiling[(klass, options)] = decode_view
+    if not view._view_fields:
+        for attr, attr_type in six.iteritems(klass.swagger_types):
+            view._view_fields[_private_name(klass, attr)] = (
+                klass.attribute_map[attr], _compile(attr_type, options))
+    return decode_view
+
+
+def _model_decoder(klass, options):
+    has_child_model = 'get_real_child_model' in klass.__dict__
+    if not klass.swagger_types and not has_child_model:
+        # enums: the value itself
+        _compiling[(klass, options)] = _identity
+        return _identity
+    if options.lazy_models and not issubclass(klass, dict):
+        return _view_decoder(klass, options, has_child_model)
+
+    # (json key, attribute, private name, decoder), filled once this decoder
+    # is registered so that models referring back to `klass` can find it
+    fields = []
+    lazy = (options.lazy_datetimes and
+            lazy_datetime_class(klass) is not klass)
+    is_dict = issubclass(klass, dict)
+    slotted = options.compact and not is_dict
+    if slotted:
+        target = compact_class(klass, lazy)
+        template = None
+    else:
+        target = lazy_datetime_class(klass) if lazy else klass
+        template = _instance_template(klass) if options.trusted else None
+    new = object.__new__
+
+    if options.trusted and slotted:
+        def decode_model(data):
+            instance = new(target)
+            get = data.get if isinstance(data, dict) else {}.get
+            for json_key, _, private, decode in fields:
+                value = get(json_key)
+                setattr(instance, private,
+                        None if value is None else decode(value))
+            instance.discriminator = None
+            if has_child_model:
+                return _child_model(instance, data, options)
+            return instance
+    elif template is not None:
+        def decode_model(data):
+            values = template.copy()
+            if isinstance(data, dict):
+                for json_key, _, private, decode in fields:
+                    value = data.get(json_key)
+                    if value is not None:
+                        values[private] = decode(value)
+            instance = new(target)
+            instance.__dict__ = values
+            if has_child_model:
+                return _child_model(instance, data, options)
+            return instance
+    else:
+        def decode_model(data):
+            kwargs = {}
+            if isinstance(data, dict):
+                for json_key, attr, _, decode in fields:
+                    if json_key in data:
+                        value = data[json_key]
+                        kwargs[attr] = (None if value is None
+                                        else decode(value))
+            instance = target(**kwargs)
+            if is_dict and isinstance(data, dict):
+                for key, value in data.items():
+                    if key not in klass.swagger_types:
+                        instance[key] = value
+            if has_child_model:
+                return _child_model(instance, data, options)
+            return instance
+
+    _compiling[(klass, options)] = decode_model
+    for attr, attr_type in six.iteritems(klass.swagger_types):
+        if lazy and attr_type in _DATE_PARSERS:
+            # kept raw, parsed by the getter of the lazy class
+            decode = _identity
+        else:
+            decode = _compile(attr_type, options)
+        fields.append((klass.attribute_map[attr], attr,
+                       _private_name(klass, attr), decode))
+    return decode_model
+
+
+def _child_model(instance, data, options):
+    klass_name = instance.get_real_child_model(data)
+    if klass_name:
+        return get_decoder(klass_name, *options)(data)
+    return instance
+
+
+_PRIMITIVE_TYPES = (float, bool, bytes, six.text_type) + six.integer_types
+_NATIVE_TYPES = {
+    'int': int,
+    'long': int if six.PY3 else long,  # noqa: F821
+    'float': float,
+    'str': str,
+    'bool': bool,
+    'date': datetime.date,
+    'datetime': datetime.datetime,
+    'object': object,
+}
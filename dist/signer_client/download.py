@@ -0,0 +1,164 @@
+# coding: utf-8
+
+"""
+Streaming of binary responses (document contents) to disk or file objects.
+
+Operations called with ``_preload_content=False`` return the raw response
+without reading its body. The functions below copy that body to a
+destination in fixed-size chunks, so memory use does not depend on the size
+of the document, while computing a checksum of what was written.
+"""
+
+from __future__ import absolute_import
+
+import hashlib
+import os
+import tempfile
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class ChecksumMismatchError(ValueError):
+    """The digest of a download differs from the expected one."""
+
+    def __init__(self, algorithm, expected, actual):
+        super(ChecksumMismatchError, self).__init__(
+            '%s checksum mismatch: expected %s, got %s'
+            % (algorithm, expected, actual))
+        self.algorithm = algorithm
+        self.expected = expected
+        self.actual = actual
+
+
+class DownloadResult(object):
+    """Outcome of a download.
+
+    :param path: the written file, None when writing to a file object.
+    :param size: number of bytes written.
+    :param algorithm: name of the hash algorithm of `digest`.
+    :param digest: hex digest of the written bytes.
+    :param content_type: `Content-Type` of the response.
+    """
+
+    def __init__(self, path, size, algorithm, digest, content_type=None):
+        self.path = path
+        self.size = size
+        self.algorithm = algorithm
+        self.digest = digest
+        self.content_type = content_type
+
+    def __repr__(self):
+        return 'DownloadResult(path=%r, size=%r, %s=%r)' % (
+            self.path, self.size, self.algorithm, self.digest)
+
+
+class _Sink(object):
+    """Writes chunks to a path (through a temporary file in the same
+    directory, moved into place only once complete) or a file object."""
+
+    def __init__(self, destination, algorithm, expected_digest, total,
+                 progress):
+        self.hash = hashlib.new(algorithm)
+        self.algorithm = algorithm
+        self.expected_digest = expected_digest
+        self.total = total
+        self.progress = progress
+        self.size = 0
+        if hasattr(destination, 'write'):
+            self.path = None
+            self.file = destination
+        else:
+            self.path = os.fspath(destination)
+            fd, self.temp_path = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(self.path)),
+                prefix='.%s.' % os.path.basename(self.path), suffix='.part')
+            self.file = os.fdopen(fd, 'wb')
+
+    def write(self, chunk):
+        if not chunk:
+            return
+        self.file.write(chunk)
+        self.hash.update(chunk)
+        self.size += len(chunk)
+        if self.progress is not None:
+            self.progress(self.size, self.total)
+
+    def finish(self, content_type):
+        digest = self.hash.hexdigest()
+        if self.path is not None:
+            self.file.close()
+        if (self.expected_digest is not None and
+                digest != self.expected_digest.lower()):
+            self.abort()
+            raise ChecksumMismatchError(self.algorithm, self.expected_digest,
+                                        digest)
+        if self.path is not None:
+            os.replace(self.temp_path, self.path)
+        return DownloadResult(self.path, self.size, self.algorithm, digest,
+                              content_type)
+
+    def abort(self):
+        if self.path is not None:
+            self.file.close()
+            if os.path.exists(self.temp_path):
+                os.remove(self.temp_path)
+
+
+def _content_length(headers):
+    try:
+        return int(headers.get('Content-Length'))
+    except (TypeError, ValueError):
+        return None
+
+
+def download_response(response, destination, chunk_size=DEFAULT_CHUNK_SIZE,
+                      progress=None, algorithm='sha256',
+                      expected_digest=None):
+    """Copies the body of a raw response to `destination`.
+
+    :param response: response returned by an operation called with
+        ``_preload_content=False``. Its connection is always released.
+    :param destination: a path, or a writable binary file object.
+    :param chunk_size: size of the chunks read from the network.
+    :param progress: optional callable receiving ``(bytes_written, total)``
+        after each chunk; `total` is None without a `Content-Length`.
+    :param algorithm: `hashlib` algorithm of the computed digest.
+    :param expected_digest: hex digest the content must match. On mismatch
+        `ChecksumMismatchError` is raised and a destination path is left
+        untouched.
+    :return: DownloadResult
+    """
+    headers = response.headers
+    sink = _Sink(destination, algorithm, expected_digest,
+                 _content_length(headers), progress)
+    try:
+        try:
+            for chunk in response.stream(chunk_size):
+                sink.write(chunk)
+        except BaseException:
+            sink.abort()
+            raise
+        return sink.finish(headers.get('Content-Type'))
+    finally:
+        response.release_conn()
+
+
+async def async_download_response(response, destination,
+                                  chunk_size=DEFAULT_CHUNK_SIZE,
+                                  progress=None, algorithm='sha256',
+                                  expected_digest=None):
+    """`download_response` for the `aiohttp.ClientResponse` returned by the
+    asyncio client."""
+    headers = response.headers
+    sink = _Sink(destination, algorithm, expected_digest,
+                 _content_length(headers), progress)
+    try:
+        try:
+            async for chunk in response.content.iter_chunked(chunk_size):
+                sink.write(chunk)
+        except BaseException:
+            sink.abort()
+            raise
+        return sink.finish(headers.get('Content-Type'))
+    finally:
+        response.release()
@@ -0,0 +1,108 @@
+# coding: utf-8
+
+"""
+Executor of the asynchronous (``async_req=True``) calls of `ApiClient`.
+
+All the clients of a process share one bounded thread pool, created on the
+first asynchronous call, so short-lived clients do not start and join
+threads of their own. Calls return an `ApiFuture`, a
+`concurrent.futures.Future` that works with `as_completed`, `wait`,
+timeouts and cancellation, and still has the ``get`` of the
+`multiprocessing.pool.AsyncResult` returned by earlier versions.
+
+Set `Configuration.executor` to run the calls of some clients on another
+`concurrent.futures.Executor`.
+"""
+
+from __future__ import absolute_import
+
+import contextvars
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+#: size of the shared pool, matching the default
+#: `Configuration.connection_pool_maxsize` so that every thread finds a
+#: pooled connection
+DEFAULT_MAX_WORKERS = multiprocessing.cpu_count() * 5
+
+_lock = threading.Lock()
+_shared = None
+_max_workers = None
+
+
+class ApiFuture(Future):
+    """`concurrent.futures.Future` of an API call."""
+
+    def get(self, timeout=None):
+        """Returns the result of the call, like `result`. Kept for code
+        written against `multiprocessing.pool.AsyncResult`."""
+        return self.result(timeout)
+
+
+def shared_executor():
+    """Returns the process-wide executor, creating it on first use."""
+    global _shared
+    executor = _shared
+    if executor is None:
+        with _lock:
+            if _shared is None:
+                _shared = ThreadPoolExecutor(
+                    max_workers=_max_workers or DEFAULT_MAX_WORKERS,
+                    thread_name_prefix='signer_client')
+            executor = _shared
+    return executor
+
+
+def set_max_workers(max_workers):
+    """Sets the size of the shared pool. Takes effect on the next call if
+    the pool already exists, whose queued calls still complete."""
+    global _max_workers
+    _max_workers = max_workers
+    shutdown_shared_executor(wait=False)
+
+
+def shutdown_shared_executor(wait=True):
+    """Shuts the shared pool down; the next asynchronous call starts a new
+    one. Calls already submitted complete unless cancelled."""
+    global _shared
+    with _lock:
+        executor, _shared = _shared, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+def submit(executor, fn, *args, **kwargs):
+    """Schedules ``fn(*args, **kwargs)`` on `executor` (the shared pool if
+    None) and returns its `ApiFuture`.
+
+    The call runs in a copy of the current `contextvars` context, so it
+    keeps the deadline of the caller (see `signer_client.deadline`).
+    """
+    future = ApiFuture()
+    (executor or shared_executor()).submit(
+        _run, future, contextvars.copy_context(), fn, args, kwargs)
+    return future
+
+
+def _run(future, context, fn, args, kwargs):
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        result = context.run(fn, *args, **kwargs)
+    except BaseException as e:
+        future.set_exception(e)
+    else:
+        future.set_result(result)
+
+
+def _after_fork():
+    # the threads of the parent do not exist in the child
+    global _lock, _shared
+    _lock = threading.Lock()
+    _shared = None
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork)
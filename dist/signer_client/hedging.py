@@ -0,0 +1,293 @@
+# coding: utf-8
+
+"""
+Hedged requests for latency-sensitive reads.
+
+When a request takes longer than most requests of the same operation (the
+`percentile` of its recent latencies), a backup request is sent and the
+first response to arrive is used. The backup only costs an extra request
+for the slowest few percent of the calls, and cuts their latency to about
+that of a typical call.
+
+Hedging is opt-in (`Configuration.hedging`) and only applies to GET and
+HEAD requests unless the policy of an operation sets ``hedge_post=True``,
+e.g. for ``POST /api/documents/{id}/action-url`` which only builds a URL.
+Requests with ``_preload_content=False`` are never hedged.
+"""
+
+from __future__ import absolute_import
+
+import asyncio
+import collections
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from signer_client.deadline import DeadlineExceeded, time_left
+from signer_client.executor import DEFAULT_MAX_WORKERS, submit
+
+_lock = threading.Lock()
+_executor = None
+
+
+def _hedging_executor():
+    # a pool of its own: queuing behind `async_req` calls of the shared
+    # pool would defeat the purpose.
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=DEFAULT_MAX_WORKERS * 2,
+                    thread_name_prefix='signer_client_hedge')
+    return _executor
+
+
+class HedgingStats(object):
+    """Thread-safe counters of a `HedgingPolicy`."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Sets all counters back to zero."""
+        with self._lock:
+            #: calls of hedged operations
+            self.requests = 0
+            #: backup requests sent
+            self.hedges = 0
+            #: calls answered by the backup request
+            self.wins = 0
+            #: hedging delay last computed, by operation
+            self.delays = {}
+
+    def record(self, operation, delay, hedged, won):
+        with self._lock:
+            self.requests += 1
+            self.hedges += int(hedged)
+            self.wins += int(won)
+            self.delays[operation] = delay
+
+    def as_dict(self):
+        """Returns a snapshot of the counters."""
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'hedges': self.hedges,
+                'wins': self.wins,
+                'hedge_ratio': (float(self.hedges) / self.requests
+                                if self.requests else None),
+                'delays': dict(self.delays),
+            }
+
+    def __repr__(self):
+        return 'HedgingStats(%r)' % self.as_dict()
+
+
+class LatencyTracker(object):
+    """Latencies of the last `window` successful requests of each
+    operation."""
+
+    def __init__(self, window=200):
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples = {}
+
+    def record(self, operation, seconds):
+        with self._lock:
+            samples = self._samples.get(operation)
+            if samples is None:
+                samples = self._samples[operation] = collections.deque(
+                    maxlen=self.window)
+            samples.append(seconds)
+
+    def percentile(self, operation, percentile, min_samples=1):
+        """Returns the `percentile` (0-100) of the recorded latencies, or
+        None with fewer than `min_samples` of them."""
+        with self._lock:
+            samples = sorted(self._samples.get(operation, ()))
+        if not samples or len(samples) < min_samples:
+            return None
+        index = int(round(percentile / 100.0 * (len(samples) - 1)))
+        return samples[index]
+
+
+class HedgingPolicy(object):
+    """Configures when backup requests are sent.
+
+    :param percentile: latency percentile of the operation after which the
+        backup request is sent.
+    :param initial_delay: delay used until `min_samples` latencies of the
+        operation were recorded, in seconds.
+    :param min_delay: lower bound of the delay, in seconds.
+    :param max_delay: upper bound of the delay, in seconds.
+    :param min_samples: latencies needed before using the percentile.
+    :param window: number of recent latencies kept per operation.
+    :param allowed_methods: HTTP methods hedged by default.
+    :param hedge_post: also hedge POST requests. Only enable it for
+        operations that are safe to repeat.
+    :param overrides: dict of policies for specific operations, keyed by
+        method and path template, e.g.
+        ``{'POST /api/documents/{id}/action-url': HedgingPolicy(hedge_post=True)}``,
+        or None to never hedge an operation. Overrides share the counters
+        and latencies of this policy.
+    """
+
+    DEFAULT_ALLOWED_METHODS = frozenset(['GET', 'HEAD'])
+
+    def __init__(self, percentile=95, initial_delay=0.5, min_delay=0.01,
+                 max_delay=5.0, min_samples=20, window=200,
+                 allowed_methods=DEFAULT_ALLOWED_METHODS, hedge_post=False,
+                 overrides=None):
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.allowed_methods = frozenset(m.upper() for m in allowed_methods)
+        self.hedge_post = hedge_post
+        self.stats = HedgingStats()
+        self.latencies = LatencyTracker(window)
+        self.overrides = {}
+        for operation, policy in (overrides or {}).items():
+            self.set_override(operation, policy)
+
+    def set_override(self, operation, policy):
+        """Uses `policy` for one operation.
+
+        :param operation: method and path template, e.g.
+            ``'GET /api/documents/{id}'``.
+        :param policy: a `HedgingPolicy`, or None to never hedge the
+            operation.
+        """
+        method, _, path = operation.partition(' ')
+        if policy is not None:
+            policy.stats = self.stats
+            policy.latencies = self.latencies
+        self.overrides[(method.upper(), path)] = policy
+
+    def for_operation(self, method, resource_path):
+        """Returns the policy applying to an operation, None if it is not
+        hedged.
+
+        :param method: http method.
+        :param resource_path: path template, e.g. ``/api/documents/{id}``.
+        """
+        policy = self.overrides.get((method.upper(), resource_path), self)
+        if policy is None or not policy.is_method_hedged(method):
+            return None
+        return policy
+
+    def is_method_hedged(self, method):
+        method = method.upper()
+        if method == 'POST':
+            return self.hedge_post
+        return method in self.allowed_methods
+
+    def delay(self, operation):
+        """Returns how long to wait for a response before hedging."""
+        latency = self.latencies.percentile(operation, self.percentile,
+                                            self.min_samples)
+        if latency is None:
+            latency = self.initial_delay
+        return min(self.max_delay, max(self.min_delay, latency))
+
+    def _timed(self, operation, send):
+        def call():
+            start = time.monotonic()
+            result = send()
+            self.latencies.record(operation, time.monotonic() - start)
+            return result
+        return call
+
+    def call(self, operation, send, send_backup=None):
+        """Calls `send`, hedging it with `send_backup` (`send` by default)
+        when it is slow, and returns the first successful result.
+
+        :param operation: key of the latencies, e.g. ``'GET /api/x/{id}'``.
+        :raises: the error of the first request if both fail.
+        """
+        delay = self.delay(operation)
+        executor = _hedging_executor()
+        primary = submit(executor, self._timed(operation, send))
+        pending = {primary}
+        done, _ = wait(pending, timeout=_wait_time(delay))
+        backup = None
+        if not done and (time_left() is None or time_left() > 0):
+            backup = submit(executor, self._timed(operation,
+                                                  send_backup or send))
+            pending.add(backup)
+        winner = None
+        while pending:
+            done, pending = wait(pending, timeout=_wait_time(None),
+                                 return_when=FIRST_COMPLETED)
+            if not done:
+                raise DeadlineExceeded('Deadline exceeded')
+            for future in done:
+                if future.exception() is None:
+                    winner = future
+                    break
+            if winner is not None:
+                break
+        self.stats.record(operation, delay, backup is not None,
+                          winner is not None and winner is backup)
+        if winner is None:
+            return primary.result()
+        return winner.result()
+
+    async def call_async(self, operation, send, send_backup=None):
+        """Coroutine version of `call`; `send` and `send_backup` return
+        coroutines. The slower request is cancelled."""
+        delay = self.delay(operation)
+
+        async def timed(factory):
+            start = time.monotonic()
+            result = await factory()
+            self.latencies.record(operation, time.monotonic() - start)
+            return result
+
+        primary = asyncio.ensure_future(timed(send))
+        pending = {primary}
+        backup = None
+        try:
+            done, _ = await asyncio.wait(pending, timeout=_wait_time(delay))
+            if not done and (time_left() is None or time_left() > 0):
+                backup = asyncio.ensure_future(timed(send_backup or send))
+                pending.add(backup)
+            winner = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, timeout=_wait_time(None),
+                    return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    raise DeadlineExceeded('Deadline exceeded')
+                for future in done:
+                    if future.exception() is None:
+                        winner = future
+                        break
+                if winner is not None:
+                    break
+        finally:
+            for future in (primary, backup):
+                if future is not None and not future.done():
+                    future.cancel()
+        self.stats.record(operation, delay, backup is not None,
+                          winner is not None and winner is backup)
+        if winner is None:
+            return primary.result()
+        return winner.result()
+
+    def __repr__(self):
+        return ('HedgingPolicy(percentile=%r, initial_delay=%r, '
+                'hedge_post=%r)' % (self.percentile, self.initial_delay,
+                                    self.hedge_post))
+
+
+def _wait_time(delay):
+    """Caps `delay` (None for no limit) to the current deadline."""
+    left = time_left()
+    if left is None:
+        return delay
+    left = max(0.0, left)
+    return left if delay is None else min(delay, left)
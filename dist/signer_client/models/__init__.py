@@ -13,151 +13,326 @@
 
 from __future__ import absolute_import
 
-# import models into model package
-from signer_client.models.action_status import ActionStatus
-from signer_client.models.agent_types import AgentTypes
-from signer_client.models.agents_agent_model import AgentsAgentModel
-from signer_client.models.api_uploads_body import ApiUploadsBody
-from signer_client.models.applications_application_display_model import ApplicationsApplicationDisplayModel
-from signer_client.models.attachments_attachment_model import AttachmentsAttachmentModel
-from signer_client.models.attachments_attachment_upload_model import AttachmentsAttachmentUploadModel
-from signer_client.models.attachments_create_attachment_result import AttachmentsCreateAttachmentResult
-from signer_client.models.authentication_types import AuthenticationTypes
-from signer_client.models.batch_item_result_model import BatchItemResultModel
-from signer_client.models.billing_billing_information_model import BillingBillingInformationModel
-from signer_client.models.billing_company_billing_information_model import BillingCompanyBillingInformationModel
-from signer_client.models.billing_individual_billing_information_model import BillingIndividualBillingInformationModel
-from signer_client.models.billing_information_types import BillingInformationTypes
-from signer_client.models.certificate_holder_types import CertificateHolderTypes
-from signer_client.models.certificate_types import CertificateTypes
-from signer_client.models.certificates_attribute_certificate_info_model import CertificatesAttributeCertificateInfoModel
-from signer_client.models.delete_action import DeleteAction
-from signer_client.models.document_download_types import DocumentDownloadTypes
-from signer_client.models.document_filter_status import DocumentFilterStatus
-from signer_client.models.document_flows_document_flow_create_request import DocumentFlowsDocumentFlowCreateRequest
-from signer_client.models.document_flows_document_flow_data import DocumentFlowsDocumentFlowData
-from signer_client.models.document_flows_document_flow_details_model import DocumentFlowsDocumentFlowDetailsModel
-from signer_client.models.document_flows_document_flow_model import DocumentFlowsDocumentFlowModel
-from signer_client.models.document_mark_document_mark_position_model import DocumentMarkDocumentMarkPositionModel
-from signer_client.models.document_mark_flow_action_position_model import DocumentMarkFlowActionPositionModel
-from signer_client.models.document_mark_marks_session_create_request import DocumentMarkMarksSessionCreateRequest
-from signer_client.models.document_mark_marks_session_create_response import DocumentMarkMarksSessionCreateResponse
-from signer_client.models.document_mark_marks_session_model import DocumentMarkMarksSessionModel
-from signer_client.models.document_mark_pre_positioned_document_mark_model import DocumentMarkPrePositionedDocumentMarkModel
-from signer_client.models.document_mark_type import DocumentMarkType
-from signer_client.models.document_mark_upload_ticket_model import DocumentMarkUploadTicketModel
-from signer_client.models.document_query_types import DocumentQueryTypes
-from signer_client.models.document_status import DocumentStatus
-from signer_client.models.document_ticket_type import DocumentTicketType
-from signer_client.models.document_types import DocumentTypes
-from signer_client.models.documents_action_url_request import DocumentsActionUrlRequest
-from signer_client.models.documents_action_url_response import DocumentsActionUrlResponse
-from signer_client.models.documents_cancel_document_request import DocumentsCancelDocumentRequest
-from signer_client.models.documents_create_document_request import DocumentsCreateDocumentRequest
-from signer_client.models.documents_create_document_result import DocumentsCreateDocumentResult
-from signer_client.models.documents_creator_model import DocumentsCreatorModel
-from signer_client.models.documents_document_add_version_request import DocumentsDocumentAddVersionRequest
-from signer_client.models.documents_document_additional_info_data import DocumentsDocumentAdditionalInfoData
-from signer_client.models.documents_document_content_model import DocumentsDocumentContentModel
-from signer_client.models.documents_document_file_model import DocumentsDocumentFileModel
-from signer_client.models.documents_document_flow_edit_request import DocumentsDocumentFlowEditRequest
-from signer_client.models.documents_document_list_model import DocumentsDocumentListModel
-from signer_client.models.documents_document_model import DocumentsDocumentModel
-from signer_client.models.documents_document_notified_emails_edit_request import DocumentsDocumentNotifiedEmailsEditRequest
-from signer_client.models.documents_document_permissions_model import DocumentsDocumentPermissionsModel
-from signer_client.models.documents_document_signatures_info_model import DocumentsDocumentSignaturesInfoModel
-from signer_client.models.documents_document_tag_data import DocumentsDocumentTagData
-from signer_client.models.documents_document_tag_model import DocumentsDocumentTagModel
-from signer_client.models.documents_envelope_add_version_request import DocumentsEnvelopeAddVersionRequest
-from signer_client.models.documents_flow_action_pending_model import DocumentsFlowActionPendingModel
-from signer_client.models.documents_move_document_batch_request import DocumentsMoveDocumentBatchRequest
-from signer_client.models.documents_move_document_request import DocumentsMoveDocumentRequest
-from signer_client.models.documents_pre_positioned_mark_model import DocumentsPrePositionedMarkModel
-from signer_client.models.error_model import ErrorModel
-from signer_client.models.file_model import FileModel
-from signer_client.models.file_upload_model import FileUploadModel
-from signer_client.models.flow_action_type import FlowActionType
-from signer_client.models.flow_actions_approval_model import FlowActionsApprovalModel
-from signer_client.models.flow_actions_document_flow_edit_response import FlowActionsDocumentFlowEditResponse
-from signer_client.models.flow_actions_flow_action_create_model import FlowActionsFlowActionCreateModel
-from signer_client.models.flow_actions_flow_action_edit_model import FlowActionsFlowActionEditModel
-from signer_client.models.flow_actions_flow_action_model import FlowActionsFlowActionModel
-from signer_client.models.flow_actions_pending_action_model import FlowActionsPendingActionModel
-from signer_client.models.flow_actions_rectified_participant_model import FlowActionsRectifiedParticipantModel
-from signer_client.models.flow_actions_sign_rule_user_edit_model import FlowActionsSignRuleUserEditModel
-from signer_client.models.flow_actions_sign_rule_user_model import FlowActionsSignRuleUserModel
-from signer_client.models.flow_actions_signature_model import FlowActionsSignatureModel
-from signer_client.models.flow_actions_xades_options_model import FlowActionsXadesOptionsModel
-from signer_client.models.folder_type import FolderType
-from signer_client.models.folders_folder_create_request import FoldersFolderCreateRequest
-from signer_client.models.folders_folder_delete_request import FoldersFolderDeleteRequest
-from signer_client.models.folders_folder_info_model import FoldersFolderInfoModel
-from signer_client.models.folders_folder_organization_model import FoldersFolderOrganizationModel
-from signer_client.models.health_documents_health_document_data import HealthDocumentsHealthDocumentData
-from signer_client.models.health_documents_health_item_model import HealthDocumentsHealthItemModel
-from signer_client.models.health_documents_health_professional_model import HealthDocumentsHealthProfessionalModel
-from signer_client.models.invoices_invoice_total_model import InvoicesInvoiceTotalModel
-from signer_client.models.invoices_update_invoice_payment_status_request import InvoicesUpdateInvoicePaymentStatusRequest
-from signer_client.models.notarization_status import NotarizationStatus
-from signer_client.models.notary_types import NotaryTypes
-from signer_client.models.notifications_create_flow_action_reminder_request import NotificationsCreateFlowActionReminderRequest
-from signer_client.models.notifications_email_list_notification_request import NotificationsEmailListNotificationRequest
-from signer_client.models.observers_observer_create_model import ObserversObserverCreateModel
-from signer_client.models.observers_observer_edit_model import ObserversObserverEditModel
-from signer_client.models.observers_observer_model import ObserversObserverModel
-from signer_client.models.organization_type import OrganizationType
-from signer_client.models.organizations_access_profile_model import OrganizationsAccessProfileModel
-from signer_client.models.organizations_organization_info_model import OrganizationsOrganizationInfoModel
-from signer_client.models.organizations_organization_owner_info_model import OrganizationsOrganizationOwnerInfoModel
-from signer_client.models.organizations_organization_user_model import OrganizationsOrganizationUserModel
-from signer_client.models.organizations_organization_user_post_request import OrganizationsOrganizationUserPostRequest
-from signer_client.models.paginated_search_response_document_flows_document_flow_model import PaginatedSearchResponseDocumentFlowsDocumentFlowModel
-from signer_client.models.paginated_search_response_documents_document_list_model import PaginatedSearchResponseDocumentsDocumentListModel
-from signer_client.models.paginated_search_response_folders_folder_info_model import PaginatedSearchResponseFoldersFolderInfoModel
-from signer_client.models.paginated_search_response_organizations_organization_user_model import PaginatedSearchResponseOrganizationsOrganizationUserModel
-from signer_client.models.pagination_orders import PaginationOrders
-from signer_client.models.participant_query_types import ParticipantQueryTypes
-from signer_client.models.probability import Probability
-from signer_client.models.refusal_refusal_model import RefusalRefusalModel
-from signer_client.models.refusal_refusal_request import RefusalRefusalRequest
-from signer_client.models.security_contexts_authentication_types_model import SecurityContextsAuthenticationTypesModel
-from signer_client.models.security_contexts_security_context_simple_model import SecurityContextsSecurityContextSimpleModel
-from signer_client.models.signature_datavalid_selfie_validation_response import SignatureDatavalidSelfieValidationResponse
-from signer_client.models.signature_evidences_model import SignatureEvidencesModel
-from signer_client.models.signature_geolocation_model import SignatureGeolocationModel
-from signer_client.models.signature_initials_modes import SignatureInitialsModes
-from signer_client.models.signature_liveness3d_authentication_model import SignatureLiveness3dAuthenticationModel
-from signer_client.models.signature_pix_authentication_model import SignaturePixAuthenticationModel
-from signer_client.models.signature_selfie_model import SignatureSelfieModel
-from signer_client.models.signature_signatures_info_request import SignatureSignaturesInfoRequest
-from signer_client.models.signature_types import SignatureTypes
-from signer_client.models.signer_model import SignerModel
-from signer_client.models.ticket_model import TicketModel
-from signer_client.models.timestamp_model import TimestampModel
-from signer_client.models.transaction_pricing_types import TransactionPricingTypes
-from signer_client.models.transaction_types import TransactionTypes
-from signer_client.models.transactions_price_range_model import TransactionsPriceRangeModel
-from signer_client.models.transactions_transaction_price_model import TransactionsTransactionPriceModel
-from signer_client.models.upload_model import UploadModel
-from signer_client.models.uploads_upload_bytes_model import UploadsUploadBytesModel
-from signer_client.models.uploads_upload_bytes_request import UploadsUploadBytesRequest
-from signer_client.models.users_participant_user_model import UsersParticipantUserModel
-from signer_client.models.validation_item_model import ValidationItemModel
-from signer_client.models.validation_results_model import ValidationResultsModel
-from signer_client.models.webhook_types import WebhookTypes
-from signer_client.models.webhooks_document_approved_model import WebhooksDocumentApprovedModel
-from signer_client.models.webhooks_document_canceled_model import WebhooksDocumentCanceledModel
-from signer_client.models.webhooks_document_concluded_model import WebhooksDocumentConcludedModel
-from signer_client.models.webhooks_document_expired_model import WebhooksDocumentExpiredModel
-from signer_client.models.webhooks_document_information_model import WebhooksDocumentInformationModel
-from signer_client.models.webhooks_document_refused_model import WebhooksDocumentRefusedModel
-from signer_client.models.webhooks_document_signed_model import WebhooksDocumentSignedModel
-from signer_client.models.webhooks_documents_created_model import WebhooksDocumentsCreatedModel
-from signer_client.models.webhooks_documents_deleted_action import WebhooksDocumentsDeletedAction
-from signer_client.models.webhooks_documents_deleted_model import WebhooksDocumentsDeletedModel
-from signer_client.models.webhooks_invoice_closed_model import WebhooksInvoiceClosedModel
-from signer_client.models.webhooks_webhook_model import WebhooksWebhookModel
-from signer_client.models.xades_element_identifier_types import XadesElementIdentifierTypes
-from signer_client.models.xades_insertion_options import XadesInsertionOptions
-from signer_client.models.xades_signature_types import XadesSignatureTypes
-from signer_client.models.xml_namespace_model import XmlNamespaceModel
+import importlib
+
+# Models are imported on first access (PEP 562): importing all of them takes
+# a noticeable share of the start up of short lived processes. The imports
+# below are only seen by type checkers.
+TYPE_CHECKING = False  # as typing.TYPE_CHECKING, without importing typing
+if TYPE_CHECKING:
+    # import models into model package
+    from signer_client.models.action_status import ActionStatus
+    from signer_client.models.agent_types import AgentTypes
+    from signer_client.models.agents_agent_model import AgentsAgentModel
+    from signer_client.models.api_uploads_body import ApiUploadsBody
+    from signer_client.models.applications_application_display_model import ApplicationsApplicationDisplayModel
+    from signer_client.models.attachments_attachment_model import AttachmentsAttachmentModel
+    from signer_client.models.attachments_attachment_upload_model import AttachmentsAttachmentUploadModel
+    from signer_client.models.attachments_create_attachment_result import AttachmentsCreateAttachmentResult
+    from signer_client.models.authentication_types import AuthenticationTypes
+    from signer_client.models.batch_item_result_model import BatchItemResultModel
+    from signer_client.models.billing_billing_information_model import BillingBillingInformationModel
+    from signer_client.models.billing_company_billing_information_model import BillingCompanyBillingInformationModel
+    from signer_client.models.billing_individual_billing_information_model import BillingIndividualBillingInformationModel
+    from signer_client.models.billing_information_types import BillingInformationTypes
+    from signer_client.models.certificate_holder_types import CertificateHolderTypes
+    from signer_client.models.certificate_types import CertificateTypes
+    from signer_client.models.certificates_attribute_certificate_info_model import CertificatesAttributeCertificateInfoModel
+    from signer_client.models.delete_action import DeleteAction
+    from signer_client.models.document_download_types import DocumentDownloadTypes
+    from signer_client.models.document_filter_status import DocumentFilterStatus
+    from signer_client.models.document_flows_document_flow_create_request import DocumentFlowsDocumentFlowCreateRequest
+    from signer_client.models.document_flows_document_flow_data import DocumentFlowsDocumentFlowData
+    from signer_client.models.document_flows_document_flow_details_model import DocumentFlowsDocumentFlowDetailsModel
+    from signer_client.models.document_flows_document_flow_model import DocumentFlowsDocumentFlowModel
+    from signer_client.models.document_mark_document_mark_position_model import DocumentMarkDocumentMarkPositionModel
+    from signer_client.models.document_mark_flow_action_position_model import DocumentMarkFlowActionPositionModel
+    from signer_client.models.document_mark_marks_session_create_request import DocumentMarkMarksSessionCreateRequest
+    from signer_client.models.document_mark_marks_session_create_response import DocumentMarkMarksSessionCreateResponse
+    from signer_client.models.document_mark_marks_session_model import DocumentMarkMarksSessionModel
+    from signer_client.models.document_mark_pre_positioned_document_mark_model import DocumentMarkPrePositionedDocumentMarkModel
+    from signer_client.models.document_mark_type import DocumentMarkType
+    from signer_client.models.document_mark_upload_ticket_model import DocumentMarkUploadTicketModel
+    from signer_client.models.document_query_types import DocumentQueryTypes
+    from signer_client.models.document_status import DocumentStatus
+    from signer_client.models.document_ticket_type import DocumentTicketType
+    from signer_client.models.document_types import DocumentTypes
+    from signer_client.models.documents_action_url_request import DocumentsActionUrlRequest
+    from signer_client.models.documents_action_url_response import DocumentsActionUrlResponse
+    from signer_client.models.documents_cancel_document_request import DocumentsCancelDocumentRequest
+    from signer_client.models.documents_create_document_request import DocumentsCreateDocumentRequest
+    from signer_client.models.documents_create_document_result import DocumentsCreateDocumentResult
+    from signer_client.models.documents_creator_model import DocumentsCreatorModel
+    from signer_client.models.documents_document_add_version_request import DocumentsDocumentAddVersionRequest
+    from signer_client.models.documents_document_additional_info_data import DocumentsDocumentAdditionalInfoData
+    from signer_client.models.documents_document_content_model import DocumentsDocumentContentModel
+    from signer_client.models.documents_document_file_model import DocumentsDocumentFileModel
+    from signer_client.models.documents_document_flow_edit_request import DocumentsDocumentFlowEditRequest
+    from signer_client.models.documents_document_list_model import DocumentsDocumentListModel
+    from signer_client.models.documents_document_model import DocumentsDocumentModel
+    from signer_client.models.documents_document_notified_emails_edit_request import DocumentsDocumentNotifiedEmailsEditRequest
+    from signer_client.models.documents_document_permissions_model import DocumentsDocumentPermissionsModel
+    from signer_client.models.documents_document_signatures_info_model import DocumentsDocumentSignaturesInfoModel
+    from signer_client.models.documents_document_tag_data import DocumentsDocumentTagData
+    from signer_client.models.documents_document_tag_model import DocumentsDocumentTagModel
+    from signer_client.models.documents_envelope_add_version_request import DocumentsEnvelopeAddVersionRequest
+    from signer_client.models.documents_flow_action_pending_model import DocumentsFlowActionPendingModel
+    from signer_client.models.documents_move_document_batch_request import DocumentsMoveDocumentBatchRequest
+    from signer_client.models.documents_move_document_request import DocumentsMoveDocumentRequest
+    from signer_client.models.documents_pre_positioned_mark_model import DocumentsPrePositionedMarkModel
+    from signer_client.models.error_model import ErrorModel
+    from signer_client.models.file_model import FileModel
+    from signer_client.models.file_upload_model import FileUploadModel
+    from signer_client.models.flow_action_type import FlowActionType
+    from signer_client.models.flow_actions_approval_model import FlowActionsApprovalModel
+    from signer_client.models.flow_actions_document_flow_edit_response import FlowActionsDocumentFlowEditResponse
+    from signer_client.models.flow_actions_flow_action_create_model import FlowActionsFlowActionCreateModel
+    from signer_client.models.flow_actions_flow_action_edit_model import FlowActionsFlowActionEditModel
+    from signer_client.models.flow_actions_flow_action_model import FlowActionsFlowActionModel
+    from signer_client.models.flow_actions_pending_action_model import FlowActionsPendingActionModel
+    from signer_client.models.flow_actions_rectified_participant_model import FlowActionsRectifiedParticipantModel
+    from signer_client.models.flow_actions_sign_rule_user_edit_model import FlowActionsSignRuleUserEditModel
+    from signer_client.models.flow_actions_sign_rule_user_model import FlowActionsSignRuleUserModel
+    from signer_client.models.flow_actions_signature_model import FlowActionsSignatureModel
+    from signer_client.models.flow_actions_xades_options_model import FlowActionsXadesOptionsModel
+    from signer_client.models.folder_type import FolderType
+    from signer_client.models.folders_folder_create_request import FoldersFolderCreateRequest
+    from signer_client.models.folders_folder_delete_request import FoldersFolderDeleteRequest
+    from signer_client.models.folders_folder_info_model import FoldersFolderInfoModel
+    from signer_client.models.folders_folder_organization_model import FoldersFolderOrganizationModel
+    from signer_client.models.health_documents_health_document_data import HealthDocumentsHealthDocumentData
+    from signer_client.models.health_documents_health_item_model import HealthDocumentsHealthItemModel
+    from signer_client.models.health_documents_health_professional_model import HealthDocumentsHealthProfessionalModel
+    from signer_client.models.invoices_invoice_total_model import InvoicesInvoiceTotalModel
+    from signer_client.models.invoices_update_invoice_payment_status_request import InvoicesUpdateInvoicePaymentStatusRequest
+    from signer_client.models.notarization_status import NotarizationStatus
+    from signer_client.models.notary_types import NotaryTypes
+    from signer_client.models.notifications_create_flow_action_reminder_request import NotificationsCreateFlowActionReminderRequest
+    from signer_client.models.notifications_email_list_notification_request import NotificationsEmailListNotificationRequest
+    from signer_client.models.observers_observer_create_model import ObserversObserverCreateModel
+    from signer_client.models.observers_observer_edit_model import ObserversObserverEditModel
+    from signer_client.models.observers_observer_model import ObserversObserverModel
+    from signer_client.models.organization_type import OrganizationType
+    from signer_client.models.organizations_access_profile_model import OrganizationsAccessProfileModel
+    from signer_client.models.organizations_organization_info_model import OrganizationsOrganizationInfoModel
+    from signer_client.models.organizations_organization_owner_info_model import OrganizationsOrganizationOwnerInfoModel
+    from signer_client.models.organizations_organization_user_model import OrganizationsOrganizationUserModel
+    from signer_client.models.organizations_organization_user_post_request import OrganizationsOrganizationUserPostRequest
+    from signer_client.models.paginated_search_response_document_flows_document_flow_model import PaginatedSearchResponseDocumentFlowsDocumentFlowModel
+    from signer_client.models.paginated_search_response_documents_document_list_model import PaginatedSearchResponseDocumentsDocumentListModel
+    from signer_client.models.paginated_search_response_folders_folder_info_model import PaginatedSearchResponseFoldersFolderInfoModel
+    from signer_client.models.paginated_search_response_organizations_organization_user_model import PaginatedSearchResponseOrganizationsOrganizationUserModel
+    from signer_client.models.pagination_orders import PaginationOrders
+    from signer_client.models.participant_query_types import ParticipantQueryTypes
+    from signer_client.models.probability import Probability
+    from signer_client.models.refusal_refusal_model import RefusalRefusalModel
+    from signer_client.models.refusal_refusal_request import RefusalRefusalRequest
+    from signer_client.models.security_contexts_authentication_types_model import SecurityContextsAuthenticationTypesModel
+    from signer_client.models.security_contexts_security_context_simple_model import SecurityContextsSecurityContextSimpleModel
+    from signer_client.models.signature_datavalid_selfie_validation_response import SignatureDatavalidSelfieValidationResponse
+    from signer_client.models.signature_evidences_model import SignatureEvidencesModel
+    from signer_client.models.signature_geolocation_model import SignatureGeolocationModel
+    from signer_client.models.signature_initials_modes import SignatureInitialsModes
+    from signer_client.models.signature_liveness3d_authentication_model import SignatureLiveness3dAuthenticationModel
+    from signer_client.models.signature_pix_authentication_model import SignaturePixAuthenticationModel
+    from signer_client.models.signature_selfie_model import SignatureSelfieModel
+    from signer_client.models.signature_signatures_info_request import SignatureSignaturesInfoRequest
+    from signer_client.models.signature_types import SignatureTypes
+    from signer_client.models.signer_model import SignerModel
+    from signer_client.models.ticket_model import TicketModel
+    from signer_client.models.timestamp_model import TimestampModel
+    from signer_client.models.transaction_pricing_types import TransactionPricingTypes
+    from signer_client.models.transaction_types import TransactionTypes
+    from signer_client.models.transactions_price_range_model import TransactionsPriceRangeModel
+    from signer_client.models.transactions_transaction_price_model import TransactionsTransactionPriceModel
+    from signer_client.models.upload_model import UploadModel
+    from signer_client.models.uploads_upload_bytes_model import UploadsUploadBytesModel
+    from signer_client.models.uploads_upload_bytes_request import UploadsUploadBytesRequest
+    from signer_client.models.users_participant_user_model import UsersParticipantUserModel
+    from signer_client.models.validation_item_model import ValidationItemModel
+    from signer_client.models.validation_results_model import ValidationResultsModel
+    from signer_client.models.webhook_types import WebhookTypes
+    from signer_client.models.webhooks_document_approved_model import WebhooksDocumentApprovedModel
+    from signer_client.models.webhooks_document_canceled_model import WebhooksDocumentCanceledModel
+    from signer_client.models.webhooks_document_concluded_model import WebhooksDocumentConcludedModel
+    from signer_client.models.webhooks_document_expired_model import WebhooksDocumentExpiredModel
+    from signer_client.models.webhooks_document_information_model import WebhooksDocumentInformationModel
+    from signer_client.models.webhooks_document_refused_model import WebhooksDocumentRefusedModel
+    from signer_client.models.webhooks_document_signed_model import WebhooksDocumentSignedModel
+    from signer_client.models.webhooks_documents_created_model import WebhooksDocumentsCreatedModel
+    from signer_client.models.webhooks_documents_deleted_action import WebhooksDocumentsDeletedAction
+    from signer_client.models.webhooks_documents_deleted_model import WebhooksDocumentsDeletedModel
+    from signer_client.models.webhooks_invoice_closed_model import WebhooksInvoiceClosedModel
+    from signer_client.models.webhooks_webhook_model import WebhooksWebhookModel
+    from signer_client.models.xades_element_identifier_types import XadesElementIdentifierTypes
+    from signer_client.models.xades_insertion_options import XadesInsertionOptions
+    from signer_client.models.xades_signature_types import XadesSignatureTypes
+    from signer_client.models.xml_namespace_model import XmlNamespaceModel
+
+# model class name -> module
+_MODULES = {
+    'ActionStatus': 'action_status',
+    'AgentTypes': 'agent_types',
+    'AgentsAgentModel': 'agents_agent_model',
+    'ApiUploadsBody': 'api_uploads_body',
+    'ApplicationsApplicationDisplayModel': 'applications_application_display_model',
+    'AttachmentsAttachmentModel': 'attachments_attachment_model',
+    'AttachmentsAttachmentUploadModel': 'attachments_attachment_upload_model',
+    'AttachmentsCreateAttachmentResult': 'attachments_create_attachment_result',
+    'AuthenticationTypes': 'authentication_types',
+    'BatchItemResultModel': 'batch_item_result_model',
+    'BillingBillingInformationModel': 'billing_billing_information_model',
+    'BillingCompanyBillingInformationModel': 'billing_company_billing_information_model',
+    'BillingIndividualBillingInformationModel': 'billing_individual_billing_information_model',
+    'BillingInformationTypes': 'billing_information_types',
+    'CertificateHolderTypes': 'certificate_holder_types',
+    'CertificateTypes': 'certificate_types',
+    'CertificatesAttributeCertificateInfoModel': 'certificates_attribute_certificate_info_model',
+    'DeleteAction': 'delete_action',
+    'DocumentDownloadTypes': 'document_download_types',
+    'DocumentFilterStatus': 'document_filter_status',
+    'DocumentFlowsDocumentFlowCreateRequest': 'document_flows_document_flow_create_request',
+    'DocumentFlowsDocumentFlowData': 'document_flows_document_flow_data',
+    'DocumentFlowsDocumentFlowDetailsModel': 'document_flows_document_flow_details_model',
+    'DocumentFlowsDocumentFlowModel': 'document_flows_document_flow_model',
+    'DocumentMarkDocumentMarkPositionModel': 'document_mark_document_mark_position_model',
+    'DocumentMarkFlowActionPositionModel': 'document_mark_flow_action_position_model',
+    'DocumentMarkMarksSessionCreateRequest': 'document_mark_marks_session_create_request',
+    'DocumentMarkMarksSessionCreateResponse': 'document_mark_marks_session_create_response',
+    'DocumentMarkMarksSessionModel': 'document_mark_marks_session_model',
+    'DocumentMarkPrePositionedDocumentMarkModel': 'document_mark_pre_positioned_document_mark_model',
+    'DocumentMarkType': 'document_mark_type',
+    'DocumentMarkUploadTicketModel': 'document_mark_upload_ticket_model',
+    'DocumentQueryTypes': 'document_query_types',
+    'DocumentStatus': 'document_status',
+    'DocumentTicketType': 'document_ticket_type',
+    'DocumentTypes': 'document_types',
+    'DocumentsActionUrlRequest': 'documents_action_url_request',
+    'DocumentsActionUrlResponse': 'documents_action_url_response',
+    'DocumentsCancelDocumentRequest': 'documents_cancel_document_request',
+    'DocumentsCreateDocumentRequest': 'documents_create_document_request',
+    'DocumentsCreateDocumentResult': 'documents_create_document_result',
+    'DocumentsCreatorModel': 'documents_creator_model',
+    'DocumentsDocumentAddVersionRequest': 'documents_document_add_version_request',
+    'DocumentsDocumentAdditionalInfoData': 'documents_document_additional_info_data',
+    'DocumentsDocumentContentModel': 'documents_document_content_model',
+    'DocumentsDocumentFileModel': 'documents_document_file_model',
+    'DocumentsDocumentFlowEditRequest': 'documents_document_flow_edit_request',
+    'DocumentsDocumentListModel': 'documents_document_list_model',
+    'DocumentsDocumentModel': 'documents_document_model',
+    'DocumentsDocumentNotifiedEmailsEditRequest': 'documents_document_notified_emails_edit_request',
+    'DocumentsDocumentPermissionsModel': 'documents_document_permissions_model',
+    'DocumentsDocumentSignaturesInfoModel': 'documents_document_signatures_info_model',
+    'DocumentsDocumentTagData': 'documents_document_tag_data',
+    'DocumentsDocumentTagModel': 'documents_document_tag_model',
+    'DocumentsEnvelopeAddVersionRequest': 'documents_envelope_add_version_request',
+    'DocumentsFlowActionPendingModel': 'documents_flow_action_pending_model',
+    'DocumentsMoveDocumentBatchRequest': 'documents_move_document_batch_request',
+    'DocumentsMoveDocumentRequest': 'documents_move_document_request',
+    'DocumentsPrePositionedMarkModel': 'documents_pre_positioned_mark_model',
+    'ErrorModel': 'error_model',
+    'FileModel': 'file_model',
+    'FileUploadModel': 'file_upload_model',
+    'FlowActionType': 'flow_action_type',
+    'FlowActionsApprovalModel': 'flow_actions_approval_model',
+    'FlowActionsDocumentFlowEditResponse': 'flow_actions_document_flow_edit_response',
+    'FlowActionsFlowActionCreateModel': 'flow_actions_flow_action_create_model',
+    'FlowActionsFlowActionEditModel': 'flow_actions_flow_action_edit_model',
+    'FlowActionsFlowActionModel': 'flow_actions_flow_action_model',
+    'FlowActionsPendingActionModel': 'flow_actions_pending_action_model',
+    'FlowActionsRectifiedParticipantModel': 'flow_actions_rectified_participant_model',
+    'FlowActionsSignRuleUserEditModel': 'flow_actions_sign_rule_user_edit_model',
+    'FlowActionsSignRuleUserModel': 'flow_actions_sign_rule_user_model',
+    'FlowActionsSignatureModel': 'flow_actions_signature_model',
+    'FlowActionsXadesOptionsModel': 'flow_actions_xades_options_model',
+    'FolderType': 'folder_type',
+    'FoldersFolderCreateRequest': 'folders_folder_create_request',
+    'FoldersFolderDeleteRequest': 'folders_folder_delete_request',
+    'FoldersFolderInfoModel': 'folders_folder_info_model',
+    'FoldersFolderOrganizationModel': 'folders_folder_organization_model',
+    'HealthDocumentsHealthDocumentData': 'health_documents_health_document_data',
+    'HealthDocumentsHealthItemModel': 'health_documents_health_item_model',
+    'HealthDocumentsHealthProfessionalModel': 'health_documents_health_professional_model',
+    'InvoicesInvoiceTotalModel': 'invoices_invoice_total_model',
+    'InvoicesUpdateInvoicePaymentStatusRequest': 'invoices_update_invoice_payment_status_request',
+    'NotarizationStatus': 'notarization_status',
+    'NotaryTypes': 'notary_types',
+    'NotificationsCreateFlowActionReminderRequest': 'notifications_create_flow_action_reminder_request',
+    'NotificationsEmailListNotificationRequest': 'notifications_email_list_notification_request',
+    'ObserversObserverCreateModel': 'observers_observer_create_model',
+    'ObserversObserverEditModel': 'observers_observer_edit_model',
+    'ObserversObserverModel': 'observers_observer_model',
+    'OrganizationType': 'organization_type',
+    'OrganizationsAccessProfileModel': 'organizations_access_profile_model',
+    'OrganizationsOrganizationInfoModel': 'organizations_organization_info_model',
+    'OrganizationsOrganizationOwnerInfoModel': 'organizations_organization_owner_info_model',
+    'OrganizationsOrganizationUserModel': 'organizations_organization_user_model',
+    'OrganizationsOrganizationUserPostRequest': 'organizations_organization_user_post_request',
+    'PaginatedSearchResponseDocumentFlowsDocumentFlowModel': 'paginated_search_response_document_flows_document_flow_model',
+    'PaginatedSearchResponseDocumentsDocumentListModel': 'paginated_search_response_documents_document_list_model',
+    'PaginatedSearchResponseFoldersFolderInfoModel': 'paginated_search_response_folders_folder_info_model',
+    'PaginatedSearchResponseOrganizationsOrganizationUserModel': 'paginated_search_response_organizations_organization_user_model',
+    'PaginationOrders': 'pagination_orders',
+    'ParticipantQueryTypes': 'participant_query_types',
+    'Probability': 'probability',
+    'RefusalRefusalModel': 'refusal_refusal_model',
+    'RefusalRefusalRequest': 'refusal_refusal_request',
+    'SecurityContextsAuthenticationTypesModel': 'security_contexts_authentication_types_model',
+    'SecurityContextsSecurityContextSimpleModel': 'security_contexts_security_context_simple_model',
+    'SignatureDatavalidSelfieValidationResponse': 'signature_datavalid_selfie_validation_response',
+    'SignatureEvidencesModel': 'signature_evidences_model',
+    'SignatureGeolocationModel': 'signature_geolocation_model',
+    'SignatureInitialsModes': 'signature_initials_modes',
+    'SignatureLiveness3dAuthenticationModel': 'signature_liveness3d_authentication_model',
+    'SignaturePixAuthenticationModel': 'signature_pix_authentication_model',
+    'SignatureSelfieModel': 'signature_selfie_model',
+    'SignatureSignaturesInfoRequest': 'signature_signatures_info_request',
+    'SignatureTypes': 'signature_types',
+    'SignerModel': 'signer_model',
+    'TicketModel': 'ticket_model',
+    'TimestampModel': 'timestamp_model',
+    'TransactionPricingTypes': 'transaction_pricing_types',
+    'TransactionTypes': 'transaction_types',
+    'TransactionsPriceRangeModel': 'transactions_price_range_model',
+    'TransactionsTransactionPriceModel': 'transactions_transaction_price_model',
+    'UploadModel': 'upload_model',
+    'UploadsUploadBytesModel': 'uploads_upload_bytes_model',
+    'UploadsUploadBytesRequest': 'uploads_upload_bytes_request',
+    'UsersParticipantUserModel': 'users_participant_user_model',
+    'ValidationItemModel': 'validation_item_model',
+    'ValidationResultsModel': 'validation_results_model',
+    'WebhookTypes': 'webhook_types',
+    'WebhooksDocumentApprovedModel': 'webhooks_document_approved_model',
+    'WebhooksDocumentCanceledModel': 'webhooks_document_canceled_model',
+    'WebhooksDocumentConcludedModel': 'webhooks_document_concluded_model',
+    'WebhooksDocumentExpiredModel': 'webhooks_document_expired_model',
+    'WebhooksDocumentInformationModel': 'webhooks_document_information_model',
+    'WebhooksDocumentRefusedModel': 'webhooks_document_refused_model',
+    'WebhooksDocumentSignedModel': 'webhooks_document_signed_model',
+    'WebhooksDocumentsCreatedModel': 'webhooks_documents_created_model',
+    'WebhooksDocumentsDeletedAction': 'webhooks_documents_deleted_action',
+    'WebhooksDocumentsDeletedModel': 'webhooks_documents_deleted_model',
+    'WebhooksInvoiceClosedModel': 'webhooks_invoice_closed_model',
+    'WebhooksWebhookModel': 'webhooks_webhook_model',
+    'XadesElementIdentifierTypes': 'xades_element_identifier_types',
+    'XadesInsertionOptions': 'xades_insertion_options',
+    'XadesSignatureTypes': 'xades_signature_types',
+    'XmlNamespaceModel': 'xml_namespace_model',
+}
+
+__all__ = sorted(_MODULES)
+
+
+def __getattr__(name):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(
+            "module '%s' has no attribute '%s'" % (__name__, name))
+    value = getattr(importlib.import_module('%s.%s' % (__name__, module)),
+                    name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODULES))
@@ -0,0 +1,143 @@
+# coding: utf-8
+
+"""
+Streaming `multipart/form-data` encoding of uploads.
+
+`MultipartEncoder` produces the request body as an iterable of chunks
+instead of one bytes object: files given by path are memory-mapped and sent
+as zero-copy slices of the mapping, file objects are read in fixed-size
+chunks. The total length is computed up front from the file sizes, so the
+body is sent with a `Content-Length`, and is only read while the socket
+accepts data, so uploading a file takes a constant amount of memory.
+"""
+
+from __future__ import absolute_import
+
+import binascii
+import mimetypes
+import os
+
+from urllib3.fields import RequestField
+
+from signer_client.streaming import (
+    DEFAULT_CHUNK_SIZE, StreamingBody, iter_source, source_size, source_start
+)
+
+
+class FilePart(tuple):
+    """A file form field, as a ``(filename, source, mimetype)`` tuple.
+
+    :param filename: name sent for the file.
+    :param source: the content: bytes, a path, or a binary file object read
+        from its position when the part is built.
+    :param mimetype: content type, guessed from `filename` by default.
+    """
+
+    def __new__(cls, filename, source, mimetype=None):
+        if mimetype is None:
+            mimetype = (mimetypes.guess_type(filename)[0] or
+                        'application/octet-stream')
+        self = tuple.__new__(cls, (filename, source, mimetype))
+        self._start = source_start(source)
+        return self
+
+    @property
+    def filename(self):
+        return self[0]
+
+    @property
+    def source(self):
+        return self[1]
+
+    @property
+    def mimetype(self):
+        return self[2]
+
+    @classmethod
+    def from_value(cls, value):
+        """Builds a `FilePart` from a form value that is a file: a path-like
+        object or a file object. Returns None for other values (strings are
+        plain text fields)."""
+        if isinstance(value, FilePart):
+            return value
+        if isinstance(value, os.PathLike):
+            path = os.fspath(value)
+            return cls(os.path.basename(path), path)
+        if hasattr(value, 'read'):
+            name = getattr(value, 'name', None)
+            if isinstance(name, str):
+                name = os.path.basename(name)
+            else:
+                name = 'file'
+            return cls(name, value)
+        return None
+
+    def size(self):
+        """Number of bytes of the content, None if it cannot be known."""
+        return source_size(self.source, self._start)
+
+    def chunks(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Yields the content in chunks of at most `chunk_size` bytes."""
+        return iter_source(self.source, chunk_size, self._start)
+
+
+class MultipartEncoder(StreamingBody):
+    """Iterable `multipart/form-data` body.
+
+    :param fields: list of ``(name, value)`` tuples. Values are strings,
+        numbers or bytes for plain fields, or ``(filename, source,
+        mimetype)`` tuples (see `FilePart`) for files.
+    :param boundary: multipart boundary, random by default.
+    :param chunk_size: size of the file chunks produced.
+
+    The body can be iterated more than once, e.g. to retry a request, as
+    long as the file objects it reads from are seekable: each pass reads
+    them from their position when the encoder was built, even after a pass
+    stopped halfway.
+    """
+
+    def __init__(self, fields, boundary=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        if isinstance(fields, dict):
+            fields = fields.items()
+        self.boundary = boundary or binascii.hexlify(os.urandom(16)).decode()
+        self.content_type = 'multipart/form-data; boundary=%s' % self.boundary
+        self.chunk_size = chunk_size
+        self._parts = []
+        for name, value in fields:
+            if isinstance(value, tuple):
+                part = value if isinstance(value, FilePart) else FilePart(*value)  # noqa: E501
+                field = RequestField(name, b'', filename=part.filename)
+                field.make_multipart(content_type=part.mimetype)
+            else:
+                if isinstance(value, (int, float)):
+                    value = str(value)
+                if isinstance(value, str):
+                    value = value.encode('utf-8')
+                part = value
+                field = RequestField(name, b'')
+                field.make_multipart()
+            header = ('--%s\r\n%s' % (self.boundary, field.render_headers()))
+            self._parts.append((header.encode('utf-8'), part))
+        self._trailer = ('--%s--\r\n' % self.boundary).encode('ascii')
+
+    @property
+    def length(self):
+        """Size of the encoded body, None when a file size is unknown."""
+        length = len(self._trailer)
+        for header, part in self._parts:
+            size = part.size() if isinstance(part, FilePart) else len(part)
+            if size is None:
+                return None
+            length += len(header) + size + 2
+        return length
+
+    def __iter__(self):
+        for header, part in self._parts:
+            yield header
+            if isinstance(part, FilePart):
+                for chunk in part.chunks(self.chunk_size):
+                    yield chunk
+            else:
+                yield part
+            yield b'\r\n'
+        yield self._trailer
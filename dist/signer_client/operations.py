@@ -0,0 +1,180 @@
+# coding: utf-8
+
+"""
+Descriptors of the API operations.
+
+The generated API methods used to rebuild, at every call, the list of the
+parameters they accept, check the arguments one by one, sort them into path,
+query and header parameters one `if` at a time and compute the `Accept` and
+`Content-Type` headers. Each operation is now described once by an
+`Operation`, which swagger-codegen writes into the API module from the spec
+(see ``templates/api.mustache``), and the generated methods hand their
+arguments to `ApiClient.call_operation`, which runs the call from the
+descriptor: the url is assembled from the precompiled path template, the
+headers are copied, and plain query and path values skip serialization.
+
+The requests sent are the same as before. The ``OPERATIONS`` of each API
+module, and `OPERATIONS` here for all of them, map the name of each generated
+method (without ``_with_http_info``) to its descriptor.
+"""
+
+from __future__ import absolute_import
+
+import importlib
+import re
+
+from six.moves.urllib.parse import quote
+
+from signer_client.serializer import sanitize
+
+# values sent as they are, see `serializer.sanitize`
+_PLAIN_TYPES = frozenset((str, int, float, bool, type(None)))
+# options of every generated method, handled by `ApiClient.call_api`
+_OPTIONS = ('async_req', '_return_http_data_only', '_preload_content',
+            '_request_timeout', '_response_format', '_fields')
+_TEMPLATE_PARAM = re.compile(r'\{([^{}]+)\}')
+
+
+def plain(value):
+    """Returns `value` as serialized in a request."""
+    if type(value) in _PLAIN_TYPES:
+        return value
+    return sanitize(value)
+
+
+def _select_accept(accepts):
+    # as `ApiClient.select_header_accept`
+    if not accepts:
+        return None
+    accepts = [x.lower() for x in accepts]
+    if 'application/json' in accepts:
+        return 'application/json'
+    return ', '.join(accepts)
+
+
+def _select_content_type(content_types):
+    # as `ApiClient.select_header_content_type`
+    if not content_types:
+        return 'application/json'
+    content_types = [x.lower() for x in content_types]
+    if 'application/json' in content_types or '*/*' in content_types:
+        return 'application/json'
+    return content_types[0]
+
+
+class Operation(object):
+    """Descriptor of an API operation.
+
+    :param name: name of the generated method, e.g. ``'api_documents_get'``.
+    :param method: HTTP method.
+    :param path: path template, e.g. ``'/api/documents/{id}'``.
+    :param params: names of the parameters of the method, positional ones
+        first.
+    :param positional: names of the positional (required) parameters.
+    :param path_params: (template name, parameter) pairs.
+    :param query_params: (query name, parameter) pairs, in request order.
+    :param header_params: (header, parameter) pairs.
+    :param form_params: (form field, parameter) pairs.
+    :param file_params: (form field, parameter) pairs of the files.
+    :param body_param: parameter sent as the body, if any.
+    :param accept: media types the operation produces.
+    :param content_types: media types it consumes, None for no
+        ``Content-Type`` header.
+    :param auth_settings: names of its authentication settings.
+    :param response_type: type of its result, None for no result.
+    :param collection_formats: formats of the list parameters.
+    """
+
+    __slots__ = ('name', 'method', 'path', 'key', 'params', 'positional',
+                 'accepted', 'path_params', 'query_params', 'header_params',
+                 'form_params', 'file_params', 'body_param', 'headers',
+                 'auth_settings', 'response_type', 'collection_formats',
+                 '_path_parts')
+
+    def __init__(self, name, method, path, params=(), positional=(),
+                 path_params=(), query_params=(), header_params=(),
+                 form_params=(), file_params=(), body_param=None,
+                 accept=(), content_types=None, auth_settings=('ApiKey',),
+                 response_type=None, collection_formats=None):
+        self.name = name
+        self.method = method
+        self.path = path
+        # as the operations are named in the per-operation settings
+        self.key = '%s %s' % (method, path)
+        self.params = tuple(params)
+        self.positional = tuple(positional)
+        self.accepted = frozenset(self.params + _OPTIONS)
+        self.path_params = tuple(path_params)
+        self.query_params = tuple(query_params)
+        self.header_params = tuple(header_params)
+        self.form_params = tuple(form_params)
+        self.file_params = tuple(file_params)
+        self.body_param = body_param
+        self.headers = {}
+        if accept:
+            self.headers['Accept'] = _select_accept(accept)
+        if content_types is not None:
+            self.headers['Content-Type'] = _select_content_type(content_types)
+        self.auth_settings = list(auth_settings)
+        self.response_type = response_type
+        self.collection_formats = dict(collection_formats or {})
+        # literal parts at even indexes, template names at odd ones
+        self._path_parts = tuple(_TEMPLATE_PARAM.split(path))
+
+    def __repr__(self):
+        return '<Operation %s: %s>' % (self.name, self.key)
+
+    def bind(self, args, kwargs):
+        """Returns the parameters of a call by name, checked as the
+        generated method did.
+
+        :param args: values of the positional parameters.
+        :param kwargs: keyword arguments of the call.
+        :raise TypeError: unexpected keyword argument.
+        :raise ValueError: missing required parameter.
+        """
+        accepted = self.accepted
+        for key in kwargs:
+            if key not in accepted:
+                raise TypeError(
+                    "Got an unexpected keyword argument '%s'"
+                    " to method %s" % (key, self.name))
+        params = dict(zip(self.positional, args))
+        params.update(kwargs)
+        for name in self.positional:
+            if params.get(name) is None:
+                raise ValueError(
+                    "Missing the required parameter `%s` when calling `%s`"
+                    % (name, self.name))
+        return params
+
+    def url_path(self, path_params, safe=''):
+        """Returns the path with the (template name -> value)
+        `path_params` quoted in; templates without value are kept."""
+        parts = self._path_parts
+        if len(parts) == 1:
+            return parts[0]
+        parts = list(parts)
+        for index in range(1, len(parts), 2):
+            name = parts[index]
+            if name in path_params:
+                parts[index] = quote(str(plain(path_params[name])),
+                                     safe=safe)
+            else:
+                parts[index] = '{%s}' % name
+        return ''.join(parts)
+
+
+def __getattr__(name):
+    # the descriptors are generated into the api modules, which are only
+    # imported here when the whole table is asked for (PEP 562)
+    if name != 'OPERATIONS':
+        raise AttributeError(
+            "module '%s' has no attribute '%s'" % (__name__, name))
+    from signer_client import api
+    table = {}
+    for module in sorted(api._MODULES.values()):
+        table.update(importlib.import_module(
+            'signer_client.api.%s' % module).OPERATIONS)
+    globals()[name] = table
+    return table
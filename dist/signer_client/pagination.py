@@ -0,0 +1,470 @@
+# coding: utf-8
+
+"""
+Iterators over all the pages of a listing.
+
+The listing operations (`api_documents_get`, `api_folders_get`,
+`api_document_flows_get`, `api_organizations_users_get`) return one page,
+selected by `limit` and `offset`. `iter_pages` and `iter_items` walk a whole
+listing, requesting the next pages while the current one is consumed, so a
+scan does not wait one round trip per page:
+
+>>> for document in pagination.iter_items(
+...         lambda offset, limit: documents_api.api_documents_get(
+...             status='Pending', offset=offset, limit=limit),
+...         page_size=100, prefetch=2):
+...     print(document.id)
+
+`prefetch` pages are requested ahead of the one being read, on
+`Configuration.executor` or the shared pool (see `signer_client.executor`).
+Pages come out in order. The listing ends at `total_count`, or on an empty
+page, or on a short page when the response has no `total_count`. If the
+server returns fewer items than asked while `total_count` says more remain
+(its own page size is smaller), the next pages are requested again with that
+size, so no item is skipped.
+
+The requests still use offsets: the responses have a `next_cursor` but the
+operations take no cursor parameter. Items created or deleted during a scan
+may therefore shift the pages, as with any offset pagination.
+
+`aiter_pages` and `aiter_items` are the asyncio variants, taking a coroutine
+function.
+
+`scan_items` exports large listings faster: it reads the total count on the
+first page, requests the other pages `parallelism` at a time and yields the
+items in order, each once. A listing can also be split into partitions, one
+fetch function per value of a filter the operation accepts, which keeps the
+offset ranges short when the listing changes during the scan:
+
+>>> documents = pagination.scan_items(
+...     [functools.partial(fetch_documents, status=status)
+...      for status in ('Pending', 'Concluded', 'Canceled')],
+...     page_size=100, parallelism=8)
+
+Items moving to an earlier page while it runs (new items inserted before
+them) would be read twice, they are yielded once, by id. Items moving to a
+later page (items deleted before them) would be missed: `overlap` starts
+every page that many items earlier to read them anyway. A short first page
+is taken as the page size of the server, and every request asks for at most
+that many items, `overlap` included. A later page shorter than requested
+before the end of the listing raises `ValueError` instead of leaving a gap.
+
+`ordered_results` runs other calls the same way, `window` at a time with
+their results in order, e.g. the details of the items of a listing.
+"""
+
+from __future__ import absolute_import
+
+import collections
+import itertools
+
+from signer_client.executor import submit
+
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_PREFETCH = 2
+DEFAULT_PARALLELISM = 8
+
+
+def _check(page_size, prefetch):
+    if page_size < 1:
+        raise ValueError("Invalid page size `%s`, must be at least 1"
+                         % page_size)
+    if prefetch < 0:
+        raise ValueError("Invalid prefetch `%s`, must not be negative"
+                         % prefetch)
+
+
+def page_items(page):
+    """Returns the items and total count of a page, a model or the decoded
+    JSON (``'dict'`` response format).
+
+    :raise ValueError: raw page.
+    """
+    if isinstance(page, dict):
+        return page.get('items') or [], page.get('totalCount')
+    if isinstance(page, (bytes, bytearray)):
+        raise ValueError("Raw responses cannot be paginated, use the 'model' "
+                         "or 'dict' response format")
+    return page.items or [], page.total_count
+
+
+def item_fields(fields, *required):
+    """Returns the JSON paths to request for the fields of the items of a
+    listing, None for the whole items. The total count is always kept, it
+    ends the listing, and so are the `required` fields of the items."""
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        fields = (fields,)
+    fields = tuple(fields)
+    fields += tuple(field for field in required if field not in fields)
+    return tuple('items.' + field for field in fields) + ('totalCount',)
+
+
+def item_id(item):
+    """Returns the id of an item, a model or a dict, None if it has
+    none."""
+    if isinstance(item, dict):
+        return item.get('id')
+    return getattr(item, 'id', None)
+
+
+class _Plan(object):
+    """Offsets of the pages to request, and the end of the listing.
+
+    Shared by the blocking and the asyncio iterators.
+    """
+
+    def __init__(self, offset, page_size):
+        self.next_offset = offset
+        self.page_size = page_size
+        self.total = None
+
+    def pending(self):
+        """Whether pages may remain to be requested."""
+        return self.total is None or self.next_offset < self.total
+
+    def take(self):
+        """Returns the (offset, limit) of the next page to request."""
+        offset = self.next_offset
+        self.next_offset += self.page_size
+        return offset, self.page_size
+
+    def received(self, offset, limit, page):
+        """Reads a page, in order, and returns whether the listing goes on
+        and whether the pages requested after it must be dropped."""
+        items, total = page_items(page)
+        if total is not None:
+            self.total = total
+        end = offset + len(items)
+        if not items or (total is not None and end >= total):
+            return False, False
+        if len(items) < limit:
+            if total is None:
+                return False, False
+            # the server has a smaller page size: go on from here with it
+            self.page_size = len(items)
+            self.next_offset = end
+            return True, True
+        return True, False
+
+
+def iter_pages(fetch, page_size=DEFAULT_PAGE_SIZE, offset=0,
+               prefetch=DEFAULT_PREFETCH, executor=None):
+    """Returns an iterator over the pages of a listing.
+
+    :param fetch: callable of (offset, limit) returning a page, a model or
+        the decoded JSON.
+    :param page_size: number of items per request.
+    :param offset: offset of the first item.
+    :param prefetch: pages requested ahead of the one being read; 0 requests
+        each page when the previous one is read.
+    :param executor: `concurrent.futures.Executor` running the requests,
+        None for the shared pool.
+    :raise ValueError: invalid page size or prefetch, or raw pages.
+    """
+    _check(page_size, prefetch)
+    return _iter_pages(fetch, _Plan(offset, page_size), prefetch, executor)
+
+
+def _iter_pages(fetch, plan, prefetch, executor):
+    requested = collections.deque()
+    try:
+        while True:
+            while len(requested) <= prefetch and plan.pending():
+                offset, limit = plan.take()
+                requested.append(
+                    (offset, limit, submit(executor, fetch, offset, limit)))
+            if not requested:
+                return
+            offset, limit, future = requested.popleft()
+            page = future.result()
+            more, restart = plan.received(offset, limit, page)
+            if restart:
+                for _, _, future in requested:
+                    future.cancel()
+                requested.clear()
+            yield page
+            if not more:
+                return
+    finally:
+        for _, _, future in requested:
+            future.cancel()
+
+
+def iter_items(fetch, page_size=DEFAULT_PAGE_SIZE, offset=0,
+               prefetch=DEFAULT_PREFETCH, executor=None):
+    """Returns an iterator over the items of all the pages of a listing,
+    see `iter_pages`."""
+    _check(page_size, prefetch)
+    return _iter_items(iter_pages(fetch, page_size, offset, prefetch,
+                                  executor))
+
+
+def _iter_items(pages):
+    for page in pages:
+        for item in page_items(page)[0]:
+            yield item
+
+
+def aiter_pages(fetch, page_size=DEFAULT_PAGE_SIZE, offset=0,
+                prefetch=DEFAULT_PREFETCH):
+    """Returns an async iterator over the pages of a listing, see
+    `iter_pages`.
+
+    :param fetch: coroutine function of (offset, limit) returning a page.
+    """
+    _check(page_size, prefetch)
+    return _aiter_pages(fetch, _Plan(offset, page_size), prefetch)
+
+
+async def _aiter_pages(fetch, plan, prefetch):
+    # imported here: asyncio is only needed by the asyncio client
+    import asyncio
+
+    requested = collections.deque()
+    try:
+        while True:
+            while len(requested) <= prefetch and plan.pending():
+                offset, limit = plan.take()
+                requested.append(
+                    (offset, limit,
+                     asyncio.ensure_future(fetch(offset, limit))))
+            if not requested:
+                return
+            offset, limit, task = requested.popleft()
+            page = await task
+            more, restart = plan.received(offset, limit, page)
+            if restart:
+                _drop(requested)
+            yield page
+            if not more:
+                return
+    finally:
+        _drop(requested)
+
+
+def _drop(requested):
+    # cancels the tasks of unread pages, and reads the exception of the
+    # finished ones, not to have it logged as never retrieved
+    for _, _, task in requested:
+        if not task.done():
+            task.cancel()
+        elif not task.cancelled():
+            task.exception()
+    requested.clear()
+
+
+def aiter_items(fetch, page_size=DEFAULT_PAGE_SIZE, offset=0,
+                prefetch=DEFAULT_PREFETCH):
+    """Returns an async iterator over the items of all the pages of a
+    listing, see `aiter_pages`."""
+    _check(page_size, prefetch)
+    return _aiter_items(aiter_pages(fetch, page_size, offset, prefetch))
+
+
+async def _aiter_items(pages):
+    async for page in pages:
+        for item in page_items(page)[0]:
+            yield item
+
+
+def _check_scan(page_size, parallelism, overlap):
+    if page_size < 1:
+        raise ValueError("Invalid page size `%s`, must be at least 1"
+                         % page_size)
+    if parallelism < 1:
+        raise ValueError("Invalid parallelism `%s`, must be at least 1"
+                         % parallelism)
+    if not 0 <= overlap < page_size:
+        raise ValueError("Invalid overlap `%s`, must be between 0 and the "
+                         "page size" % overlap)
+
+
+def _page_requests(first_pages, page_size, overlap):
+    """Returns the number of pages after the first one of each partition,
+    and the (partition, offset, limit) of those pages, in order."""
+    counts = []
+    requests = []
+    for partition, page in enumerate(first_pages):
+        items, total = page_items(page)
+        size = len(items)
+        if total is None and size >= page_size:
+            raise ValueError("Scans need the total count of the listing")
+        if total is None or size >= total or not items:
+            counts.append(0)
+            continue
+        # a short first page is the page size of the server, each request
+        # asks for one page and brings `overlap` items less than that
+        step = size - overlap
+        if step < 1:
+            raise ValueError("Pages of %d items cannot hold an overlap of %d"
+                             % (size, overlap))
+        offsets = range(size, total, step)
+        counts.append(len(offsets))
+        requests.extend((partition, max(0, offset - overlap), size)
+                        for offset in offsets)
+    return counts, requests
+
+
+def _checked(page, offset, limit):
+    """Returns `page`, raising if it is short before the end of the
+    listing, which would leave a gap in a scan."""
+    items, total = page_items(page)
+    if (len(items) < limit and total is not None and
+            offset + len(items) < total):
+        raise ValueError("The page at offset %d has %d items instead of %d"
+                         " before the end of the listing" %
+                         (offset, len(items), limit))
+    return page
+
+
+def _unique(pages, key):
+    seen = set()
+    for page in pages:
+        for item in page_items(page)[0]:
+            value = None if key is None else key(item)
+            if value is not None:
+                if value in seen:
+                    continue
+                seen.add(value)
+            yield item
+
+
+def ordered_results(calls, window=DEFAULT_PARALLELISM, executor=None):
+    """Returns an iterator over the results of calls run `window` at a
+    time, in the order of the calls.
+
+    The next calls are submitted as the results are consumed; closing the
+    iterator cancels those not started yet.
+
+    :param calls: iterable of ``(fn, *args)`` tuples.
+    :param window: calls running at a time.
+    :param executor: `concurrent.futures.Executor` running the calls, None
+        for the shared pool.
+    :raise ValueError: invalid window.
+    """
+    if window < 1:
+        raise ValueError("Invalid window `%s`, must be at least 1" % window)
+    return _ordered(calls, window, executor)
+
+
+def _ordered(calls, window, executor):
+    calls = iter(calls)
+    requested = collections.deque()
+    try:
+        while True:
+            for call in calls:
+                requested.append(submit(executor, *call))
+                if len(requested) >= window:
+                    break
+            if not requested:
+                return
+            yield requested.popleft().result()
+    finally:
+        for future in requested:
+            future.cancel()
+
+
+def scan_items(fetch, page_size=DEFAULT_PAGE_SIZE,
+               parallelism=DEFAULT_PARALLELISM, overlap=0, key=item_id,
+               executor=None):
+    """Returns an iterator over the items of a whole listing, fetched
+    `parallelism` pages at a time.
+
+    :param fetch: callable of (offset, limit) returning a page, or list of
+        such callables, one per partition of the listing, scanned in turn.
+    :param page_size: number of items per request.
+    :param parallelism: requests running at a time.
+    :param overlap: items read again at the start of every page, to find
+        those moved by deletions during the scan.
+    :param key: callable returning the identity of an item, items with the
+        same one being yielded once; None for no identity.
+    :param executor: `concurrent.futures.Executor` running the requests,
+        None for the shared pool.
+    :raise ValueError: invalid arguments, raw pages or pages without total
+        count.
+    """
+    _check_scan(page_size, parallelism, overlap)
+    fetches = [fetch] if callable(fetch) else list(fetch)
+    return _unique(_scan_pages(fetches, page_size, parallelism, overlap,
+                               executor), key)
+
+
+def _scan_pages(fetches, page_size, parallelism, overlap, executor):
+    first_pages = list(_ordered(
+        [(fetch, 0, page_size) for fetch in fetches], parallelism, executor))
+    counts, requests = _page_requests(first_pages, page_size, overlap)
+    pages = _ordered([(fetches[partition], offset, limit)
+                      for partition, offset, limit in requests],
+                     parallelism, executor)
+    requested = iter(requests)
+    try:
+        for first_page, count in zip(first_pages, counts):
+            yield first_page
+            for _, offset, limit in itertools.islice(requested, count):
+                yield _checked(next(pages), offset, limit)
+    finally:
+        pages.close()
+
+
+async def _aordered(calls, window):
+    import asyncio
+
+    calls = iter(calls)
+    requested = collections.deque()
+    try:
+        while True:
+            for fn, offset, limit in calls:
+                requested.append((offset, limit,
+                                  asyncio.ensure_future(fn(offset, limit))))
+                if len(requested) >= window:
+                    break
+            if not requested:
+                return
+            yield await requested.popleft()[2]
+    finally:
+        _drop(requested)
+
+
+def ascan_items(fetch, page_size=DEFAULT_PAGE_SIZE,
+                parallelism=DEFAULT_PARALLELISM, overlap=0, key=item_id):
+    """Returns an async iterator over the items of a whole listing, see
+    `scan_items`.
+
+    :param fetch: coroutine function of (offset, limit) returning a page,
+        or list of such functions, one per partition.
+    """
+    _check_scan(page_size, parallelism, overlap)
+    fetches = [fetch] if callable(fetch) else list(fetch)
+    return _aunique(_ascan_pages(fetches, page_size, parallelism, overlap),
+                    key)
+
+
+async def _ascan_pages(fetches, page_size, parallelism, overlap):
+    first_pages = [page async for page in _aordered(
+        [(fetch, 0, page_size) for fetch in fetches], parallelism)]
+    counts, requests = _page_requests(first_pages, page_size, overlap)
+    pages = _aordered([(fetches[partition], offset, limit)
+                       for partition, offset, limit in requests],
+                      parallelism)
+    requested = iter(requests)
+    try:
+        for first_page, count in zip(first_pages, counts):
+            yield first_page
+            for _, offset, limit in itertools.islice(requested, count):
+                yield _checked(await pages.__anext__(), offset, limit)
+    finally:
+        await pages.aclose()
+
+
+async def _aunique(pages, key):
+    seen = set()
+    async for page in pages:
+        for item in page_items(page)[0]:
+            value = None if key is None else key(item)
+            if value is not None:
+                if value in seen:
+                    continue
+                seen.add(value)
+            yield item
@@ -0,0 +1,305 @@
+# coding: utf-8
+
+"""
+Connection pool controls for the HTTP transports.
+
+- Warm-up: `RESTClientObject.warm_up` opens keep-alive connections to a
+  host ahead of the first requests, so they do not pay for the TCP and TLS
+  handshakes.
+- Expiry: pooled connections idle for longer than
+  `Configuration.connection_idle_timeout`, or older than
+  `Configuration.connection_max_lifetime`, are closed instead of reused
+  (e.g. before a load balancer silently drops them).
+- TLS session reuse: `SessionCachingContext` resumes the last TLS session
+  of a host on new connections, saving a round trip and the key exchange.
+- `PoolStats` counts pool hits, misses and new connections.
+
+The urllib3 transport only uses the pool classes of this module when one of
+these features is enabled (`Configuration.connection_pool_tracking`, the
+idle timeout, the max lifetime or `tls_session_reuse`), as they override
+private methods of the urllib3 2.x connection pools.
+"""
+
+from __future__ import absolute_import
+
+import ssl
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import certifi
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.wait import wait_for_read
+
+
+class PoolStats(object):
+    """Thread-safe counters of a transport's connection pools."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Sets all counters back to zero."""
+        with self._lock:
+            #: connections taken from the pool already open
+            self.hits = 0
+            #: connections taken from the pool without an open socket (never
+            #: opened, dropped by the server or expired); urllib3 connects
+            #: them when sending the request
+            self.misses = 0
+            #: connections actually opened, by requests and by warm-ups
+            self.new_connections = 0
+            #: connections opened by `warm_up`
+            self.warmed_up = 0
+            #: pooled connections closed by the idle timeout or max lifetime
+            self.expired = 0
+            #: TLS handshakes, and those that resumed a previous session
+            self.tls_handshakes = 0
+            self.tls_sessions_reused = 0
+
+    def record(self, **counts):
+        with self._lock:
+            for name, count in counts.items():
+                setattr(self, name, getattr(self, name) + count)
+
+    def as_dict(self):
+        """Returns a snapshot of the counters and the hit ratio."""
+        with self._lock:
+            stats = {
+                'hits': self.hits,
+                'misses': self.misses,
+                'new_connections': self.new_connections,
+                'warmed_up': self.warmed_up,
+                'expired': self.expired,
+                'tls_handshakes': self.tls_handshakes,
+                'tls_sessions_reused': self.tls_sessions_reused,
+            }
+        requests = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = (float(stats['hits']) / requests
+                              if requests else None)
+        return stats
+
+    def __repr__(self):
+        return 'PoolStats(%r)' % self.as_dict()
+
+
+class SessionCachingContext(ssl.SSLContext):
+    """`ssl.SSLContext` resuming the last TLS session of each server.
+
+    Sessions are taken from the connections returned to the pool
+    (`remember`), or from the last connection to the server still open.
+    Resumption is negotiated, a server that does not accept the session
+    falls back to a full handshake.
+    """
+
+    def __new__(cls, protocol=ssl.PROTOCOL_TLS_CLIENT, stats=None):
+        context = super(SessionCachingContext, cls).__new__(cls, protocol)
+        context.stats = stats
+        context._sessions = {}
+        context._sockets = {}
+        context._lock = threading.Lock()
+        return context
+
+    def __init__(self, protocol=ssl.PROTOCOL_TLS_CLIENT, stats=None):
+        pass
+
+    def remember(self, server_hostname, sock):
+        """Keeps the session of `sock` for the next connections."""
+        session = getattr(sock, 'session', None)
+        if session is not None and server_hostname:
+            with self._lock:
+                self._sessions[server_hostname] = session
+
+    def _session_for(self, server_hostname):
+        with self._lock:
+            ref = self._sockets.get(server_hostname)
+            sock = ref() if ref is not None else None
+            session = getattr(sock, 'session', None) if sock else None
+            if session is not None:
+                self._sessions[server_hostname] = session
+            return self._sessions.get(server_hostname)
+
+    def wrap_socket(self, sock, server_side=False,
+                    do_handshake_on_connect=True, suppress_ragged_eofs=True,
+                    server_hostname=None, session=None):
+        if session is None and server_hostname and not server_side:
+            session = self._session_for(server_hostname)
+        ssock = super(SessionCachingContext, self).wrap_socket(
+            sock, server_side=server_side,
+            do_handshake_on_connect=do_handshake_on_connect,
+            suppress_ragged_eofs=suppress_ragged_eofs,
+            server_hostname=server_hostname, session=session)
+        if server_hostname and not server_side:
+            with self._lock:
+                self._sockets[server_hostname] = weakref.ref(ssock)
+        if self.stats is not None and do_handshake_on_connect:
+            self.stats.record(tls_handshakes=1,
+                              tls_sessions_reused=int(ssock.session_reused))
+        return ssock
+
+
+def create_ssl_context(configuration, stats=None, session_reuse=True):
+    """Builds the client SSL context matching the TLS settings of
+    `configuration`: a `SessionCachingContext` updating `stats`, or a plain
+    `ssl.SSLContext` if not `session_reuse`."""
+    if session_reuse:
+        context = SessionCachingContext(stats=stats)
+    else:
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    if configuration.verify_ssl:
+        # if not set certificate file, use Mozilla's root certificates.
+        context.load_verify_locations(
+            cafile=configuration.ssl_ca_cert or certifi.where())
+        if configuration.assert_hostname is False:
+            context.check_hostname = False
+    else:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    if configuration.cert_file:
+        context.load_cert_chain(configuration.cert_file,
+                                keyfile=configuration.key_file)
+    return context
+
+
+class _TlsConnection(HTTPSConnection):
+    """HTTPS connection that is not taken for dropped when the server sent
+    TLS 1.3 session tickets after the handshake (typically on warmed-up
+    connections, which did not read anything yet)."""
+
+    @property
+    def is_connected(self):
+        if self.sock is None:
+            return False
+        if not wait_for_read(self.sock, timeout=0.0):
+            return True
+        if not isinstance(self.sock, ssl.SSLSocket):
+            return False
+        timeout = self.sock.gettimeout()
+        self.sock.settimeout(0.0)
+        try:
+            # processes the tickets; data or EOF mean the connection is
+            # unusable
+            self.sock.recv(1)
+            return False
+        except ssl.SSLWantReadError:
+            return True
+        except (OSError, ValueError):
+            return False
+        finally:
+            self.sock.settimeout(timeout)
+
+
+class _TrackedConnection(object):
+    """Mixin of urllib3 connections counting those opened.
+
+    `pool_stats` is a class attribute, see `tracked_pool_classes`.
+    """
+
+    pool_stats = None
+
+    def connect(self):
+        super(_TrackedConnection, self).connect()
+        self._signer_opened_at = time.monotonic()
+        self.pool_stats.record(new_connections=1)
+
+
+class _TrackedPool(object):
+    """Mixin of urllib3 connection pools applying the idle timeout and max
+    lifetime, and counting hits and misses.
+
+    The settings are class attributes, see `tracked_pool_classes`.
+    """
+
+    pool_stats = None
+    idle_timeout = None
+    max_lifetime = None
+    session_context = None
+
+    def _expired(self, conn, now):
+        if (self.idle_timeout is not None and
+                now - getattr(conn, '_signer_released_at', now) >
+                self.idle_timeout):
+            return True
+        return (self.max_lifetime is not None and
+                now - getattr(conn, '_signer_opened_at', now) >
+                self.max_lifetime)
+
+    def _get_conn(self, timeout=None):
+        conn = super(_TrackedPool, self)._get_conn(timeout)
+        if conn.sock is not None:
+            if not self._expired(conn, time.monotonic()):
+                self.pool_stats.record(hits=1)
+                return conn
+            conn.close()
+            self.pool_stats.record(expired=1)
+        # connected by urllib3 when the request is sent, counted then
+        self.pool_stats.record(misses=1)
+        return conn
+
+    def _put_conn(self, conn):
+        if conn is not None:
+            conn._signer_released_at = time.monotonic()
+            if self.session_context is not None and conn.sock is not None:
+                self.session_context.remember(
+                    getattr(conn, 'server_hostname', None) or self.host,
+                    conn.sock)
+        super(_TrackedPool, self)._put_conn(conn)
+
+    def warm_up(self, connections):
+        """Opens up to `connections` keep-alive connections in parallel,
+        counting those already open. Returns the number opened."""
+        connections = min(connections, self.pool.maxsize)
+        conns = []
+        try:
+            for _ in range(connections):
+                conn = super(_TrackedPool, self)._get_conn(timeout=0)
+                if conn.sock is not None and self._expired(
+                        conn, time.monotonic()):
+                    conn.close()
+                    self.pool_stats.record(expired=1)
+                conns.append(conn)
+            closed = [conn for conn in conns if conn.sock is None]
+            if closed:
+                with ThreadPoolExecutor(len(closed)) as executor:
+                    # raises the first connection error, if any
+                    list(executor.map(self._open, closed))
+            return len(closed)
+        finally:
+            for conn in conns:
+                self._put_conn(conn)
+
+    def _open(self, conn):
+        conn.connect()
+        self.pool_stats.record(warmed_up=1)
+
+
+def tracked_pool_classes(stats, idle_timeout=None, max_lifetime=None,
+                         session_context=None):
+    """Returns urllib3 pool classes by scheme (for
+    `PoolManager.pool_classes_by_scheme`) bound to these settings.
+
+    :param stats: the `PoolStats` to update.
+    :param idle_timeout: seconds a pooled connection may stay unused.
+    :param max_lifetime: seconds a connection may be reused after opening.
+    :param session_context: the `SessionCachingContext` of the https pools,
+        to which the sessions of released connections are given.
+    """
+    settings = {'pool_stats': stats, 'idle_timeout': idle_timeout,
+                'max_lifetime': max_lifetime,
+                'session_context': session_context}
+    connection = {'pool_stats': stats}
+    return {
+        'http': type('TrackedHTTPConnectionPool',
+                     (_TrackedPool, HTTPConnectionPool),
+                     dict(settings, ConnectionCls=type(
+                         'TrackedHTTPConnection',
+                         (_TrackedConnection, HTTPConnection), connection))),
+        'https': type('TrackedHTTPSConnectionPool',
+                      (_TrackedPool, HTTPSConnectionPool),
+                      dict(settings, ConnectionCls=type(
+                          'TrackedHTTPSConnection',
+                          (_TrackedConnection, _TlsConnection), connection))),
+    }
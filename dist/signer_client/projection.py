@@ -0,0 +1,101 @@
+# coding: utf-8
+
+"""
+Response formats and field projection.
+
+Operations return models by default. Code forwarding the JSON elsewhere can
+skip building them and have the decoded JSON (``'dict'``: dicts, lists and
+strings as parsed by the JSON codec) or the body itself (``'raw'``: bytes),
+either for all the calls of a client:
+
+>>> configuration.response_format = 'dict'
+
+or for one call:
+
+>>> documents_api.api_documents_get(limit=100, _response_format='raw')
+
+`_fields` keeps only some JSON paths of the response, dot separated and
+applied to each item of the lists they go through, before the result is
+returned as a dict or turned into a model:
+
+>>> documents_api.api_documents_get(
+...     _response_format='dict',
+...     _fields=['items.id', 'items.status', 'totalCount'])
+{'items': [{'id': '...', 'status': 'Pending'}, ...], 'totalCount': 42}
+"""
+
+from __future__ import absolute_import
+
+import functools
+
+import six
+
+MODEL = 'model'
+DICT = 'dict'
+RAW = 'raw'
+RESPONSE_FORMATS = (MODEL, DICT, RAW)
+
+
+def response_options(response_format, fields=None):
+    """Validates the format and fields a response is requested in.
+
+    :param response_format: one of `RESPONSE_FORMATS`.
+    :param fields: JSON path or iterable of JSON paths, None for the whole
+        response.
+    :return: tuple of (response_format, fields), fields being a tuple or
+        None.
+    :raise ValueError: unknown format, or fields of a raw response.
+    """
+    if response_format not in RESPONSE_FORMATS:
+        raise ValueError(
+            "Invalid response format `%s`, must be one of %s"
+            % (response_format, ', '.join(RESPONSE_FORMATS)))
+    if fields is None:
+        return response_format, None
+    if isinstance(fields, six.string_types):
+        fields = (fields,)
+    fields = tuple(fields)
+    if response_format == RAW:
+        raise ValueError("Fields cannot be projected from raw responses")
+    return response_format, fields
+
+
+@functools.lru_cache(maxsize=256)
+def compile_fields(fields):
+    """Returns the tree of a tuple of JSON paths, e.g.
+    ``('items.id', 'totalCount')`` gives
+    ``{'items': {'id': None}, 'totalCount': None}``, None standing for the
+    whole value."""
+    tree = {}
+    for field in fields:
+        node = tree
+        keys = field.split('.')
+        for key in keys[:-1]:
+            child = node.setdefault(key, {})
+            if child is None:
+                # the whole value is already kept
+                break
+            node = child
+        else:
+            node[keys[-1]] = None
+    return tree
+
+
+def _project(value, tree):
+    if isinstance(value, list):
+        return [_project(item, tree) for item in value]
+    if not isinstance(value, dict):
+        return value
+    result = {}
+    for key, subtree in six.iteritems(tree):
+        if key in value:
+            item = value[key]
+            result[key] = (item if subtree is None or item is None
+                           else _project(item, subtree))
+    return result
+
+
+def project(data, fields):
+    """Returns the parts of decoded JSON `data` found at `fields`, a tuple
+    of JSON paths, with the same nesting."""
+    return _project(data, compile_fields(fields))
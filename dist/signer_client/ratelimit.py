@@ -0,0 +1,281 @@
+# coding: utf-8
+
+"""
+Client-side rate limiting with token buckets.
+
+A `RateLimiter` is assigned to `Configuration.rate_limiter` and consulted by
+`ApiClient` before each API call. Buckets either live in memory
+(`TokenBucket`, shared by the threads of a process) or in a small state file
+(`FileTokenBucket`, shared by every process opening the same path), so a
+fleet of workers on one machine can be kept under a single API key quota
+without any external service.
+
+Buckets hand out reservations instead of blocking: taking a token always
+succeeds, possibly leaving the bucket in debt, and returns how long the
+caller must wait before sending. Waiters are therefore served in arrival
+order and the same buckets work for the blocking and the asyncio clients.
+"""
+
+from __future__ import absolute_import
+
+import fnmatch
+import os
+import struct
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+
+def _refill(tokens, updated, now, rate, capacity, requested):
+    """Returns the bucket level after taking `requested` tokens at `now` and
+    the seconds to wait until that level is back to zero."""
+    tokens = min(capacity, tokens + max(0.0, now - updated) * rate)
+    tokens -= requested
+    return tokens, max(0.0, -tokens / rate)
+
+
+class TokenBucket(object):
+    """In-memory token bucket, shared by the threads of a process.
+
+    :param rate: tokens added per second, i.e. the sustained request rate.
+    :param capacity: maximum number of tokens, i.e. the largest burst.
+        Defaults to `rate` (one second worth of requests).
+    """
+
+    def __init__(self, rate, capacity=None):
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None
+                              else max(rate, 1))
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def reserve(self, tokens=1):
+        """Takes `tokens` and returns the seconds to wait before using them."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens, wait = _refill(self._tokens, self._updated, now,
+                                         self.rate, self.capacity, tokens)
+            self._updated = now
+            return wait
+
+    def __repr__(self):
+        return '%s(rate=%r, capacity=%r)' % (type(self).__name__, self.rate,
+                                             self.capacity)
+
+
+class FileTokenBucket(TokenBucket):
+    """Token bucket stored in a file, shared by all processes using `path`.
+
+    Each reservation locks the file (`fcntl.flock` on POSIX, `msvcrt.locking`
+    on Windows), updates the 16 bytes of state and unlocks it. Wall-clock
+    time is used, so the processes only need to share a machine.
+
+    :param path: state file, created if missing. Processes must agree on
+        `rate` and `capacity` for a given path.
+    :param rate: tokens added per second.
+    :param capacity: maximum number of tokens, defaults to `rate`.
+    """
+
+    _STATE = struct.Struct('<dd')
+
+    def __init__(self, path, rate, capacity=None):
+        super(FileTokenBucket, self).__init__(rate, capacity)
+        self.path = path
+        self._fd = None
+        self._pid = None
+
+    def _file(self):
+        # A descriptor inherited through fork shares its lock with the
+        # parent, so every process opens its own.
+        if self._fd is None or self._pid != os.getpid():
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            self._pid = os.getpid()
+        return self._fd
+
+    def reserve(self, tokens=1):
+        with self._lock:
+            fd = self._file()
+            _lock_file(fd)
+            try:
+                os.lseek(fd, 0, os.SEEK_SET)
+                state = os.read(fd, self._STATE.size)
+                now = time.time()
+                if len(state) == self._STATE.size:
+                    level, updated = self._STATE.unpack(state)
+                else:
+                    level, updated = self.capacity, now
+                level, wait = _refill(level, updated, now, self.rate,
+                                      self.capacity, tokens)
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.write(fd, self._STATE.pack(level, now))
+            finally:
+                _unlock_file(fd)
+            return wait
+
+    def close(self):
+        """Closes the state file of this process."""
+        with self._lock:
+            if self._fd is not None and self._pid == os.getpid():
+                os.close(self._fd)
+            self._fd = None
+
+    def __repr__(self):
+        return 'FileTokenBucket(%r, rate=%r, capacity=%r)' % (
+            self.path, self.rate, self.capacity)
+
+
+def _lock_file(fd):
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+
+def _unlock_file(fd):
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+class RateLimiterStats(object):
+    """Thread-safe counters of a `RateLimiter`."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Sets all counters back to zero."""
+        with self._lock:
+            #: calls that went through the limiter
+            self.requests = 0
+            #: calls that had to wait
+            self.throttled = 0
+            #: total seconds waited
+            self.waited_seconds = 0.0
+
+    def record(self, wait):
+        with self._lock:
+            self.requests += 1
+            if wait > 0:
+                self.throttled += 1
+                self.waited_seconds += wait
+
+    def as_dict(self):
+        """Returns a snapshot of the counters."""
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'throttled': self.throttled,
+                'waited_seconds': self.waited_seconds,
+            }
+
+    def __repr__(self):
+        return 'RateLimiterStats(%r)' % self.as_dict()
+
+
+class RateLimiter(object):
+    """Throttles API calls through token buckets.
+
+    Every call takes a token from `default` (the overall quota) and from the
+    first bucket of `buckets` whose pattern matches it, then waits for the
+    longest of both reservations.
+
+    :param default: bucket applying to all calls, or None.
+    :param buckets: dict of buckets for specific operations, keyed by method
+        and `fnmatch` pattern of the path template, e.g.
+        ``{'POST /api/uploads*': TokenBucket(2), 'GET *': TokenBucket(20)}``.
+        Patterns are tried in insertion order.
+    """
+
+    def __init__(self, default=None, buckets=None):
+        self.default = default
+        self.buckets = []
+        self._routes = {}
+        for operation, bucket in (buckets or {}).items():
+            self.add_bucket(operation, bucket)
+        self.stats = RateLimiterStats()
+
+    @classmethod
+    def shared(cls, directory, rate, capacity=None, buckets=None):
+        """Builds a limiter whose buckets are shared between processes.
+
+        :param directory: where the state files are kept; every process
+            limited together must use the same directory.
+        :param rate: requests per second of the default bucket.
+        :param capacity: burst of the default bucket.
+        :param buckets: dict of ``(rate, capacity)`` tuples keyed by pattern,
+            like the `buckets` of `RateLimiter`.
+        """
+        def path(name):
+            safe = ''.join(c if c.isalnum() else '_' for c in name)
+            return os.path.join(directory, 'signer-ratelimit-%s' % safe)
+
+        limiter = cls(FileTokenBucket(path('default'), rate, capacity))
+        for operation, (op_rate, op_capacity) in (buckets or {}).items():
+            limiter.add_bucket(operation, FileTokenBucket(
+                path(operation), op_rate, op_capacity))
+        return limiter
+
+    def add_bucket(self, operation, bucket):
+        """Limits the operations matching `operation` with `bucket`.
+
+        :param operation: method and path pattern, e.g. ``'POST /api/uploads*'``.
+            The method may be ``*``.
+        """
+        method, _, pattern = operation.partition(' ')
+        self.buckets.append((method.upper(), pattern or '*', bucket))
+        self._routes = {}
+
+    def bucket_for(self, method, resource_path):
+        """Returns the operation specific bucket of a call, if any."""
+        key = (method, resource_path)
+        try:
+            return self._routes[key]
+        except KeyError:
+            pass
+        bucket = None
+        for bucket_method, pattern, candidate in self.buckets:
+            if (bucket_method in ('*', method.upper()) and
+                    fnmatch.fnmatchcase(resource_path, pattern)):
+                bucket = candidate
+                break
+        self._routes[key] = bucket
+        return bucket
+
+    def reserve(self, method, resource_path):
+        """Takes the tokens of a call and returns the seconds to wait.
+
+        :param method: http method.
+        :param resource_path: path template, e.g. ``/api/documents/{id}``.
+        """
+        wait = 0.0
+        if self.default is not None:
+            wait = self.default.reserve()
+        bucket = self.bucket_for(method, resource_path)
+        if bucket is not None:
+            wait = max(wait, bucket.reserve())
+        self.stats.record(wait)
+        return wait
+
+    def acquire(self, method, resource_path):
+        """Blocks until a call may be sent."""
+        wait = self.reserve(method, resource_path)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def __repr__(self):
+        return 'RateLimiter(default=%r, buckets=%r)' % (
+            self.default, ['%s %s' % (m, p) for m, p, _ in self.buckets])
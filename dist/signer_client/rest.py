@@ -13,14 +13,11 @@
 from __future__ import absolute_import
 
 import io
-import json
 import logging
 import re
-import ssl
+import time
 
-import certifi
 # python 2 and python 3 compatibility library
-import six
 from six.moves.urllib.parse import urlencode
 
 try:
@@ -28,6 +25,16 @@ try:
 except ImportError:
     raise ImportError('Swagger python client requires urllib3.')
 
+from signer_client.codec import get_codec
+from signer_client.deadline import (
+    DeadlineExceeded, cap_timeout, time_left, within_deadline
+)
+from signer_client.compression import (
+    TransferStats, accept_encoding, compress_request
+)
+from signer_client.multipart import MultipartEncoder
+from signer_client.streaming import StreamingBody
+
 
 logger = logging.getLogger(__name__)
 
@@ -52,61 +59,53 @@ class RESTResponse(io.IOBase):
 class RESTClientObject(object):
 
     def __init__(self, configuration, pools_size=4, maxsize=None):
-        # urllib3.PoolManager will pass all kw parameters to connectionpool
-        # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/poolmanager.py#L75  # noqa: E501
-        # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/connectionpool.py#L680  # noqa: E501
-        # maxsize is the number of requests to host that are allowed in parallel  # noqa: E501
-        # Custom SSL certificates and client certificates: http://urllib3.readthedocs.io/en/latest/advanced-usage.html  # noqa: E501
-
-        # cert_reqs
-        if configuration.verify_ssl:
-            cert_reqs = ssl.CERT_REQUIRED
-        else:
-            cert_reqs = ssl.CERT_NONE
-
-        # ca_certs
-        if configuration.ssl_ca_cert:
-            ca_certs = configuration.ssl_ca_cert
-        else:
-            # if not set certificate file, use Mozilla's root certificates.
-            ca_certs = certifi.where()
-
-        addition_pool_args = {}
-        if configuration.assert_hostname is not None:
-            addition_pool_args['assert_hostname'] = configuration.assert_hostname  # noqa: E501
+        # imported here, transports raise this module's ApiException
+        from signer_client.transport import create_transport
+
+        self.configuration = configuration
+        # the HTTP backend (urllib3 by default), see `signer_client.transport`
+        self.transport = create_transport(configuration, pools_size=pools_size,
+                                          maxsize=maxsize)
+        # bytes sent and received, compressed and decoded
+        self.transfer_stats = TransferStats()
+
+    @property
+    def pool_manager(self):
+        """The urllib3 pool manager of the default transport."""
+        return getattr(self.transport, 'pool_manager', None)
+
+    @property
+    def pool_stats(self):
+        """`signer_client.pool.PoolStats` of the transport: pool hits,
+        misses, new connections and resumed TLS sessions. None with the
+        urllib3 transport unless `configuration.connection_pool_tracking`
+        (see `signer_client.pool`)."""
+        return self.transport.pool_stats
+
+    def warm_up(self, connections=4, host=None):
+        """Opens keep-alive connections ahead of the first requests, so they
+        are sent at steady-state latency.
+
+        Connections already open count towards `connections`, which is also
+        capped by the pool size (`configuration.connection_pool_maxsize`).
+        The urllib3 transport requires
+        `configuration.connection_pool_tracking`.
+
+        :param connections: number of connections to have open.
+        :param host: base url, `configuration.host` by default.
+        :return: the number of connections opened.
+        :raise ValueError: pool tracking is disabled.
+        """
+        return self.transport.warm_up(host or self.configuration.host,
+                                      connections)
 
-        if maxsize is None:
-            if configuration.connection_pool_maxsize is not None:
-                maxsize = configuration.connection_pool_maxsize
-            else:
-                maxsize = 4
-
-        # https pool manager
-        if configuration.proxy:
-            self.pool_manager = urllib3.ProxyManager(
-                num_pools=pools_size,
-                maxsize=maxsize,
-                cert_reqs=cert_reqs,
-                ca_certs=ca_certs,
-                cert_file=configuration.cert_file,
-                key_file=configuration.key_file,
-                proxy_url=configuration.proxy,
-                **addition_pool_args
-            )
-        else:
-            self.pool_manager = urllib3.PoolManager(
-                num_pools=pools_size,
-                maxsize=maxsize,
-                cert_reqs=cert_reqs,
-                ca_certs=ca_certs,
-                cert_file=configuration.cert_file,
-                key_file=configuration.key_file,
-                **addition_pool_args
-            )
+    def close(self):
+        """Releases the transport's pooled connections."""
+        self.transport.close()
 
     def request(self, method, url, query_params=None, headers=None,
                 body=None, post_params=None, _preload_content=True,
-                _request_timeout=None):
+                _request_timeout=None, _retry_policy=None, _throttle=None):
         """Perform requests.
 
         :param method: http request method
@@ -124,6 +123,10 @@ class RESTClientObject(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _retry_policy: `signer_client.retry.RetryPolicy` for this
+                              request, defaults to `configuration.retries`.
+        :param _throttle: callable waiting for the rate limiter, called
+                          before every attempt, retries included.
         """
         method = method.upper()
         assert method in ['GET', 'HEAD', 'DELETE', 'POST', 'PUT',
@@ -139,80 +142,78 @@ class RESTClientObject(object):
 
         timeout = None
         if _request_timeout:
-            if isinstance(_request_timeout, (int, ) if six.PY3 else (int, long)):  # noqa: E501,F821
-                timeout = urllib3.Timeout(total=_request_timeout)
+            if isinstance(_request_timeout, (int, float)):
+                timeout = _request_timeout
             elif (isinstance(_request_timeout, tuple) and
                   len(_request_timeout) == 2):
-                timeout = urllib3.Timeout(
-                    connect=_request_timeout[0], read=_request_timeout[1])
+                timeout = _request_timeout
 
         if 'Content-Type' not in headers:
             headers['Content-Type'] = 'application/json'
-
-        try:
-            # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
-            if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
-                if query_params:
-                    url += '?' + urlencode(query_params)
-                if re.search('json', headers['Content-Type'], re.IGNORECASE):
-                    request_body = '{}'
-                    if body is not None:
-                        request_body = json.dumps(body)
-                    r = self.pool_manager.request(
-                        method, url,
-                        body=request_body,
-                        preload_content=_preload_content,
-                        timeout=timeout,
-                        headers=headers)
-                elif headers['Content-Type'] == 'application/x-www-form-urlencoded':  # noqa: E501
-                    r = self.pool_manager.request(
-                        method, url,
-                        fields=post_params,
-                        encode_multipart=False,
-                        preload_content=_preload_content,
-                        timeout=timeout,
-                        headers=headers)
-                elif headers['Content-Type'] == 'multipart/form-data':
-                    # must del headers['Content-Type'], or the correct
-                    # Content-Type which generated by urllib3 will be
-                    # overwritten.
-                    del headers['Content-Type']
-                    r = self.pool_manager.request(
-                        method, url,
-                        fields=post_params,
-                        encode_multipart=True,
-                        preload_content=_preload_content,
-                        timeout=timeout,
-                        headers=headers)
-                # Pass a `string` parameter directly in the body to support
-                # other content types than Json when `body` argument is
-                # provided in serialized form
-                elif isinstance(body, str):
-                    request_body = body
-                    r = self.pool_manager.request(
-                        method, url,
-                        body=request_body,
-                        preload_content=_preload_content,
-                        timeout=timeout,
-                        headers=headers)
-                else:
-                    # Cannot generate the request from given parameters
-                    msg = """Cannot prepare a request message for provided
-                             arguments. Please check that your arguments match
-                             declared content type."""
-                    raise ApiException(status=0, reason=msg)
-            # For `GET`, `HEAD`
+        if 'Accept-Encoding' not in headers:
+            headers['Accept-Encoding'] = accept_encoding(
+                self.configuration, self.transport.accept_encoding)
+
+        if query_params:
+            url += '?' + urlencode(query_params)
+
+        request_body = None
+        # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
+        if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
+            if isinstance(body, StreamingBody):
+                # encoded while sending, see `signer_client.streaming`
+                request_body = body
+            elif re.search('json', headers['Content-Type'], re.IGNORECASE):
+                request_body = b'{}'
+                if body is not None:
+                    request_body = get_codec(self.configuration).dumps(body)
+            elif headers['Content-Type'] == 'application/x-www-form-urlencoded':  # noqa: E501
+                request_body = urlencode(post_params)
+            elif headers['Content-Type'] == 'multipart/form-data':
+                # streamed from disk while sending, see
+                # `signer_client.multipart`.
+                request_body = MultipartEncoder(post_params)
+            # Pass a `string` parameter directly in the body to support
+            # other content types than Json when `body` argument is
+            # provided in serialized form
+            elif isinstance(body, str):
+                request_body = body
             else:
-                r = self.pool_manager.request(method, url,
-                                              fields=query_params,
-                                              preload_content=_preload_content,
-                                              timeout=timeout,
-                                              headers=headers)
-        except urllib3.exceptions.SSLError as e:
-            msg = "{0}\n{1}".format(type(e).__name__, str(e))
-            raise ApiException(status=0, reason=msg)
+                # Cannot generate the request from given parameters
+                msg = """Cannot prepare a request message for provided
+                         arguments. Please check that your arguments match
+                         declared content type."""
+                raise ApiException(status=0, reason=msg)
+
+        if request_body is not None and 'Content-Encoding' not in headers:
+            request_body, encoding = compress_request(
+                request_body,
+                (request_body.content_type
+                 if isinstance(request_body, StreamingBody)
+                 else headers['Content-Type']),
+                getattr(self.configuration, 'request_compression', None),
+                getattr(self.configuration, 'request_compression_min_size', 0),
+                self.transfer_stats)
+            if encoding:
+                headers['Content-Encoding'] = encoding
+
+        if isinstance(request_body, StreamingBody):
+            # e.g. the multipart Content-Type carrying the boundary
+            headers['Content-Type'] = request_body.content_type
+            length = request_body.length
+            if length is not None:
+                headers['Content-Length'] = str(length)
+
+        if _retry_policy is None:
+            _retry_policy = getattr(self.configuration, 'retries', None)
+        r = self._send(_retry_policy, method, url, throttle=_throttle,
+                       body=request_body,
+                       headers=headers,
+                       preload_content=_preload_content,
+                       timeout=timeout)
 
         if _preload_content:
+            self._record_response(r)
             r = RESTResponse(r)
 
             # log response body
@@ -223,72 +224,169 @@ class RESTClientObject(object):
 
         return r
 
+    def _record_response(self, response):
+        """Counts the size of a read response, on the wire and decoded."""
+        decoded = len(response.data or b'')
+        tell = getattr(response, 'tell', None)
+        self.transfer_stats.record_response(
+            tell() if tell is not None else decoded, decoded,
+            response.headers.get('Content-Encoding'))
+
+    def _send(self, policy, method, url, timeout=None, throttle=None,
+              **kwargs):
+        """Sends a request through the transport, retrying per `policy`.
+
+        Each attempt waits for `throttle`, if any, so that retries count
+        against the rate limit too, and gets `timeout` capped to the time
+        left before the deadline of the operation, see
+        `signer_client.deadline`.
+        """
+        if policy is None:
+            if throttle is not None:
+                throttle()
+            return self._attempt(method, url, timeout, kwargs)
+
+        attempt = 0
+        while True:
+            if throttle is not None:
+                throttle()
+            policy.stats.record_attempt()
+            try:
+                r = self._attempt(method, url, timeout, kwargs)
+            except self.transport.connection_errors as e:
+                delay = None
+                if policy.should_retry(method, attempt):
+                    delay = within_deadline(policy.sleep_time(attempt))
+                if delay is None:
+                    policy.stats.record_outcome(attempt > 0, False)
+                    raise
+                cause = type(e).__name__
+            else:
+                if (200 <= r.status <= 299 or
+                        not policy.should_retry(method, attempt, r.status)):
+                    break
+                cause = r.status
+                delay = within_deadline(
+                    policy.sleep_time(attempt, r.status, r.headers))
+                if delay is None:
+                    break
+                _discard(r)
+
+            policy.stats.record_retry(cause, delay)
+            logger.info("retrying %s %s in %.2fs after %s (retry %d of %d)",
+                        method, url, delay, cause, attempt + 1, policy.total)
+            time.sleep(delay)
+            attempt += 1
+
+        policy.stats.record_outcome(attempt > 0, 200 <= r.status <= 299)
+        return r
+
+    def _attempt(self, method, url, timeout, kwargs):
+        try:
+            return self.transport.request(method, url,
+                                          timeout=cap_timeout(timeout),
+                                          **kwargs)
+        except self.transport.connection_errors as e:
+            left = time_left()
+            if left is not None and left <= 0:
+                raise DeadlineExceeded('Deadline exceeded: %s' % e)
+            raise
+
     def GET(self, url, headers=None, query_params=None, _preload_content=True,
-            _request_timeout=None):
+            _request_timeout=None, _retry_policy=None, _throttle=None):
         return self.request("GET", url,
                             headers=headers,
                             _preload_content=_preload_content,
                             _request_timeout=_request_timeout,
+                            _retry_policy=_retry_policy,
+                            _throttle=_throttle,
                             query_params=query_params)
 
     def HEAD(self, url, headers=None, query_params=None, _preload_content=True,
-             _request_timeout=None):
+             _request_timeout=None, _retry_policy=None, _throttle=None):
         return self.request("HEAD", url,
                             headers=headers,
                             _preload_content=_preload_content,
                             _request_timeout=_request_timeout,
+                            _retry_policy=_retry_policy,
+                            _throttle=_throttle,
                             query_params=query_params)
 
     def OPTIONS(self, url, headers=None, query_params=None, post_params=None,
-                body=None, _preload_content=True, _request_timeout=None):
+                body=None, _preload_content=True, _request_timeout=None,
+                _retry_policy=None, _throttle=None):
         return self.request("OPTIONS", url,
                             headers=headers,
                             query_params=query_params,
                             post_params=post_params,
                             _preload_content=_preload_content,
                             _request_timeout=_request_timeout,
+                            _retry_policy=_retry_policy,
+                            _throttle=_throttle,
                             body=body)
 
     def DELETE(self, url, headers=None, query_params=None, body=None,
-               _preload_content=True, _request_timeout=None):
+               _preload_content=True, _request_timeout=None,
+               _retry_policy=None, _throttle=None):
         return self.request("DELETE", url,
                             headers=headers,
                             query_params=query_params,
                             _preload_content=_preload_content,
                             _request_timeout=_request_timeout,
+                            _retry_policy=_retry_policy,
+                            _throttle=_throttle,
                             body=body)
 
     def POST(self, url, headers=None, query_params=None, post_params=None,
-             body=None, _preload_content=True, _request_timeout=None):
+             body=None, _preload_content=True, _request_timeout=None,
+             _retry_policy=None, _throttle=None):
         return self.request("POST", url,
                             headers=headers,
                             query_params=query_params,
                             post_params=post_params,
                             _preload_content=_preload_content,
                             _request_timeout=_request_timeout,
+                            _retry_policy=_retry_policy,
+                            _throttle=_throttle,
                             body=body)
 
     def PUT(self, url, headers=None, query_params=None, post_params=None,
-            body=None, _preload_content=True, _request_timeout=None):
+            body=None, _preload_content=True, _request_timeout=None,
+            _retry_policy=None, _throttle=None):
         return self.request("PUT", url,
                             headers=headers,
                             query_params=query_params,
                             post_params=post_params,
                             _preload_content=_preload_content,
                             _request_timeout=_request_timeout,
+                            _retry_policy=_retry_policy,
+                            _throttle=_throttle,
                             body=body)
 
     def PATCH(self, url, headers=None, query_params=None, post_params=None,
-              body=None, _preload_content=True, _request_timeout=None):
+              body=None, _preload_content=True, _request_timeout=None,
+              _retry_policy=None, _throttle=None):
         return self.request("PATCH", url,
                             headers=headers,
                             query_params=query_params,
                             post_params=post_params,
                             _preload_content=_preload_content,
                             _request_timeout=_request_timeout,
+                            _retry_policy=_retry_policy,
+                            _throttle=_throttle,
                             body=body)
 
 
+def _discard(response):
+    """Releases the connection of a response whose body will not be read."""
+    drain_conn = getattr(response, 'drain_conn', None)
+    if drain_conn is not None:
+        drain_conn()
+    release_conn = getattr(response, 'release_conn', None)
+    if release_conn is not None:
+        release_conn()
+
+
 class ApiException(Exception):
 
     def __init__(self, status=None, reason=None, http_resp=None):
@@ -0,0 +1,219 @@
+# coding: utf-8
+
+"""
+Retry policy applied by the REST layer to failed requests.
+
+A request is retried when it fails with a connection error or with one of
+the `status_forcelist` statuses (429, 502, 503 and 504 by default), as long
+as its method is idempotent (GET, HEAD, OPTIONS, PUT and DELETE by
+default). POST requests are only retried when the policy, or the override
+for the operation, sets ``retry_post=True``.
+
+Waits use exponential backoff with full jitter, so clients failing together
+do not retry together, and honor the `Retry-After` header of 429 and 503
+responses.
+"""
+
+from __future__ import absolute_import
+
+import copy
+import email.utils
+import random
+import threading
+import time
+
+
+class RetryStats(object):
+    """Thread-safe retry counters of a `RetryPolicy`."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Sets all counters back to zero."""
+        with self._lock:
+            #: requests sent, including retries
+            self.attempts = 0
+            #: retries performed
+            self.retries = 0
+            #: requests that failed after exhausting their retries
+            self.exhausted = 0
+            #: requests that succeeded after at least one retry
+            self.recovered = 0
+            #: retries per cause: an HTTP status or an exception name
+            self.by_cause = {}
+            #: total seconds spent waiting between attempts
+            self.backoff_seconds = 0.0
+
+    def record_attempt(self):
+        with self._lock:
+            self.attempts += 1
+
+    def record_retry(self, cause, delay):
+        with self._lock:
+            self.retries += 1
+            self.by_cause[cause] = self.by_cause.get(cause, 0) + 1
+            self.backoff_seconds += delay
+
+    def record_outcome(self, retried, succeeded):
+        if not retried:
+            return
+        with self._lock:
+            if succeeded:
+                self.recovered += 1
+            else:
+                self.exhausted += 1
+
+    def as_dict(self):
+        """Returns a snapshot of the counters."""
+        with self._lock:
+            return {
+                'attempts': self.attempts,
+                'retries': self.retries,
+                'exhausted': self.exhausted,
+                'recovered': self.recovered,
+                'by_cause': dict(self.by_cause),
+                'backoff_seconds': self.backoff_seconds,
+            }
+
+    def __repr__(self):
+        return 'RetryStats(%r)' % self.as_dict()
+
+
+class RetryPolicy(object):
+    """Configures how failed requests are retried.
+
+    :param total: maximum number of retries of a request (0 disables).
+    :param backoff_factor: base of the exponential backoff, in seconds.
+        The wait before retry ``n`` (starting at 0) is a random value
+        between 0 and ``min(backoff_max, backoff_factor * 2 ** n)``.
+    :param backoff_max: upper bound of a single backoff, in seconds.
+    :param status_forcelist: HTTP statuses that trigger a retry.
+    :param allowed_methods: HTTP methods retried by default.
+    :param retry_post: also retry POST requests. Only enable it for
+        operations that are safe to repeat.
+    :param respect_retry_after_header: on 429 and 503 responses, wait at
+        least the delay given by `Retry-After`.
+    :param retry_after_max: upper bound honored for `Retry-After`, in
+        seconds; longer waits fail immediately instead.
+    :param overrides: dict of policies for specific operations, keyed by
+        method and path template, e.g.
+        ``{'POST /api/documents/{id}/action-url': RetryPolicy(retry_post=True)}``.
+        Overrides share the counters of this policy.
+    """
+
+    DEFAULT_ALLOWED_METHODS = frozenset(
+        ['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+    DEFAULT_STATUS_FORCELIST = frozenset([429, 502, 503, 504])
+    RETRY_AFTER_STATUS_CODES = frozenset([429, 503])
+
+    def __init__(self, total=3, backoff_factor=0.5, backoff_max=30.0,
+                 status_forcelist=DEFAULT_STATUS_FORCELIST,
+                 allowed_methods=DEFAULT_ALLOWED_METHODS, retry_post=False,
+                 respect_retry_after_header=True, retry_after_max=120.0,
+                 overrides=None):
+        self.total = total
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.status_forcelist = frozenset(status_forcelist)
+        self.allowed_methods = frozenset(m.upper() for m in allowed_methods)
+        self.retry_post = retry_post
+        self.respect_retry_after_header = respect_retry_after_header
+        self.retry_after_max = retry_after_max
+        self.stats = RetryStats()
+        self.overrides = {}
+        for operation, policy in (overrides or {}).items():
+            self.set_override(operation, policy)
+
+    def copy(self):
+        """Returns a policy with the same settings and overrides, and
+        counters of its own."""
+        policy = copy.copy(self)
+        policy.stats = RetryStats()
+        policy.overrides = {}
+        for key, override in self.overrides.items():
+            override = copy.copy(override)
+            override.stats = policy.stats
+            policy.overrides[key] = override
+        return policy
+
+    def set_override(self, operation, policy):
+        """Uses `policy` for one operation.
+
+        :param operation: method and path template, e.g.
+            ``'GET /api/documents/{id}'``.
+        :param policy: a `RetryPolicy`, or None to never retry the operation.
+        """
+        method, _, path = operation.partition(' ')
+        if policy is None:
+            policy = RetryPolicy(total=0)
+        policy.stats = self.stats
+        self.overrides[(method.upper(), path)] = policy
+
+    def for_operation(self, method, resource_path):
+        """Returns the policy applying to an operation.
+
+        :param method: http method.
+        :param resource_path: path template, e.g. ``/api/documents/{id}``.
+        """
+        if not self.overrides:
+            return self
+        return self.overrides.get((method.upper(), resource_path), self)
+
+    def is_method_retryable(self, method):
+        method = method.upper()
+        if method == 'POST':
+            return self.retry_post
+        return method in self.allowed_methods
+
+    def should_retry(self, method, attempt, status=None):
+        """Tells whether a failed attempt must be retried.
+
+        :param method: http method of the request.
+        :param attempt: number of retries already performed.
+        :param status: HTTP status of the response, or None for a
+            connection error.
+        """
+        if attempt >= self.total or not self.is_method_retryable(method):
+            return False
+        return status is None or status in self.status_forcelist
+
+    def backoff(self, attempt):
+        """Returns a jittered backoff delay for a retry, in seconds."""
+        ceiling = min(self.backoff_max, self.backoff_factor * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    def get_retry_after(self, status, headers):
+        """Parses the `Retry-After` header, in seconds, if it applies."""
+        if (not self.respect_retry_after_header or headers is None or
+                status not in self.RETRY_AFTER_STATUS_CODES):
+            return None
+        value = headers.get('Retry-After')
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        parsed = email.utils.parsedate_tz(value)
+        if parsed is None:
+            return None
+        return max(0.0, email.utils.mktime_tz(parsed) - time.time())
+
+    def sleep_time(self, attempt, status=None, headers=None):
+        """Returns how long to wait before a retry, or None to give up.
+
+        The jittered backoff is added on top of `Retry-After`, so clients
+        told to come back at the same time still spread their retries.
+        """
+        delay = self.backoff(attempt)
+        retry_after = self.get_retry_after(status, headers)
+        if retry_after is not None:
+            if retry_after > self.retry_after_max:
+                return None
+            delay += retry_after
+        return delay
+
+    def __repr__(self):
+        return ('RetryPolicy(total=%r, backoff_factor=%r, retry_post=%r)'
+                % (self.total, self.backoff_factor, self.retry_post))
@@ -0,0 +1,262 @@
+# coding: utf-8
+
+"""
+Request bodies produced while they are sent.
+
+A `StreamingBody` is passed as the `body` of an operation (or built by the
+REST layer, like `signer_client.multipart.MultipartEncoder`) and is sent as
+an iterable of chunks instead of a serialized string, with a
+`Content-Length` when its size is known up front.
+
+`Base64JsonBody` produces the ``{"bytes": "<base64>"}`` body of
+`UploadApi.api_uploads_bytes_post`, encoding the source in chunks. By
+default the source is read and encoded in a background thread a few chunks
+ahead of the socket, so encoding overlaps with the network transfer while
+memory stays bounded.
+"""
+
+from __future__ import absolute_import
+
+import abc
+import base64
+import mmap
+import os
+import threading
+
+import six
+from six.moves.queue import Full, Queue
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class StreamingBody(six.with_metaclass(abc.ABCMeta, object)):
+    """Base class of request bodies streamed to the server.
+
+    Subclasses set `content_type` and implement `__iter__`, which must
+    start over on each call so the request can be retried.
+
+    Bodies of another copy of this module, such as ``dist.signer_client``
+    imported from the repository root next to the installed
+    ``signer_client``, are recognized as streaming bodies too.
+    """
+
+    content_type = 'application/octet-stream'
+
+    @classmethod
+    def __subclasshook__(cls, subclass):
+        if cls is not StreamingBody:
+            return NotImplemented
+        for base in subclass.__mro__:
+            if (base.__name__ == 'StreamingBody' and
+                    base.__module__.endswith('signer_client.streaming')):
+                return True
+        return NotImplemented
+
+    @property
+    def length(self):
+        """Size of the body in bytes, None when it cannot be known."""
+        return None
+
+    def __iter__(self):
+        raise NotImplementedError
+
+    async def __aiter__(self):
+        # used by aiohttp, which accepts asynchronous iterables only
+        for chunk in self:
+            yield bytes(chunk)
+
+    def to_bytes(self):
+        """Returns the whole body at once (for tests and small bodies)."""
+        return b''.join(bytes(chunk) for chunk in self)
+
+
+def source_start(source):
+    """Returns the position a stream source is read from, to capture when a
+    body is built. None for bytes-like objects, paths and streams that
+    cannot tell their position."""
+    if isinstance(source, (bytes, bytearray, memoryview, str, os.PathLike)):
+        return None
+    try:
+        return source.tell()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def source_size(source, start=None):
+    """Returns the number of bytes of a source: bytes-like, path or binary
+    stream (from `start`, or from its current position if None). None if it
+    cannot be known."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return memoryview(source).nbytes
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.getsize(source)
+    try:
+        position = source.tell()
+        end = source.seek(0, os.SEEK_END)
+        source.seek(position)
+        return end - (position if start is None else start)
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def iter_source(source, chunk_size=DEFAULT_CHUNK_SIZE, start=None):
+    """Yields the content of a source in chunks of at most `chunk_size`.
+
+    Bytes-like sources and paths (memory-mapped) are yielded as zero-copy
+    memoryview slices. Streams are read from `start` (see `source_start`),
+    sought to first so that a pass abandoned halfway, e.g. by a failed
+    attempt, does not shorten the next one, and sought back to it at the
+    end. Streams without `start` are read from their current position.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source).cast('B')
+        for i in range(0, len(view), chunk_size):
+            yield view[i:i + chunk_size]
+    elif isinstance(source, (str, os.PathLike)):
+        for chunk in _mapped_chunks(source, chunk_size):
+            yield chunk
+    else:
+        if start is None:
+            start = source_start(source)
+        else:
+            source.seek(start)
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+        # not in a `finally`: an abandoned pass may be closed late, from
+        # another thread, while the next one reads
+        if start is not None:
+            source.seek(start)
+
+
+def _mapped_chunks(path, chunk_size):
+    with open(path, 'rb') as f:
+        try:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # empty or special files cannot be mapped
+            mapping = None
+        if mapping is None:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+            return
+        view = memoryview(mapping)
+        try:
+            for i in range(0, len(view), chunk_size):
+                yield view[i:i + chunk_size]
+        finally:
+            del view
+            try:
+                mapping.close()
+            except BufferError:
+                # a chunk is still referenced, the mapping is released
+                # when it is garbage collected
+                pass
+
+
+_DONE = object()
+
+
+def read_ahead(chunks, depth):
+    """Iterates `chunks` in a background thread, up to `depth` chunks ahead
+    of the consumer, so producing them overlaps with consuming them."""
+    queue = Queue(depth)
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for chunk in chunks:
+                if not put((chunk, None)):
+                    return
+            put((_DONE, None))
+        except BaseException as e:
+            put((_DONE, e))
+
+    thread = threading.Thread(target=produce, name='signer-read-ahead')
+    thread.daemon = True
+    thread.start()
+    try:
+        while True:
+            chunk, error = queue.get()
+            if chunk is _DONE:
+                if error is not None:
+                    raise error
+                return
+            yield chunk
+    finally:
+        stop.set()
+        thread.join()
+
+
+class Base64JsonBody(StreamingBody):
+    """JSON object with one field holding the base64 encoding of a source.
+
+    >>> body = Base64JsonBody('scan.pdf')
+    >>> upload_api.api_uploads_bytes_post(body=body)
+
+    :param source: bytes-like object, path, or binary stream, read from its
+        position when the body is built.
+    :param field: JSON name of the field (`bytes` for
+        `UploadsUploadBytesRequest`).
+    :param chunk_size: bytes of the source encoded at a time, rounded down to
+        a multiple of 3 so chunks encode without padding.
+    :param read_ahead: number of encoded chunks prepared in a background
+        thread while the previous ones are sent, 0 to encode in the sending
+        thread.
+    """
+
+    content_type = 'application/json'
+
+    def __init__(self, source, field='bytes', chunk_size=3 * 16 * 1024,
+                 read_ahead=2):
+        self.source = source
+        self._start = source_start(source)
+        self.chunk_size = max(3, chunk_size - chunk_size % 3)
+        self.read_ahead = read_ahead
+        self._prefix = ('{"%s": "' % field).encode('utf-8')
+        self._suffix = b'"}'
+
+    @property
+    def length(self):
+        size = source_size(self.source, self._start)
+        if size is None:
+            return None
+        return len(self._prefix) + 4 * ((size + 2) // 3) + len(self._suffix)
+
+    def _encoded(self):
+        carry = b''
+        for chunk in iter_source(self.source, self.chunk_size, self._start):
+            if carry or len(chunk) % 3:
+                chunk = carry + bytes(chunk)
+                cut = len(chunk) - len(chunk) % 3
+                chunk, carry = chunk[:cut], chunk[cut:]
+            if chunk:
+                yield base64.b64encode(chunk)
+        if carry:
+            yield base64.b64encode(carry)
+
+    def __iter__(self):
+        yield self._prefix
+        encoded = self._encoded()
+        if self.read_ahead > 0:
+            encoded = read_ahead(encoded, self.read_ahead)
+        for chunk in encoded:
+            yield chunk
+        yield self._suffix
+
+    def __repr__(self):
+        return 'Base64JsonBody(%r)' % (self.source,)
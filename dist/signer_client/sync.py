@@ -0,0 +1,346 @@
+# coding: utf-8
+
+"""
+Incremental mirror of the documents in a local SQLite database.
+
+Polling `api_documents_get` and then `api_documents_id_get` for every
+document costs a request per document on every cycle. `DocumentSync` keeps
+the listing of each document and selected fields of its details in SQLite,
+and each `run` only asks for what changed since the previous one:
+
+>>> with DocumentSync(documents_api, 'documents.db') as sync:
+...     result = sync.run()
+...     print(result.changed, 'documents changed')
+
+The listing is read newest first (``order=Desc``) and the run stops once it
+reaches documents updated before the checkpoint, the latest `update_date`
+stored by the previous runs, less `lookback` seconds for changes the server
+made visible late. Only documents whose `update_date` differs from the
+stored one, and documents whose details are missing, have their details
+fetched, `parallelism` at a time, as the JSON paths `detail_fields` of
+`DocumentsDocumentModel`. A steady-state run therefore costs a page or two
+of listing plus one request per changed document.
+
+The API does not document the key its `order` sorts by. A run checks that
+the pages it reads come in decreasing `update_date` and lists everything
+when they do not, as it does on the first run, when `full` is set and every
+`full_sync_interval` seconds. A full listing is scanned in parallel (see
+`signer_client.pagination.scan_items`) and also removes the documents that
+are no longer listed.
+
+Everything a run writes is committed at its end together with the new
+checkpoint, so a failed run leaves the previous state. The tables can be
+queried directly through `connection`:
+
+``documents``
+    ``id``, ``name``, ``type``, ``folder_id``, ``creation_date`` and
+    ``update_date`` (as returned by the API), ``updated`` (`update_date` as
+    a UTC timestamp), ``listing`` (JSON of the `DocumentsDocumentListModel`),
+    ``details`` (JSON of the selected fields, NULL until fetched) and
+    ``synced_at`` (timestamp of the last change).
+``sync_state``
+    ``key``/``value`` pairs: ``checkpoint``, ``last_full_sync`` and
+    ``detail_fields``.
+"""
+
+from __future__ import absolute_import
+
+import datetime
+import json
+import sqlite3
+import time
+
+from signer_client.deserializer import parse_datetime
+from signer_client.pagination import (
+    DEFAULT_PAGE_SIZE, DEFAULT_PARALLELISM, iter_pages, ordered_results,
+    page_items, scan_items,
+)
+from signer_client.projection import DICT
+from signer_client.rest import ApiException
+
+#: fields of `DocumentsDocumentModel` mirrored by default
+DEFAULT_DETAIL_FIELDS = ('status', 'isConcluded', 'isDeleted', 'hasSignature',
+                         'expirationDate', 'description')
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS documents (
+    id TEXT PRIMARY KEY,
+    name TEXT,
+    type TEXT,
+    folder_id TEXT,
+    creation_date TEXT,
+    update_date TEXT,
+    updated REAL,
+    listing TEXT NOT NULL,
+    details TEXT,
+    synced_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS documents_updated ON documents (updated);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+'''
+
+
+def _timestamp(update_date):
+    """Returns an `update_date` of the API as a UTC timestamp, None if
+    missing; dates without offset are taken as UTC."""
+    if not update_date:
+        return None
+    value = parse_datetime(update_date)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return value.timestamp()
+
+
+class SyncResult(object):
+    """Outcome of a `DocumentSync.run`.
+
+    :param full: whether the whole listing was read.
+    :param listed: documents read from the listing.
+    :param changed: documents new or updated since the previous run.
+    :param details: details fetched.
+    :param deleted: documents removed from the mirror.
+    :param checkpoint: latest `update_date` stored, a UTC timestamp.
+    """
+
+    def __init__(self, full, listed, changed, details, deleted, checkpoint):
+        self.full = full
+        self.listed = listed
+        self.changed = changed
+        self.details = details
+        self.deleted = deleted
+        self.checkpoint = checkpoint
+
+    def __repr__(self):
+        return ('SyncResult(full=%r, listed=%r, changed=%r, details=%r, '
+                'deleted=%r)' % (self.full, self.listed, self.changed,
+                                 self.details, self.deleted))
+
+
+class DocumentSync(object):
+    """Mirrors the documents listed by a `DocumentsApi` into SQLite.
+
+    :param documents_api: `signer_client.DocumentsApi` to read from.
+    :param path: SQLite database file, created if missing.
+    :param detail_fields: JSON paths of `DocumentsDocumentModel` to store,
+        None for the whole details. Changing them fetches the details of
+        all the documents again.
+    :param filters: keyword arguments of `api_documents_get` selecting the
+        documents to mirror, e.g. ``{'folder_id': ...}``.
+    :param page_size: documents per listing request.
+    :param parallelism: requests running at a time, for details and full
+        listings.
+    :param lookback: seconds before the checkpoint the listing is read
+        again, for changes the server made visible late.
+    :param full_sync_interval: seconds between two full listings, None for
+        only the first one.
+    :param executor: `concurrent.futures.Executor` running the requests,
+        None for the shared pool.
+    """
+
+    def __init__(self, documents_api, path,
+                 detail_fields=DEFAULT_DETAIL_FIELDS, filters=None,
+                 page_size=DEFAULT_PAGE_SIZE, parallelism=DEFAULT_PARALLELISM,
+                 lookback=60, full_sync_interval=24 * 60 * 60,
+                 executor=None):
+        self.documents_api = documents_api
+        self.detail_fields = (None if detail_fields is None
+                              else tuple(detail_fields))
+        self.filters = dict(filters or {})
+        self.page_size = page_size
+        self.parallelism = parallelism
+        self.lookback = lookback
+        self.full_sync_interval = full_sync_interval
+        self.executor = executor
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(_SCHEMA)
+        fields = json.dumps(self.detail_fields)
+        if self._state('detail_fields') != fields:
+            with self.connection:
+                self.connection.execute('UPDATE documents SET details = NULL')
+                self._set_state('detail_fields', fields)
+
+    def close(self):
+        """Closes the database."""
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def checkpoint(self):
+        """Latest `update_date` stored, a UTC timestamp, None before the
+        first run."""
+        value = self._state('checkpoint')
+        return None if value is None else float(value)
+
+    def get(self, document_id):
+        """Returns the stored listing of a document, with its stored
+        details under ``'details'``, None if it is not mirrored."""
+        row = self.connection.execute(
+            'SELECT listing, details FROM documents WHERE id = ?',
+            (document_id,)).fetchone()
+        if row is None:
+            return None
+        document = json.loads(row[0])
+        document['details'] = None if row[1] is None else json.loads(row[1])
+        return document
+
+    def run(self, full=False):
+        """Brings the mirror up to date.
+
+        :param full: read the whole listing even if an incremental run is
+            possible.
+        :return: `SyncResult`.
+        """
+        checkpoint = self.checkpoint
+        last_full = self._state('last_full_sync')
+        now = time.time()
+        full = (full or checkpoint is None or last_full is None or
+                (self.full_sync_interval is not None and
+                 now - float(last_full) >= self.full_sync_interval))
+        try:
+            listed = None
+            if not full:
+                listed = self._listed_since(checkpoint - self.lookback)
+                full = listed is None
+            if full:
+                listed = list(scan_items(
+                    self._fetch_page, self.page_size, self.parallelism,
+                    executor=self.executor))
+            changed, deleted = self._store_listing(listed, full, now)
+            details, gone = self._store_details(now)
+            if full:
+                self._set_state('last_full_sync', repr(now))
+            updated = [value for value in (
+                _timestamp(item.get('updateDate')) for item in listed)
+                if value is not None]
+            if updated:
+                checkpoint = max(updated + [checkpoint or updated[0]])
+                self._set_state('checkpoint', repr(checkpoint))
+            self.connection.commit()
+        except BaseException:
+            self.connection.rollback()
+            raise
+        return SyncResult(full, len(listed), changed, details,
+                          deleted + gone, checkpoint)
+
+    def _fetch_page(self, offset, limit):
+        return self.documents_api.api_documents_get(
+            offset=offset, limit=limit, order='Desc',
+            _response_format=DICT, **self.filters)
+
+    def _fetch_details(self, document_id):
+        try:
+            return document_id, self.documents_api.api_documents_id_get(
+                document_id, _response_format=DICT,
+                _fields=self.detail_fields)
+        except ApiException as e:
+            if e.status != 404:
+                raise
+            return document_id, None
+
+    def _listed_since(self, since):
+        """Returns the documents listed newest first down to the page
+        reaching those updated before `since`, None if these pages are not
+        in decreasing `update_date` order."""
+        listed = []
+        previous = None
+        pages = iter_pages(self._fetch_page, self.page_size, prefetch=1,
+                           executor=self.executor)
+        try:
+            for page in pages:
+                # the order is checked over whole pages, past `since`
+                reached = False
+                for item in page_items(page)[0]:
+                    updated = _timestamp(item.get('updateDate'))
+                    if updated is None or (previous is not None and
+                                           updated > previous):
+                        return None
+                    previous = updated
+                    if updated < since:
+                        reached = True
+                    else:
+                        listed.append(item)
+                if reached:
+                    return listed
+        finally:
+            pages.close()
+        return listed
+
+    def _store_listing(self, listed, full, now):
+        """Writes the new and updated documents of a listing; a full one
+        also removes the documents no longer listed. Returns the number of
+        documents changed and removed."""
+        stored = dict(self.connection.execute(
+            'SELECT id, update_date FROM documents'))
+        changed = 0
+        seen = set()
+        for item in listed:
+            document_id = item['id']
+            if document_id in seen:
+                continue
+            seen.add(document_id)
+            if (document_id in stored and
+                    stored[document_id] == item.get('updateDate')):
+                continue
+            changed += 1
+            folder = item.get('folder') or {}
+            self.connection.execute(
+                'INSERT INTO documents (id, name, type, folder_id, '
+                'creation_date, update_date, updated, listing, details, '
+                'synced_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, NULL, ?) '
+                'ON CONFLICT (id) DO UPDATE SET name = excluded.name, '
+                'type = excluded.type, folder_id = excluded.folder_id, '
+                'creation_date = excluded.creation_date, '
+                'update_date = excluded.update_date, '
+                'updated = excluded.updated, listing = excluded.listing, '
+                'details = NULL, synced_at = excluded.synced_at',
+                (document_id, item.get('name'), item.get('type'),
+                 folder.get('id'), item.get('creationDate'),
+                 item.get('updateDate'), _timestamp(item.get('updateDate')),
+                 json.dumps(item), now))
+        deleted = 0
+        if full:
+            missing = [(document_id,) for document_id in stored
+                       if document_id not in seen]
+            self.connection.executemany(
+                'DELETE FROM documents WHERE id = ?', missing)
+            deleted = len(missing)
+        return changed, deleted
+
+    def _store_details(self, now):
+        """Fetches the missing details, `parallelism` at a time. Returns
+        the number fetched and the number of documents found deleted."""
+        pending = [row[0] for row in self.connection.execute(
+            'SELECT id FROM documents WHERE details IS NULL')]
+        fetched = gone = 0
+        for document_id, details in ordered_results(
+                [(self._fetch_details, document_id)
+                 for document_id in pending],
+                self.parallelism, self.executor):
+            fetched += 1
+            if details is None:
+                gone += 1
+                self.connection.execute(
+                    'DELETE FROM documents WHERE id = ?', (document_id,))
+            else:
+                self.connection.execute(
+                    'UPDATE documents SET details = ?, synced_at = ? '
+                    'WHERE id = ?', (json.dumps(details), now, document_id))
+        return fetched, gone
+
+    def _state(self, key):
+        row = self.connection.execute(
+            'SELECT value FROM sync_state WHERE key = ?', (key,)).fetchone()
+        return None if row is None else row[0]
+
+    def _set_state(self, key, value):
+        self.connection.execute(
+            'INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)',
+            (key, value))
@@ -0,0 +1,399 @@
+# coding: utf-8
+
+"""
+HTTP transport backends used by `signer_client.rest.RESTClientObject`.
+
+`RESTClientObject` builds the request (url, headers and encoded body) and a
+transport only moves bytes. The backend is picked with
+`Configuration.transport`, either by name:
+
+- ``'urllib3'`` (default): `urllib3.PoolManager`, one HTTP/1.1 connection per
+  in-flight request.
+- ``'http2'``: `httpx` with HTTP/2 enabled. Concurrent requests from any
+  number of threads are multiplexed as streams over a few connections per
+  host. Requires the optional dependency
+  (`pip install signer-python-client[http2]`).
+
+or by passing a `Transport` instance, or a callable taking
+``(configuration, pools_size, maxsize)`` and returning one. Custom backends
+can also be registered by name with `register_transport`.
+"""
+
+from __future__ import absolute_import
+
+import ssl
+
+import certifi
+
+try:
+    import urllib3
+except ImportError:
+    raise ImportError('Swagger python client requires urllib3.')
+
+from signer_client.compression import DEFAULT_ACCEPT_ENCODING
+from signer_client.deadline import time_left
+from signer_client.pool import (
+    PoolStats, create_ssl_context, tracked_pool_classes
+)
+from signer_client.rest import ApiException
+
+
+class Transport(object):
+    """Interface of an HTTP backend.
+
+    `request` must return a response object exposing ``status``,
+    ``reason``, ``headers`` (a case-insensitive mapping) and ``data``. When
+    called with ``preload_content=False`` the body must not be read yet; the
+    response must then also provide ``stream(amt)``, ``read(amt)`` and
+    ``release_conn()`` like `urllib3.HTTPResponse`. An optional ``tell()``
+    returns the number of body bytes received before decoding, for
+    `signer_client.compression.TransferStats`.
+
+    SSL failures must be raised as `ApiException` with status 0.
+    """
+
+    #: Exceptions raised by `request` when the connection itself failed
+    #: (refused, reset, timed out), as opposed to an HTTP error response.
+    connection_errors = ()
+
+    #: `signer_client.pool.PoolStats` of the backend, if it keeps any
+    pool_stats = None
+
+    #: `Accept-Encoding` of the content encodings the backend decodes, sent
+    #: when `Configuration.accept_encoding` is True
+    accept_encoding = 'identity'
+
+    def request(self, method, url, body=None, headers=None,
+                preload_content=True, timeout=None):
+        """Sends a request.
+
+        :param method: http request method
+        :param url: full request url, including the query string
+        :param body: encoded request body: bytes, str, or an iterable of
+                     bytes-like chunks (streamed uploads)
+        :param headers: http request headers
+        :param preload_content: read the whole body before returning
+        :param timeout: None, a number (total timeout) or a
+                        (connection, read) tuple
+        """
+        raise NotImplementedError
+
+    def warm_up(self, url, connections):
+        """Opens up to `connections` keep-alive connections to the host of
+        `url` and returns the number opened. Optional."""
+        return 0
+
+    def close(self):
+        """Releases all pooled connections."""
+
+
+class Urllib3Transport(Transport):
+    """HTTP/1.1 backend on top of `urllib3.PoolManager`/`ProxyManager`."""
+
+    connection_errors = (urllib3.exceptions.ProtocolError,
+                         urllib3.exceptions.NewConnectionError,
+                         urllib3.exceptions.ConnectTimeoutError,
+                         urllib3.exceptions.ReadTimeoutError,
+                         urllib3.exceptions.MaxRetryError)
+
+    accept_encoding = DEFAULT_ACCEPT_ENCODING
+
+    #: With a `Configuration.retries` policy, urllib3 only follows
+    #: redirects and failed requests are retried by `RESTClientObject`;
+    #: without one, urllib3 keeps its default retries, except under a
+    #: deadline (see `signer_client.deadline`), which they would overrun.
+    retries = urllib3.Retry(total=None, connect=0, read=0, other=0, status=0,
+                            redirect=3, respect_retry_after_header=False)
+
+    def __init__(self, configuration, pools_size=4, maxsize=None):
+        # urllib3.PoolManager will pass all kw parameters to connectionpool
+        # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/poolmanager.py#L75  # noqa: E501
+        # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/connectionpool.py#L680  # noqa: E501
+        # maxsize is the number of requests to host that are allowed in parallel  # noqa: E501
+        # Custom SSL certificates and client certificates: http://urllib3.readthedocs.io/en/latest/advanced-usage.html  # noqa: E501
+
+        self.configuration = configuration
+
+        # cert_reqs
+        if configuration.verify_ssl:
+            cert_reqs = ssl.CERT_REQUIRED
+        else:
+            cert_reqs = ssl.CERT_NONE
+
+        # ca_certs
+        if configuration.ssl_ca_cert:
+            ca_certs = configuration.ssl_ca_cert
+        else:
+            # if not set certificate file, use Mozilla's root certificates.
+            ca_certs = certifi.where()
+
+        addition_pool_args = {}
+        if configuration.assert_hostname is not None:
+            addition_pool_args['assert_hostname'] = configuration.assert_hostname  # noqa: E501
+
+        idle_timeout = getattr(configuration, 'connection_idle_timeout',
+                               None)
+        max_lifetime = getattr(configuration, 'connection_max_lifetime',
+                               None)
+        session_reuse = getattr(configuration, 'tls_session_reuse', False)
+        tracking = (getattr(configuration, 'connection_pool_tracking', False)
+                    or idle_timeout is not None or max_lifetime is not None
+                    or session_reuse)
+        if tracking:
+            self.pool_stats = PoolStats()
+        session_context = None
+        if session_reuse:
+            # one context for all the connections, holding the certificates
+            # and the TLS sessions to resume, see `signer_client.pool`
+            session_context = create_ssl_context(configuration,
+                                                 self.pool_stats)
+            addition_pool_args['ssl_context'] = session_context
+            ca_certs = cert_file = key_file = None
+        else:
+            cert_file = configuration.cert_file
+            key_file = configuration.key_file
+
+        if maxsize is None:
+            if configuration.connection_pool_maxsize is not None:
+                maxsize = configuration.connection_pool_maxsize
+            else:
+                maxsize = 4
+
+        # https pool manager
+        if configuration.proxy:
+            self.pool_manager = urllib3.ProxyManager(
+                num_pools=pools_size,
+                maxsize=maxsize,
+                cert_reqs=cert_reqs,
+                ca_certs=ca_certs,
+                cert_file=cert_file,
+                key_file=key_file,
+                proxy_url=configuration.proxy,
+                **addition_pool_args
+            )
+        else:
+            self.pool_manager = urllib3.PoolManager(
+                num_pools=pools_size,
+                maxsize=maxsize,
+                cert_reqs=cert_reqs,
+                ca_certs=ca_certs,
+                cert_file=cert_file,
+                key_file=key_file,
+                **addition_pool_args
+            )
+        if tracking:
+            self.pool_manager.pool_classes_by_scheme = tracked_pool_classes(
+                self.pool_stats, idle_timeout=idle_timeout,
+                max_lifetime=max_lifetime, session_context=session_context)
+
+    def request(self, method, url, body=None, headers=None,
+                preload_content=True, timeout=None):
+        if isinstance(timeout, tuple):
+            timeout = urllib3.Timeout(connect=timeout[0], read=timeout[1])
+        elif timeout is not None:
+            timeout = urllib3.Timeout(total=timeout)
+
+        retries = None
+        if (getattr(self.configuration, 'retries', None) is not None or
+                time_left() is not None):
+            retries = self.retries
+        try:
+            return self.pool_manager.request(
+                method, url,
+                body=body,
+                preload_content=preload_content,
+                timeout=timeout,
+                retries=retries,
+                headers=headers)
+        except urllib3.exceptions.SSLError as e:
+            msg = "{0}\n{1}".format(type(e).__name__, str(e))
+            raise ApiException(status=0, reason=msg)
+
+    def warm_up(self, url, connections):
+        if self.pool_stats is None:
+            raise ValueError('Warming up the urllib3 transport requires '
+                             'configuration.connection_pool_tracking')
+        pool = self.pool_manager.connection_from_url(url)
+        try:
+            return pool.warm_up(connections)
+        except ssl.SSLError as e:
+            msg = "{0}\n{1}".format(type(e).__name__, str(e))
+            raise ApiException(status=0, reason=msg)
+
+    def close(self):
+        self.pool_manager.clear()
+
+
+class Http2Response(object):
+    """Adapts an `httpx.Response` to the urllib3 response interface."""
+
+    def __init__(self, response, preload_content=True):
+        self.httpx_response = response
+        self.status = response.status_code
+        self.reason = response.reason_phrase
+        self.headers = response.headers
+        self.http_version = response.http_version
+        self._data = None
+        if preload_content:
+            self._data = response.read()
+            response.close()
+
+    @property
+    def data(self):
+        if self._data is None:
+            self._data = self.httpx_response.read()
+        return self._data
+
+    def getheaders(self):
+        return self.headers
+
+    def getheader(self, name, default=None):
+        return self.headers.get(name, default)
+
+    def stream(self, amt=2 ** 16, decode_content=True):
+        if self._data is not None:
+            for i in range(0, len(self._data), amt):
+                yield self._data[i:i + amt]
+            return
+        if decode_content:
+            chunks = self.httpx_response.iter_bytes(amt)
+        else:
+            chunks = self.httpx_response.iter_raw(amt)
+        for chunk in chunks:
+            yield chunk
+
+    def read(self, amt=None):
+        if amt is None:
+            return self.data
+        if not hasattr(self, '_chunks'):
+            self._chunks = self.httpx_response.iter_bytes(amt)
+        return next(self._chunks, b'')
+
+    def tell(self):
+        # bytes received from the wire, before decoding (like urllib3)
+        return self.httpx_response.num_bytes_downloaded
+
+    def release_conn(self):
+        self.httpx_response.close()
+
+    def close(self):
+        self.httpx_response.close()
+
+
+class Http2Transport(Transport):
+    """HTTP/2 backend on top of a shared, thread-safe `httpx.Client`.
+
+    HTTP/2 is negotiated through ALPN, so it only applies to https hosts;
+    plain http hosts (and servers without HTTP/2) fall back to HTTP/1.1.
+    `maxsize` caps the connections per host, each of which carries many
+    concurrent streams.
+    """
+
+    def __init__(self, configuration, pools_size=4, maxsize=None):
+        try:
+            import httpx
+            import h2  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                'The http2 transport requires httpx with HTTP/2 support '
+                '(pip install signer-python-client[http2]).')
+        self._httpx = httpx
+
+        self.pool_stats = PoolStats()
+        verify = create_ssl_context(
+            configuration, self.pool_stats,
+            session_reuse=getattr(configuration, 'tls_session_reuse', False))
+
+        if maxsize is None:
+            if configuration.connection_pool_maxsize is not None:
+                maxsize = configuration.connection_pool_maxsize
+            else:
+                maxsize = 4
+
+        keepalive = {}
+        idle_timeout = getattr(configuration, 'connection_idle_timeout', None)
+        if idle_timeout is not None:
+            keepalive['keepalive_expiry'] = idle_timeout
+
+        self.connection_errors = (httpx.TransportError,)
+        try:
+            from httpx._decoders import SUPPORTED_DECODERS
+        except ImportError:
+            # decoded by every httpx version
+            SUPPORTED_DECODERS = ('gzip', 'deflate')
+        # br and zstd only when their optional packages are installed
+        self.accept_encoding = ','.join(
+            name for name in SUPPORTED_DECODERS if name != 'identity')
+        self.client = httpx.Client(
+            http2=True,
+            verify=verify,
+            proxy=configuration.proxy,
+            limits=httpx.Limits(max_connections=maxsize,
+                                max_keepalive_connections=maxsize,
+                                **keepalive),
+            timeout=None)
+
+    def request(self, method, url, body=None, headers=None,
+                preload_content=True, timeout=None):
+        httpx = self._httpx
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(None, connect=timeout[0], read=timeout[1])
+        elif timeout is not None:
+            timeout = httpx.Timeout(timeout)
+
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        elif body is not None and not isinstance(body, bytes):
+            # streamed bodies may yield memoryviews, h2 only sends bytes
+            body = (bytes(chunk) for chunk in body)
+        request = self.client.build_request(
+            method, url, content=body, headers=headers, timeout=timeout)
+        try:
+            response = self.client.send(request, stream=True)
+        except httpx.ConnectError as e:
+            if isinstance(e.__context__, ssl.SSLError):
+                msg = "{0}\n{1}".format(type(e.__context__).__name__, str(e))
+                raise ApiException(status=0, reason=msg)
+            raise
+        return Http2Response(response, preload_content=preload_content)
+
+    def warm_up(self, url, connections):
+        # a single HTTP/2 connection carries all the concurrent requests;
+        # httpx opens connections for requests only, so send a HEAD.
+        self.client.request('HEAD', url).close()
+        self.pool_stats.record(warmed_up=1)
+        return 1
+
+    def close(self):
+        self.client.close()
+
+
+TRANSPORTS = {
+    'urllib3': Urllib3Transport,
+    'http2': Http2Transport,
+}
+
+
+def register_transport(name, factory):
+    """Registers a backend selectable through `Configuration.transport`.
+
+    :param name: the name to select the backend with.
+    :param factory: callable taking ``(configuration, pools_size, maxsize)``
+        and returning a `Transport`.
+    """
+    TRANSPORTS[name] = factory
+
+
+def create_transport(configuration, pools_size=4, maxsize=None):
+    """Builds the transport selected by `configuration.transport`."""
+    transport = getattr(configuration, 'transport', None) or 'urllib3'
+    if isinstance(transport, Transport):
+        return transport
+    if isinstance(transport, str):
+        try:
+            transport = TRANSPORTS[transport]
+        except KeyError:
+            raise ValueError(
+                "Unknown transport `%s`, expected one of: %s"
+                % (transport, ', '.join(sorted(TRANSPORTS))))
+    return transport(configuration, pools_size=pools_size, maxsize=maxsize)
@@ -0,0 +1,138 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import asyncio
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import aiohttp  # noqa: F401
+except ImportError:
+    aiohttp = None
+
+import signer_client
+from signer_client.rest import ApiException
+
+
+class _SignerHandler(BaseHTTPRequestHandler):
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.startswith('/api/documents/missing'):
+            self._reply(422, {'code': 'DocumentNotFound'})
+        elif self.path.startswith('/api/documents/'):
+            document_id = self.path.split('/')[3]
+            self._reply(200, {
+                'id': document_id,
+                'name': 'Contract',
+                'creationDate': '2024-01-02T03:04:05Z',
+                'apiKey': self.headers.get('X-Api-Key'),
+            })
+        elif self.path.startswith('/api/documents'):
+            self._reply(200, {'items': [{'id': 'a'}], 'totalCount': 1,
+                              'query': self.path})
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        received = json.loads(self.rfile.read(length))
+        self._reply(200, {'id': 'u1', 'name': received.get('bytes')})
+
+
+@unittest.skipIf(aiohttp is None, 'aiohttp is not installed')
+class TestAsyncApiClient(unittest.IsolatedAsyncioTestCase):
+    """AsyncApiClient and async API classes against a local server"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _SignerHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever,
+                                      daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        from signer_client.aio import AsyncApiClient
+        self.configuration = signer_client.Configuration()
+        self.configuration.host = 'http://127.0.0.1:%d' % (
+            self.server.server_address[1])
+        self.configuration.api_key['X-Api-Key'] = 'app|key'
+        self.api_client = AsyncApiClient(self.configuration)
+
+    async def asyncTearDown(self):
+        await self.api_client.close()
+
+    async def test_get_deserializes_into_models(self):
+        from signer_client.aio import AsyncDocumentsApi
+        api = AsyncDocumentsApi(self.api_client)
+        document = await api.api_documents_id_get('doc-1')
+        self.assertIsInstance(document, signer_client.DocumentsDocumentModel)
+        self.assertEqual(document.id, 'doc-1')
+        self.assertEqual(document.creation_date.year, 2024)
+
+    async def test_query_params_and_pagination_model(self):
+        from signer_client.aio import AsyncDocumentsApi
+        api = AsyncDocumentsApi(self.api_client)
+        page = await api.api_documents_get(limit=5, offset=10)
+        self.assertEqual(page.total_count, 1)
+        self.assertEqual(page.items[0].id, 'a')
+
+    async def test_many_requests_in_flight(self):
+        from signer_client.aio import AsyncDocumentsApi
+        api = AsyncDocumentsApi(self.api_client)
+        ids = ['doc-%d' % i for i in range(50)]
+        documents = await asyncio.gather(
+            *(api.api_documents_id_get(i) for i in ids))
+        self.assertEqual([d.id for d in documents], ids)
+
+    async def test_async_req_returns_task(self):
+        from signer_client.aio import AsyncDocumentsApi
+        api = AsyncDocumentsApi(self.api_client)
+        task = api.api_documents_id_get('doc-2', async_req=True)
+        self.assertIsInstance(task, asyncio.Future)
+        self.assertEqual((await task).id, 'doc-2')
+
+    async def test_error_status_raises_api_exception(self):
+        from signer_client.aio import AsyncDocumentsApi
+        api = AsyncDocumentsApi(self.api_client)
+        with self.assertRaises(ApiException) as context:
+            await api.api_documents_id_get('missing')
+        self.assertEqual(context.exception.status, 422)
+
+    async def test_json_body(self):
+        from signer_client.aio import AsyncUploadApi
+        api = AsyncUploadApi(self.api_client)
+        body = signer_client.UploadsUploadBytesRequest(bytes='AAEC')
+        result = await api.api_uploads_bytes_post(body=body)
+        self.assertEqual(result.id, 'u1')
+
+    async def test_signer_client(self):
+        from signer_client.aio import AsyncSignerClient
+        async with AsyncSignerClient('app|key', self.configuration.host) as client:  # noqa: E501
+            document = await client.get_document('doc-3')
+        self.assertEqual(document.id, 'doc-3')
+
+    def test_requires_async_api_client(self):
+        from signer_client.aio import AsyncDocumentsApi
+        with self.assertRaises(TypeError):
+            AsyncDocumentsApi(signer_client.ApiClient())
+
+
+if __name__ == '__main__':
+    unittest.main()
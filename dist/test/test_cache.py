@@ -0,0 +1,191 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import asyncio
+import collections
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import aiohttp  # noqa: F401
+except ImportError:
+    aiohttp = None
+
+from signer_client.api.documents_api import DocumentsApi
+from signer_client.api_client import ApiClient
+from signer_client.cache import ResponseCache, parse_cache_control
+from signer_client.configuration import Configuration
+
+
+class _VersionedHandler(BaseHTTPRequestHandler):
+    """Serves ``/api/documents/<id>`` with an ETag changed by each PUT on the
+    document or its sub-resources, answering 304 when it still matches.
+    The ``Cache-Control`` header of each id is taken from `cache_control`.
+    """
+
+    protocol_version = 'HTTP/1.1'
+    hits = collections.Counter()
+    versions = collections.Counter()
+    cache_control = {}
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def _document_id(self):
+        return self.path.split('?')[0].split('/')[3]
+
+    def do_GET(self):
+        document_id = self._document_id()
+        with self.lock:
+            self.hits[document_id] += 1
+            etag = '"v%d"' % self.versions[document_id]
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        body = json.dumps({'id': document_id, 'name': etag}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        if document_id in self.cache_control:
+            self.send_header('Cache-Control',
+                             self.cache_control[document_id])
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_PUT(self):
+        self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        with self.lock:
+            self.versions[self._document_id()] += 1
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+
+class TestParseCacheControl(unittest.TestCase):
+    """parse_cache_control"""
+
+    def test_parse(self):
+        self.assertEqual(
+            parse_cache_control('Private, max-age="60", no-cache'),
+            {'private': True, 'max-age': '60', 'no-cache': True})
+        self.assertEqual(parse_cache_control(None), {})
+
+
+class TestResponseCache(unittest.TestCase):
+    """Response cache of ApiClient"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _VersionedHandler)
+        cls.server.daemon_threads = True
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.configuration = Configuration()
+        self.configuration.host = 'http://127.0.0.1:%d' % (
+            self.server.server_address[1])
+        self.configuration.retries = None
+        self.cache = ResponseCache()
+        self.configuration.response_cache = self.cache
+        self.documents_api = DocumentsApi(ApiClient(self.configuration))
+
+    def _get(self, document_id):
+        return self.documents_api.api_documents_id_get(document_id)
+
+    def test_revalidation(self):
+        first = self._get('cache-1')
+        second = self._get('cache-1')
+        self.assertIs(second, first)
+        self.assertEqual(_VersionedHandler.hits['cache-1'], 2)
+        stats = self.cache.stats.as_dict()
+        self.assertEqual((stats['misses'], stats['revalidations'],
+                          stats['not_modified']), (1, 1, 1))
+        self.assertEqual(stats['hit_ratio'], 0.5)
+
+    def test_fresh_hit(self):
+        _VersionedHandler.cache_control['cache-2'] = 'max-age=60'
+        first = self._get('cache-2')
+        self.assertIs(self._get('cache-2'), first)
+        self.assertEqual(_VersionedHandler.hits['cache-2'], 1)
+        self.assertEqual(self.cache.stats.hits, 1)
+
+    def test_changed(self):
+        first = self._get('cache-3')
+        _VersionedHandler.versions['cache-3'] += 1
+        second = self._get('cache-3')
+        self.assertEqual((first.name, second.name), ('"v0"', '"v1"'))
+        self.assertEqual(self.cache.stats.not_modified, 0)
+
+    def test_no_store(self):
+        _VersionedHandler.cache_control['cache-4'] = 'no-store'
+        self._get('cache-4')
+        self._get('cache-4')
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.stats.misses, 2)
+
+    def test_operation_ttl(self):
+        self.cache.ttls['GET /api/documents/{id}'] = 0.2
+        self._get('cache-5')
+        self._get('cache-5')
+        self.assertEqual(_VersionedHandler.hits['cache-5'], 1)
+        time.sleep(0.25)
+        self._get('cache-5')
+        self.assertEqual(_VersionedHandler.hits['cache-5'], 2)
+        self.assertEqual(self.cache.stats.not_modified, 1)
+
+    def test_disabled_operation(self):
+        self.cache.ttls['GET /api/documents/{id}'] = None
+        self._get('cache-6')
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.stats.misses, 0)
+
+    def test_eviction(self):
+        self.cache.max_entries = 2
+        for document_id in ('cache-7', 'cache-8', 'cache-7', 'cache-9'):
+            self._get(document_id)
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(self.cache.stats.evictions, 1)
+        # cache-8 was the least recently used
+        self._get('cache-8')
+        self.assertEqual(self.cache.stats.misses, 4)
+
+    def test_invalidation(self):
+        _VersionedHandler.cache_control['cache-10'] = 'max-age=60'
+        self._get('cache-10')
+        self.documents_api.api_documents_id_notified_emails_put(
+            'cache-10', body={'emails': []})
+        self.assertEqual(self.cache.stats.invalidations, 1)
+        self.assertEqual(self._get('cache-10').name, '"v1"')
+
+    @unittest.skipIf(aiohttp is None, 'aiohttp is not installed')
+    def test_asyncio(self):
+        from signer_client.aio import AsyncApiClient, AsyncDocumentsApi
+
+        async def main():
+            async with AsyncApiClient(self.configuration) as api_client:
+                api = AsyncDocumentsApi(api_client)
+                first = await api.api_documents_id_get('cache-11')
+                second = await api.api_documents_id_get('cache-11')
+                return first, second
+
+        first, second = asyncio.run(main())
+        self.assertIs(second, first)
+        self.assertEqual(self.cache.stats.not_modified, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
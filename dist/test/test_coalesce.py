@@ -0,0 +1,179 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import asyncio
+import collections
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import aiohttp  # noqa: F401
+except ImportError:
+    aiohttp = None
+
+from signer_client.api.documents_api import DocumentsApi
+from signer_client.api_client import ApiClient
+from signer_client.coalesce import SingleFlight
+from signer_client.configuration import Configuration
+from signer_client.rest import ApiException
+
+
+class _CountingHandler(BaseHTTPRequestHandler):
+    """Answers ``/api/documents/<id>`` after a short delay, counting the
+    requests per path; the id ``missing`` gets a 404."""
+
+    hits = collections.Counter()
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        with self.lock:
+            self.hits[self.path] += 1
+        time.sleep(0.2)
+        document_id = self.path.split('?')[0].rsplit('/', 1)[-1]
+        if document_id == 'missing':
+            body = b'{"code": "DocumentNotFound"}'
+            self.send_response(404)
+        else:
+            body = json.dumps({'id': document_id}).encode('utf-8')
+            self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _concurrently(count, fn):
+    results, errors = [], []
+
+    def run():
+        try:
+            results.append(fn())
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+class TestSingleFlight(unittest.TestCase):
+    """SingleFlight"""
+
+    def test_sequential_calls_are_not_shared(self):
+        flight = SingleFlight()
+        self.assertEqual(flight.call('a', lambda: 1), 1)
+        self.assertEqual(flight.call('a', lambda: 2), 2)
+        self.assertEqual(flight.stats.as_dict(),
+                         {'requests': 2, 'coalesced': 0})
+
+    def test_concurrent_calls_are_shared(self):
+        flight = SingleFlight()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            time.sleep(0.2)
+            return object()
+
+        results, errors = _concurrently(
+            5, lambda: flight.call('a', slow))
+        self.assertEqual(errors, [])
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(set(map(id, results))), 1)
+        self.assertEqual(flight.stats.coalesced, 4)
+
+
+class TestCoalescing(unittest.TestCase):
+    """Coalescing of the GET requests of ApiClient"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _CountingHandler)
+        cls.server.daemon_threads = True
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.configuration = Configuration()
+        self.configuration.host = 'http://127.0.0.1:%d' % (
+            self.server.server_address[1])
+        self.configuration.retries = None
+        self.configuration.coalesce_requests = True
+        self.api_client = ApiClient(self.configuration)
+        self.documents_api = DocumentsApi(self.api_client)
+
+    def test_identical_gets_share_one_request(self):
+        results, errors = _concurrently(
+            10, lambda: self.documents_api.api_documents_id_get('coalesce-1'))
+        self.assertEqual(errors, [])
+        self.assertEqual(_CountingHandler.hits['/api/documents/coalesce-1'], 1)
+        self.assertEqual(len(set(map(id, results))), 1)
+        self.assertEqual(results[0].id, 'coalesce-1')
+        self.assertEqual(self.api_client.singleflight.stats.as_dict(),
+                         {'requests': 1, 'coalesced': 9})
+
+    def test_different_requests(self):
+        ids = iter(['coalesce-2', 'coalesce-3'] * 2)
+        lock = threading.Lock()
+
+        def get():
+            with lock:
+                document_id = next(ids)
+            return self.documents_api.api_documents_id_get(document_id)
+
+        results, errors = _concurrently(4, get)
+        self.assertEqual(errors, [])
+        self.assertEqual(_CountingHandler.hits['/api/documents/coalesce-2'], 1)
+        self.assertEqual(_CountingHandler.hits['/api/documents/coalesce-3'], 1)
+
+    def test_errors_are_shared(self):
+        results, errors = _concurrently(
+            3, lambda: self.documents_api.api_documents_id_get('missing'))
+        self.assertEqual(results, [])
+        self.assertEqual([e.status for e in errors], [404] * 3)
+        self.assertIsInstance(errors[0], ApiException)
+
+    def test_disabled(self):
+        self.configuration.coalesce_requests = False
+        _concurrently(
+            3, lambda: self.documents_api.api_documents_id_get('coalesce-4'))
+        self.assertEqual(_CountingHandler.hits['/api/documents/coalesce-4'], 3)
+
+    @unittest.skipIf(aiohttp is None, 'aiohttp is not installed')
+    def test_asyncio(self):
+        from signer_client.aio import AsyncApiClient, AsyncDocumentsApi
+
+        async def main():
+            async with AsyncApiClient(self.configuration) as api_client:
+                api = AsyncDocumentsApi(api_client)
+                cancelled = asyncio.ensure_future(
+                    api.api_documents_id_get('coalesce-5'))
+                others = [api.api_documents_id_get('coalesce-5')
+                          for _ in range(4)]
+                await asyncio.sleep(0.05)
+                cancelled.cancel()
+                results = await asyncio.gather(*others)
+                return results, api_client.singleflight.stats.as_dict()
+
+        results, stats = asyncio.run(main())
+        self.assertEqual(_CountingHandler.hits['/api/documents/coalesce-5'], 1)
+        self.assertEqual(len(set(map(id, results))), 1)
+        self.assertEqual(stats, {'requests': 1, 'coalesced': 4})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import json
+import unittest
+
+from signer_client import codec as codec_module
+from signer_client.api_client import ApiClient
+from signer_client.codec import (
+    JsonCodec, OrjsonCodec, StdlibCodec, get_codec, register_codec
+)
+from signer_client.configuration import Configuration
+from signer_client.rest import RESTClientObject
+from signer_client.transport import Transport
+
+DOCUMENT = {'id': 'b3b4e5b0-0000-0000-0000-000000000001',
+            'name': 'Contrato de prestação', 'fileSize': 2 ** 70,
+            'tags': [{'label': 'área', 'value': None}], 'isDeleted': False}
+
+
+class _RecordingTransport(Transport):
+
+    def __init__(self):
+        self.bodies = []
+
+    def request(self, method, url, body=None, headers=None,
+                preload_content=True, timeout=None):
+        self.bodies.append(body)
+        return _Response(b'{}')
+
+
+class _Response(object):
+
+    status = 200
+    reason = 'OK'
+
+    def __init__(self, data):
+        self.data = data
+        self.headers = {}
+
+
+class _UpperCodec(StdlibCodec):
+    name = 'upper'
+
+    def loads(self, data):
+        return super(_UpperCodec, self).loads(data.upper())
+
+
+class TestCodecs(unittest.TestCase):
+    """JSON codecs"""
+
+    def _check(self, codec, ensure_ascii):
+        encoded = codec.dumps(DOCUMENT)
+        self.assertIsInstance(encoded, bytes)
+        self.assertNotIn(b', ', encoded)
+        if ensure_ascii:
+            self.assertEqual(encoded.decode('ascii'),
+                             json.dumps(DOCUMENT, separators=(',', ':')))
+        else:
+            self.assertNotIn(b'\\u', encoded)
+        self.assertEqual(json.loads(encoded.decode('utf-8')), DOCUMENT)
+        self.assertEqual(codec.loads(encoded), DOCUMENT)
+        self.assertEqual(codec.loads(encoded.decode('utf-8')), DOCUMENT)
+        with self.assertRaises(ValueError):
+            codec.loads(b'Not found')
+
+    def test_stdlib(self):
+        self._check(StdlibCodec(), True)
+        self._check(StdlibCodec(ensure_ascii=False), False)
+
+    @unittest.skipIf(codec_module.orjson is None, 'orjson is not installed')
+    def test_orjson(self):
+        # falls back to the stdlib for the integer beyond 64 bits
+        self._check(OrjsonCodec(), False)
+        small = dict(DOCUMENT, fileSize=1)
+        self.assertEqual(OrjsonCodec().dumps(small),
+                         codec_module.orjson.dumps(small))
+
+    def test_selection(self):
+        configuration = Configuration()
+        self.assertIsInstance(get_codec(configuration), StdlibCodec)
+        configuration.json_codec = 'auto'
+        self.assertEqual(get_codec(configuration).name,
+                         'orjson' if codec_module.orjson else 'json')
+        configuration.json_codec = 'json'
+        self.assertIs(get_codec(configuration), get_codec(configuration))
+        self.assertIsInstance(get_codec(configuration), StdlibCodec)
+        instance = StdlibCodec()
+        configuration.json_codec = instance
+        self.assertIs(get_codec(configuration), instance)
+        configuration.json_codec = 'yaml'
+        with self.assertRaises(ValueError):
+            get_codec(configuration)
+
+    def test_register(self):
+        self.addCleanup(codec_module.CODECS.pop, 'upper')
+        register_codec('upper', _UpperCodec)
+        configuration = Configuration()
+        configuration.json_codec = 'upper'
+        self.assertIsInstance(get_codec(configuration), _UpperCodec)
+        self.assertEqual(
+            ApiClient(configuration).deserialize(
+                _Response(b'{"id": "abc"}'), 'object'),
+            {'ID': 'ABC'})
+
+    def test_interface(self):
+        with self.assertRaises(NotImplementedError):
+            JsonCodec().dumps({})
+
+
+class TestRestCodec(unittest.TestCase):
+    """Bodies encoded and decoded with the configured codec"""
+
+    def setUp(self):
+        self.configuration = Configuration()
+        self.configuration.json_codec = 'json'
+        self.transport = _RecordingTransport()
+        self.configuration.transport = self.transport
+
+    def test_request_body_is_compact_bytes(self):
+        client = RESTClientObject(self.configuration)
+        client.POST('http://signer/api/documents', body=DOCUMENT)
+        client.POST('http://signer/api/documents')
+        self.assertEqual(self.transport.bodies[0],
+                         StdlibCodec().dumps(DOCUMENT))
+        self.assertEqual(self.transport.bodies[1], b'{}')
+
+    def test_deserialize(self):
+        api_client = ApiClient(self.configuration)
+        data = StdlibCodec().dumps({'id': 'abc', 'name': 'Contrato'})
+        model = api_client.deserialize(_Response(data),
+                                       'DocumentsDocumentModel')
+        self.assertEqual((model.id, model.name), ('abc', 'Contrato'))
+        # not JSON: returned as received
+        self.assertEqual(api_client.deserialize(_Response(b'plain'), 'str'),
+                         'plain')
+
+
+if __name__ == '__main__':
+    unittest.main()
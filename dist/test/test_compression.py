@@ -0,0 +1,286 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import gzip
+import json
+import threading
+import unittest
+import zlib
+from unittest import mock
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import aiohttp  # noqa: F401
+except ImportError:
+    aiohttp = None
+
+try:
+    import httpx  # noqa: F401
+    import h2  # noqa: F401
+except ImportError:
+    httpx = None
+
+from signer_client.api_client import ApiClient
+from signer_client.compression import (
+    DEFAULT_ACCEPT_ENCODING, CompressedBody, TransferStats, accept_encoding,
+    compress, compress_request
+)
+from signer_client.configuration import Configuration
+from signer_client.streaming import Base64JsonBody
+from signer_client.transport import Transport
+
+DOCUMENT = {'id': 'b3b4e5b0-0000-0000-0000-000000000001',
+            'name': 'contract.pdf', 'description': 'x' * 4000}
+
+
+class _CompressingHandler(BaseHTTPRequestHandler):
+    """Returns DOCUMENT gzipped when asked to, and records the requests."""
+
+    requests = []
+
+    def log_message(self, *args):
+        pass
+
+    def _respond(self, body):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            data = gzip.compress(data)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self.requests.append((dict(self.headers), None))
+        self._respond(DOCUMENT)
+
+    def do_POST(self):
+        if self.headers.get('Transfer-Encoding') == 'chunked':
+            body = b''
+            while True:
+                size = int(self.rfile.readline().strip(), 16)
+                if not size:
+                    self.rfile.readline()
+                    break
+                body += self.rfile.read(size)
+                self.rfile.readline()
+        else:
+            body = self.rfile.read(int(self.headers['Content-Length']))
+        self.requests.append((dict(self.headers), body))
+        self._respond({'id': DOCUMENT['id']})
+
+
+def _decode(headers, body):
+    encoding = headers.get('Content-Encoding')
+    if encoding == 'gzip':
+        return gzip.decompress(body)
+    if encoding == 'deflate':
+        return zlib.decompress(body)
+    return body
+
+
+class TestCompressRequest(unittest.TestCase):
+    """compress_request and CompressedBody"""
+
+    def test_json_bodies(self):
+        payload = json.dumps({'name': 'a' * 2000})
+        stats = TransferStats()
+        for encoding in ('gzip', 'deflate'):
+            body, applied = compress_request(payload, 'application/json',
+                                             encoding, 1024, stats)
+            self.assertEqual(applied, encoding)
+            self.assertEqual(_decode({'Content-Encoding': encoding}, body),
+                             payload.encode('utf-8'))
+        self.assertEqual(stats.requests_compressed, 2)
+        self.assertLess(stats.as_dict()['request_ratio'], 0.1)
+
+    def test_small_or_not_json(self):
+        for body, content_type in (('{}', 'application/json'),
+                                   ('a' * 2000, 'text/plain')):
+            self.assertEqual(
+                compress_request(body, content_type, 'gzip', 1024),
+                (body, None))
+        self.assertEqual(compress_request('{}', 'application/json', None),
+                         ('{}', None))
+
+    def test_streaming_body(self):
+        source = b'%PDF-1.7' * 3000
+        stats = TransferStats()
+        body, applied = compress_request(
+            Base64JsonBody(source, chunk_size=3000), 'application/json',
+            'gzip', 1024, stats)
+        self.assertIsInstance(body, CompressedBody)
+        self.assertIsNone(body.length)
+        # iterable more than once (retries)
+        for _ in range(2):
+            data = json.loads(gzip.decompress(body.to_bytes()))
+            self.assertEqual(len(data['bytes']), 32000)
+        self.assertEqual(stats.requests, 2)
+
+    def test_unsupported_encoding(self):
+        with self.assertRaises(ValueError):
+            compress(b'{}', 'zstd')
+
+    def test_accept_encoding_of_transport(self):
+        configuration = Configuration()
+        self.assertEqual(accept_encoding(configuration),
+                         DEFAULT_ACCEPT_ENCODING)
+        self.assertEqual(accept_encoding(configuration, 'gzip'), 'gzip')
+        # custom transports decode nothing unless they say so
+        self.assertEqual(Transport.accept_encoding, 'identity')
+        configuration.accept_encoding = False
+        self.assertEqual(accept_encoding(configuration, 'gzip'), 'identity')
+
+
+class TestCompressionEndToEnd(unittest.TestCase):
+    """Negotiated responses and compressed requests against a local server"""
+
+    transport = 'urllib3'
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _CompressingHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.host = 'http://127.0.0.1:%d' % cls.server.server_address[1]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        del _CompressingHandler.requests[:]
+        self.configuration = Configuration()
+        self.configuration.host = self.host
+        self.configuration.transport = self.transport
+        self.api_client = ApiClient(self.configuration)
+        self.stats = self.api_client.rest_client.transfer_stats
+
+    def _get(self):
+        return self.api_client.call_api(
+            '/api/documents/1', 'GET', response_type='object',
+            _return_http_data_only=True)
+
+    def test_response_decoded(self):
+        self.assertEqual(self._get(), DOCUMENT)
+        headers = _CompressingHandler.requests[0][0]
+        self.assertEqual(headers['Accept-Encoding'],
+                         self.api_client.rest_client.transport.accept_encoding)
+        stats = self.stats.as_dict()
+        self.assertEqual(stats['responses_compressed'], 1)
+        self.assertEqual(stats['response_bytes_decoded'],
+                         len(json.dumps(DOCUMENT)))
+        self.assertLess(stats['response_bytes_on_wire'],
+                        stats['response_bytes_decoded'] // 4)
+
+    def test_accept_encoding_disabled(self):
+        self.configuration.accept_encoding = False
+        self.assertEqual(self._get(), DOCUMENT)
+        headers = _CompressingHandler.requests[0][0]
+        self.assertEqual(headers['Accept-Encoding'], 'identity')
+        stats = self.stats.as_dict()
+        self.assertEqual(stats['responses_compressed'], 0)
+        self.assertEqual(stats['response_ratio'], 1.0)
+
+    def test_request_compression(self):
+        self.configuration.request_compression = 'gzip'
+        body = {'title': 'a' * 5000}
+        self.api_client.call_api('/api/documents', 'POST', body=body,
+                                 header_params={'Content-Type':
+                                                'application/json'})
+        headers, sent = _CompressingHandler.requests[0]
+        self.assertEqual(headers['Content-Encoding'], 'gzip')
+        self.assertEqual(json.loads(gzip.decompress(sent)), body)
+        stats = self.stats.as_dict()
+        self.assertEqual(stats['requests_compressed'], 1)
+        self.assertEqual(stats['request_bytes_sent'], len(sent))
+
+    def test_streaming_request_compression(self):
+        self.configuration.request_compression = 'deflate'
+        self.api_client.call_api(
+            '/api/uploads/bytes', 'POST', body=Base64JsonBody(b'\0' * 30000),
+            header_params={'Content-Type': 'application/json'})
+        headers, sent = _CompressingHandler.requests[0]
+        self.assertEqual(headers['Content-Encoding'], 'deflate')
+        self.assertNotIn('Content-Length', headers)
+        self.assertEqual(len(json.loads(zlib.decompress(sent))['bytes']),
+                         40000)
+        self.assertEqual(self.stats.requests_compressed, 1)
+
+    def test_compression_off_by_default(self):
+        self.api_client.call_api('/api/documents', 'POST',
+                                 body={'title': 'a' * 5000},
+                                 header_params={'Content-Type':
+                                                'application/json'})
+        headers, sent = _CompressingHandler.requests[0]
+        self.assertNotIn('Content-Encoding', headers)
+        self.assertEqual(self.stats.requests_compressed, 0)
+
+
+@unittest.skipIf(httpx is None, 'httpx[http2] is not installed')
+class TestCompressionHttp2Transport(TestCompressionEndToEnd):
+    """Same scenarios through the httpx transport (HTTP/1.1 to the server)"""
+
+    transport = 'http2'
+
+    def test_accept_encoding_of_httpx(self):
+        # the decoders of httpx, which may differ from those of urllib3
+        from httpx._decoders import SUPPORTED_DECODERS
+        with mock.patch.dict(SUPPORTED_DECODERS):
+            SUPPORTED_DECODERS.pop('br', None)
+            api_client = ApiClient(self.configuration)
+        self.addCleanup(api_client.rest_client.close)
+        api_client.call_api('/api/documents/1', 'GET')
+        headers = _CompressingHandler.requests[0][0]
+        self.assertEqual(headers['Accept-Encoding'], 'gzip,deflate')
+
+
+@unittest.skipIf(aiohttp is None, 'aiohttp is not installed')
+class TestAsyncCompression(unittest.TestCase):
+    """Compression with the asyncio client"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _CompressingHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.host = 'http://127.0.0.1:%d' % cls.server.server_address[1]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_round_trip(self):
+        import asyncio
+        from signer_client.aio import AsyncApiClient
+
+        configuration = Configuration()
+        configuration.host = self.host
+        configuration.request_compression = 'gzip'
+        del _CompressingHandler.requests[:]
+
+        async def run():
+            async with AsyncApiClient(configuration) as api_client:
+                document = await api_client.call_api(
+                    '/api/documents/1', 'GET', response_type='object',
+                    _return_http_data_only=True)
+                await api_client.call_api(
+                    '/api/documents', 'POST', body={'title': 'a' * 5000},
+                    header_params={'Content-Type': 'application/json'})
+                return document, api_client.rest_client.transfer_stats
+
+        document, stats = asyncio.run(run())
+        self.assertEqual(document, DOCUMENT)
+        headers, sent = _CompressingHandler.requests[1]
+        self.assertEqual(headers['Content-Encoding'], 'gzip')
+        self.assertEqual(json.loads(gzip.decompress(sent)),
+                         {'title': 'a' * 5000})
+        self.assertEqual(stats.responses_compressed, 2)
+        self.assertEqual(stats.requests_compressed, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,337 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import datetime
+import pickle
+import unittest
+
+from signer_client import deserializer, serializer
+from signer_client.api_client import ApiClient
+from signer_client.configuration import Configuration
+from signer_client.models import (
+    AttachmentsAttachmentUploadModel,
+    DocumentsDocumentListModel,
+    FlowActionsApprovalModel,
+    FoldersFolderInfoModel,
+    PaginatedSearchResponseDocumentsDocumentListModel,
+)
+from signer_client.rest import ApiException
+
+LISTING = {
+    'items': [{
+        'id': 'a5e3c1f0-0000-0000-0000-000000000001',
+        'name': 'Contrato',
+        'creationDate': '2024-03-01T10:20:30-03:00',
+        'updateDate': None,
+        'folder': {'id': 'f1', 'name': 'Contratos', 'parentId': None},
+        'type': 'Deed',
+        'tags': [{'id': 't1', 'label': 'área', 'value': 'vendas'}, None],
+        'unknown': 'ignored',
+    }],
+    'totalCount': 1,
+    'nextCursor': None,
+}
+
+
+class _ChildModel(object):
+    swagger_types = {'kind': 'str'}
+    attribute_map = {'kind': 'kind'}
+
+    def __init__(self, kind=None):
+        self.kind = kind
+
+    def get_real_child_model(self, data):
+        return 'FoldersFolderInfoModel' if data['kind'] == 'folder' else None
+
+
+class TestDeserializer(unittest.TestCase):
+    """signer_client.deserializer"""
+
+    def _check_listing(self, trusted):
+        listing = deserializer.deserialize(
+            LISTING, 'PaginatedSearchResponseDocumentsDocumentListModel',
+            trusted)
+        self.assertIsInstance(
+            listing, PaginatedSearchResponseDocumentsDocumentListModel)
+        self.assertEqual(listing.total_count, 1)
+        self.assertIsNone(listing.next_cursor)
+        document = listing.items[0]
+        self.assertIsInstance(document, DocumentsDocumentListModel)
+        self.assertEqual(document.creation_date.tzinfo.utcoffset(None),
+                         datetime.timedelta(hours=-3))
+        self.assertIsNone(document.update_date)
+        self.assertEqual(document.folder,
+                         FoldersFolderInfoModel(id='f1', name='Contratos'))
+        self.assertEqual(document.type, 'Deed')
+        self.assertEqual(document.tags[0].label, 'área')
+        self.assertIsNone(document.tags[1])
+        return listing
+
+    def test_listing(self):
+        self._check_listing(False)
+
+    def test_trusted_matches_constructed(self):
+        trusted = self._check_listing(True)
+        self.assertEqual(trusted, self._check_listing(False))
+
+    def test_decoders_are_cached(self):
+        decoder = deserializer.get_decoder('list[DocumentsDocumentListModel]')
+        self.assertIs(
+            deserializer.get_decoder('list[DocumentsDocumentListModel]'),
+            decoder)
+        self.assertIsNot(
+            deserializer.get_decoder('list[DocumentsDocumentListModel]',
+                                     trusted=True),
+            decoder)
+
+    def test_containers_and_primitives(self):
+        self.assertEqual(
+            deserializer.deserialize({'a': [1, None], 'b': ['2']},
+                                     'dict(str, list[int])'),
+            {'a': [1, None], 'b': [2]})
+        self.assertEqual(deserializer.deserialize(1, 'float'), 1.0)
+        self.assertEqual(deserializer.deserialize({'x': 1}, 'object'),
+                         {'x': 1})
+        self.assertEqual(deserializer.deserialize('2024-03-01', 'date'),
+                         datetime.date(2024, 3, 1))
+        with self.assertRaises(ApiException):
+            deserializer.deserialize('not a date', 'datetime')
+
+    def test_mangled_attribute(self):
+        # `_date` is stored as `self.__date` by the generated code
+        approval = deserializer.deserialize(
+            {'date': '2024-03-01'}, FlowActionsApprovalModel, trusted=True)
+        self.assertEqual(approval._date, datetime.datetime(2024, 3, 1))
+
+    def test_real_child_model(self):
+        folder = deserializer.deserialize(
+            {'kind': 'folder', 'id': 'f1'}, _ChildModel)
+        self.assertIsInstance(folder, FoldersFolderInfoModel)
+        self.assertEqual(folder.id, 'f1')
+        other = deserializer.deserialize({'kind': 'other'}, _ChildModel,
+                                         trusted=True)
+        self.assertEqual(other.kind, 'other')
+
+    def test_api_client(self):
+        class Response(object):
+            data = (b'{"id": "f1", "name": "Contratos", '
+                    b'"parentId": null}')
+
+        configuration = Configuration()
+        configuration.trusted_deserialization = True
+        folder = ApiClient(configuration).deserialize(
+            Response(), 'FoldersFolderInfoModel')
+        self.assertEqual(folder,
+                         FoldersFolderInfoModel(id='f1', name='Contratos'))
+
+
+class TestDatetimes(unittest.TestCase):
+    """Date parsing of signer_client.deserializer"""
+
+    def test_formats(self):
+        minus_3 = datetime.timezone(datetime.timedelta(hours=-3))
+        cases = {
+            '2024-03-01T10:20:30.1234567-03:00':
+                datetime.datetime(2024, 3, 1, 10, 20, 30, 123456, minus_3),
+            '2024-03-01T10:20:30.12Z':
+                datetime.datetime(2024, 3, 1, 10, 20, 30, 120000,
+                                  datetime.timezone.utc),
+            '2024-03-01T10:20:30':
+                datetime.datetime(2024, 3, 1, 10, 20, 30),
+            '2024-03-01': datetime.datetime(2024, 3, 1),
+            # not ISO 8601: dateutil
+            'March 1, 2024 10:20': datetime.datetime(2024, 3, 1, 10, 20),
+        }
+        for string, expected in cases.items():
+            self.assertEqual(deserializer.parse_datetime(string), expected)
+            self.assertEqual(deserializer.deserialize(string, 'datetime'),
+                             expected)
+
+    def test_normalize(self):
+        self.assertEqual(
+            deserializer._normalize_iso('2024-03-01T10:20:30.1234567Z'),
+            '2024-03-01T10:20:30.123456+00:00')
+        self.assertEqual(
+            deserializer._normalize_iso('2024-03-01T10:20:30.1-03:00'),
+            '2024-03-01T10:20:30.100000-03:00')
+
+    def test_cache(self):
+        string = '2031-07-08T09:10:11.123-03:00'
+        first = deserializer.parse_datetime(string)
+        hits = deserializer.parse_datetime.cache_info().hits
+        self.assertIs(deserializer.parse_datetime(string), first)
+        self.assertEqual(deserializer.parse_datetime.cache_info().hits,
+                         hits + 1)
+
+    def test_lazy(self):
+        for trusted in (False, True):
+            listing = deserializer.deserialize(
+                LISTING, 'PaginatedSearchResponseDocumentsDocumentListModel',
+                trusted, lazy_datetimes=True)
+            document = listing.items[0]
+            self.assertIsInstance(document, DocumentsDocumentListModel)
+            self.assertEqual(type(document).__name__,
+                             'DocumentsDocumentListModel')
+            self.assertEqual(document._creation_date,
+                             '2024-03-01T10:20:30-03:00')
+            eager = deserializer.deserialize(
+                LISTING, 'PaginatedSearchResponseDocumentsDocumentListModel')
+            self.assertEqual(listing, eager)
+            self.assertEqual(eager, listing)
+            self.assertEqual(document.creation_date,
+                             eager.items[0].creation_date)
+            self.assertIsInstance(document._creation_date, datetime.datetime)
+            self.assertEqual(document.to_dict(), eager.items[0].to_dict())
+
+    def test_lazy_pickle(self):
+        document = deserializer.deserialize(
+            LISTING['items'][0], DocumentsDocumentListModel,
+            lazy_datetimes=True)
+        copy = pickle.loads(pickle.dumps(document))
+        self.assertIs(type(copy), DocumentsDocumentListModel)
+        self.assertEqual(copy, document)
+
+    def test_lazy_invalid(self):
+        document = deserializer.deserialize(
+            {'creationDate': 'not a date'}, DocumentsDocumentListModel,
+            lazy_datetimes=True)
+        with self.assertRaises(ApiException):
+            document.creation_date
+
+
+class TestCompactModels(unittest.TestCase):
+    """Slotted models of signer_client.deserializer"""
+
+    def _listing(self, **options):
+        return deserializer.deserialize(
+            LISTING, 'PaginatedSearchResponseDocumentsDocumentListModel',
+            **options)
+
+    def test_compact(self):
+        eager = self._listing()
+        for trusted in (False, True):
+            for lazy in (False, True):
+                listing = self._listing(trusted=trusted, lazy_datetimes=lazy,
+                                        compact=True)
+                document = listing.items[0]
+                self.assertEqual(type(document).__name__,
+                                 'DocumentsDocumentListModel')
+                self.assertFalse(hasattr(document, '__dict__'))
+                self.assertFalse(hasattr(document.folder, '__dict__'))
+                self.assertEqual(listing.to_dict(), eager.to_dict())
+                self.assertEqual(listing, eager)
+                self.assertEqual(listing, self._listing(compact=True))
+                self.assertEqual(serializer.sanitize(listing),
+                                 serializer.sanitize(eager))
+                document.name = 'Renamed'
+                self.assertNotEqual(document, eager.items[0])
+
+    def test_no_dict_in_mro(self):
+        for lazy in (False, True):
+            compact = deserializer.compact_class(DocumentsDocumentListModel,
+                                                 lazy)
+            self.assertEqual(compact.__mro__, (compact, object))
+            self.assertFalse(issubclass(compact, DocumentsDocumentListModel))
+            self.assertEqual(compact().to_dict(),
+                             DocumentsDocumentListModel().to_dict())
+
+    def test_pickle(self):
+        document = self._listing(compact=True, lazy_datetimes=True).items[0]
+        copy = pickle.loads(pickle.dumps(document))
+        self.assertIs(type(copy), type(document))
+        self.assertEqual(copy, document)
+        self.assertEqual(copy.creation_date, document.creation_date)
+
+    def test_trusted_required_attributes(self):
+        data = {'id': 'a1', 'name': 'anexo.pdf'}
+        with self.assertRaises(ValueError):
+            deserializer.deserialize(data, AttachmentsAttachmentUploadModel)
+        for compact in (False, True):
+            attachment = deserializer.deserialize(
+                data, AttachmentsAttachmentUploadModel, trusted=True,
+                compact=compact)
+            self.assertEqual((attachment.id, attachment.display_name),
+                             ('a1', None))
+
+
+class TestLazyModels(unittest.TestCase):
+    """Model views of signer_client.deserializer"""
+
+    def _listing(self):
+        return deserializer.deserialize(
+            LISTING, 'PaginatedSearchResponseDocumentsDocumentListModel',
+            lazy_models=True)
+
+    def test_on_access(self):
+        listing = self._listing()
+        self.assertIsInstance(
+            listing, PaginatedSearchResponseDocumentsDocumentListModel)
+        self.assertEqual(listing.__dict__, {})
+        document = listing.items[0]
+        self.assertIsInstance(document, DocumentsDocumentListModel)
+        self.assertEqual(type(document).__name__,
+                         'DocumentsDocumentListModel')
+        self.assertEqual(set(listing.__dict__), {'_items'})
+        self.assertEqual(document.id, LISTING['items'][0]['id'])
+        self.assertEqual(set(document.__dict__), {'_id'})
+        self.assertIsNone(document.update_date)
+        # built once, then kept
+        self.assertIs(document.folder, document.folder)
+        self.assertIs(document.creation_date, document.creation_date)
+        self.assertEqual(document.creation_date.tzinfo.utcoffset(None),
+                         datetime.timedelta(hours=-3))
+        self.assertIsInstance(document.folder, FoldersFolderInfoModel)
+        self.assertEqual(document.folder.__dict__, {})
+        self.assertEqual(document.tags[0].label, 'área')
+        self.assertIsNone(document.tags[1])
+        with self.assertRaises(AttributeError):
+            document.missing
+
+    def test_matches_eager(self):
+        eager = deserializer.deserialize(
+            LISTING, 'PaginatedSearchResponseDocumentsDocumentListModel')
+        self.assertEqual(self._listing(), eager)
+        self.assertEqual(eager, self._listing())
+        self.assertEqual(self._listing().to_dict(), eager.to_dict())
+        self.assertEqual(serializer.sanitize(self._listing()),
+                         serializer.sanitize(eager))
+        document = self._listing().items[0]
+        document.name = 'Renamed'
+        self.assertEqual(document.name, 'Renamed')
+        self.assertNotEqual(document, eager.items[0])
+
+    def test_pickle(self):
+        document = self._listing().items[0]
+        copy = pickle.loads(pickle.dumps(document))
+        self.assertIs(type(copy), DocumentsDocumentListModel)
+        self.assertIs(type(copy.folder), FoldersFolderInfoModel)
+        self.assertEqual(copy, document)
+
+    def test_required_attributes(self):
+        attachment = deserializer.deserialize(
+            {'id': 'a1'}, AttachmentsAttachmentUploadModel, lazy_models=True)
+        self.assertEqual((attachment.id, attachment.display_name),
+                         ('a1', None))
+
+    def test_real_child_model(self):
+        folder = deserializer.deserialize(
+            {'kind': 'folder', 'id': 'f1'}, _ChildModel, lazy_models=True)
+        self.assertIsInstance(folder, FoldersFolderInfoModel)
+        self.assertEqual(folder.id, 'f1')
+
+    def test_api_client(self):
+        class Response(object):
+            data = b'{"id": "f1", "name": "Contratos", "parentId": null}'
+
+        configuration = Configuration()
+        configuration.lazy_models = True
+        folder = ApiClient(configuration).deserialize(
+            Response(), 'FoldersFolderInfoModel')
+        self.assertEqual(folder.__dict__, {})
+        self.assertEqual(folder,
+                         FoldersFolderInfoModel(id='f1', name='Contratos'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import aiohttp  # noqa: F401
+except ImportError:
+    aiohttp = None
+
+from signer_client.client import SignerClient
+from signer_client.download import ChecksumMismatchError
+from signer_client.models import DocumentDownloadTypes
+
+CONTENT = bytes(range(256)) * 4096  # 1 MiB
+DIGEST = hashlib.sha256(CONTENT).hexdigest()
+
+
+class _ContentHandler(BaseHTTPRequestHandler):
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.server.paths.append(self.path)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/pdf')
+        self.send_header('Content-Length', str(len(CONTENT)))
+        self.end_headers()
+        for i in range(0, len(CONTENT), 100000):
+            self.wfile.write(CONTENT[i:i + 100000])
+
+
+class _ServerMixin(object):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _ContentHandler)
+        cls.server.paths = []
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.host = 'http://127.0.0.1:%d' % cls.server.server_address[1]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+
+class TestDownload(_ServerMixin, unittest.TestCase):
+    """Streaming document downloads of SignerClient"""
+
+    def setUp(self):
+        super(TestDownload, self).setUp()
+        self.client = SignerClient('app|key', self.host)
+        self.addCleanup(self.client.close)
+
+    def test_get_document_content(self):
+        self.assertEqual(self.client.get_document_content('doc-1'), CONTENT)
+
+    def test_download_to_path(self):
+        path = os.path.join(self.directory, 'signed.pdf')
+        progress = []
+        result = self.client.download_document(
+            'doc-1', path, download_type=DocumentDownloadTypes.SIGNATURES,
+            chunk_size=65536, progress=lambda n, total: progress.append(
+                (n, total)), expected_digest=DIGEST)
+
+        with open(path, 'rb') as f:
+            self.assertEqual(f.read(), CONTENT)
+        self.assertEqual(result.size, len(CONTENT))
+        self.assertEqual(result.digest, DIGEST)
+        self.assertEqual(result.content_type, 'application/pdf')
+        self.assertEqual(progress[-1], (len(CONTENT), len(CONTENT)))
+        self.assertTrue(all(b - a <= 65536 for (a, _), (b, _)
+                            in zip([(0, 0)] + progress, progress)))
+        self.assertEqual(self.server.paths[-1],
+                         '/api/documents/doc-1/content?type=Signatures')
+        self.assertEqual(os.listdir(self.directory), ['signed.pdf'])
+
+    def test_download_to_file_object(self):
+        buffer = io.BytesIO()
+        result = self.client.download_document('doc-2', buffer,
+                                               algorithm='md5')
+        self.assertEqual(buffer.getvalue(), CONTENT)
+        self.assertEqual(result.digest, hashlib.md5(CONTENT).hexdigest())
+        self.assertIsNone(result.path)
+
+    def test_checksum_mismatch_keeps_existing_file(self):
+        path = os.path.join(self.directory, 'signed.pdf')
+        with open(path, 'wb') as f:
+            f.write(b'previous')
+        with self.assertRaises(ChecksumMismatchError) as context:
+            self.client.download_signed_document('doc-3', path,
+                                                 expected_digest='00' * 32)
+        self.assertEqual(context.exception.actual, DIGEST)
+        with open(path, 'rb') as f:
+            self.assertEqual(f.read(), b'previous')
+        self.assertEqual(os.listdir(self.directory), ['signed.pdf'])
+
+
+@unittest.skipIf(aiohttp is None, 'aiohttp is not installed')
+class TestAsyncDownload(_ServerMixin, unittest.IsolatedAsyncioTestCase):
+    """Streaming document downloads of AsyncSignerClient"""
+
+    async def test_download(self):
+        from signer_client.aio import AsyncSignerClient
+        path = os.path.join(self.directory, 'signed.pdf')
+        async with AsyncSignerClient('app|key', self.host) as client:
+            self.assertEqual(await client.get_document_content('doc-1'),
+                             CONTENT)
+            result = await client.download_signed_document(
+                'doc-1', path, expected_digest=DIGEST)
+        self.assertEqual(result.size, len(CONTENT))
+        with open(path, 'rb') as f:
+            self.assertEqual(f.read(), CONTENT)
+
+
+if __name__ == '__main__':
+    unittest.main()
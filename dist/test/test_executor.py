@@ -0,0 +1,153 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import json
+import threading
+import time
+import unittest
+from concurrent.futures import (
+    Future, ThreadPoolExecutor, TimeoutError, as_completed
+)
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from signer_client import executor
+from signer_client.api.documents_api import DocumentsApi
+from signer_client.api_client import ApiClient
+from signer_client.configuration import Configuration
+from signer_client.executor import ApiFuture, shared_executor, submit
+from signer_client.rest import ApiException
+
+
+class _SlowHandler(BaseHTTPRequestHandler):
+    """Answers ``/api/documents/<id>`` after ``?delay=`` seconds, with 404
+    for the id ``missing``."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        path, _, query = self.path.partition('?')
+        if query.startswith('delay='):
+            time.sleep(float(query[len('delay='):]))
+        document_id = path.rsplit('/', 1)[-1]
+        if document_id == 'missing':
+            body = b'{"code": "DocumentNotFound"}'
+            self.send_response(404)
+        else:
+            body = json.dumps({'id': document_id}).encode('utf-8')
+            self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class TestExecutor(unittest.TestCase):
+    """async_req calls on the shared executor"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _SlowHandler)
+        cls.server.daemon_threads = True
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.configuration = Configuration()
+        self.configuration.host = 'http://127.0.0.1:%d' % (
+            self.server.server_address[1])
+
+    def _client(self):
+        client = ApiClient(self.configuration)
+        self.addCleanup(client.close)
+        return client
+
+    def _get(self, client, document_id, delay=None):
+        return client.call_api(
+            '/api/documents/{id}', 'GET', {'id': document_id},
+            [('delay', delay)] if delay else [], {'Accept': 'application/json'},
+            response_type='object', _return_http_data_only=True,
+            async_req=True)
+
+    def test_returns_futures(self):
+        client = self._client()
+        futures = {self._get(client, str(i)): str(i) for i in range(8)}
+        for future in as_completed(futures, timeout=10):
+            self.assertIsInstance(future, Future)
+            self.assertEqual(future.result(), {'id': futures[future]})
+
+    def test_get_alias(self):
+        future = self._get(self._client(), 'a')
+        self.assertEqual(future.get(10), {'id': 'a'})
+
+    def test_exception(self):
+        future = self._get(self._client(), 'missing')
+        with self.assertRaises(ApiException) as cm:
+            future.result(10)
+        self.assertEqual(cm.exception.status, 404)
+        self.assertIsInstance(future.exception(), ApiException)
+
+    def test_timeout(self):
+        future = self._get(self._client(), 'slow', delay=0.3)
+        with self.assertRaises(TimeoutError):
+            future.result(timeout=0.01)
+        self.assertEqual(future.result(10), {'id': 'slow'})
+
+    def test_clients_share_the_executor(self):
+        threads = set(threading.enumerate())
+        for _ in range(5):
+            client = ApiClient(self.configuration)
+            self._get(client, 'a').result(10)
+            client.close()
+        started = set(threading.enumerate()) - threads
+        self.assertLessEqual(len(started), 1)
+        self.assertIs(shared_executor(), shared_executor())
+
+    def test_generated_api(self):
+        api = DocumentsApi(self._client())
+        future = api.api_documents_id_get('a', async_req=True)
+        self.assertIsInstance(future, ApiFuture)
+        self.assertEqual(future.result(10).id, 'a')
+
+    def test_configuration_executor(self):
+        pool = ThreadPoolExecutor(1, thread_name_prefix='custom')
+        self.addCleanup(pool.shutdown)
+        self.configuration.executor = pool
+        names = []
+        client = self._client()
+        original = client.request
+
+        def request(*args, **kwargs):
+            names.append(threading.current_thread().name)
+            return original(*args, **kwargs)
+
+        client.request = request
+        self._get(client, 'a').result(10)
+        self.assertTrue(names[0].startswith('custom'))
+
+    def test_cancel(self):
+        pool = ThreadPoolExecutor(1)
+        self.addCleanup(pool.shutdown)
+        self.configuration.executor = pool
+        client = self._client()
+        blocking = self._get(client, 'slow', delay=0.3)
+        queued = self._get(client, 'b')
+        self.assertTrue(queued.cancel())
+        self.assertTrue(queued.cancelled())
+        self.assertEqual(blocking.result(10), {'id': 'slow'})
+
+    def test_set_max_workers(self):
+        self.addCleanup(executor.set_max_workers, None)
+        executor.set_max_workers(2)
+        self.assertEqual(shared_executor()._max_workers, 2)
+        future = submit(None, sum, [1, 2])
+        self.assertEqual(future.result(10), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
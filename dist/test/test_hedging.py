@@ -0,0 +1,218 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import asyncio
+import collections
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import aiohttp  # noqa: F401
+except ImportError:
+    aiohttp = None
+
+from signer_client.api_client import ApiClient
+from signer_client.configuration import Configuration
+from signer_client.deadline import DeadlineExceeded, deadline
+from signer_client.hedging import HedgingPolicy, LatencyTracker
+from signer_client.rest import ApiException
+
+
+class _SlowFirstHandler(BaseHTTPRequestHandler):
+    """Answers ``/api/documents/<key>`` after `slow` seconds the first time
+    for each key, right away afterwards; ``/api/fail/<key>`` with 404."""
+
+    protocol_version = 'HTTP/1.1'
+    hits = collections.Counter()
+    lock = threading.Lock()
+    slow = 1.0
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        self.rfile.read(length)
+        key = self.path.rsplit('/', 1)[-1]
+        with self.lock:
+            self.hits[key] += 1
+            hit = self.hits[key]
+        if '/fail/' in self.path:
+            body = b'{"code": "DocumentNotFound"}'
+            status = 404
+        else:
+            if hit == 1:
+                time.sleep(self.slow)
+            body = json.dumps({'id': key, 'hit': hit}).encode('utf-8')
+            status = 200
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = _reply
+
+
+class _ServerTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _SlowFirstHandler)
+        cls.server.daemon_threads = True
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.configuration = Configuration()
+        self.configuration.host = 'http://127.0.0.1:%d' % (
+            self.server.server_address[1])
+        self.configuration.retries = None
+
+    def _call(self, api_client, key, method='GET', path='/api/documents/{id}'):
+        return api_client.call_api(
+            path, method, {'id': key}, [], {'Accept': 'application/json'},
+            response_type='object', _return_http_data_only=True)
+
+
+class TestDeadline(_ServerTestCase):
+    """Deadlines of operations"""
+
+    def test_caps_timeout(self):
+        api_client = ApiClient(self.configuration)
+        start = time.monotonic()
+        with self.assertRaises(DeadlineExceeded):
+            with deadline(0.2):
+                self._call(api_client, 'deadline-slow')
+        self.assertLess(time.monotonic() - start, 0.8)
+
+    def test_expired_before_request(self):
+        api_client = ApiClient(self.configuration)
+        _SlowFirstHandler.hits['deadline-fast-1'] += 1
+        with deadline(0.2) as budget:
+            self._call(api_client, 'deadline-fast-1')
+            self.assertGreater(budget.remaining(), 0)
+            time.sleep(0.25)
+            with self.assertRaises(DeadlineExceeded):
+                self._call(api_client, 'deadline-fast-2')
+
+    def test_nested_deadline_does_not_extend(self):
+        with deadline(0.1) as outer:
+            with deadline(10) as inner:
+                self.assertIs(inner, outer)
+            with deadline(0.01) as inner:
+                self.assertLess(inner.expires_at, outer.expires_at)
+
+    def test_async_req_keeps_deadline(self):
+        api_client = ApiClient(self.configuration)
+        with deadline(0.2):
+            future = api_client.call_api(
+                '/api/documents/{id}', 'GET', {'id': 'deadline-async'},
+                response_type='object', async_req=True)
+        with self.assertRaises(DeadlineExceeded):
+            future.result(5)
+
+
+class TestLatencyTracker(unittest.TestCase):
+    """Latency percentiles"""
+
+    def test_percentile(self):
+        tracker = LatencyTracker(window=100)
+        for i in range(200):
+            tracker.record('GET /x', i / 1000.0)
+        self.assertAlmostEqual(tracker.percentile('GET /x', 50), 0.15, 2)
+        self.assertAlmostEqual(tracker.percentile('GET /x', 95), 0.195, 2)
+        self.assertIsNone(tracker.percentile('GET /y', 95))
+        self.assertIsNone(tracker.percentile('GET /x', 95, min_samples=101))
+
+    def test_delay(self):
+        policy = HedgingPolicy(initial_delay=0.3, min_samples=5,
+                               min_delay=0.02, max_delay=1)
+        self.assertEqual(policy.delay('GET /x'), 0.3)
+        for _ in range(5):
+            policy.latencies.record('GET /x', 0.001)
+        self.assertEqual(policy.delay('GET /x'), 0.02)
+
+
+class TestHedging(_ServerTestCase):
+    """Hedged requests"""
+
+    def setUp(self):
+        super(TestHedging, self).setUp()
+        self.policy = HedgingPolicy(initial_delay=0.05, overrides={
+            'POST /api/documents/{id}/action-url': HedgingPolicy(
+                initial_delay=0.05, hedge_post=True),
+            'GET /api/folders/{id}': None,
+        })
+        self.configuration.hedging = self.policy
+        self.api_client = ApiClient(self.configuration)
+
+    def test_backup_wins(self):
+        start = time.monotonic()
+        result = self._call(self.api_client, 'hedge-1')
+        self.assertLess(time.monotonic() - start, 0.8)
+        self.assertEqual(result['hit'], 2)
+        stats = self.policy.stats.as_dict()
+        self.assertEqual((stats['requests'], stats['hedges'], stats['wins']),
+                         (1, 1, 1))
+        self.assertEqual(stats['delays'], {'GET /api/documents/{id}': 0.05})
+
+    def test_fast_request_not_hedged(self):
+        _SlowFirstHandler.hits['hedge-2'] += 1
+        self.assertEqual(self._call(self.api_client, 'hedge-2')['hit'], 2)
+        stats = self.policy.stats.as_dict()
+        self.assertEqual((stats['requests'], stats['hedges']), (1, 0))
+
+    def test_post_opt_in(self):
+        result = self._call(self.api_client, 'hedge-3', 'POST',
+                            '/api/documents/{id}/action-url')
+        self.assertEqual(result['hit'], 2)
+        start = time.monotonic()
+        self._call(self.api_client, 'hedge-4', 'POST', '/api/documents/{id}')
+        self.assertGreater(time.monotonic() - start, 0.9)
+        self.assertEqual(self.policy.stats.hedges, 1)
+
+    def test_disabled_operation(self):
+        start = time.monotonic()
+        self._call(self.api_client, 'hedge-5', path='/api/folders/{id}')
+        self.assertGreater(time.monotonic() - start, 0.9)
+        self.assertEqual(self.policy.stats.requests, 0)
+
+    def test_errors(self):
+        with self.assertRaises(ApiException) as cm:
+            self._call(self.api_client, 'hedge-6', path='/api/fail/{id}')
+        self.assertEqual(cm.exception.status, 404)
+
+    def test_deadline(self):
+        self.policy.initial_delay = 0.5
+        with self.assertRaises(DeadlineExceeded):
+            with deadline(0.1):
+                self._call(self.api_client, 'hedge-7')
+        self.assertEqual(self.policy.stats.hedges, 0)
+
+    @unittest.skipIf(aiohttp is None, 'aiohttp is not installed')
+    def test_asyncio(self):
+        from signer_client.aio import AsyncApiClient
+
+        async def main():
+            async with AsyncApiClient(self.configuration) as api_client:
+                return await api_client.call_api(
+                    '/api/documents/{id}', 'GET', {'id': 'hedge-8'},
+                    response_type='object', _return_http_data_only=True)
+
+        start = time.monotonic()
+        self.assertEqual(asyncio.run(main())['hit'], 2)
+        self.assertLess(time.monotonic() - start, 0.8)
+        self.assertEqual(self.policy.stats.wins, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
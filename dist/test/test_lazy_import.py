@@ -0,0 +1,118 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+import signer_client
+import signer_client.api
+import signer_client.models
+
+PACKAGE_DIR = os.path.dirname(signer_client.__file__)
+
+
+def _loaded_after(code):
+    """Runs `code` in a new interpreter and returns the modules it left
+    loaded, signer_client ones and the third-party ones we care about."""
+    script = code + '''
+import json, sys
+print(json.dumps(sorted(
+    name for name in sys.modules
+    if name.split('.')[0] in ('signer_client', 'urllib3', 'six', 'asyncio'))))
+'''
+    output = subprocess.check_output(
+        [sys.executable, '-c', script],
+        cwd=os.path.dirname(PACKAGE_DIR))
+    return set(json.loads(output.decode('utf-8').splitlines()[-1]))
+
+
+def _modules(directory):
+    return sorted(name[:-3] for name in os.listdir(directory)
+                  if name.endswith('.py') and name != '__init__.py')
+
+
+class TestLazyImport(unittest.TestCase):
+    """Lazy imports of signer_client, signer_client.api and
+    signer_client.models"""
+
+    def test_import_package(self):
+        loaded = _loaded_after('import signer_client')
+        self.assertEqual(loaded, {'signer_client', 'signer_client.models'})
+
+    def test_import_name(self):
+        loaded = _loaded_after('from signer_client import DocumentsApi')
+        self.assertIn('signer_client.api.documents_api', loaded)
+        self.assertNotIn('signer_client.api.flows_api', loaded)
+        self.assertNotIn('asyncio', loaded)
+        self.assertFalse([name for name in loaded
+                          if name.startswith('signer_client.models.')])
+
+    def test_submodule_attribute(self):
+        # loaded as a side effect of the former eager imports
+        loaded = _loaded_after(
+            'import signer_client; signer_client.rest.ApiException')
+        self.assertIn('signer_client.rest', loaded)
+
+    def test_deserialize_on_demand(self):
+        loaded = _loaded_after('''
+from signer_client import deserializer
+folder = deserializer.deserialize({'id': 'f1'}, 'FoldersFolderInfoModel')
+assert type(folder).__name__ == 'FoldersFolderInfoModel'
+''')
+        self.assertEqual(
+            sorted(name for name in loaded
+                   if name.startswith('signer_client.models.')),
+            ['signer_client.models.folders_folder_info_model'])
+
+    def test_maps_are_complete(self):
+        self.assertEqual(sorted(signer_client.models._MODULES.values()),
+                         _modules(os.path.join(PACKAGE_DIR, 'models')))
+        self.assertEqual(sorted(signer_client.api._MODULES.values()),
+                         _modules(os.path.join(PACKAGE_DIR, 'api')))
+        for name in signer_client.__all__:
+            self.assertEqual(getattr(signer_client, name).__name__, name)
+        self.assertEqual(
+            dict((name, module) for name, module
+                 in signer_client._EXPORTS.items()
+                 if module.startswith('signer_client.api.')),
+            dict((name, 'signer_client.api.' + module) for name, module
+                 in signer_client.api._MODULES.items()))
+        self.assertEqual(signer_client._EXPORTS['SignerClient'],
+                         'signer_client.client')
+
+    def test_kept_on_regeneration(self):
+        # the generator would bring back the eager imports
+        with open(os.path.join(os.path.dirname(PACKAGE_DIR),
+                               '.swagger-codegen-ignore')) as f:
+            ignored = set(line.strip() for line in f)
+        for path in ('signer_client/__init__.py',
+                     'signer_client/api/__init__.py',
+                     'signer_client/models/__init__.py'):
+            self.assertIn(path, ignored)
+
+    def test_names(self):
+        from signer_client import FoldersFolderInfoModel
+        from signer_client.models import (
+            FoldersFolderInfoModel as ModelsFoldersFolderInfoModel,
+        )
+        from signer_client.models.folders_folder_info_model import (
+            FoldersFolderInfoModel as ModuleFoldersFolderInfoModel,
+        )
+        self.assertIs(FoldersFolderInfoModel, ModelsFoldersFolderInfoModel)
+        self.assertIs(FoldersFolderInfoModel, ModuleFoldersFolderInfoModel)
+        self.assertIn('DocumentsApi', dir(signer_client))
+        self.assertIn('FoldersFolderInfoModel', dir(signer_client.models))
+        with self.assertRaises(AttributeError):
+            signer_client.Missing
+        with self.assertRaises(AttributeError):
+            signer_client.models.Missing
+        with self.assertRaises(ImportError):
+            from signer_client import missing  # noqa: F401
+
+
+if __name__ == '__main__':
+    unittest.main()
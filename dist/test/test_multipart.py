@@ -0,0 +1,216 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import tracemalloc
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import urllib3
+
+try:
+    import aiohttp  # noqa: F401
+except ImportError:
+    aiohttp = None
+
+import signer_client
+from signer_client.client import SignerClient
+from signer_client.multipart import FilePart, MultipartEncoder
+
+
+class _UploadHandler(BaseHTTPRequestHandler):
+    """Reads the upload in chunks and echoes its size and boundaries."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        length = int(self.headers['Content-Length'])
+        received, head, tail = 0, b'', b''
+        while received < length:
+            chunk = self.rfile.read(min(65536, length - received))
+            if not head:
+                head = chunk[:300]
+            tail = (tail + chunk)[-100:]
+            received += len(chunk)
+        body = json.dumps({
+            'id': 'f1',
+            'name': self.headers['Content-Type'],
+            'contentType': head.decode('latin-1'),
+            'location': '%d %s' % (received, tail.decode('latin-1')),
+        }).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class TestMultipartEncoder(unittest.TestCase):
+    """MultipartEncoder and FilePart"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, 'contract.pdf')
+        with open(self.path, 'wb') as f:
+            f.write(b'%PDF' + os.urandom(200000))
+
+    def test_same_body_as_urllib3(self):
+        with open(self.path, 'rb') as f:
+            content = f.read()
+        fields = [('name', 'contrato'), ('size', 3),
+                  ('file', ('contract.pdf', content, 'application/pdf'))]
+        expected, content_type = urllib3.encode_multipart_formdata(
+            fields, boundary='b0undary')
+
+        for source in (content, self.path, open(self.path, 'rb')):
+            fields[2] = ('file', FilePart('contract.pdf', source))
+            encoder = MultipartEncoder(fields, boundary='b0undary',
+                                       chunk_size=4096)
+            self.assertEqual(encoder.content_type, content_type)
+            self.assertEqual(encoder.length, len(expected))
+            self.assertTrue(all(len(c) <= 4096 for c in encoder))
+            self.assertEqual(encoder.to_bytes(), expected)
+            if hasattr(source, 'close'):
+                source.close()
+
+    def test_stream_is_sent_again(self):
+        stream = io.BytesIO(b'skipped|content')
+        stream.read(8)
+        encoder = MultipartEncoder([('file', FilePart('a.txt', stream))])
+        self.assertEqual(encoder.length, len(encoder.to_bytes()))
+        self.assertEqual(encoder.to_bytes().count(b'\r\ncontent\r\n'), 1)
+        self.assertEqual(encoder.to_bytes(), encoder.to_bytes())
+
+    def test_stream_is_sent_again_after_abort(self):
+        # a failed attempt stops reading the file halfway
+        content = bytes(range(100))
+        stream = io.BytesIO(content)
+        part = FilePart('a.bin', stream)
+        chunks = part.chunks(10)
+        self.assertEqual([bytes(next(chunks)) for _ in range(2)],
+                         [content[:10], content[10:20]])
+        chunks.close()
+        self.assertEqual(part.size(), 100)
+        self.assertEqual(b''.join(part.chunks(10)), content)
+
+        encoder = MultipartEncoder([('file', FilePart('a.bin', stream))],
+                                   chunk_size=10)
+        body = iter(encoder)
+        for _ in range(4):
+            next(body)
+        body.close()
+        self.assertEqual(encoder.length, len(encoder.to_bytes()))
+        self.assertEqual(encoder.to_bytes().count(content), 1)
+
+    def test_unknown_length(self):
+        class Pipe(object):
+            def __init__(self):
+                self.chunks = [b'a', b'b']
+
+            def read(self, size):
+                return self.chunks.pop(0) if self.chunks else b''
+
+        encoder = MultipartEncoder([('file', FilePart('pipe', Pipe()))])
+        self.assertIsNone(encoder.length)
+        self.assertIn(b'\r\nab\r\n', encoder.to_bytes())
+
+    def test_empty_file(self):
+        path = os.path.join(self.directory, 'empty.txt')
+        open(path, 'wb').close()
+        encoder = MultipartEncoder([('file', FilePart('empty.txt', path))])
+        self.assertEqual(encoder.length, len(encoder.to_bytes()))
+
+    def test_from_value(self):
+        from pathlib import Path
+        part = FilePart.from_value(Path(self.path))
+        self.assertEqual(part, ('contract.pdf', self.path, 'application/pdf'))
+        with open(self.path, 'rb') as f:
+            self.assertEqual(FilePart.from_value(f).filename, 'contract.pdf')
+        self.assertIsNone(FilePart.from_value('just text'))
+
+    def test_prepare_post_parameters_does_not_read_files(self):
+        api_client = signer_client.ApiClient()
+        params = api_client.prepare_post_parameters(
+            [('title', 't')], files={'file': self.path})
+        self.assertEqual(params[0], ('title', 't'))
+        self.assertEqual(params[1][1].source, self.path)
+
+
+class TestStreamingUpload(unittest.TestCase):
+    """Uploads through SignerClient against a local server"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _UploadHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.host = 'http://127.0.0.1:%d' % cls.server.server_address[1]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.client = SignerClient('app|key', self.host)
+        self.addCleanup(self.client.close)
+
+    def test_upload_file_streams_from_disk(self):
+        size = 16 * 1024 * 1024
+        path = os.path.join(self.directory, 'scan.pdf')
+        with open(path, 'wb') as f:
+            f.seek(size - 4)
+            f.write(b'%EOF')
+
+        tracemalloc.start()
+        try:
+            result = self.client.upload_file(path)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        self.assertTrue(result.name.startswith(
+            'multipart/form-data; boundary='))
+        self.assertIn('filename="scan.pdf"', result.content_type)
+        self.assertIn('Content-Type: application/pdf', result.content_type)
+        received, tail = result.location.split(' ', 1)
+        self.assertGreater(int(received), size)
+        self.assertIn('%EOF\r\n--', tail)
+        self.assertLess(peak, size // 8)
+
+    def test_upload_file_object(self):
+        with open(os.path.join(self.directory, 'a.txt'), 'w+b') as f:
+            f.write(b'hello')
+            f.seek(0)
+            result = self.client.upload_file(f)
+        self.assertIn('filename="a.txt"', result.content_type)
+        self.assertIn('hello\r\n--', result.location)
+
+    @unittest.skipIf(aiohttp is None, 'aiohttp is not installed')
+    def test_async_upload_file(self):
+        import asyncio
+        from signer_client.aio import AsyncSignerClient
+        path = os.path.join(self.directory, 'a.txt')
+        with open(path, 'wb') as f:
+            f.write(b'hello')
+
+        async def upload():
+            async with AsyncSignerClient('app|key', self.host) as client:
+                return await client.upload_file(path)
+
+        result = asyncio.run(upload())
+        self.assertIn('filename="a.txt"', result.content_type)
+        self.assertIn('hello\r\n--', result.location)
+
+
+if __name__ == '__main__':
+    unittest.main()
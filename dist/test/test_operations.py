@@ -0,0 +1,322 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import asyncio
+import glob
+import inspect
+import os
+import re
+import sys
+import unittest
+
+try:
+    import aiohttp  # noqa: F401
+except ImportError:
+    aiohttp = None
+
+import signer_client.api
+from signer_client.api.documents_api import DocumentsApi
+from signer_client.api.organizations_api import OrganizationsApi
+from signer_client.api.upload_api import UploadApi
+from signer_client.api_client import ApiClient
+from signer_client.configuration import Configuration
+from signer_client.models import DocumentsDocumentNotifiedEmailsEditRequest
+from signer_client.operations import OPERATIONS, Operation
+
+HOST = 'https://signer.example.com'
+DIST_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# generated docs: table rows and the parts of each operation section
+_DOC_ROW = re.compile(
+    r'^\[\*\*(\w+)\*\*\]\(\w+\.md#\w+\) \| \*\*(\w+)\*\* (\S+) \|', re.M)
+_DOC_SECTION = re.compile(r'^# \*\*(\w+)\*\*\n> (.*?)\1\((.*?)\n(.*?)'
+                          r'(?=^# \*\*|\Z)', re.M | re.S)
+_DOC_PARAM = re.compile(r'^ \*\*(\w+)\*\* \|', re.M)
+_DOC_HEADER = re.compile(r'^ - \*\*(Content-Type|Accept)\*\*: (.*)$', re.M)
+
+
+def _documented_operations():
+    """Returns the operations described by the generated docs/*Api.md, which
+    swagger-codegen rewrites from the spec, as the arguments of
+    `Operation`."""
+    operations = {}
+    for path in glob.glob(os.path.join(DIST_DIR, 'docs', '*Api.md')):
+        with open(path) as f:
+            text = f.read()
+        rows = dict((name, (method, template)) for name, method, template
+                    in _DOC_ROW.findall(text))
+        for name, response_type, _, section in _DOC_SECTION.findall(text):
+            headers = dict(_DOC_HEADER.findall(section))
+            content_type = headers['Content-Type']
+            method, template = rows[name]
+            operations[name] = dict(
+                method=method, path=template,
+                params=tuple(_DOC_PARAM.findall(section)),
+                response_type=response_type.strip() or None,
+                accept=tuple(x.strip() for x in headers['Accept'].split(',')),
+                content_types=(None if content_type == 'Not defined'
+                               else tuple(x.strip() for x in
+                                          content_type.split(','))))
+    return operations
+
+
+class _Response(object):
+    status = 200
+    reason = 'OK'
+    data = b'{}'
+
+    def getheaders(self):
+        return {'Content-Type': 'application/json'}
+
+    def getheader(self, name, default=None):
+        return self.getheaders().get(name, default)
+
+
+class _RecordingApiClient(ApiClient):
+    """Records the requests instead of sending them."""
+
+    def __init__(self, configuration):
+        super(_RecordingApiClient, self).__init__(configuration)
+        self.requests = []
+
+    def request(self, method, url, query_params=None, headers=None,
+                post_params=None, body=None, _preload_content=True,
+                _request_timeout=None, _retry_policy=None, _throttle=None):
+        self.requests.append((method, url, query_params, headers,
+                              post_params, body))
+        return _Response()
+
+
+def _configuration():
+    configuration = Configuration()
+    configuration.host = HOST
+    configuration.api_key = {'X-Api-Key': 'app|key'}
+    return configuration
+
+
+class TestOperation(unittest.TestCase):
+    """signer_client.operations.Operation"""
+
+    def test_url_path(self):
+        operation = OPERATIONS['api_organizations_users_user_id_delete']
+        self.assertEqual(operation.key,
+                         'DELETE /api/organizations/users/{userId}')
+        self.assertEqual(operation.url_path({'userId': 'a b/c'}),
+                         '/api/organizations/users/a%20b%2Fc')
+        self.assertEqual(operation.url_path({'userId': 'a/b'}, safe='/'),
+                         '/api/organizations/users/a/b')
+        self.assertEqual(operation.url_path({}),
+                         '/api/organizations/users/{userId}')
+        self.assertEqual(OPERATIONS['api_documents_get'].url_path({}),
+                         '/api/documents')
+
+    def test_headers(self):
+        self.assertEqual(OPERATIONS['api_documents_id_get'].headers,
+                         {'Accept': 'application/json'})
+        self.assertEqual(
+            OPERATIONS['api_documents_id_notified_emails_put'].headers,
+            {'Accept': 'application/json', 'Content-Type': 'application/json'})
+        self.assertEqual(OPERATIONS['api_uploads_post'].headers,
+                         {'Accept': 'application/json',
+                          'Content-Type': 'multipart/form-data'})
+        self.assertEqual(
+            Operation('x', 'GET', '/x', accept=('text/plain',)).headers,
+            {'Accept': 'text/plain'})
+
+    def test_bind(self):
+        operation = OPERATIONS['api_documents_id_get']
+        self.assertEqual(operation.bind(('d1',), {'async_req': True}),
+                         {'id': 'd1', 'async_req': True})
+        with self.assertRaises(TypeError) as raised:
+            operation.bind(('d1',), {'limit': 10})
+        self.assertEqual(
+            str(raised.exception),
+            "Got an unexpected keyword argument 'limit'"
+            " to method api_documents_id_get")
+        with self.assertRaises(ValueError) as raised:
+            operation.bind((None,), {})
+        self.assertEqual(
+            str(raised.exception),
+            "Missing the required parameter `id` when calling "
+            "`api_documents_id_get`")
+
+    def test_descriptors_match_methods(self):
+        names = set()
+        for class_name in signer_client.api.__all__:
+            api_class = getattr(signer_client.api, class_name)
+            for name, method in inspect.getmembers(api_class,
+                                                   inspect.isfunction):
+                if not name.endswith('_with_http_info'):
+                    continue
+                name = name[:-len('_with_http_info')]
+                names.add(name)
+                operation = OPERATIONS[name]
+                positional = [
+                    parameter.name for parameter in
+                    inspect.signature(method).parameters.values()
+                    if parameter.kind == parameter.POSITIONAL_OR_KEYWORD
+                ][1:]
+                self.assertEqual(list(operation.positional), positional)
+                self.assertEqual(
+                    list(operation.params[:len(positional)]), positional)
+                for documented in operation.params:
+                    self.assertIn(' %s:' % documented, method.__doc__)
+        self.assertEqual(names, set(OPERATIONS))
+
+    def test_methods_dispatch_through_descriptors(self):
+        # the api modules and their descriptors are generated from
+        # templates/api.mustache, a regenerated client keeps dispatching
+        for class_name in signer_client.api.__all__:
+            api_class = getattr(signer_client.api, class_name)
+            module = sys.modules[api_class.__module__]
+            for name, method in inspect.getmembers(api_class,
+                                                   inspect.isfunction):
+                if name.endswith('_with_http_info'):
+                    name = name[:-len('_with_http_info')]
+                    with self.subTest(name):
+                        self.assertRegex(
+                            inspect.getsource(method),
+                            r"call_operation\(\s*OPERATIONS\['%s'\]" % name)
+                        self.assertIs(module.OPERATIONS[name],
+                                      OPERATIONS[name])
+        with open(os.path.join(DIST_DIR, '.swagger-codegen-ignore')) as f:
+            self.assertNotIn('signer_client/api/*.py',
+                             set(line.strip() for line in f))
+        with open(os.path.join(DIST_DIR, os.pardir, 'templates',
+                               'api.mustache')) as f:
+            template = f.read()
+        self.assertIn("OPERATIONS['{{operationId}}']", template)
+
+    def test_descriptors_match_spec(self):
+        # against the docs generated from the current spec, so that a
+        # change of the spec shows up here once the client is regenerated
+        documented = _documented_operations()
+        self.assertEqual(set(documented), set(OPERATIONS))
+        for name, operation in sorted(OPERATIONS.items()):
+            expected = documented[name]
+            with self.subTest(name):
+                self.assertEqual(
+                    (operation.method, operation.path,
+                     operation.params, operation.response_type),
+                    (expected['method'], expected['path'],
+                     expected['params'], expected['response_type']))
+                self.assertEqual(operation.headers, Operation(
+                    name, operation.method, operation.path,
+                    accept=expected['accept'],
+                    content_types=expected['content_types']).headers)
+
+
+class TestDispatch(unittest.TestCase):
+    """Requests sent by the generated methods through the descriptors"""
+
+    def setUp(self):
+        self.api_client = _RecordingApiClient(_configuration())
+
+    def test_path(self):
+        organizations_api = OrganizationsApi(self.api_client)
+        organizations_api.api_organizations_users_user_id_delete(
+            'u 1', _response_format='raw')
+        self.assertEqual(self.api_client.requests, [(
+            'DELETE', HOST + '/api/organizations/users/u%201', [],
+            {'Accept': 'application/json',
+             'User-Agent': 'Swagger-Codegen/1.0.0/python',
+             'X-Api-Key': 'app|key'},
+            [], None)])
+
+    def test_query(self):
+        DocumentsApi(self.api_client).api_documents_get(
+            status='Pending', q='contrato', limit=20, offset=40)
+        method, url, query, headers, _, body = self.api_client.requests[0]
+        self.assertEqual((method, url, body),
+                         ('GET', HOST + '/api/documents', None))
+        # in the order of the generated method, not of the call
+        self.assertEqual(query, [('Status', 'Pending'), ('Q', 'contrato'),
+                                 ('Limit', 20), ('Offset', 40)])
+        self.assertNotIn('Content-Type', headers)
+
+    def test_body(self):
+        body = DocumentsDocumentNotifiedEmailsEditRequest(
+            emails=['ana@example.com'])
+        DocumentsApi(self.api_client).api_documents_id_notified_emails_put(
+            'd1', body=body)
+        method, url, _, headers, _, sent = self.api_client.requests[0]
+        self.assertEqual((method, url, sent),
+                         ('PUT', HOST + '/api/documents/d1/notified-emails',
+                          {'emails': ['ana@example.com']}))
+        self.assertEqual(headers['Content-Type'], 'application/json')
+
+    def test_form(self):
+        UploadApi(self.api_client).api_uploads_post(file=b'%PDF-1.7',
+                                                   _response_format='raw')
+        method, url, _, headers, post_params, _ = self.api_client.requests[0]
+        self.assertEqual((method, url), ('POST', HOST + '/api/uploads'))
+        self.assertEqual(headers['Content-Type'], 'multipart/form-data')
+        self.assertEqual(post_params, [('file', b'%PDF-1.7')])
+
+    def test_default_headers(self):
+        self.api_client.set_default_header('X-Tenant', 't1')
+        self.api_client.cookie = 'session=1'
+        DocumentsApi(self.api_client).api_documents_id_get('d1')
+        headers = self.api_client.requests[0][3]
+        self.assertEqual((headers['X-Tenant'], headers['Cookie']),
+                         ('t1', 'session=1'))
+
+    def test_same_request_as_call_api(self):
+        # every operation, against the request built from the parameters
+        # of `call_api`, as the generated methods used to
+        for name, operation in sorted(OPERATIONS.items()):
+            params = dict((param, 'v-%s' % param)
+                          for param in operation.params)
+            if operation.body_param:
+                params[operation.body_param] = {'name': 'n'}
+            params['_response_format'] = 'raw'
+            self.api_client.call_operation(operation, (), params)
+            self.api_client.call_api(
+                operation.path, operation.method,
+                dict((key, params[param])
+                     for key, param in operation.path_params),
+                [(key, params[param])
+                 for key, param in operation.query_params],
+                dict(operation.headers),
+                body=params.get(operation.body_param),
+                post_params=[(key, params[param])
+                             for key, param in operation.form_params],
+                files={}, response_type=operation.response_type,
+                auth_settings=['ApiKey'], collection_formats={},
+                _response_format='raw')
+            with self.subTest(name):
+                self.assertEqual(self.api_client.requests[-2],
+                                 self.api_client.requests[-1])
+
+    def test_async_req(self):
+        future = DocumentsApi(self.api_client).api_documents_id_get(
+            'd1', async_req=True, _response_format='dict')
+        self.assertEqual(future.result(timeout=5), {})
+
+    @unittest.skipIf(aiohttp is None, 'aiohttp is not installed')
+    def test_asyncio(self):
+        from signer_client.aio import AsyncApiClient
+
+        requests = []
+
+        class _RecordingAsyncApiClient(AsyncApiClient):
+
+            async def request(self, method, url, query_params=None,
+                              headers=None, post_params=None, body=None,
+                              _preload_content=True, _request_timeout=None,
+                              _retry_policy=None, _throttle=None):
+                requests.append((method, url, query_params))
+                return _Response()
+
+        async def run():
+            async with _RecordingAsyncApiClient(_configuration()) as client:
+                return await DocumentsApi(client).api_documents_get(
+                    limit=5, _response_format='dict')
+
+        self.assertEqual(asyncio.run(run()), {})
+        self.assertEqual(requests, [('GET', HOST + '/api/documents',
+                                     [('Limit', 5)])])
+
+
+if __name__ == '__main__':
+    unittest.main()
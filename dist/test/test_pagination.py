@@ -0,0 +1,421 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import asyncio
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+try:
+    import aiohttp  # noqa: F401
+except ImportError:
+    aiohttp = None
+
+from signer_client import pagination
+from signer_client.client import SignerClient
+from signer_client.models import OrganizationsOrganizationUserModel
+
+USERS = [{'id': 'u%03d' % i, 'name': 'User %d' % i,
+          'email': 'user%d@example.com' % i} for i in range(47)]
+DOCUMENTS = [{'id': 'd%03d' % i, 'name': 'Document %d' % i,
+              'status': ('Pending', 'Concluded', 'Canceled')[i % 3]}
+             for i in range(95)]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves `USERS` by offset, answering after `delay` seconds with at
+    most `max_limit` items, and records the requested offsets."""
+
+    protocol_version = 'HTTP/1.1'
+    delay = 0
+    max_limit = None
+    offsets = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        offset = int(query.get('Offset', ['0'])[0])
+        limit = int(query.get('Limit', ['20'])[0])
+        if self.max_limit is not None:
+            limit = min(limit, self.max_limit)
+        type(self).offsets.append(offset)
+        time.sleep(self.delay)
+        if url.path == '/api/documents':
+            items = [document for document in DOCUMENTS
+                     if document['status'] in query.get('Status',
+                                                        [document['status']])]
+        else:
+            items = USERS
+        body = json.dumps({'items': items[offset:offset + limit],
+                           'totalCount': len(items),
+                           'nextCursor': None}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _pages(items, total=True):
+    """Returns a fetch function over `items`, and the calls it gets."""
+    calls = []
+
+    def fetch(offset, limit):
+        calls.append((offset, limit))
+        page = {'items': items[offset:offset + limit]}
+        if total:
+            page['totalCount'] = len(items)
+        return page
+    return fetch, calls
+
+
+class TestPagination(unittest.TestCase):
+    """signer_client.pagination"""
+
+    def test_iter_items(self):
+        fetch, calls = _pages(list(range(10)))
+        self.assertEqual(list(pagination.iter_items(fetch, page_size=3)),
+                         list(range(10)))
+        self.assertEqual(sorted(calls), [(0, 3), (3, 3), (6, 3), (9, 3)])
+
+    def test_offset(self):
+        fetch, _ = _pages(list(range(10)))
+        self.assertEqual(
+            list(pagination.iter_items(fetch, page_size=4, offset=5)),
+            [5, 6, 7, 8, 9])
+
+    def test_no_total_count(self):
+        # the first short page ends the listing
+        fetch, _ = _pages(list(range(7)), total=False)
+        pages = list(pagination.iter_pages(fetch, page_size=3, prefetch=0))
+        self.assertEqual([page['items'] for page in pages],
+                         [[0, 1, 2], [3, 4, 5], [6]])
+
+    def test_smaller_server_pages(self):
+        items = list(range(23))
+
+        def fetch(offset, limit):
+            return {'items': items[offset:offset + min(limit, 5)],
+                    'totalCount': len(items)}
+        self.assertEqual(list(pagination.iter_items(fetch, page_size=10)),
+                         items)
+
+    def test_empty(self):
+        fetch, calls = _pages([])
+        self.assertEqual(list(pagination.iter_items(fetch)), [])
+
+    def test_errors(self):
+        def fetch(offset, limit):
+            if offset:
+                raise RuntimeError('page %d' % offset)
+            return {'items': [1, 2], 'totalCount': 10}
+        items = pagination.iter_items(fetch, page_size=2)
+        self.assertEqual([next(items), next(items)], [1, 2])
+        with self.assertRaises(RuntimeError):
+            next(items)
+        with self.assertRaises(ValueError):
+            list(pagination.iter_items(lambda offset, limit: b'{}'))
+        with self.assertRaises(ValueError):
+            pagination.iter_items(fetch, page_size=0)
+        with self.assertRaises(ValueError):
+            pagination.iter_pages(fetch, prefetch=-1)
+
+    def test_item_fields(self):
+        self.assertIsNone(pagination.item_fields(None))
+        self.assertEqual(pagination.item_fields('id'),
+                         ('items.id', 'totalCount'))
+        self.assertEqual(pagination.item_fields(['id', 'name']),
+                         ('items.id', 'items.name', 'totalCount'))
+
+    def test_aiter_items(self):
+        items = list(range(11))
+
+        async def fetch(offset, limit):
+            await asyncio.sleep(0)
+            return {'items': items[offset:offset + limit],
+                    'totalCount': len(items)}
+
+        async def run():
+            return [item async for item in
+                    pagination.aiter_items(fetch, page_size=4, prefetch=1)]
+        self.assertEqual(asyncio.run(run()), items)
+
+
+class TestScan(unittest.TestCase):
+    """signer_client.pagination.scan_items"""
+
+    def test_scan_items(self):
+        items = list(range(1, 24))
+        fetch, calls = _pages(items)
+        self.assertEqual(list(pagination.scan_items(
+            fetch, page_size=5, parallelism=3, key=None)), items)
+        self.assertEqual(sorted(calls),
+                         [(0, 5), (5, 5), (10, 5), (15, 5), (20, 5)])
+
+    def test_bounded_parallelism(self):
+        running = []
+        peak = []
+        lock = threading.Lock()
+        items = list(range(60))
+
+        def fetch(offset, limit):
+            with lock:
+                running.append(offset)
+                peak.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.remove(offset)
+            return {'items': items[offset:offset + limit],
+                    'totalCount': len(items)}
+        self.assertEqual(list(pagination.scan_items(
+            fetch, page_size=4, parallelism=3, key=None)), items)
+        self.assertLessEqual(max(peak), 3)
+
+    def test_shifted_items(self):
+        # an item inserted at the start after the first page shifts the
+        # others to later offsets: the last item of each page comes again
+        items = ['i%02d' % i for i in range(20)]
+
+        def fetch(offset, limit):
+            current = items if offset == 0 else ['new'] + items
+            return {'items': [{'id': item}
+                              for item in current[offset:offset + limit]],
+                    'totalCount': len(current)}
+        self.assertEqual(
+            [item['id'] for item in pagination.scan_items(fetch,
+                                                          page_size=6)],
+            items)
+
+    def test_overlap(self):
+        # an item deleted after the first page shifts the others to
+        # earlier offsets: the first item of each page would be missed
+        items = ['i%02d' % i for i in range(20)]
+
+        def fetch(offset, limit):
+            current = items if offset == 0 else items[1:]
+            return {'items': [{'id': item}
+                              for item in current[offset:offset + limit]],
+                    'totalCount': len(current)}
+        self.assertNotEqual(
+            [item['id'] for item in pagination.scan_items(fetch,
+                                                          page_size=6)],
+            items)
+        self.assertEqual(
+            [item['id'] for item in pagination.scan_items(
+                fetch, page_size=6, overlap=2)],
+            items)
+
+    def test_partitions(self):
+        even, even_calls = _pages([{'id': i} for i in range(0, 20, 2)])
+        odd, odd_calls = _pages([{'id': i} for i in range(1, 20, 2)])
+        self.assertEqual(
+            [item['id'] for item in pagination.scan_items(
+                [even, odd], page_size=3, parallelism=4)],
+            list(range(0, 20, 2)) + list(range(1, 20, 2)))
+
+    def test_smaller_server_pages(self):
+        items = list(range(17))
+
+        def fetch(offset, limit):
+            return {'items': items[offset:offset + min(limit, 4)],
+                    'totalCount': len(items)}
+        self.assertEqual(list(pagination.scan_items(
+            fetch, page_size=10, key=None)), items)
+
+    def test_capped_server_pages_with_overlap(self):
+        # the server returns at most 20 items whatever the limit
+        items = [{'id': i} for i in range(100)]
+        calls = []
+
+        def fetch(offset, limit):
+            calls.append((offset, limit))
+            return {'items': items[offset:offset + min(limit, 20)],
+                    'totalCount': len(items)}
+        self.assertEqual(list(pagination.scan_items(
+            fetch, page_size=50, overlap=5)), items)
+        self.assertTrue(all(offset >= 0 and limit <= 50
+                            for offset, limit in calls))
+
+        with self.assertRaises(ValueError):
+            # pages of 20 items cannot hold an overlap of 30
+            list(pagination.scan_items(fetch, page_size=50, overlap=30))
+
+    def test_short_page(self):
+        items = list(range(30))
+
+        def fetch(offset, limit):
+            page = items[offset:offset + limit]
+            return {'items': page[:3] if offset == 10 else page,
+                    'totalCount': len(items)}
+        with self.assertRaises(ValueError):
+            list(pagination.scan_items(fetch, page_size=10, key=None))
+
+    def test_errors(self):
+        fetch, _ = _pages(list(range(10)))
+        with self.assertRaises(ValueError):
+            pagination.scan_items(fetch, parallelism=0)
+        with self.assertRaises(ValueError):
+            pagination.scan_items(fetch, page_size=5, overlap=5)
+        fetch, _ = _pages(list(range(10)), total=False)
+        with self.assertRaises(ValueError):
+            list(pagination.scan_items(fetch, page_size=5))
+
+    def test_ordered_results(self):
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def square(value):
+            with lock:
+                running.append(value)
+                peak.append(len(running))
+            time.sleep(0.01 * (value % 3))
+            with lock:
+                running.remove(value)
+            return value * value
+        self.assertEqual(
+            list(pagination.ordered_results(
+                [(square, value) for value in range(12)], window=4)),
+            [value * value for value in range(12)])
+        self.assertLessEqual(max(peak), 4)
+        with self.assertRaises(ValueError):
+            pagination.ordered_results([], window=0)
+
+    def test_ascan_items(self):
+        items = [{'id': i} for i in range(13)]
+
+        async def fetch(offset, limit):
+            await asyncio.sleep(0)
+            return {'items': items[offset:offset + limit],
+                    'totalCount': len(items)}
+
+        async def run():
+            return [item async for item in pagination.ascan_items(
+                [fetch, fetch], page_size=4, parallelism=2)]
+        self.assertEqual(asyncio.run(run()), items)
+
+
+class TestIterators(unittest.TestCase):
+    """Iterators of SignerClient over a local server"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        cls.server.daemon_threads = True
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.host = 'http://127.0.0.1:%d' % cls.server.server_address[1]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        _Handler.delay = 0
+        _Handler.max_limit = None
+        _Handler.offsets = []
+        self.client = SignerClient('app|key', self.host)
+
+    def tearDown(self):
+        self.client.close()
+
+    def test_all_users(self):
+        users = list(self.client.iter_organization_users(page_size=10))
+        for user in users:
+            self.assertIsInstance(user, OrganizationsOrganizationUserModel)
+        self.assertEqual([user.id for user in users],
+                         [user['id'] for user in USERS])
+        self.assertEqual(sorted(_Handler.offsets), [0, 10, 20, 30, 40])
+
+    def test_dict_fields(self):
+        self.assertEqual(
+            list(self.client.iter_organization_users(
+                page_size=20, response_format='dict', fields=['email']))[:2],
+            [{'email': 'user0@example.com'}, {'email': 'user1@example.com'}])
+        with self.assertRaises(ValueError):
+            self.client.iter_organization_users(response_format='raw')
+
+    def test_smaller_server_pages(self):
+        _Handler.max_limit = 8
+        users = list(self.client.iter_organization_users(page_size=20))
+        self.assertEqual([user.id for user in users],
+                         [user['id'] for user in USERS])
+
+    def test_configuration(self):
+        self.client.configuration.page_size = 25
+        self.client.configuration.prefetch_pages = 0
+        self.assertEqual(len(list(self.client.iter_organization_users())),
+                         len(USERS))
+        self.assertEqual(_Handler.offsets, [0, 25])
+
+    def test_prefetch(self):
+        # pages are requested while the previous ones are read
+        _Handler.delay = 0.1
+        start = time.monotonic()
+        users = list(self.client.iter_organization_users(page_size=5,
+                                                         prefetch=9))
+        elapsed = time.monotonic() - start
+        self.assertEqual(len(users), len(USERS))
+        # 1 second one page after the other
+        self.assertLess(elapsed, 0.5)
+
+    def test_scan_documents(self):
+        documents = list(self.client.scan_documents(page_size=10,
+                                                    parallelism=4))
+        self.assertEqual([document.id for document in documents],
+                         [document['id'] for document in DOCUMENTS])
+
+    def test_scan_documents_partitions(self):
+        statuses = ('Concluded', 'Pending', 'Canceled')
+        documents = list(self.client.scan_documents(
+            partitions=[{'status': status} for status in statuses],
+            page_size=7, response_format='dict', fields=['status']))
+        self.assertEqual(
+            documents,
+            [{'id': document['id'], 'status': status} for status in statuses
+             for document in DOCUMENTS if document['status'] == status])
+        with self.assertRaises(ValueError):
+            self.client.scan_documents(partitions=[{'order': 'Asc'}])
+
+    @unittest.skipIf(aiohttp is None, 'aiohttp is not installed')
+    def test_asyncio(self):
+        from signer_client.aio import AsyncSignerClient
+
+        _Handler.max_limit = 15
+
+        async def run():
+            async with AsyncSignerClient('app|key', self.host) as client:
+                return [user.id async for user in
+                        client.iter_organization_users(page_size=20)]
+
+        self.assertEqual(asyncio.run(run()),
+                         [user['id'] for user in USERS])
+
+    @unittest.skipIf(aiohttp is None, 'aiohttp is not installed')
+    def test_asyncio_scan(self):
+        from signer_client.aio import AsyncSignerClient
+
+        async def run():
+            async with AsyncSignerClient('app|key', self.host) as client:
+                return [document.id async for document in
+                        client.scan_documents(
+                            partitions=[{'status': 'Pending'},
+                                        {'status': 'Canceled'}],
+                            page_size=8, parallelism=3)]
+
+        self.assertEqual(asyncio.run(run()),
+                         [document['id'] for document in DOCUMENTS
+                          if document['status'] == 'Pending'] +
+                         [document['id'] for document in DOCUMENTS
+                          if document['status'] == 'Canceled'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,232 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import json
+import os
+import shutil
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from signer_client.client import SignerClient
+from signer_client.configuration import Configuration
+from signer_client.rest import RESTClientObject
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 handler counting the connections it serves."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        body = json.dumps({'path': self.path}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_HEAD = do_GET
+
+
+def _serve(server):
+    server.lock = threading.Lock()
+    server.connections = 0
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _self_signed_certificate(directory):
+    path = os.path.join(directory, 'server.pem')
+    subprocess.check_call(
+        ['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes',
+         '-keyout', path, '-out', path, '-days', '1',
+         '-subj', '/CN=localhost'],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return path
+
+
+class TestPool(unittest.TestCase):
+    """Warm-up, expiry and statistics of the urllib3 transport"""
+
+    scheme = 'http'
+
+    def setUp(self):
+        self.server = _serve(ThreadingHTTPServer(('127.0.0.1', 0),
+                                                 _KeepAliveHandler))
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.configuration = Configuration()
+        self.configuration.host = '%s://localhost:%d' % (
+            self.scheme, self.server.server_address[1])
+        self.configuration.connection_pool_maxsize = 4
+        self.configuration.connection_pool_tracking = True
+
+    def _client(self):
+        client = RESTClientObject(self.configuration)
+        self.addCleanup(client.close)
+        return client
+
+    def test_hits_and_misses(self):
+        client = self._client()
+        for _ in range(3):
+            client.GET(self.configuration.host + '/api/documents')
+        stats = client.pool_stats.as_dict()
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['new_connections'], 1)
+        self.assertEqual(self.server.connections, 1)
+
+    def test_failed_connection_is_not_new(self):
+        client = self._client()
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _KeepAliveHandler)
+        url = 'http://127.0.0.1:%d/' % server.server_address[1]
+        server.server_close()
+        with self.assertRaises(Exception):
+            client.GET(url)
+        stats = client.pool_stats.as_dict()
+        self.assertGreater(stats['misses'], 0)
+        self.assertEqual(stats['new_connections'], 0)
+
+    def test_disabled(self):
+        self.configuration.connection_pool_tracking = False
+        self.configuration.tls_session_reuse = False
+        client = self._client()
+        client.GET(self.configuration.host + '/')
+        self.assertIsNone(client.pool_stats)
+        self.assertEqual(
+            client.pool_manager.connection_from_url(
+                self.configuration.host).__class__.__module__,
+            'urllib3.connectionpool')
+        with self.assertRaises(ValueError):
+            client.warm_up(1)
+
+    def test_warm_up(self):
+        client = self._client()
+        self.assertEqual(client.warm_up(3), 3)
+        # already open connections count towards the number
+        self.assertEqual(client.warm_up(3), 0)
+        # capped by the pool size
+        self.assertEqual(client.warm_up(10), 1)
+
+        errors = []
+
+        def get():
+            try:
+                client.GET(self.configuration.host + '/api/documents')
+            except Exception as e:  # pragma: no cover
+                errors.append(e)
+
+        threads = [threading.Thread(target=get) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        stats = client.pool_stats.as_dict()
+        self.assertEqual(stats['warmed_up'], 4)
+        self.assertEqual(stats['misses'], 0)
+        self.assertEqual(stats['hits'], 4)
+        self.assertEqual(self.server.connections, 4)
+
+    def test_idle_timeout(self):
+        self.configuration.connection_idle_timeout = 0.3
+        client = self._client()
+        client.GET(self.configuration.host + '/')
+        client.GET(self.configuration.host + '/')
+        time.sleep(0.4)
+        client.GET(self.configuration.host + '/')
+        stats = client.pool_stats.as_dict()
+        self.assertEqual((stats['hits'], stats['misses'], stats['expired']),
+                         (1, 2, 1))
+        self.assertEqual(self.server.connections, 2)
+
+    def test_max_lifetime(self):
+        self.configuration.connection_max_lifetime = 0.3
+        client = self._client()
+        client.warm_up(1)
+        time.sleep(0.4)
+        client.GET(self.configuration.host + '/')
+        client.GET(self.configuration.host + '/')
+        stats = client.pool_stats.as_dict()
+        self.assertEqual((stats['hits'], stats['misses'], stats['expired']),
+                         (1, 1, 1))
+
+    def test_signer_client_warm_up(self):
+        self.addCleanup(setattr, Configuration, '_default',
+                        Configuration._default)
+        Configuration.set_default(self.configuration)
+        client = SignerClient('app|key', self.configuration.host)
+        self.addCleanup(client.close)
+        self.assertEqual(client.warm_up(2), 2)
+        # counted once the server thread handles the accepted connections
+        deadline = time.monotonic() + 5
+        while self.server.connections < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.server.connections, 2)
+
+
+@unittest.skipIf(shutil.which('openssl') is None, 'openssl is not available')
+class TestTlsSessionReuse(TestPool):
+    """Same scenarios over TLS, resuming sessions"""
+
+    scheme = 'https'
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.mkdtemp()
+        cls.certificate = _self_signed_certificate(cls.directory)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directory)
+
+    def setUp(self):
+        super(TestTlsSessionReuse, self).setUp()
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(self.certificate)
+        self.server.socket = context.wrap_socket(self.server.socket,
+                                                 server_side=True)
+        self.configuration.ssl_ca_cert = self.certificate
+        self.configuration.assert_hostname = False
+        self.configuration.tls_session_reuse = True
+
+    @unittest.skip('SignerClient does not trust the test certificate')
+    def test_signer_client_warm_up(self):
+        pass
+
+    def test_session_resumed(self):
+        self.configuration.connection_max_lifetime = 0
+        client = self._client()
+        for _ in range(3):
+            client.GET(self.configuration.host + '/')
+        stats = client.pool_stats.as_dict()
+        self.assertEqual(stats['tls_handshakes'], 3)
+        self.assertEqual(stats['tls_sessions_reused'], 2)
+
+    def test_session_reuse_disabled(self):
+        self.configuration.connection_max_lifetime = 0
+        self.configuration.tls_session_reuse = False
+        client = self._client()
+        for _ in range(2):
+            client.GET(self.configuration.host + '/')
+        self.assertEqual(client.pool_stats.tls_handshakes, 0)
+        self.assertEqual(self.server.connections, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,262 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import asyncio
+import inspect
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import aiohttp  # noqa: F401
+except ImportError:
+    aiohttp = None
+
+import signer_client.api
+from signer_client import projection
+from signer_client.api.documents_api import DocumentsApi
+from signer_client.api.folders_api import FoldersApi
+from signer_client.api_client import ApiClient
+from signer_client.cache import ResponseCache
+from signer_client.client import SignerClient
+from signer_client.configuration import Configuration
+from signer_client.models import (
+    DocumentsDocumentModel,
+    PaginatedSearchResponseDocumentsDocumentListModel,
+)
+
+DOCUMENT = {
+    'id': 'd1',
+    'name': 'Contrato',
+    'status': 'Pending',
+    'updateDate': '2024-03-01T10:20:30-03:00',
+    'folder': {'id': 'f1', 'name': 'Contratos', 'parentId': None},
+    'flowActions': [
+        {'id': 'a1', 'type': 'Signer', 'status': 'Pending',
+         'user': {'name': 'Ana', 'email': 'ana@example.com'}},
+        {'id': 'a2', 'type': 'Approver', 'status': 'Completed',
+         'user': {'name': 'Rui', 'email': 'rui@example.com'}},
+    ],
+}
+LISTING = {
+    'items': [
+        {'id': 'd1', 'name': 'Contrato', 'type': 'Deed',
+         'folder': {'id': 'f1', 'name': 'Contratos'}},
+        {'id': 'd2', 'name': 'Proposta', 'type': 'Deed', 'folder': None},
+    ],
+    'totalCount': 2,
+    'nextCursor': None,
+}
+FOLDERS = {'items': [{'id': 'f1', 'name': 'Contratos', 'parentId': None}],
+           'totalCount': 1}
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+    responses_by_path = {
+        '/api/documents': LISTING,
+        '/api/documents/d1': DOCUMENT,
+        '/api/folders': FOLDERS,
+    }
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        body = json.dumps(
+            self.responses_by_path[self.path.split('?')[0]]).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class TestProjection(unittest.TestCase):
+    """signer_client.projection"""
+
+    def test_compile_fields(self):
+        self.assertEqual(
+            projection.compile_fields(('items.id', 'items.folder.name',
+                                       'totalCount')),
+            {'items': {'id': None, 'folder': {'name': None}},
+             'totalCount': None})
+        # the whole value wins over its parts, in any order
+        for fields in (('folder', 'folder.id'), ('folder.id', 'folder')):
+            self.assertEqual(projection.compile_fields(fields),
+                             {'folder': None})
+
+    def test_project(self):
+        self.assertEqual(
+            projection.project(DOCUMENT, ('id', 'folder.name',
+                                          'flowActions.user.email',
+                                          'missing', 'status.value')),
+            {'id': 'd1', 'folder': {'name': 'Contratos'},
+             'flowActions': [{'user': {'email': 'ana@example.com'}},
+                             {'user': {'email': 'rui@example.com'}}],
+             'status': 'Pending'})
+        self.assertEqual(projection.project(LISTING, ('items.folder.id',)),
+                         {'items': [{'folder': {'id': 'f1'}},
+                                    {'folder': None}]})
+
+    def test_response_options(self):
+        self.assertEqual(projection.response_options('dict', 'items.id'),
+                         ('dict', ('items.id',)))
+        self.assertEqual(projection.response_options('model'),
+                         ('model', None))
+        with self.assertRaises(ValueError):
+            projection.response_options('xml')
+        with self.assertRaises(ValueError):
+            projection.response_options('raw', ['id'])
+
+
+class _StubApiClient(object):
+    """Accepts any call of the generated methods."""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class TestGeneratedOptions(unittest.TestCase):
+    """_response_format and _fields in every generated method"""
+
+    def test_accepted(self):
+        # accepted by `Operation.bind`, which every method of
+        # templates/api.mustache goes through
+        for class_name in signer_client.api.__all__:
+            api = getattr(signer_client.api, class_name)(_StubApiClient())
+            for name, method in inspect.getmembers(api, inspect.ismethod):
+                if name.startswith('_'):
+                    continue
+                args = ['x'] * sum(
+                    1 for parameter in
+                    inspect.signature(method).parameters.values()
+                    if parameter.kind == parameter.POSITIONAL_OR_KEYWORD)
+                with self.subTest(name):
+                    method(*args, _response_format='dict', _fields=['id'])
+
+
+class TestResponseFormats(unittest.TestCase):
+    """Response formats of the generated API methods and SignerClient"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        cls.server.daemon_threads = True
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.host = 'http://127.0.0.1:%d' % cls.server.server_address[1]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.configuration = Configuration()
+        self.configuration.host = self.host
+        self.documents_api = DocumentsApi(ApiClient(self.configuration))
+
+    def test_per_call(self):
+        listing = self.documents_api.api_documents_get()
+        self.assertIsInstance(
+            listing, PaginatedSearchResponseDocumentsDocumentListModel)
+        self.assertEqual(self.documents_api.api_documents_get(
+            _response_format='dict'), LISTING)
+        raw = self.documents_api.api_documents_get(_response_format='raw')
+        self.assertIsInstance(raw, bytes)
+        self.assertEqual(json.loads(raw.decode('utf-8')), LISTING)
+        self.assertEqual(
+            self.documents_api.api_documents_id_get(
+                'd1', _response_format='dict',
+                _fields=['id', 'status', 'updateDate']),
+            {'id': 'd1', 'status': 'Pending',
+             'updateDate': '2024-03-01T10:20:30-03:00'})
+
+    def test_per_client(self):
+        self.configuration.response_format = 'dict'
+        self.assertEqual(self.documents_api.api_documents_id_get('d1'),
+                         DOCUMENT)
+        folders = FoldersApi(self.documents_api.api_client).api_folders_get(
+            _fields='items.name')
+        self.assertEqual(folders, {'items': [{'name': 'Contratos'}]})
+        document = self.documents_api.api_documents_id_get(
+            'd1', _response_format='model')
+        self.assertIsInstance(document, DocumentsDocumentModel)
+
+    def test_projected_model(self):
+        document = self.documents_api.api_documents_id_get(
+            'd1', _fields=['id', 'flowActions.user.name'])
+        self.assertIsInstance(document, DocumentsDocumentModel)
+        self.assertEqual(document.id, 'd1')
+        self.assertIsNone(document.name)
+        self.assertEqual(document.flow_actions[1].user.name, 'Rui')
+        self.assertIsNone(document.flow_actions[1].user.email)
+
+    def test_with_http_info(self):
+        data, status, headers = \
+            self.documents_api.api_documents_id_get_with_http_info(
+                'd1', _response_format='raw')
+        self.assertEqual((status, json.loads(data.decode('utf-8'))),
+                         (200, DOCUMENT))
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            self.documents_api.api_documents_get(_response_format='xml')
+        with self.assertRaises(ValueError):
+            self.documents_api.api_documents_get(_response_format='raw',
+                                                 _fields=['items'])
+
+    def test_cache_key(self):
+        self.configuration.response_cache = ResponseCache()
+        self.configuration.coalesce_requests = True
+        model = self.documents_api.api_documents_id_get('d1')
+        self.assertIsInstance(model, DocumentsDocumentModel)
+        self.assertEqual(self.documents_api.api_documents_id_get(
+            'd1', _response_format='dict'), DOCUMENT)
+        self.assertEqual(self.documents_api.api_documents_id_get(
+            'd1', _response_format='dict', _fields=['id']), {'id': 'd1'})
+
+    def test_signer_client(self):
+        with SignerClient('app|key', self.host) as client:
+            self.assertEqual(
+                client.list_documents(response_format='dict',
+                                      fields=['items.id', 'totalCount']),
+                {'items': [{'id': 'd1'}, {'id': 'd2'}], 'totalCount': 2})
+            self.assertEqual(client.get_document('d1', response_format='raw'),
+                             json.dumps(DOCUMENT).encode('utf-8'))
+        with SignerClient('app|key', self.host,
+                          response_format='dict') as client:
+            self.assertEqual(client.get_document('d1'), DOCUMENT)
+            self.assertEqual(client.list_folders(fields='items.id'),
+                             {'items': [{'id': 'f1'}]})
+            # helpers reading attributes still get models
+            self.assertEqual(client.get_document_status('d1'), 'Pending')
+            # as do the other methods and the generated APIs
+            self.assertEqual(client.configuration.response_format, 'model')
+            self.assertIsInstance(
+                client.documents_api.api_documents_id_get('d1'),
+                DocumentsDocumentModel)
+        with self.assertRaises(ValueError):
+            SignerClient('app|key', self.host, response_format='xml')
+
+    @unittest.skipIf(aiohttp is None, 'aiohttp is not installed')
+    def test_asyncio(self):
+        from signer_client.aio import AsyncSignerClient
+
+        async def run():
+            async with AsyncSignerClient('app|key', self.host,
+                                         response_format='dict') as client:
+                return await asyncio.gather(
+                    client.get_document('d1', fields=['id', 'status']),
+                    client.list_documents(response_format='raw'))
+
+        document, raw = asyncio.run(run())
+        self.assertEqual(document, {'id': 'd1', 'status': 'Pending'})
+        self.assertEqual(json.loads(raw.decode('utf-8')), LISTING)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,212 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import asyncio
+import collections
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import aiohttp  # noqa: F401
+except ImportError:
+    aiohttp = None
+
+import signer_client
+from signer_client import transport
+from signer_client.ratelimit import FileTokenBucket, RateLimiter, TokenBucket
+from signer_client.retry import RetryPolicy
+
+
+class _OkTransport(transport.Transport):
+
+    def request(self, method, url, body=None, headers=None,
+                preload_content=True, timeout=None):
+        return _OkResponse()
+
+
+class _OkResponse(object):
+    status = 200
+    reason = 'OK'
+    data = b'{}'
+    headers = {}
+
+
+class _UnavailableOnceHandler(BaseHTTPRequestHandler):
+    """Answers 503 the first time for each path, 200 afterwards."""
+
+    protocol_version = 'HTTP/1.1'
+    hits = collections.Counter()
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        with self.lock:
+            self.hits[self.path] += 1
+            hit = self.hits[self.path]
+        self.send_response(503 if hit == 1 else 200)
+        self.send_header('Retry-After', '0')
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'{}')
+
+
+def _reserve_many(path, count, queue):
+    bucket = FileTokenBucket(path, rate=1, capacity=10)
+    queue.put([bucket.reserve() for _ in range(count)])
+
+
+class TestTokenBucket(unittest.TestCase):
+    """TokenBucket and FileTokenBucket"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_burst_then_debt(self):
+        bucket = TokenBucket(rate=10, capacity=3)
+        waits = [bucket.reserve() for _ in range(5)]
+        self.assertEqual(waits[:3], [0, 0, 0])
+        self.assertAlmostEqual(waits[3], 0.1, delta=0.01)
+        self.assertAlmostEqual(waits[4], 0.2, delta=0.01)
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(0)
+
+    def test_file_bucket_shared_by_instances(self):
+        path = os.path.join(self.directory, 'bucket')
+        first = FileTokenBucket(path, rate=1, capacity=2)
+        second = FileTokenBucket(path, rate=1, capacity=2)
+        self.addCleanup(first.close)
+        self.addCleanup(second.close)
+        self.assertEqual(first.reserve(), 0)
+        self.assertEqual(second.reserve(), 0)
+        self.assertAlmostEqual(first.reserve(), 1, delta=0.05)
+
+    @unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(),
+                         'fork is not available')
+    def test_file_bucket_shared_by_processes(self):
+        path = os.path.join(self.directory, 'bucket')
+        context = multiprocessing.get_context('fork')
+        queue = context.Queue()
+        workers = [context.Process(target=_reserve_many,
+                                   args=(path, 5, queue)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        waits = sorted(w for _ in workers for w in queue.get(timeout=10))
+        for worker in workers:
+            worker.join()
+        # 10 tokens of burst, then one more second of debt per request
+        self.assertEqual(waits[:10], [0] * 10)
+        for expected, wait in zip(range(1, 11), waits[10:]):
+            self.assertAlmostEqual(wait, expected, delta=0.5)
+
+
+class TestRateLimiter(unittest.TestCase):
+    """RateLimiter routing and ApiClient integration"""
+
+    def test_route_buckets(self):
+        uploads = TokenBucket(rate=1, capacity=1)
+        limiter = RateLimiter(TokenBucket(rate=100, capacity=100),
+                              {'POST /api/uploads*': uploads})
+        self.assertIs(limiter.bucket_for('POST', '/api/uploads/bytes'),
+                      uploads)
+        self.assertIsNone(limiter.bucket_for('GET', '/api/documents'))
+        self.assertEqual(limiter.reserve('POST', '/api/uploads'), 0)
+        self.assertGreater(limiter.reserve('POST', '/api/uploads'), 0.9)
+        self.assertEqual(limiter.reserve('GET', '/api/documents'), 0)
+        self.assertEqual(limiter.stats.as_dict()['throttled'], 1)
+
+    def test_wildcard_method(self):
+        reads = TokenBucket(5)
+        limiter = RateLimiter(buckets={'* /api/documents*': reads})
+        self.assertIs(limiter.bucket_for('DELETE', '/api/documents/{id}'),
+                      reads)
+
+    def test_shared(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        limiter = RateLimiter.shared(directory, rate=10, buckets={
+            'POST /api/uploads*': (1, 1)})
+        self.assertIsInstance(limiter.default, FileTokenBucket)
+        limiter.reserve('POST', '/api/uploads')
+        self.assertEqual(len(os.listdir(directory)), 2)
+
+    def test_api_client_is_throttled(self):
+        configuration = signer_client.Configuration()
+        configuration.transport = _OkTransport()
+        limiter = RateLimiter(TokenBucket(rate=50, capacity=2))
+        configuration.rate_limiter = limiter
+        api_client = signer_client.ApiClient(configuration)
+        self.addCleanup(api_client.close)
+
+        api = signer_client.DocumentsApi(api_client)
+        for _ in range(4):
+            api.api_documents_id_delete('doc-1')
+        stats = limiter.stats.as_dict()
+        self.assertEqual(stats['requests'], 4)
+        self.assertEqual(stats['throttled'], 2)
+        self.assertAlmostEqual(stats['waited_seconds'], 0.04, delta=0.01)
+
+
+class TestRetriesThrottled(unittest.TestCase):
+    """Every attempt of a retried call takes a token"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0),
+                                         _UnavailableOnceHandler)
+        cls.server.daemon_threads = True
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.configuration = signer_client.Configuration()
+        self.configuration.host = 'http://127.0.0.1:%d' % (
+            self.server.server_address[1])
+        self.configuration.retries = RetryPolicy(backoff_factor=0)
+        self.limiter = RateLimiter(TokenBucket(rate=1000, capacity=100))
+        self.configuration.rate_limiter = self.limiter
+
+    def _call(self, api_client, key):
+        return api_client.call_api(
+            '/api/documents/{id}', 'GET', {'id': key},
+            response_type='object', _return_http_data_only=True)
+
+    def test_sync(self):
+        api_client = signer_client.ApiClient(self.configuration)
+        self.addCleanup(api_client.close)
+        self._call(api_client, 'sync-1')
+        self._call(api_client, 'sync-2')
+        self.assertEqual(self.limiter.stats.as_dict()['requests'], 4)
+        self.assertEqual(self.configuration.retries.stats.recovered, 2)
+
+    @unittest.skipIf(aiohttp is None, 'aiohttp is not installed')
+    def test_asyncio(self):
+        from signer_client.aio import AsyncApiClient
+
+        async def main():
+            async with AsyncApiClient(self.configuration) as api_client:
+                await self._call(api_client, 'async-1')
+                await self._call(api_client, 'async-2')
+
+        asyncio.run(main())
+        self.assertEqual(self.limiter.stats.as_dict()['requests'], 4)
+        self.assertEqual(self.configuration.retries.stats.recovered, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
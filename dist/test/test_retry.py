@@ -0,0 +1,257 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import collections
+import json
+import threading
+import time
+import unittest
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import aiohttp  # noqa: F401
+except ImportError:
+    aiohttp = None
+
+import signer_client
+from signer_client.rest import ApiException, RESTClientObject
+from signer_client.retry import RetryPolicy
+from signer_client.transport import Urllib3Transport
+
+
+class _FlakyHandler(BaseHTTPRequestHandler):
+    """Answers ``/<key>/<failures>/<status>`` with `status` `failures` times
+    for each key, then with 200."""
+
+    hits = collections.Counter()
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        self.rfile.read(length)
+        key, failures, status = self.path.split('?')[0].split('/')[-3:]
+        with self.lock:
+            self.hits[key] += 1
+            hit = self.hits[key]
+        if hit <= int(failures):
+            body = b'{"code": "Unavailable"}'
+            self.send_response(int(status))
+            self.send_header('Retry-After', '0')
+        else:
+            body = json.dumps({'id': key, 'hits': hit}).encode('utf-8')
+            self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_DELETE = _reply
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """RetryPolicy decisions"""
+
+    def test_methods(self):
+        policy = RetryPolicy()
+        self.assertTrue(policy.should_retry('get', 0, 503))
+        self.assertTrue(policy.should_retry('DELETE', 0))
+        self.assertFalse(policy.should_retry('POST', 0, 503))
+        self.assertFalse(policy.should_retry('GET', 0, 500))
+        self.assertFalse(policy.should_retry('GET', 3, 503))
+        self.assertTrue(RetryPolicy(retry_post=True).should_retry('POST', 0))
+
+    def test_backoff_is_jittered_and_capped(self):
+        policy = RetryPolicy(backoff_factor=1, backoff_max=5)
+        delays = [policy.backoff(10) for _ in range(100)]
+        self.assertTrue(all(0 <= d <= 5 for d in delays))
+        self.assertGreater(len(set(delays)), 1)
+
+    def test_retry_after(self):
+        policy = RetryPolicy(backoff_factor=0, retry_after_max=60)
+        self.assertEqual(policy.sleep_time(0, 503, {'Retry-After': '7'}), 7)
+        self.assertEqual(policy.sleep_time(0, 502, {'Retry-After': '7'}), 0)
+        self.assertIsNone(policy.sleep_time(0, 429, {'Retry-After': '61'}))
+        date = formatdate(time.time() + 30, usegmt=True)
+        self.assertAlmostEqual(
+            policy.sleep_time(0, 429, {'Retry-After': date}), 30, delta=2)
+        ignoring = RetryPolicy(backoff_factor=0,
+                               respect_retry_after_header=False)
+        self.assertEqual(ignoring.sleep_time(0, 503, {'Retry-After': '7'}), 0)
+
+    def test_overrides(self):
+        policy = RetryPolicy(overrides={
+            'POST /api/documents': RetryPolicy(retry_post=True),
+            'GET /api/documents/{id}': None,
+        })
+        post = policy.for_operation('post', '/api/documents')
+        self.assertTrue(post.should_retry('POST', 0))
+        self.assertIs(post.stats, policy.stats)
+        self.assertFalse(
+            policy.for_operation('GET', '/api/documents/{id}')
+            .should_retry('GET', 0))
+        self.assertIs(policy.for_operation('GET', '/api/folders'), policy)
+
+    def test_default_configuration(self):
+        self.assertIsNone(signer_client.Configuration().retries)
+
+    def test_copy(self):
+        policy = RetryPolicy(total=5, overrides={
+            'POST /api/documents': RetryPolicy(retry_post=True)})
+        copied = policy.copy()
+        self.assertEqual(copied.total, 5)
+        self.assertIsNot(copied.stats, policy.stats)
+        override = copied.for_operation('POST', '/api/documents')
+        self.assertTrue(override.retry_post)
+        self.assertIs(override.stats, copied.stats)
+        self.assertIsNot(override,
+                         policy.for_operation('POST', '/api/documents'))
+
+    def test_configurations_do_not_share_policy(self):
+        self.addCleanup(setattr, signer_client.Configuration, '_default',
+                        signer_client.Configuration._default)
+        default = signer_client.Configuration()
+        default.retries = RetryPolicy()
+        signer_client.Configuration.set_default(default)
+        first = signer_client.Configuration()
+        second = signer_client.Configuration()
+        self.assertIsNot(first.retries, second.retries)
+        first.retries.total = 0
+        first.retries.stats.record_attempt()
+        self.assertEqual(second.retries.total, 3)
+        self.assertEqual(second.retries.stats.attempts, 0)
+
+    def test_urllib3_retries(self):
+        configuration = signer_client.Configuration()
+        transport = Urllib3Transport(configuration)
+        self.addCleanup(transport.close)
+        retries = []
+
+        def request(method, url, **kwargs):
+            retries.append(kwargs['retries'])
+        transport.pool_manager.request = request
+        transport.request('GET', 'http://localhost/')
+        configuration.retries = RetryPolicy()
+        transport.request('GET', 'http://localhost/')
+        # urllib3's defaults without a policy, only redirects with one
+        self.assertEqual(retries, [None, Urllib3Transport.retries])
+
+
+class TestRetry(unittest.TestCase):
+    """Retries against a local server"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _FlakyHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.host = 'http://127.0.0.1:%d' % cls.server.server_address[1]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.configuration = signer_client.Configuration()
+        self.configuration.host = self.host
+        self.configuration.retries = RetryPolicy(backoff_factor=0.01)
+        self.rest_client = RESTClientObject(self.configuration)
+
+    def url(self, failures, status=503):
+        return '%s/%s/%d/%d' % (self.host, self.id().split('.')[-1],
+                                failures, status)
+
+    def test_get_recovers(self):
+        r = self.rest_client.GET(self.url(2))
+        self.assertEqual(json.loads(r.data)['hits'], 3)
+        stats = self.configuration.retries.stats.as_dict()
+        self.assertEqual(stats['attempts'], 3)
+        self.assertEqual(stats['retries'], 2)
+        self.assertEqual(stats['recovered'], 1)
+        self.assertEqual(stats['by_cause'], {503: 2})
+
+    def test_gives_up_after_total(self):
+        with self.assertRaises(ApiException) as context:
+            self.rest_client.DELETE(self.url(10, 429))
+        self.assertEqual(context.exception.status, 429)
+        stats = self.configuration.retries.stats
+        self.assertEqual(stats.attempts, 4)
+        self.assertEqual(stats.exhausted, 1)
+
+    def test_post_not_retried_by_default(self):
+        with self.assertRaises(ApiException):
+            self.rest_client.POST(self.url(1), body={})
+        self.assertEqual(self.configuration.retries.stats.retries, 0)
+
+    def test_post_retried_when_enabled(self):
+        r = self.rest_client.POST(self.url(1), body={},
+                                  _retry_policy=RetryPolicy(
+                                      backoff_factor=0.01, retry_post=True))
+        self.assertEqual(json.loads(r.data)['hits'], 2)
+
+    def test_connection_errors(self):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _FlakyHandler)
+        url = 'http://127.0.0.1:%d/x/0/200' % server.server_address[1]
+        server.server_close()
+        with self.assertRaises(Exception):
+            self.rest_client.GET(url, _request_timeout=1)
+        stats = self.configuration.retries.stats
+        self.assertEqual(stats.retries, 3)
+        self.assertEqual(stats.exhausted, 1)
+
+    def test_disabled(self):
+        self.configuration.retries = None
+        # urllib3 itself only retries 503 responses with a Retry-After
+        with self.assertRaises(ApiException):
+            self.rest_client.GET(self.url(1, 502))
+
+    def test_operation_override_through_api_client(self):
+        policy = self.configuration.retries
+        policy.set_override('POST /{key}/{failures}/{status}',
+                            RetryPolicy(backoff_factor=0.01, retry_post=True))
+        api_client = signer_client.ApiClient(self.configuration)
+        self.addCleanup(api_client.close)
+        data = api_client.call_api(
+            '/{key}/{failures}/{status}', 'POST',
+            path_params={'key': 'override', 'failures': 1, 'status': 503},
+            body={}, response_type='object', _return_http_data_only=True)
+        self.assertEqual(data['hits'], 2)
+        self.assertEqual(policy.stats.recovered, 1)
+
+
+@unittest.skipIf(aiohttp is None, 'aiohttp is not installed')
+class TestAsyncRetry(unittest.IsolatedAsyncioTestCase):
+    """Retries of the asyncio client"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _FlakyHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.host = 'http://127.0.0.1:%d' % cls.server.server_address[1]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    async def test_get_recovers(self):
+        from signer_client.aio.rest import AsyncRESTClientObject
+        configuration = signer_client.Configuration()
+        configuration.retries = RetryPolicy(backoff_factor=0.01)
+        rest_client = AsyncRESTClientObject(configuration)
+        self.addAsyncCleanup(rest_client.close)
+
+        r = await rest_client.request('GET', self.host + '/async/2/502')
+        self.assertEqual(json.loads(r.data)['hits'], 3)
+        with self.assertRaises(ApiException):
+            await rest_client.request('POST', self.host + '/async-post/1/503',
+                                      body={})
+        self.assertEqual(configuration.retries.stats.recovered, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
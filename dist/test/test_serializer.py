@@ -0,0 +1,155 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import datetime
+import inspect
+import unittest
+
+import six
+
+import signer_client.models
+from signer_client import deserializer, serializer
+from signer_client.api_client import ApiClient
+from signer_client.models import (
+    DocumentsCreateDocumentRequest,
+    DocumentsDocumentListModel,
+    FileUploadModel,
+    FlowActionsFlowActionCreateModel,
+    UsersParticipantUserModel,
+)
+from signer_client.multipart import FilePart
+
+_PRIMITIVE_TYPES = (float, bool, bytes, six.text_type) + six.integer_types
+
+
+def _reference(obj):
+    """`sanitize_for_serialization` before its encoders were compiled."""
+    if obj is None:
+        return None
+    elif isinstance(obj, _PRIMITIVE_TYPES + (FilePart,)):
+        return obj
+    elif isinstance(obj, list):
+        return [_reference(sub_obj) for sub_obj in obj]
+    elif isinstance(obj, tuple):
+        return tuple(_reference(sub_obj) for sub_obj in obj)
+    elif isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+    if isinstance(obj, dict):
+        obj_dict = obj
+    else:
+        obj_dict = {obj.attribute_map[attr]: getattr(obj, attr)
+                    for attr, _ in six.iteritems(obj.swagger_types)
+                    if getattr(obj, attr) is not None}
+    return {key: _reference(val) for key, val in six.iteritems(obj_dict)}
+
+
+def _sample(type_name, depth):
+    """Returns a value of a swagger type, with nested models down to
+    `depth` levels."""
+    if type_name.startswith('list['):
+        item = _sample(type_name[5:-1], depth)
+        return [item, item] if item is not None else []
+    if type_name.startswith('dict('):
+        return {'key': _sample(type_name[5:-1].split(', ', 1)[1], depth)}
+    samples = {
+        'str': 'valor é', 'int': 7, 'float': 1.5, 'bool': False,
+        'date': datetime.date(2024, 3, 1),
+        'datetime': datetime.datetime(
+            2024, 3, 1, 10, 20, 30, 123000,
+            datetime.timezone(datetime.timedelta(hours=-3))),
+        'object': {'any': [1, None]},
+        'file': '/tmp/upload.pdf',
+    }
+    if type_name in samples:
+        return samples[type_name]
+    klass = getattr(signer_client.models, type_name)
+    if not klass.swagger_types:
+        return 'EnumValue'
+    if depth == 0:
+        return None
+    return _model(klass, depth - 1)
+
+
+def _model(klass, depth=2):
+    # as the constructor does, which rejects missing required attributes
+    instance = object.__new__(klass)
+    instance.discriminator = None
+    for attr in klass.swagger_types:
+        setattr(instance, deserializer._private_name(klass, attr), None)
+    for index, (attr, attr_type) in enumerate(
+            six.iteritems(klass.swagger_types)):
+        # leave some attributes unset
+        value = _sample(attr_type, depth)
+        if index % 4 != 3 and value is not None:
+            setattr(instance, attr, value)
+    return instance
+
+
+def _model_classes():
+    return [klass for _, klass in inspect.getmembers(signer_client.models,
+                                                     inspect.isclass)
+            if hasattr(klass, 'swagger_types')]
+
+
+class TestSerializer(unittest.TestCase):
+    """signer_client.serializer"""
+
+    def test_all_models(self):
+        classes = _model_classes()
+        self.assertGreater(len(classes), 140)
+        for klass in classes:
+            with self.subTest(model=klass.__name__):
+                instance = _model(klass)
+                self.assertEqual(serializer.sanitize(instance),
+                                 _reference(instance))
+
+    def test_parameters(self):
+        values = [
+            None, 'a', 1, 2.5, True, b'raw',
+            datetime.date(2024, 3, 1),
+            ('a', [datetime.datetime(2024, 3, 1)]),
+            {'nested': {'user': UsersParticipantUserModel(name='A')}},
+            FilePart('doc.pdf', b'%PDF'),
+        ]
+        for value in values:
+            self.assertEqual(serializer.sanitize(value), _reference(value))
+        self.assertIsInstance(serializer.sanitize(values[-1]), FilePart)
+
+    def test_request(self):
+        request = DocumentsCreateDocumentRequest(
+            files=[FileUploadModel(display_name='Contrato', id='u1',
+                                   name='contrato.pdf',
+                                   content_type='application/pdf')],
+            flow_actions=[FlowActionsFlowActionCreateModel(
+                type='Signer', step=1,
+                user=UsersParticipantUserModel(name='A', email='a@b.c'))],
+            expiration_date=datetime.datetime(2024, 3, 1))
+        expected = {
+            'files': [{'displayName': 'Contrato', 'id': 'u1',
+                       'name': 'contrato.pdf',
+                       'contentType': 'application/pdf'}],
+            'flowActions': [{'user': {'name': 'A', 'email': 'a@b.c'},
+                             'type': 'Signer', 'step': 1}],
+            'expirationDate': '2024-03-01T00:00:00',
+        }
+        self.assertEqual(serializer.sanitize(request), expected)
+        self.assertEqual(ApiClient().sanitize_for_serialization(request),
+                         expected)
+
+    def test_overridden_properties(self):
+        # the lazy date subclass keeps raw strings in its __dict__
+        document = deserializer.deserialize(
+            {'id': 'd1', 'creationDate': '2024-03-01T10:20:30.1234567Z'},
+            DocumentsDocumentListModel, lazy_datetimes=True)
+        self.assertEqual(serializer.sanitize(document),
+                         {'id': 'd1',
+                          'creationDate': '2024-03-01T10:20:30.123456+00:00'})
+
+    def test_unknown_object(self):
+        with self.assertRaises(AttributeError):
+            serializer.sanitize(object())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,218 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import base64
+import hashlib
+import importlib.util
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import tracemalloc
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import aiohttp  # noqa: F401
+except ImportError:
+    aiohttp = None
+
+from signer_client import serializer, streaming
+from signer_client.client import SignerClient
+from signer_client.streaming import Base64JsonBody, read_ahead
+
+
+class _UploadBytesHandler(BaseHTTPRequestHandler):
+    """Decodes the uploaded base64 incrementally and echoes its digest."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        length = int(self.headers['Content-Length'])
+        prefix = self.rfile.read(len(b'{"bytes": "'))
+        remaining = length - len(prefix) - 2
+        digest = hashlib.sha256()
+        while remaining:
+            chunk = self.rfile.read(min(4 * 16384, remaining))
+            digest.update(base64.b64decode(chunk))
+            remaining -= len(chunk)
+        suffix = self.rfile.read(2)
+        body = json.dumps({
+            'id': (prefix + suffix).decode('ascii'),
+            'digest': digest.hexdigest(),
+        }).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class _ShortReads(io.RawIOBase):
+    """Stream returning at most 1000 bytes per read, and not seekable."""
+
+    def __init__(self, data):
+        self.data = data
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        chunk, self.data = self.data[:1000], self.data[1000:]
+        return chunk
+
+
+class TestBase64JsonBody(unittest.TestCase):
+    """Base64JsonBody encoding"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.content = os.urandom(100001)
+        self.expected = json.dumps(
+            {'bytes': base64.b64encode(self.content).decode('ascii')})
+        self.path = os.path.join(self.directory, 'scan.pdf')
+        with open(self.path, 'wb') as f:
+            f.write(self.content)
+
+    def test_sources(self):
+        for source in (self.content, memoryview(self.content),
+                       bytearray(self.content), self.path,
+                       io.BytesIO(self.content)):
+            for read_ahead_depth in (0, 2):
+                body = Base64JsonBody(source, chunk_size=1000,
+                                      read_ahead=read_ahead_depth)
+                self.assertEqual(body.to_bytes().decode('ascii'),
+                                 self.expected)
+                self.assertEqual(body.length, len(self.expected))
+                # can be sent again (retries)
+                self.assertEqual(body.to_bytes().decode('ascii'),
+                                 self.expected)
+
+    def test_sent_again_after_abort(self):
+        # a failed attempt stops reading the stream halfway
+        for read_ahead_depth in (0, 2):
+            stream = io.BytesIO(self.content)
+            body = Base64JsonBody(stream, chunk_size=1000,
+                                  read_ahead=read_ahead_depth)
+            chunks = iter(body)
+            for _ in range(5):
+                next(chunks)
+            chunks.close()
+            self.assertEqual(body.length, len(self.expected))
+            self.assertEqual(body.to_bytes().decode('ascii'), self.expected)
+
+    def test_short_reads(self):
+        body = Base64JsonBody(_ShortReads(self.content), chunk_size=3000)
+        self.assertIsNone(body.length)
+        self.assertEqual(body.to_bytes().decode('ascii'), self.expected)
+
+    def test_chunks_are_bounded(self):
+        body = Base64JsonBody(self.path, chunk_size=3 * 1024)
+        self.assertTrue(all(len(c) <= 4 * 1024 for c in body))
+
+    def test_other_copy_of_the_module(self):
+        # the root wrapper imports it as dist.signer_client.streaming
+        spec = importlib.util.spec_from_file_location(
+            'dist.signer_client.streaming', streaming.__file__)
+        copy = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(copy)
+        body = copy.Base64JsonBody(b'hello')
+        self.assertIsNot(copy.StreamingBody, streaming.StreamingBody)
+        self.assertIsInstance(body, streaming.StreamingBody)
+        self.assertNotIsInstance(io.BytesIO(b'hello'),
+                                 streaming.StreamingBody)
+        self.assertEqual(serializer.sanitize(body), body)
+
+    def test_empty(self):
+        body = Base64JsonBody(b'')
+        self.assertEqual(json.loads(body.to_bytes()), {'bytes': ''})
+        self.assertEqual(body.length, len(body.to_bytes()))
+
+    def test_read_ahead_propagates_errors(self):
+        def chunks():
+            yield b'a'
+            raise IOError('disk failure')
+
+        consumed = read_ahead(chunks(), 2)
+        self.assertEqual(next(consumed), b'a')
+        with self.assertRaises(IOError):
+            next(consumed)
+
+    def test_read_ahead_stops_producer(self):
+        produced = []
+
+        def chunks():
+            for i in range(1000):
+                produced.append(i)
+                yield i
+
+        consumed = read_ahead(chunks(), 2)
+        next(consumed)
+        consumed.close()
+        self.assertLess(len(produced), 10)
+
+
+class TestStreamingUploadBytes(unittest.TestCase):
+    """upload_file_bytes against a local server"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0),
+                                         _UploadBytesHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.host = 'http://127.0.0.1:%d' % cls.server.server_address[1]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.client = SignerClient('app|key', self.host)
+        self.addCleanup(self.client.close)
+
+    def test_upload_path_in_constant_memory(self):
+        size = 16 * 1024 * 1024
+        path = os.path.join(self.directory, 'scan.pdf')
+        with open(path, 'wb') as f:
+            f.seek(size - 4)
+            f.write(b'%EOF')
+        expected = hashlib.sha256(b'\0' * (size - 4) + b'%EOF').hexdigest()
+
+        tracemalloc.start()
+        try:
+            result = self.client.upload_file_bytes(path)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(result.digest, expected)
+        self.assertEqual(result.id, '{"bytes": ""}')
+        self.assertLess(peak, size // 8)
+
+    def test_upload_bytes(self):
+        result = self.client.upload_file_bytes(b'hello')
+        self.assertEqual(result.digest, hashlib.sha256(b'hello').hexdigest())
+
+    @unittest.skipIf(aiohttp is None, 'aiohttp is not installed')
+    def test_async_upload_bytes(self):
+        import asyncio
+        from signer_client.aio import AsyncSignerClient
+
+        async def upload():
+            async with AsyncSignerClient('app|key', self.host) as client:
+                return await client.upload_file_bytes(io.BytesIO(b'hello'))
+
+        result = asyncio.run(upload())
+        self.assertEqual(result.digest, hashlib.sha256(b'hello').hexdigest())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,237 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import datetime
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from signer_client.client import SignerClient
+from signer_client.sync import DocumentSync
+
+LISTING = ('id', 'name', 'creationDate', 'updateDate', 'folder', 'type',
+           'tags')
+START = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def _document(index, minutes):
+    created = (START + datetime.timedelta(minutes=index)).isoformat()
+    return {'id': 'd%03d' % index, 'name': 'Document %d' % index,
+            'creationDate': created,
+            'updateDate': (START + datetime.timedelta(
+                minutes=minutes)).isoformat(),
+            'folder': None, 'type': None, 'tags': [],
+            'status': 'Pending', 'isConcluded': False, 'isDeleted': False,
+            'hasSignature': False, 'description': None,
+            'filename': 'document%d.pdf' % index, 'fileSize': 100}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves `documents` newest first by `updateDate`, or by
+    `creationDate` if `by_creation`, and records the requested paths."""
+
+    protocol_version = 'HTTP/1.1'
+    documents = {}
+    by_creation = False
+    requests = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        type(self).requests.append(url.path)
+        if url.path == '/api/documents':
+            query = parse_qs(url.query)
+            offset = int(query['Offset'][0])
+            limit = int(query['Limit'][0])
+            key = 'creationDate' if self.by_creation else 'updateDate'
+            items = sorted(self.documents.values(), key=lambda d: d[key],
+                           reverse=query['Order'] == ['Desc'])
+            body = {'items': [dict((k, d[k]) for k in LISTING)
+                              for d in items[offset:offset + limit]],
+                    'totalCount': len(items)}
+        else:
+            body = self.documents.get(url.path.rsplit('/', 1)[1])
+            if body is None:
+                self.send_response(404)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class TestDocumentSync(unittest.TestCase):
+    """signer_client.sync.DocumentSync over a local server"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        cls.server.daemon_threads = True
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.host = 'http://127.0.0.1:%d' % cls.server.server_address[1]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        _Handler.documents = dict(
+            (d['id'], d) for d in (_document(i, i) for i in range(45)))
+        _Handler.by_creation = False
+        _Handler.requests = []
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'documents.db')
+        self.client = SignerClient('app|key', self.host)
+
+    def tearDown(self):
+        self.client.close()
+        shutil.rmtree(self.directory)
+
+    def _sync(self, **kwargs):
+        kwargs.setdefault('page_size', 10)
+        kwargs.setdefault('lookback', 0)
+        return DocumentSync(self.client.documents_api, self.path, **kwargs)
+
+    def _update(self, index, minutes, **fields):
+        document = _Handler.documents['d%03d' % index]
+        document['updateDate'] = (START + datetime.timedelta(
+            minutes=minutes)).isoformat()
+        document.update(fields)
+
+    def _details(self):
+        return [path for path in _Handler.requests
+                if path != '/api/documents']
+
+    def test_first_run(self):
+        with self._sync() as sync:
+            result = sync.run()
+            self.assertTrue(result.full)
+            self.assertEqual((result.listed, result.changed, result.details,
+                              result.deleted), (45, 45, 45, 0))
+            document = sync.get('d007')
+        self.assertEqual(document['name'], 'Document 7')
+        self.assertEqual(document['details'],
+                         {'status': 'Pending', 'isConcluded': False,
+                          'isDeleted': False, 'hasSignature': False,
+                          'description': None})
+        self.assertEqual(
+            result.checkpoint,
+            (START + datetime.timedelta(minutes=44)).timestamp())
+
+    def test_incremental(self):
+        with self._sync() as sync:
+            sync.run()
+            _Handler.requests = []
+            result = sync.run()
+            self.assertFalse(result.full)
+            self.assertEqual((result.changed, result.details), (0, 0))
+            self.assertEqual(_Handler.requests[0], '/api/documents')
+            self.assertEqual(self._details(), [])
+
+            self._update(3, 100, status='Concluded')
+            self._update(20, 101)
+            _Handler.documents['d100'] = _document(100, 102)
+            _Handler.requests = []
+            result = sync.run()
+            self.assertFalse(result.full)
+            self.assertEqual((result.changed, result.details), (3, 3))
+            self.assertEqual(sorted(self._details()),
+                             ['/api/documents/d003', '/api/documents/d020',
+                              '/api/documents/d100'])
+            # the first page reaches the checkpoint
+            self.assertLessEqual(_Handler.requests.count('/api/documents'),
+                                 2)
+            self.assertEqual(sync.get('d003')['details']['status'],
+                             'Concluded')
+            self.assertEqual(sync.get('d100')['name'], 'Document 100')
+
+    def test_persisted_checkpoint(self):
+        with self._sync() as sync:
+            sync.run()
+            checkpoint = sync.checkpoint
+        self._update(5, 200)
+        _Handler.requests = []
+        with self._sync() as sync:
+            self.assertEqual(sync.checkpoint, checkpoint)
+            result = sync.run()
+        self.assertFalse(result.full)
+        self.assertEqual(self._details(), ['/api/documents/d005'])
+
+    def test_unordered_listing(self):
+        with self._sync() as sync:
+            sync.run()
+            _Handler.by_creation = True
+            self._update(40, 100)
+            result = sync.run()
+        # the first page is not by update date, all the listing is read
+        self.assertTrue(result.full)
+        self.assertEqual((result.listed, result.changed), (45, 1))
+
+    def test_full_sync_deletes(self):
+        with self._sync() as sync:
+            sync.run()
+            del _Handler.documents['d010']
+            self.assertFalse(sync.run().full)
+            self.assertIsNotNone(sync.get('d010'))
+            result = sync.run(full=True)
+            self.assertEqual(result.deleted, 1)
+            self.assertIsNone(sync.get('d010'))
+        with self._sync(full_sync_interval=0) as sync:
+            self.assertTrue(sync.run().full)
+
+    def test_deleted_before_details(self):
+        with self._sync() as sync:
+            sync.run()
+            self._update(4, 100)
+            original = _Handler.documents.pop('d004')
+
+            def listed_since(since):
+                return [original]
+            sync._listed_since = listed_since
+            result = sync.run()
+            self.assertEqual((result.details, result.deleted), (1, 1))
+            self.assertIsNone(sync.get('d004'))
+
+    def test_failed_run(self):
+        with self._sync() as sync:
+            sync.run()
+            checkpoint = sync.checkpoint
+            self._update(6, 100)
+
+            def fetch_details(document_id):
+                raise RuntimeError(document_id)
+            sync._fetch_details = fetch_details
+            with self.assertRaises(RuntimeError):
+                sync.run()
+            self.assertEqual(sync.checkpoint, checkpoint)
+            del sync._fetch_details
+            result = sync.run()
+            self.assertEqual(result.changed, 1)
+            self.assertGreater(sync.checkpoint, checkpoint)
+
+    def test_detail_fields(self):
+        with self._sync() as sync:
+            sync.run()
+        _Handler.requests = []
+        with self._sync(detail_fields=['filename', 'fileSize']) as sync:
+            result = sync.run()
+            self.assertEqual((result.changed, result.details), (0, 45))
+            self.assertEqual(sync.get('d001')['details'],
+                             {'filename': 'document1.pdf', 'fileSize': 100})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import httpx
+    import h2  # noqa: F401
+except ImportError:
+    httpx = None
+
+import signer_client
+from signer_client import transport
+from signer_client.rest import ApiException, RESTClientObject
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length).decode('utf-8')
+        payload = json.dumps({
+            'method': self.command,
+            'path': self.path,
+            'contentType': self.headers.get('Content-Type'),
+            'body': body,
+        }).encode('utf-8')
+        self.send_response(404 if 'missing' in self.path else 200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_DELETE = _reply
+
+
+class _RecordingTransport(transport.Transport):
+
+    def __init__(self):
+        self.requests = []
+
+    def request(self, method, url, body=None, headers=None,
+                preload_content=True, timeout=None):
+        self.requests.append((method, url, body, dict(headers), timeout))
+        return _FakeResponse()
+
+
+class _FakeResponse(object):
+    status = 200
+    reason = 'OK'
+    data = b'{}'
+    headers = {}
+
+
+class TestTransport(unittest.TestCase):
+    """Transport selection and request encoding"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _EchoHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.host = 'http://127.0.0.1:%d' % cls.server.server_address[1]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.configuration = signer_client.Configuration()
+
+    def test_default_transport_is_urllib3(self):
+        rest_client = RESTClientObject(self.configuration)
+        self.assertIsInstance(rest_client.transport,
+                              transport.Urllib3Transport)
+        self.assertIsNotNone(rest_client.pool_manager)
+
+    def test_unknown_transport(self):
+        self.configuration.transport = 'carrier-pigeon'
+        with self.assertRaises(ValueError):
+            RESTClientObject(self.configuration)
+
+    def test_transport_instance_and_encoding(self):
+        recorder = _RecordingTransport()
+        self.configuration.transport = recorder
+        rest_client = RESTClientObject(self.configuration)
+
+        rest_client.GET('http://signer/api/documents',
+                        query_params=[('Limit', 5), ('Q', 'a b')],
+                        _request_timeout=(1, 2))
+        rest_client.POST('http://signer/api/documents', body={'title': 't'})
+        rest_client.POST('http://signer/api/uploads',
+                         headers={'Content-Type': 'multipart/form-data'},
+                         post_params=[('file', ('a.txt', b'abc', 'text/plain'))])  # noqa: E501
+
+        get, post, upload = recorder.requests
+        self.assertEqual(get[1], 'http://signer/api/documents?Limit=5&Q=a+b')
+        self.assertIsNone(get[2])
+        self.assertEqual(get[4], (1, 2))
+        self.assertEqual(json.loads(post[2]), {'title': 't'})
+        self.assertTrue(
+            upload[3]['Content-Type'].startswith('multipart/form-data; boundary='))  # noqa: E501
+        self.assertIn(b'filename="a.txt"', upload[2].to_bytes())
+
+    def test_registered_transport(self):
+        recorder = _RecordingTransport()
+        transport.register_transport('recorder', lambda *a, **kw: recorder)
+        self.addCleanup(transport.TRANSPORTS.pop, 'recorder')
+        self.configuration.transport = 'recorder'
+        self.assertIs(RESTClientObject(self.configuration).transport, recorder)
+
+    def test_urllib3_round_trip(self):
+        rest_client = RESTClientObject(self.configuration)
+        r = rest_client.POST(self.host + '/api/documents', body={'a': 1})
+        self.assertEqual(json.loads(r.data)['body'], '{"a":1}')
+        with self.assertRaises(ApiException) as context:
+            rest_client.GET(self.host + '/api/missing')
+        self.assertEqual(context.exception.status, 404)
+
+    @unittest.skipIf(httpx is None, 'httpx[http2] is not installed')
+    def test_http2_transport_round_trip(self):
+        self.configuration.transport = 'http2'
+        self.configuration.host = self.host
+        api_client = signer_client.ApiClient(self.configuration)
+        self.addCleanup(api_client.close)
+        self.assertIsInstance(api_client.rest_client.transport,
+                              transport.Http2Transport)
+
+        r = api_client.rest_client.POST(self.host + '/api/documents',
+                                        query_params=[('x', 1)],
+                                        body={'a': 1})
+        echoed = json.loads(r.data)
+        self.assertEqual(echoed['path'], '/api/documents?x=1')
+        self.assertEqual(echoed['body'], '{"a":1}')
+        self.assertEqual(r.getheader('content-type'), 'application/json')
+
+        raw = api_client.rest_client.GET(self.host + '/api/documents',
+                                         _preload_content=False)
+        self.assertIn(b'/api/documents', b''.join(raw.stream(4)))
+        raw.release_conn()
+
+        with self.assertRaises(ApiException) as context:
+            api_client.rest_client.DELETE(self.host + '/api/missing')
+        self.assertEqual(context.exception.status, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,8 +4,10 @@ if (-not (Test-Path -Path swagger-codegen-cli.jar)) {
     wget https://repo1.maven.org/maven2/io/swagger/codegen/v3/swagger-codegen-cli/3.0.68/swagger-codegen-cli-3.0.68.jar -O swagger-codegen-cli.jar
 }
 
-# Generate the library
-java -jar swagger-codegen-cli.jar generate -i https://signer-lac.azurewebsites.net/swagger/api/swagger.json -l python -o ./dist -c swagger-codegen-config-simple.json   
+# Generate the library. templates/api.mustache replaces the stock API
+# template: the methods dispatch through the Operation descriptors it writes
+# from the spec, see signer_client/operations.py
+java -jar swagger-codegen-cli.jar generate -i https://signer-lac.azurewebsites.net/swagger/api/swagger.json -l python -o ./dist -c swagger-codegen-config-simple.json -t templates
 
 # Manual files section
 
@@ -17,11 +19,17 @@ Copy-Item -Path "manually_generated_files/documents_create_document_request.py"
 
 # End of manual files section
 
-# Add the import statement to dist/signer_client/__init__.py
+# Export SignerClient from dist/signer_client/__init__.py. The file is kept
+# by .swagger-codegen-ignore and imports its exports lazily through the
+# _EXPORTS map, an eager import would load the whole client on startup.
 if (Test-Path -Path "dist/signer_client/__init__.py") {
     $content = Get-Content "dist/signer_client/__init__.py" -Raw
-    if ($content -notmatch "from signer_client.client import SignerClient") {
-        Add-Content "dist/signer_client/__init__.py" "from signer_client.client import SignerClient"
+    if ($content -notmatch "'SignerClient': 'signer_client.client'") {
+        if ($content -notmatch "_EXPORTS = \{") {
+            throw "dist/signer_client/__init__.py has no _EXPORTS map, restore the lazy version listed in dist/.swagger-codegen-ignore"
+        }
+        $content = $content -replace "(_EXPORTS = \{\r?\n)", "`$1    'SignerClient': 'signer_client.client',`n"
+        Set-Content "dist/signer_client/__init__.py" $content -NoNewline
     }
 } else {
     # Throw an error
@@ -7,9 +7,12 @@ for digital signatures, document management, and workflow automation.
 Based on the Lacuna Signer documentation: https://docs.lacunasoftware.com/pt-br/articles/signer/index.html
 """
 
+from __future__ import annotations
+
 import os
 import base64
-from typing import List, Dict, Any, Optional, Union, BinaryIO
+import functools
+from typing import TYPE_CHECKING, List, Dict, Any, Iterator, Optional, Union, BinaryIO, Callable
 from pathlib import Path
 
 # Import the generated client
@@ -21,84 +24,103 @@ from signer_client import (
     DocumentsApi, FlowsApi, FoldersApi, MarksSessionsApi, 
     NotificationsApi, OrganizationsApi, UploadApi
 )
+from signer_client.download import (
+    DEFAULT_CHUNK_SIZE, DownloadResult, download_response
+)
+from signer_client.deadline import deadline
+from signer_client.pagination import item_fields, iter_items, scan_items
+from signer_client.projection import MODEL, RAW, response_options
+from signer_client.streaming import Base64JsonBody
+# used at run time; the other models only appear in annotations, which are
+# not evaluated, so that importing the client does not load all the models
 from signer_client.models import (
-    # Document Models
-    DocumentsCreateDocumentRequest, DocumentsCreateDocumentResult,
-    DocumentsDocumentModel, DocumentsDocumentListModel,
-    DocumentsDocumentFileModel, DocumentsDocumentContentModel,
-    DocumentsDocumentSignaturesInfoModel, DocumentsDocumentPermissionsModel,
-    DocumentsDocumentTagModel, DocumentsDocumentTagData,
-    DocumentsDocumentAdditionalInfoData, DocumentsCreatorModel,
-    
-    # Document Request Models
-    DocumentsActionUrlRequest, DocumentsActionUrlResponse,
-    DocumentsCancelDocumentRequest, DocumentsDocumentAddVersionRequest,
-    DocumentsDocumentFlowEditRequest, DocumentsDocumentNotifiedEmailsEditRequest,
-    DocumentsEnvelopeAddVersionRequest, DocumentsMoveDocumentRequest,
-    DocumentsMoveDocumentBatchRequest, DocumentsPrePositionedMarkModel,
-    DocumentsFlowActionPendingModel,
-    
-    # Document Flow Models
-    DocumentFlowsDocumentFlowCreateRequest, DocumentFlowsDocumentFlowModel,
-    DocumentFlowsDocumentFlowData, DocumentFlowsDocumentFlowDetailsModel,
-    
-    # Folder Models
-    FoldersFolderCreateRequest, FoldersFolderInfoModel, FoldersFolderOrganizationModel,
-    FoldersFolderDeleteRequest,
-    
-    # Upload Models
-    UploadsUploadBytesRequest, UploadsUploadBytesModel, FileModel, UploadModel, FileUploadModel,
-    
-    # Flow Action Models
-    FlowActionsFlowActionCreateModel, FlowActionsFlowActionModel,
-    FlowActionsFlowActionEditModel, FlowActionsDocumentFlowEditResponse,
-    FlowActionsApprovalModel, FlowActionsSignatureModel, FlowActionsPendingActionModel,
-    FlowActionsRectifiedParticipantModel, FlowActionsSignRuleUserModel,
-    FlowActionsSignRuleUserEditModel, FlowActionsXadesOptionsModel,
-    
-    # User Models
-    UsersParticipantUserModel,
-    
-    # Enum Types
-    DocumentStatus, DocumentTypes, FolderType, FlowActionType,
-    SignatureTypes, AuthenticationTypes, PaginationOrders,
-    DocumentDownloadTypes, DocumentTicketType, DocumentFilterStatus,
-    DocumentQueryTypes, DocumentMarkType,
-    
-    # Notification Models
-    NotificationsCreateFlowActionReminderRequest, NotificationsEmailListNotificationRequest,
-    
-    # Pagination Models
-    PaginatedSearchResponseDocumentsDocumentListModel, 
-    PaginatedSearchResponseFoldersFolderInfoModel,
-    PaginatedSearchResponseDocumentFlowsDocumentFlowModel,
-    PaginatedSearchResponseOrganizationsOrganizationUserModel,
-    
-    # Organization Models
-    OrganizationsOrganizationUserPostRequest, OrganizationsOrganizationUserModel,
-    
-    # Mark Session Models
-    DocumentMarkMarksSessionCreateRequest, DocumentMarkMarksSessionCreateResponse,
-    DocumentMarkMarksSessionModel, DocumentMarkDocumentMarkPositionModel,
-    DocumentMarkFlowActionPositionModel, DocumentMarkPrePositionedDocumentMarkModel,
-    DocumentMarkUploadTicketModel,
-    
-    # Other Models
-    BatchItemResultModel, TicketModel, SignatureSignaturesInfoRequest,
-    RefusalRefusalRequest, RefusalRefusalModel, SignerModel,
-    
-    # Webhook Models
-    WebhooksDocumentSignedModel, WebhooksDocumentApprovedModel,
-    WebhooksDocumentRefusedModel, WebhooksDocumentConcludedModel,
-    WebhooksDocumentCanceledModel, WebhooksDocumentExpiredModel,
-    WebhooksDocumentsCreatedModel, WebhooksDocumentsDeletedModel,
-    WebhooksDocumentsDeletedAction, WebhooksDocumentInformationModel,
-    
-    # Health Document Models
-    HealthDocumentsHealthDocumentData, HealthDocumentsHealthItemModel,
-    HealthDocumentsHealthProfessionalModel
+    AuthenticationTypes, DocumentFlowsDocumentFlowCreateRequest,
+    DocumentsActionUrlRequest, DocumentsCreateDocumentRequest,
+    DocumentsDocumentNotifiedEmailsEditRequest,
+    DocumentsMoveDocumentBatchRequest, DocumentsMoveDocumentRequest,
+    FlowActionType, FlowActionsFlowActionCreateModel,
+    UsersParticipantUserModel
 )
 
+if TYPE_CHECKING:
+    from signer_client.models import (
+        # Document Models
+        DocumentsCreateDocumentRequest, DocumentsCreateDocumentResult,
+        DocumentsDocumentModel, DocumentsDocumentListModel,
+        DocumentsDocumentFileModel, DocumentsDocumentContentModel,
+        DocumentsDocumentSignaturesInfoModel, DocumentsDocumentPermissionsModel,
+        DocumentsDocumentTagModel, DocumentsDocumentTagData,
+        DocumentsDocumentAdditionalInfoData, DocumentsCreatorModel,
+
+        # Document Request Models
+        DocumentsActionUrlRequest, DocumentsActionUrlResponse,
+        DocumentsCancelDocumentRequest, DocumentsDocumentAddVersionRequest,
+        DocumentsDocumentFlowEditRequest, DocumentsDocumentNotifiedEmailsEditRequest,
+        DocumentsEnvelopeAddVersionRequest, DocumentsMoveDocumentRequest,
+        DocumentsMoveDocumentBatchRequest, DocumentsPrePositionedMarkModel,
+        DocumentsFlowActionPendingModel,
+
+        # Document Flow Models
+        DocumentFlowsDocumentFlowCreateRequest, DocumentFlowsDocumentFlowModel,
+        DocumentFlowsDocumentFlowData, DocumentFlowsDocumentFlowDetailsModel,
+
+        # Folder Models
+        FoldersFolderCreateRequest, FoldersFolderInfoModel, FoldersFolderOrganizationModel,
+        FoldersFolderDeleteRequest,
+
+        # Upload Models
+        UploadsUploadBytesRequest, UploadsUploadBytesModel, FileModel, UploadModel, FileUploadModel,
+
+        # Flow Action Models
+        FlowActionsFlowActionCreateModel, FlowActionsFlowActionModel,
+        FlowActionsFlowActionEditModel, FlowActionsDocumentFlowEditResponse,
+        FlowActionsApprovalModel, FlowActionsSignatureModel, FlowActionsPendingActionModel,
+        FlowActionsRectifiedParticipantModel, FlowActionsSignRuleUserModel,
+        FlowActionsSignRuleUserEditModel, FlowActionsXadesOptionsModel,
+
+        # User Models
+        UsersParticipantUserModel,
+
+        # Enum Types
+        DocumentStatus, DocumentTypes, FolderType, FlowActionType,
+        SignatureTypes, AuthenticationTypes, PaginationOrders,
+        DocumentDownloadTypes, DocumentTicketType, DocumentFilterStatus,
+        DocumentQueryTypes, DocumentMarkType,
+
+        # Notification Models
+        NotificationsCreateFlowActionReminderRequest, NotificationsEmailListNotificationRequest,
+
+        # Pagination Models
+        PaginatedSearchResponseDocumentsDocumentListModel, 
+        PaginatedSearchResponseFoldersFolderInfoModel,
+        PaginatedSearchResponseDocumentFlowsDocumentFlowModel,
+        PaginatedSearchResponseOrganizationsOrganizationUserModel,
+
+        # Organization Models
+        OrganizationsOrganizationUserPostRequest, OrganizationsOrganizationUserModel,
+
+        # Mark Session Models
+        DocumentMarkMarksSessionCreateRequest, DocumentMarkMarksSessionCreateResponse,
+        DocumentMarkMarksSessionModel, DocumentMarkDocumentMarkPositionModel,
+        DocumentMarkFlowActionPositionModel, DocumentMarkPrePositionedDocumentMarkModel,
+        DocumentMarkUploadTicketModel,
+
+        # Other Models
+        BatchItemResultModel, TicketModel, SignatureSignaturesInfoRequest,
+        RefusalRefusalRequest, RefusalRefusalModel, SignerModel,
+
+        # Webhook Models
+        WebhooksDocumentSignedModel, WebhooksDocumentApprovedModel,
+        WebhooksDocumentRefusedModel, WebhooksDocumentConcludedModel,
+        WebhooksDocumentCanceledModel, WebhooksDocumentExpiredModel,
+        WebhooksDocumentsCreatedModel, WebhooksDocumentsDeletedModel,
+        WebhooksDocumentsDeletedAction, WebhooksDocumentInformationModel,
+
+        # Health Document Models
+        HealthDocumentsHealthDocumentData, HealthDocumentsHealthItemModel,
+        HealthDocumentsHealthProfessionalModel
+    )
+
 
 class SignerClient:
     """
@@ -114,17 +136,26 @@ class SignerClient:
     - Support for various document types (contracts, proposals, medical reports, etc.)
     """
     
-    def __init__(self, api_key: str, base_url: str = "https://signer-demo.lacunasoftware.com"):
+    def __init__(self, api_key: str, base_url: str = "https://signer-demo.lacunasoftware.com",
+                 response_format: str = MODEL):
         """
         Initialize the Signer client.
         
         Args:
             api_key: Your API key in the format 'your-app|xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx'
             base_url: The base URL for the Signer API (defaults to demo environment)
+            response_format: What the listing and detail methods (get_*,
+                list_*, iter_* and scan_*) return by default: 'model',
+                'dict' (the decoded JSON) or 'raw' (the response bytes), see
+                signer_client.projection; the other methods return models
         """
+        response_options(response_format)
         self.configuration = Configuration()
         self.configuration.host = base_url
         self.configuration.api_key = {'X-Api-Key': api_key}
+        # only for the listing and detail methods, unlike
+        # configuration.response_format which applies to every call
+        self.response_format = response_format
         self.api_client = ApiClient(configuration=self.configuration)
         
         # Initialize all API clients
@@ -152,17 +183,23 @@ class SignerClient:
         """
         return self.documents_api.api_documents_post(body=document_request)
     
-    def get_document(self, document_id: str) -> DocumentsDocumentModel:
+    def get_document(self, document_id: str,
+                     response_format: Optional[str] = None,
+                     fields: Optional[List[str]] = None) -> DocumentsDocumentModel:
         """
         Get document details by ID.
         
         Args:
             document_id: The document ID
+            response_format: 'model', 'dict' or 'raw' (defaults to the
+                response_format of the client)
+            fields: JSON paths to keep, e.g. ['id', 'status', 'updateDate']
             
         Returns:
             Document details
         """
-        return self.documents_api.api_documents_id_get(document_id)
+        return self.documents_api.api_documents_id_get(
+            document_id, _response_format=response_format or self.response_format, _fields=fields)
     
     def list_documents(self, 
                       status: Optional[DocumentStatus] = None,
@@ -171,7 +208,9 @@ class SignerClient:
                       query: Optional[str] = None,
                       limit: int = 20,
                       offset: int = 0,
-                      order: Optional[PaginationOrders] = None) -> PaginatedSearchResponseDocumentsDocumentListModel:
+                      order: Optional[PaginationOrders] = None,
+                      response_format: Optional[str] = None,
+                      fields: Optional[List[str]] = None) -> PaginatedSearchResponseDocumentsDocumentListModel:
         """
         List documents with optional filtering.
         
@@ -183,6 +222,9 @@ class SignerClient:
             limit: Number of items to return
             offset: Pagination offset
             order: Sort order
+            response_format: 'model', 'dict' or 'raw' (defaults to the
+                response_format of the client)
+            fields: JSON paths to keep, e.g. ['items.id', 'totalCount']
             
         Returns:
             Paginated list of documents
@@ -194,20 +236,192 @@ class SignerClient:
             q=query,
             limit=limit,
             offset=offset,
-            order=order
+            order=order,
+            _response_format=response_format or self.response_format,
+            _fields=fields
         )
     
-    def get_document_content(self, document_id: str) -> bytes:
+    def iter_documents(self,
+                       status: Optional[DocumentStatus] = None,
+                       folder_id: Optional[str] = None,
+                       document_type: Optional[DocumentTypes] = None,
+                       query: Optional[str] = None,
+                       order: Optional[PaginationOrders] = None,
+                       page_size: Optional[int] = None,
+                       prefetch: Optional[int] = None,
+                       response_format: Optional[str] = None,
+                       fields: Optional[List[str]] = None) -> Iterator[DocumentsDocumentListModel]:
+        """
+        Iterate over all the documents matching the filters, page after page.
+        
+        The next pages are requested while the current one is read, see
+        signer_client.pagination.
+        
+        Args:
+            status: Filter by document status
+            folder_id: Filter by folder ID
+            document_type: Filter by document type
+            query: Search query
+            order: Sort order
+            page_size: Documents per request (defaults to
+                configuration.page_size)
+            prefetch: Pages requested ahead (defaults to
+                configuration.prefetch_pages)
+            response_format: 'model' or 'dict' (defaults to the
+                response_format of the client)
+            fields: JSON paths of the documents to keep, e.g. ['id', 'status']
+            
+        Returns:
+            Iterator over the documents
+        """
+        fields = item_fields(fields)
+        return self._iter_items(
+            lambda offset, limit: self.documents_api.api_documents_get(
+                status=status,
+                folder_id=folder_id,
+                document_type=document_type,
+                q=query,
+                limit=limit,
+                offset=offset,
+                order=order,
+                _response_format=response_format or self.response_format,
+                _fields=fields
+            ),
+            page_size, prefetch, response_format)
+    
+    def scan_documents(self,
+                       status: Optional[DocumentStatus] = None,
+                       folder_id: Optional[str] = None,
+                       document_type: Optional[DocumentTypes] = None,
+                       tags: Optional[str] = None,
+                       query: Optional[str] = None,
+                       order: Optional[PaginationOrders] = None,
+                       partitions: Optional[List[Dict[str, Any]]] = None,
+                       page_size: Optional[int] = None,
+                       parallelism: Optional[int] = None,
+                       overlap: int = 0,
+                       response_format: Optional[str] = None,
+                       fields: Optional[List[str]] = None) -> Iterator[DocumentsDocumentListModel]:
+        """
+        Export all the documents matching the filters, fetching many pages at
+        a time.
+        
+        The first page gives the total count, the other pages are then
+        requested `parallelism` at a time and their documents yielded in
+        order, each once even if it moved to another page during the scan.
+        See signer_client.pagination.scan_items.
+        
+        When the listing changes a lot during the scan, split it with
+        `partitions`, filters scanned one after the other and merged:
+        
+            client.scan_documents(partitions=[
+                {'status': DocumentFilterStatus.PENDING},
+                {'status': DocumentFilterStatus.CONCLUDED},
+            ])
+        
+        Args:
+            status: Filter by document status
+            folder_id: Filter by folder ID
+            document_type: Filter by document type
+            tags: Filter by tags, see DocumentsApi.api_documents_get
+            query: Search query
+            order: Sort order
+            partitions: Filters (status, folder_id, document_type, tags) of
+                each partition, overriding the arguments of the same name
+            page_size: Documents per request (defaults to
+                configuration.page_size)
+            parallelism: Requests running at a time (defaults to
+                configuration.scan_parallelism)
+            overlap: Documents read again at the start of every page, to find
+                those moved by deletions during the scan
+            response_format: 'model' or 'dict' (defaults to the
+                response_format of the client)
+            fields: JSON paths of the documents to keep, e.g. ['id', 'status'];
+                the id is always kept
+            
+        Returns:
+            Iterator over the documents
+        """
+        self._check_pageable(response_format)
+        fields = item_fields(fields, 'id')
+        fetches = [
+            functools.partial(self._fetch_documents,
+                              dict(filters, q=query, order=order),
+                              response_format, fields)
+            for filters in self._document_partitions(
+                dict(status=status, folder_id=folder_id,
+                     document_type=document_type, tags=tags), partitions)
+        ]
+        return scan_items(
+            fetches,
+            self.configuration.page_size if page_size is None else page_size,
+            parallelism=(self.configuration.scan_parallelism
+                         if parallelism is None else parallelism),
+            overlap=overlap,
+            executor=self.configuration.executor)
+    
+    def get_document_content(self, document_id: str,
+                             download_type: Optional[DocumentDownloadTypes] = None) -> bytes:
         """
         Get document content as bytes.
         
+        The whole document is held in memory; use download_document to
+        stream large documents to disk instead.
+        
         Args:
             document_id: The document ID
+            download_type: The version of the document (DocumentDownloadTypes enum)
             
         Returns:
             Document content as bytes
         """
-        return self.documents_api.api_documents_id_content_get(document_id)
+        response = self._open_document_content(document_id, download_type)
+        try:
+            return response.data
+        finally:
+            response.release_conn()
+    
+    def download_document(self, document_id: str,
+                          destination: Union[str, os.PathLike, BinaryIO],
+                          download_type: Optional[DocumentDownloadTypes] = None,
+                          chunk_size: int = DEFAULT_CHUNK_SIZE,
+                          progress: Optional[Callable[[int, Optional[int]], None]] = None,
+                          expected_digest: Optional[str] = None,
+                          algorithm: str = 'sha256') -> DownloadResult:
+        """
+        Stream document content to a file or a writable object.
+        
+        The content is written in chunks of chunk_size bytes, so memory use
+        does not depend on the document size. A path is only replaced once
+        the download is complete and its checksum verified.
+        
+        Args:
+            document_id: The document ID
+            destination: Path of the output file, or a writable binary file object
+            download_type: The version of the document (DocumentDownloadTypes enum)
+            chunk_size: Size of the chunks read from the network
+            progress: Optional callback receiving (bytes_written, total_bytes or None)
+            expected_digest: Optional hex digest the content must match
+            algorithm: hashlib algorithm of the digest (sha256 by default)
+            
+        Returns:
+            DownloadResult with the size and digest of the content
+            
+        Raises:
+            ChecksumMismatchError: If expected_digest does not match
+        """
+        response = self._open_document_content(document_id, download_type)
+        return download_response(response, destination, chunk_size=chunk_size,
+                                 progress=progress, algorithm=algorithm,
+                                 expected_digest=expected_digest)
+    
+    def _open_document_content(self, document_id: str,
+                               download_type: Optional[DocumentDownloadTypes] = None):
+        """Request document content without reading the response body."""
+        kwargs = {'_preload_content': False}
+        if download_type is not None:
+            kwargs['type'] = download_type
+        return self.documents_api.api_documents_id_content_get(document_id, **kwargs)
     
     def get_document_content_b64(self, document_id: str) -> str:
         """
@@ -221,17 +435,23 @@ class SignerClient:
         """
         return self.documents_api.api_documents_id_content_b64_get(document_id)
     
-    def get_document_signatures_details(self, document_id: str) -> DocumentsDocumentSignaturesInfoModel:
+    def get_document_signatures_details(self, document_id: str,
+                                        response_format: Optional[str] = None,
+                                        fields: Optional[List[str]] = None) -> DocumentsDocumentSignaturesInfoModel:
         """
         Get detailed signature information for a document.
         
         Args:
             document_id: The document ID
+            response_format: 'model', 'dict' or 'raw' (defaults to the
+                response_format of the client)
+            fields: JSON paths to keep, e.g. ['signers.name']
             
         Returns:
             Document signatures details
         """
-        return self.documents_api.api_documents_id_signatures_details_get(document_id)
+        return self.documents_api.api_documents_id_signatures_details_get(
+            document_id, _response_format=response_format or self.response_format, _fields=fields)
     
     def get_document_ticket(self, document_id: str) -> TicketModel:
         """
@@ -435,7 +655,9 @@ class SignerClient:
                     limit: int = 20,
                     offset: int = 0,
                     order: Optional[PaginationOrders] = None,
-                    parent_id: Optional[str] = None) -> PaginatedSearchResponseFoldersFolderInfoModel:
+                    parent_id: Optional[str] = None,
+                    response_format: Optional[str] = None,
+                    fields: Optional[List[str]] = None) -> PaginatedSearchResponseFoldersFolderInfoModel:
         """
         List folders with optional filtering.
         
@@ -445,6 +667,9 @@ class SignerClient:
             offset: Pagination offset
             order: Sort order
             parent_id: Filter by parent folder ID
+            response_format: 'model', 'dict' or 'raw' (defaults to the
+                response_format of the client)
+            fields: JSON paths to keep, e.g. ['items.id', 'items.name']
             
         Returns:
             Paginated list of folders
@@ -455,9 +680,51 @@ class SignerClient:
             offset=offset,
             order=order,
             filter_by_parent=parent_id is not None,
-            parent_id=parent_id
+            parent_id=parent_id,
+            _response_format=response_format or self.response_format,
+            _fields=fields
         )
     
+    def iter_folders(self,
+                     query: Optional[str] = None,
+                     order: Optional[PaginationOrders] = None,
+                     parent_id: Optional[str] = None,
+                     page_size: Optional[int] = None,
+                     prefetch: Optional[int] = None,
+                     response_format: Optional[str] = None,
+                     fields: Optional[List[str]] = None) -> Iterator[FoldersFolderInfoModel]:
+        """
+        Iterate over all the folders matching the filters, page after page.
+        
+        Args:
+            query: Search query
+            order: Sort order
+            parent_id: Filter by parent folder ID
+            page_size: Folders per request (defaults to
+                configuration.page_size)
+            prefetch: Pages requested ahead (defaults to
+                configuration.prefetch_pages)
+            response_format: 'model' or 'dict' (defaults to the
+                response_format of the client)
+            fields: JSON paths of the folders to keep, e.g. ['id', 'name']
+            
+        Returns:
+            Iterator over the folders
+        """
+        fields = item_fields(fields)
+        return self._iter_items(
+            lambda offset, limit: self.folders_api.api_folders_get(
+                q=query,
+                limit=limit,
+                offset=offset,
+                order=order,
+                filter_by_parent=parent_id is not None,
+                parent_id=parent_id,
+                _response_format=response_format or self.response_format,
+                _fields=fields
+            ),
+            page_size, prefetch, response_format)
+    
     def delete_folder(self, folder_id: str, delete_request: FoldersFolderDeleteRequest) -> None:
         """
         Delete a folder.
@@ -533,20 +800,58 @@ class SignerClient:
         """
         return self.flows_api.api_document_flows_id_get(flow_id)
     
-    def list_signature_flows(self, limit: int = 20, offset: int = 0) -> List[DocumentFlowsDocumentFlowModel]:
+    def list_signature_flows(self, limit: int = 20, offset: int = 0,
+                             response_format: Optional[str] = None,
+                             fields: Optional[List[str]] = None) -> List[DocumentFlowsDocumentFlowModel]:
         """
         List signature flows.
         
         Args:
             limit: Number of flows to return
             offset: Pagination offset
+            response_format: 'model', 'dict' or 'raw' (defaults to the
+                response_format of the client); raw returns the whole page
+            fields: JSON paths of the flows to keep, e.g. ['id', 'name']
             
         Returns:
             List of flow models
         """
-        response = self.flows_api.api_document_flows_get(limit=limit, offset=offset)
+        if fields is not None:
+            fields = ['items.' + field for field in
+                      ([fields] if isinstance(fields, str) else fields)]
+        response = self.flows_api.api_document_flows_get(
+            limit=limit, offset=offset,
+            _response_format=response_format or self.response_format, _fields=fields)
+        if isinstance(response, dict):
+            return response.get('items')
         return response.items if hasattr(response, 'items') else response
     
+    def iter_signature_flows(self,
+                             page_size: Optional[int] = None,
+                             prefetch: Optional[int] = None,
+                             response_format: Optional[str] = None,
+                             fields: Optional[List[str]] = None) -> Iterator[DocumentFlowsDocumentFlowModel]:
+        """
+        Iterate over all the signature flows, page after page.
+        
+        Args:
+            page_size: Flows per request (defaults to configuration.page_size)
+            prefetch: Pages requested ahead (defaults to
+                configuration.prefetch_pages)
+            response_format: 'model' or 'dict' (defaults to the
+                response_format of the client)
+            fields: JSON paths of the flows to keep, e.g. ['id', 'name']
+            
+        Returns:
+            Iterator over the flows
+        """
+        fields = item_fields(fields)
+        return self._iter_items(
+            lambda offset, limit: self.flows_api.api_document_flows_get(
+                limit=limit, offset=offset,
+                _response_format=response_format or self.response_format, _fields=fields),
+            page_size, prefetch, response_format)
+    
     def cancel_signature_flow(self, flow_id: str, reason: Optional[str] = None) -> None:
         """
         Cancel a signature flow.
@@ -583,41 +888,38 @@ class SignerClient:
     # FILE UPLOAD
     # ============================================================================
     
-    def upload_file(self, file_path: str) -> FileModel:
+    def upload_file(self, file_path: Union[str, os.PathLike, BinaryIO]) -> FileModel:
         """
         Upload a file using multipart/form-data.
         
+        The file is streamed from disk (memory-mapped) while the request is
+        sent, so it is never loaded in memory as a whole.
+        
         Args:
-            file_path: Path to the file to upload
+            file_path: Path to the file to upload, or a binary file object
             
         Returns:
             Uploaded file details
         """
-        with open(file_path, 'rb') as file:
-            return self.upload_api.api_uploads_post(file=file)
+        if isinstance(file_path, str):
+            file_path = Path(file_path)
+        return self.upload_api.api_uploads_post(file=file_path)
     
-    def upload_file_bytes(self, file_bytes: bytes) -> UploadModel:
+    def upload_file_bytes(self, file_bytes: Union[bytes, memoryview, str, os.PathLike, BinaryIO]) -> UploadModel:
         """
         Upload file bytes to the server.
         
+        The base64 JSON body is encoded in chunks while it is sent, so the
+        upload takes constant memory whatever the size of the file.
+        
         Args:
-            file_name: Name of the file
-            file_bytes: File content as bytes
-            content_type: MIME type of the file (optional)
+            file_bytes: File content as bytes or memoryview, or the path of
+                the file, or a binary stream
             
         Returns:
             Upload model with file information
         """
-        import base64
-        
-        # Encode bytes as base64
-        base64_bytes = base64.b64encode(file_bytes).decode('utf-8')
-        
-        request = UploadsUploadBytesRequest(
-            bytes=base64_bytes
-        )
-        
-        return self.upload_api.api_uploads_bytes_post(body=request)
+        return self.upload_api.api_uploads_bytes_post(body=Base64JsonBody(file_bytes))
     
     # ============================================================================
     # NOTIFICATIONS
@@ -669,7 +971,9 @@ class SignerClient:
                               query: Optional[str] = None,
                               limit: int = 20,
                               offset: int = 0,
-                              order: Optional[PaginationOrders] = None) -> PaginatedSearchResponseOrganizationsOrganizationUserModel:
+                              order: Optional[PaginationOrders] = None,
+                              response_format: Optional[str] = None,
+                              fields: Optional[List[str]] = None) -> PaginatedSearchResponseOrganizationsOrganizationUserModel:
         """
         List organization users.
         
@@ -678,6 +982,9 @@ class SignerClient:
             limit: Number of items to return
             offset: Pagination offset
             order: Sort order
+            response_format: 'model', 'dict' or 'raw' (defaults to the
+                response_format of the client)
+            fields: JSON paths to keep, e.g. ['items.email']
             
         Returns:
             Paginated list of organization users
@@ -686,9 +993,49 @@ class SignerClient:
             q=query,
             limit=limit,
             offset=offset,
-            order=order
+            order=order,
+            _response_format=response_format or self.response_format,
+            _fields=fields
         )
     
+    def iter_organization_users(self,
+                                query: Optional[str] = None,
+                                order: Optional[PaginationOrders] = None,
+                                page_size: Optional[int] = None,
+                                prefetch: Optional[int] = None,
+                                response_format: Optional[str] = None,
+                                fields: Optional[List[str]] = None) -> Iterator[OrganizationsOrganizationUserModel]:
+        """
+        Iterate over all the users of the organization, page after page.
+        
+        A full scan runs at network speed: the next pages are requested while
+        the current one is read.
+        
+        Args:
+            query: Search query
+            order: Sort order
+            page_size: Users per request (defaults to configuration.page_size)
+            prefetch: Pages requested ahead (defaults to
+                configuration.prefetch_pages)
+            response_format: 'model' or 'dict' (defaults to the
+                response_format of the client)
+            fields: JSON paths of the users to keep, e.g. ['email']
+            
+        Returns:
+            Iterator over the users
+        """
+        fields = item_fields(fields)
+        return self._iter_items(
+            lambda offset, limit: self.organizations_api.api_organizations_users_get(
+                q=query,
+                limit=limit,
+                offset=offset,
+                order=order,
+                _response_format=response_format or self.response_format,
+                _fields=fields
+            ),
+            page_size, prefetch, response_format)
+    
     def add_organization_user(self, user_request: OrganizationsOrganizationUserPostRequest) -> OrganizationsOrganizationUserModel:
         """
         Add a user to the organization.
@@ -804,7 +1151,7 @@ class SignerClient:
         Returns:
             Document status
         """
-        document = self.get_document(document_id)
+        document = self.get_document(document_id, response_format=MODEL)
         return document.status if document.status else "Unknown"
     
     def get_signing_url(self, document_id: str, signer_email: str) -> str:
@@ -821,20 +1168,26 @@ class SignerClient:
         action_request = DocumentsActionUrlRequest(
             email_address=signer_email
         )
-        action_url = self.create_action_url(document_id, action_request)
+        action_url = self.documents_api.api_documents_id_action_url_post(
+            document_id, body=action_request, _response_format=MODEL)
         return action_url.url
     
-    def download_signed_document(self, document_id: str, output_path: str) -> None:
+    def download_signed_document(self, document_id: str, output_path: str,
+                                 **kwargs) -> DownloadResult:
         """
         Download a signed document to a local file.
         
+        The content is streamed to disk, see download_document.
+        
         Args:
             document_id: The document ID
             output_path: Path where to save the file
+            **kwargs: Options of download_document (progress, expected_digest...)
+            
+        Returns:
+            DownloadResult with the size and digest of the file
         """
-        content = self.get_document_content(document_id)
-        with open(output_path, 'wb') as f:
-            f.write(content)
+        return self.download_document(document_id, output_path, **kwargs)
     
     def get_document_summary(self, document_id: str) -> Dict[str, Any]:
         """
@@ -846,8 +1199,9 @@ class SignerClient:
         Returns:
             Document summary dictionary
         """
-        document = self.get_document(document_id)
-        signatures = self.get_document_signatures_details(document_id)
+        document = self.get_document(document_id, response_format=MODEL)
+        signatures = self.get_document_signatures_details(
+            document_id, response_format=MODEL)
         
         return {
             'id': document.id,
@@ -864,6 +1218,89 @@ class SignerClient:
     # UTILITY METHODS
     # ============================================================================
     
+    def deadline(self, seconds: float):
+        """
+        Give all the calls made within a `with` block one time budget.
+        
+        Each request of the block has its timeout capped to the time left, and
+        signer_client.deadline.DeadlineExceeded is raised once it is spent:
+        
+            with client.deadline(1.5):
+                summary = client.get_document_summary(document_id)
+        
+        Args:
+            seconds: Budget of the whole block, in seconds
+            
+        Returns:
+            Context manager yielding the signer_client.deadline.Deadline
+        """
+        return deadline(seconds)
+    
+    def warm_up(self, connections: int = 4) -> int:
+        """
+        Open keep-alive connections to the API ahead of the first requests.
+        
+        Call it when a worker starts so that its first requests do not pay for
+        the TCP and TLS handshakes. Requires
+        configuration.connection_pool_tracking with the default transport.
+        
+        Args:
+            connections: Number of connections to have open (capped by
+                configuration.connection_pool_maxsize)
+            
+        Returns:
+            Number of connections opened
+            
+        Raises:
+            ValueError: If pool tracking is disabled
+        """
+        return self.api_client.rest_client.warm_up(connections)
+    
+    def _check_pageable(self, response_format: Optional[str]) -> None:
+        """Reject the raw format, whose pages cannot be read."""
+        if (response_format or self.response_format) == RAW:
+            raise ValueError("Raw responses cannot be paginated, use the "
+                             "'model' or 'dict' response format")
+    
+    @staticmethod
+    def _document_partitions(filters: Dict[str, Any],
+                             partitions: Optional[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Filters of each partition of scan_documents."""
+        if partitions is None:
+            return [filters]
+        result = []
+        for partition in partitions:
+            unknown = set(partition) - set(filters)
+            if unknown:
+                raise ValueError("Documents cannot be partitioned by %s, only "
+                                 "by %s" % (', '.join(sorted(unknown)),
+                                            ', '.join(filters)))
+            result.append(dict(filters, **partition))
+        return result
+    
+    def _fetch_documents(self, filters: Dict[str, Any],
+                         response_format: Optional[str], fields: Optional[tuple],
+                         offset: int, limit: int) -> PaginatedSearchResponseDocumentsDocumentListModel:
+        """Fetch a page of documents for scan_documents, sending only the
+        filters that are set."""
+        filters = {name: value for name, value in filters.items()
+                   if value is not None}
+        return self.documents_api.api_documents_get(
+            limit=limit, offset=offset, _response_format=response_format or self.response_format,
+            _fields=fields, **filters)
+    
+    def _iter_items(self, fetch: Callable, page_size: Optional[int],
+                    prefetch: Optional[int],
+                    response_format: Optional[str]) -> Iterator[Any]:
+        """Iterate over the items of a listing, see signer_client.pagination."""
+        self._check_pageable(response_format)
+        return iter_items(
+            fetch,
+            self.configuration.page_size if page_size is None else page_size,
+            prefetch=(self.configuration.prefetch_pages if prefetch is None
+                      else prefetch),
+            executor=self.configuration.executor)
+    
     def close(self):
         """Close the API client and clean up resources."""
         if hasattr(self.api_client, 'close'):
@@ -8,7 +8,6 @@ Based on the Lacuna Signer documentation: https://docs.lacunasoftware.com/pt-br/
 """
 
 import os
-import base64
 from typing import List, Dict, Optional, Union, BinaryIO
 from pathlib import Path
 
@@ -23,12 +22,13 @@ from dist.signer_client.models import (
     DocumentsDocumentModel, DocumentsDocumentListModel,
     DocumentFlowsDocumentFlowCreateRequest, DocumentFlowsDocumentFlowModel,
     FoldersFolderCreateRequest, FoldersFolderInfoModel,
-    UploadsUploadBytesRequest, UploadsUploadBytesModel,
+    UploadsUploadBytesModel,
     FlowActionsFlowActionCreateModel, FlowActionsFlowActionModel,
     UsersParticipantUserModel, DocumentsDocumentFileModel,
     DocumentStatus, DocumentTypes, FolderType, FlowActionType,
     SignatureTypes, AuthenticationTypes
 )
+from dist.signer_client.streaming import Base64JsonBody
 
 
 class SignerClient:
@@ -348,24 +348,10 @@ class SignerClient:
             file_path = Path(file_path)
             if not file_path.exists():
                 raise FileNotFoundError(f"File not found: {file_path}")
-            
-            with open(file_path, 'rb') as f:
-                content = f.read()
-            filename = file_path.name
-        else:
-            # Assume it's a file-like object
-            content = file_path.read()
-            filename = getattr(file_path, 'name', 'uploaded_file')
-        
-        # Encode content as base64
-        content_b64 = base64.b64encode(content).decode('utf-8')
-        
-        request = UploadsUploadBytesRequest(
-            content=content_b64,
-            name=filename
-        )
         
-        return self.upload.api_uploads_bytes_post(body=request)
+        # The base64 JSON body is encoded in chunks while it is sent, so
+        # the file is never held in memory
+        return self.upload.api_uploads_bytes_post(body=Base64JsonBody(file_path))
     
     # ============================================================================
     # NOTIFICATIONS
@@ -503,9 +489,11 @@ class SignerClient:
         Returns:
             Validation results
         """
-        content_b64 = base64.b64encode(document_content).decode('utf-8')
+        # The API validates an uploaded file, the content is streamed to
+        # the upload API first
+        upload = self.upload_file(document_content)
         request = {
-            'content': content_b64
+            'fileId': upload.id
         }
         
         return self.documents.api_documents_validate_signatures_post(body=request)